@@ -26,12 +26,24 @@ from src.modules.coordinator.infrastructure.persistence.research_session_model i
 from src.modules.coordinator.infrastructure.persistence.node_execution_model import (
     NodeExecutionModel,
 )  # noqa
+from src.modules.coordinator.infrastructure.persistence.research_batch_model import (
+    ResearchBatchModel,
+)  # noqa
 from src.modules.llm_platform.infrastructure.persistence.models.llm_call_log_model import (
     LLMCallLogModel,
 )  # noqa
 from src.shared.infrastructure.persistence.external_api_call_log_model import (
     ExternalAPICallLogModel,
 )  # noqa
+from src.modules.research.infrastructure.persistence.stock_indicator_daily_model import (
+    StockIndicatorDailyModel,
+)  # noqa
+from src.modules.research.infrastructure.persistence.stock_indicator_state_model import (
+    StockIndicatorStateModel,
+)  # noqa
+from src.modules.llm_platform.infrastructure.persistence.models.llm_completion_cache_model import (
+    LLMCompletionCacheModel,
+)  # noqa
 
 # Alembic 配置对象，提供对 .ini 文件的访问
 config = context.config
@@ -0,0 +1,35 @@
+"""add_trade_calendar_table
+
+新增交易日历表 de_trade_calendar，缓存 Tushare trade_cal 数据，
+供增量同步跳过周末与节假日。
+
+Revision ID: c0ff00000014
+Revises: c0ff00000013
+Create Date: 2026-10-18
+
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision = "c0ff00000014"
+down_revision = "c0ff00000013"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "de_trade_calendar",
+        sa.Column("exchange", sa.String(length=10), nullable=False, comment="交易所代码"),
+        sa.Column("cal_date", sa.Date(), nullable=False, comment="日历日期"),
+        sa.Column("is_open", sa.Boolean(), nullable=False, comment="是否交易日"),
+        sa.Column("pretrade_date", sa.Date(), nullable=True, comment="上一个交易日"),
+        sa.Column("updated_at", sa.DateTime(), nullable=False, comment="更新时间"),
+        sa.PrimaryKeyConstraint("exchange", "cal_date"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("de_trade_calendar")
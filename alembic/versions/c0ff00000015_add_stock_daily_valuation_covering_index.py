@@ -0,0 +1,44 @@
+"""add_stock_daily_valuation_covering_index
+
+为 stock_daily 新增 (third_code, trade_date) INCLUDE (close, pe_ttm, pb, ps_ttm) 覆盖索引，
+估值历史分位查询只投影这几列，可走 index-only scan 而无需回表。
+
+索引使用 CONCURRENTLY 创建，避免在大表上长时间阻塞写入。
+
+Revision ID: c0ff00000015
+Revises: c0ff00000014
+Create Date: 2026-10-18
+
+"""
+
+from alembic import op
+
+revision = "c0ff00000015"
+down_revision = "c0ff00000014"
+branch_labels = None
+depends_on = None
+
+INDEX_NAME = "ix_stock_daily_valuation_covering"
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            INDEX_NAME,
+            "stock_daily",
+            ["third_code", "trade_date"],
+            unique=False,
+            postgresql_include=["close", "pe_ttm", "pb", "ps_ttm"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            INDEX_NAME,
+            table_name="stock_daily",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
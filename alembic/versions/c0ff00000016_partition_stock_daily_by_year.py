@@ -0,0 +1,134 @@
+"""partition_stock_daily_by_year
+
+将 stock_daily 改造为按 trade_date 年度范围分区的分区表：
+- 原表重命名为 stock_daily_legacy，新建同结构分区表并按年创建分区（覆盖已有数据至次年）；
+- 数据迁移后在父表上建立主键 (third_code, trade_date)（包含分区键，ON CONFLICT 冲突目标不变）、
+  原有 btree 索引、估值覆盖索引，以及 trade_date 的 BRIN 索引；
+- 此后的新年度分区由写入前按需创建与 maintain_stock_daily_partitions 定时任务提前创建。
+
+Revision ID: c0ff00000016
+Revises: c0ff00000015
+Create Date: 2026-10-18
+
+"""
+
+from datetime import date
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision = "c0ff00000016"
+down_revision = "c0ff00000015"
+branch_labels = None
+depends_on = None
+
+
+def _columns() -> list:
+    """stock_daily 列定义（与初始迁移一致）。"""
+    return [
+        sa.Column("third_code", sa.String(length=20), nullable=False, comment="第三方代码"),
+        sa.Column("trade_date", sa.Date(), nullable=False, comment="交易日期"),
+        sa.Column("open", sa.Float(), nullable=True, comment="开盘价"),
+        sa.Column("high", sa.Float(), nullable=True, comment="最高价"),
+        sa.Column("low", sa.Float(), nullable=True, comment="最低价"),
+        sa.Column("close", sa.Float(), nullable=True, comment="收盘价"),
+        sa.Column("pre_close", sa.Float(), nullable=True, comment="昨收价"),
+        sa.Column("change", sa.Float(), nullable=True, comment="涨跌额"),
+        sa.Column("pct_chg", sa.Float(), nullable=True, comment="涨跌幅"),
+        sa.Column("vol", sa.Float(), nullable=True, comment="成交量"),
+        sa.Column("amount", sa.Float(), nullable=True, comment="成交额"),
+        sa.Column("adj_factor", sa.Float(), nullable=True, comment="复权因子"),
+        sa.Column("turnover_rate", sa.Float(), nullable=True, comment="换手率"),
+        sa.Column("turnover_rate_f", sa.Float(), nullable=True, comment="换手率(自由流通股)"),
+        sa.Column("volume_ratio", sa.Float(), nullable=True, comment="量比"),
+        sa.Column("pe", sa.Float(), nullable=True, comment="市盈率"),
+        sa.Column("pe_ttm", sa.Float(), nullable=True, comment="市盈率TTM"),
+        sa.Column("pb", sa.Float(), nullable=True, comment="市净率"),
+        sa.Column("ps", sa.Float(), nullable=True, comment="市销率"),
+        sa.Column("ps_ttm", sa.Float(), nullable=True, comment="市销率TTM"),
+        sa.Column("dv_ratio", sa.Float(), nullable=True, comment="股息率"),
+        sa.Column("dv_ttm", sa.Float(), nullable=True, comment="股息率TTM"),
+        sa.Column("total_share", sa.Float(), nullable=True, comment="总股本"),
+        sa.Column("float_share", sa.Float(), nullable=True, comment="流通股本"),
+        sa.Column("free_share", sa.Float(), nullable=True, comment="自由流通股本"),
+        sa.Column("total_mv", sa.Float(), nullable=True, comment="总市值"),
+        sa.Column("circ_mv", sa.Float(), nullable=True, comment="流通市值"),
+        sa.Column("source", sa.String(length=20), nullable=True, comment="数据来源"),
+    ]
+
+
+_OLD_INDEXES = (
+    "ix_stock_daily_third_code",
+    "ix_stock_daily_trade_date",
+    "ix_stock_daily_valuation_covering",
+)
+
+
+def _create_indexes() -> None:
+    op.create_index("ix_stock_daily_third_code", "stock_daily", ["third_code"])
+    op.create_index("ix_stock_daily_trade_date", "stock_daily", ["trade_date"])
+    op.create_index(
+        "ix_stock_daily_valuation_covering",
+        "stock_daily",
+        ["third_code", "trade_date"],
+        postgresql_include=["close", "pe_ttm", "pb", "ps_ttm"],
+    )
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+
+    op.rename_table("stock_daily", "stock_daily_legacy")
+    op.execute(
+        "ALTER TABLE stock_daily_legacy RENAME CONSTRAINT stock_daily_pkey TO stock_daily_legacy_pkey"
+    )
+    for name in _OLD_INDEXES:
+        op.execute(f"DROP INDEX IF EXISTS {name}")
+
+    op.create_table("stock_daily", *_columns(), postgresql_partition_by="RANGE (trade_date)")
+
+    min_year, max_year = conn.execute(
+        sa.text(
+            "SELECT EXTRACT(YEAR FROM min(trade_date))::int, EXTRACT(YEAR FROM max(trade_date))::int "
+            "FROM stock_daily_legacy"
+        )
+    ).one()
+    current_year = date.today().year
+    first_year = min(min_year or current_year, current_year)
+    last_year = max(max_year or current_year, current_year) + 1
+    for year in range(first_year, last_year + 1):
+        op.execute(
+            f"CREATE TABLE stock_daily_y{year} PARTITION OF stock_daily "
+            f"FOR VALUES FROM ('{date(year, 1, 1)}') TO ('{date(year + 1, 1, 1)}')"
+        )
+
+    # 先迁移数据再建主键与索引，避免逐行维护索引
+    op.execute("INSERT INTO stock_daily SELECT * FROM stock_daily_legacy ORDER BY trade_date")
+    op.execute("ALTER TABLE stock_daily ADD PRIMARY KEY (third_code, trade_date)")
+    _create_indexes()
+    op.create_index(
+        "ix_stock_daily_trade_date_brin",
+        "stock_daily",
+        ["trade_date"],
+        postgresql_using="brin",
+    )
+
+    op.drop_table("stock_daily_legacy")
+
+
+def downgrade() -> None:
+    op.rename_table("stock_daily", "stock_daily_partitioned")
+    op.execute(
+        "ALTER TABLE stock_daily_partitioned RENAME CONSTRAINT stock_daily_pkey "
+        "TO stock_daily_partitioned_pkey"
+    )
+    for name in _OLD_INDEXES + ("ix_stock_daily_trade_date_brin",):
+        op.execute(f"DROP INDEX IF EXISTS {name}")
+
+    op.create_table("stock_daily", *_columns(), sa.PrimaryKeyConstraint("third_code", "trade_date"))
+    op.execute("INSERT INTO stock_daily SELECT * FROM stock_daily_partitioned")
+    _create_indexes()
+
+    # 删除分区父表会一并删除全部分区
+    op.drop_table("stock_daily_partitioned")
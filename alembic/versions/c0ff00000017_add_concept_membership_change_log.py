@@ -0,0 +1,60 @@
+"""add_concept_membership_change_log
+
+概念成份股增量同步：
+- concept 表新增 membership_hash（成份股集合内容哈希），成员未变的概念跳过写库；
+- 新增 concept_stock_change_log，记录成份股映射的新增 / 移除 / 更名，供下游按 id 增量消费；
+- 新增 concept_change_cursor，记录各下游消费者（如知识图谱同步）已应用到的变更日志 id。
+
+Revision ID: c0ff00000017
+Revises: c0ff00000016
+Create Date: 2026-10-18
+
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision = "c0ff00000017"
+down_revision = "c0ff00000016"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "concept",
+        sa.Column(
+            "membership_hash", sa.String(length=64), nullable=True, comment="成份股集合内容哈希"
+        ),
+    )
+    op.create_table(
+        "concept_stock_change_log",
+        sa.Column("id", sa.BigInteger(), autoincrement=True, nullable=False),
+        sa.Column("concept_code", sa.String(length=20), nullable=False, comment="概念板块代码"),
+        sa.Column(
+            "third_code", sa.String(length=20), nullable=False, comment="股票代码（系统标准格式）"
+        ),
+        sa.Column("stock_name", sa.String(length=100), nullable=True, comment="股票名称"),
+        sa.Column(
+            "change_type",
+            sa.String(length=10),
+            nullable=False,
+            comment="变更类型 ADDED/REMOVED/RENAMED",
+        ),
+        sa.Column("changed_at", sa.DateTime(), nullable=False, comment="变更时间"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_table(
+        "concept_change_cursor",
+        sa.Column("consumer", sa.String(length=50), nullable=False, comment="消费者标识"),
+        sa.Column("last_change_id", sa.BigInteger(), nullable=False, comment="已应用的变更日志 id"),
+        sa.Column("updated_at", sa.DateTime(), nullable=False, comment="更新时间"),
+        sa.PrimaryKeyConstraint("consumer"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("concept_change_cursor")
+    op.drop_table("concept_stock_change_log")
+    op.drop_column("concept", "membership_hash")
@@ -0,0 +1,81 @@
+"""add_stock_indicator_daily_table
+
+新增 stock_indicator_daily：全市场技术指标日快照（每标的每交易日一行，字段同
+TechnicalIndicatorsSnapshot），由批量任务写入，技术分析按 (third_code, trade_date) 直接读取。
+
+Revision ID: c0ff00000018
+Revises: c0ff00000017
+Create Date: 2026-10-18
+
+"""
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+revision = "c0ff00000018"
+down_revision = "c0ff00000017"
+branch_labels = None
+depends_on = None
+
+_REQUIRED_FLOAT_COLUMNS = (
+    "ma5",
+    "ma10",
+    "ma20",
+    "ma30",
+    "ma60",
+    "ma120",
+    "ma200",
+)
+_OPTIONAL_FLOAT_COLUMNS = (
+    "rsi_value",
+    "macd_dif",
+    "macd_dea",
+    "macd_histogram",
+    "kdj_k",
+    "kdj_d",
+    "kdj_j",
+    "adx_value",
+    "volume_ratio",
+)
+_BAND_FLOAT_COLUMNS = (
+    "bb_upper",
+    "bb_lower",
+    "bb_middle",
+    "bb_bandwidth",
+    "atr_value",
+)
+_JSONB_COLUMNS = (
+    "calculated_support_levels",
+    "calculated_resistance_levels",
+    "detected_patterns",
+)
+
+
+def upgrade() -> None:
+    op.create_table(
+        "stock_indicator_daily",
+        sa.Column("third_code", sa.String(length=20), nullable=False, comment="股票代码"),
+        sa.Column("trade_date", sa.Date(), nullable=False, comment="交易日期"),
+        sa.Column("current_price", sa.Float(), nullable=False, comment="收盘价"),
+        sa.Column("change_percent", sa.Float(), nullable=False, comment="日涨跌幅（%）"),
+        *(sa.Column(name, sa.Float(), nullable=False) for name in _REQUIRED_FLOAT_COLUMNS),
+        *(sa.Column(name, sa.Float(), nullable=True) for name in _OPTIONAL_FLOAT_COLUMNS),
+        sa.Column("obv_trend", sa.String(length=10), nullable=False),
+        sa.Column("vwap_value", sa.Float(), nullable=True),
+        sa.Column("price_vs_vwap_status", sa.String(length=10), nullable=False),
+        *(sa.Column(name, sa.Float(), nullable=True) for name in _BAND_FLOAT_COLUMNS),
+        sa.Column("high_20d", sa.Float(), nullable=False),
+        sa.Column("low_20d", sa.Float(), nullable=False),
+        *(
+            sa.Column(name, postgresql.JSONB(astext_type=sa.Text()), nullable=False)
+            for name in _JSONB_COLUMNS
+        ),
+        sa.Column("computed_at", sa.DateTime(), nullable=False, comment="计算时间"),
+        sa.PrimaryKeyConstraint("third_code", "trade_date"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("stock_indicator_daily")
@@ -0,0 +1,42 @@
+"""add_stock_indicator_state_table
+
+新增 stock_indicator_state：每个标的一行的增量指标状态（EMA / Wilder 平滑 / OBV 末值与滚动窗口），
+批量任务每个交易日只推进新 K 线，不再重放全部历史。
+
+Revision ID: c0ff00000019
+Revises: c0ff00000018
+Create Date: 2026-10-18
+
+"""
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+revision = "c0ff00000019"
+down_revision = "c0ff00000018"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "stock_indicator_state",
+        sa.Column("third_code", sa.String(length=20), nullable=False, comment="股票代码"),
+        sa.Column("start_date", sa.Date(), nullable=False, comment="状态起始交易日"),
+        sa.Column("last_trade_date", sa.Date(), nullable=False, comment="最后推进的交易日"),
+        sa.Column("bar_count", sa.Integer(), nullable=False, comment="已消费的 K 线数"),
+        sa.Column(
+            "state",
+            postgresql.JSONB(astext_type=sa.Text()),
+            nullable=False,
+            comment="IndicatorState JSON",
+        ),
+        sa.Column("updated_at", sa.DateTime(), nullable=False, comment="更新时间"),
+        sa.PrimaryKeyConstraint("third_code"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("stock_indicator_state")
@@ -0,0 +1,29 @@
+"""add_stock_indicator_daily_trade_date_index
+
+stock_indicator_daily 新增 trade_date 索引：主键以 third_code 开头，条件选股按交易日读取
+全市场截面时无法利用主键，需单独索引避免全表扫描。
+
+Revision ID: c0ff00000020
+Revises: c0ff00000019
+Create Date: 2026-10-18
+
+"""
+
+from alembic import op
+
+revision = "c0ff00000020"
+down_revision = "c0ff00000019"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_stock_indicator_daily_trade_date",
+        "stock_indicator_daily",
+        ["trade_date"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_stock_indicator_daily_trade_date", table_name="stock_indicator_daily")
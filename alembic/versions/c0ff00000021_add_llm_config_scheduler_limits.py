@@ -0,0 +1,42 @@
+"""add_llm_config_scheduler_limits
+
+llm_configs 新增调度限额：max_concurrency（同一别名并发上限）、tokens_per_minute（每分钟 token 预算），
+均可为空（并发上限为空时取平台默认值，token 预算为空表示不限）。
+
+Revision ID: c0ff00000021
+Revises: c0ff00000020
+Create Date: 2026-10-18
+
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision = "c0ff00000021"
+down_revision = "c0ff00000020"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "llm_configs",
+        sa.Column(
+            "max_concurrency", sa.Integer(), nullable=True, comment="并发上限，空表示使用平台默认值"
+        ),
+    )
+    op.add_column(
+        "llm_configs",
+        sa.Column(
+            "tokens_per_minute",
+            sa.Integer(),
+            nullable=True,
+            comment="每分钟 token 预算，空表示不限",
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("llm_configs", "tokens_per_minute")
+    op.drop_column("llm_configs", "max_concurrency")
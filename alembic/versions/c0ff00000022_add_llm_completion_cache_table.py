@@ -0,0 +1,48 @@
+"""add_llm_completion_cache_table
+
+新增 llm_completion_cache 表，用于 LLM 补全结果缓存（cache_key PK、request_params JSONB、
+completion_text TEXT、created_at/expires_at + expires_at 索引）。
+
+Revision ID: c0ff00000022
+Revises: c0ff00000021
+Create Date: 2026-10-18
+
+"""
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+revision = "c0ff00000022"
+down_revision = "c0ff00000021"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "llm_completion_cache",
+        sa.Column("cache_key", sa.String(length=64), nullable=False, comment="请求 SHA-256 哈希"),
+        sa.Column(
+            "request_params",
+            postgresql.JSONB(astext_type=sa.Text()),
+            nullable=False,
+            comment="路由与采样参数",
+        ),
+        sa.Column("completion_text", sa.Text(), nullable=False, comment="大模型生成的文本"),
+        sa.Column("created_at", sa.DateTime(), nullable=False, comment="写入时间"),
+        sa.Column("expires_at", sa.DateTime(), nullable=False, comment="过期时间"),
+        sa.PrimaryKeyConstraint("cache_key"),
+    )
+    op.create_index(
+        op.f("ix_llm_completion_cache_expires_at"),
+        "llm_completion_cache",
+        ["expires_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_llm_completion_cache_expires_at"), table_name="llm_completion_cache")
+    op.drop_table("llm_completion_cache")
@@ -0,0 +1,34 @@
+"""add_llm_call_log_ttft
+
+llm_call_logs 新增 time_to_first_token_ms：流式调用记录首个增量文本耗时（非流式调用为空）。
+
+Revision ID: c0ff00000023
+Revises: c0ff00000022
+Create Date: 2026-10-18
+
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision = "c0ff00000023"
+down_revision = "c0ff00000022"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "llm_call_logs",
+        sa.Column(
+            "time_to_first_token_ms",
+            sa.Integer(),
+            nullable=True,
+            comment="首个增量文本耗时（毫秒，仅流式调用）",
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("llm_call_logs", "time_to_first_token_ms")
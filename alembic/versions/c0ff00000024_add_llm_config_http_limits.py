@@ -0,0 +1,45 @@
+"""add_llm_config_http_limits
+
+llm_configs 新增 HTTP 客户端参数：max_connections（连接池上限）、timeout_seconds（请求超时秒数），
+均可为空（为空时取平台默认值）。
+
+Revision ID: c0ff00000024
+Revises: c0ff00000023
+Create Date: 2026-10-18
+
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision = "c0ff00000024"
+down_revision = "c0ff00000023"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "llm_configs",
+        sa.Column(
+            "max_connections",
+            sa.Integer(),
+            nullable=True,
+            comment="HTTP 连接池上限，空表示使用平台默认值",
+        ),
+    )
+    op.add_column(
+        "llm_configs",
+        sa.Column(
+            "timeout_seconds",
+            sa.Float(),
+            nullable=True,
+            comment="请求超时秒数，空表示使用平台默认值",
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("llm_configs", "timeout_seconds")
+    op.drop_column("llm_configs", "max_connections")
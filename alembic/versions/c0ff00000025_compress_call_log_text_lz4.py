@@ -0,0 +1,43 @@
+"""compress_call_log_text_lz4
+
+调用日志中的大文本列（LLM prompt / system / completion、外部 API 响应）改用 lz4 TOAST 压缩：
+超过 TOAST 阈值（约 2KB）的值由 PostgreSQL 透明压缩，读取方不变；lz4 压缩与解压均快于默认 pglz，
+降低批量写入时的 CPU 开销。仅影响之后写入的值；PostgreSQL 14 以下无列压缩选项，跳过。
+
+Revision ID: c0ff00000025
+Revises: c0ff00000024
+Create Date: 2026-10-18
+
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision = "c0ff00000025"
+down_revision = "c0ff00000024"
+branch_labels = None
+depends_on = None
+
+_COLUMNS = [
+    ("llm_call_logs", "prompt_text"),
+    ("llm_call_logs", "system_message"),
+    ("llm_call_logs", "completion_text"),
+    ("external_api_call_logs", "response_data"),
+]
+
+
+def _set_compression(method: str) -> None:
+    version = op.get_bind().execute(sa.text("SHOW server_version_num")).scalar()
+    if int(version) < 140000:
+        return
+    for table, column in _COLUMNS:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} SET COMPRESSION {method}")
+
+
+def upgrade() -> None:
+    _set_compression("lz4")
+
+
+def downgrade() -> None:
+    _set_compression("default")
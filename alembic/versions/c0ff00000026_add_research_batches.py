@@ -0,0 +1,92 @@
+"""add_research_batches
+
+新增 research_batches 表（批量研究请求参数与整体状态），research_sessions 新增 batch_id
+（关联所属批次，带索引，用于批次续跑时查询已完成的标的）。
+
+Revision ID: c0ff00000026
+Revises: c0ff00000025
+Create Date: 2026-10-18
+
+"""
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+revision = "c0ff00000026"
+down_revision = "c0ff00000025"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "research_batches",
+        sa.Column("id", postgresql.UUID(as_uuid=True), nullable=False, comment="批次唯一标识"),
+        sa.Column(
+            "symbols",
+            postgresql.JSONB(astext_type=sa.Text()),
+            nullable=False,
+            comment="标的列表（按请求顺序）",
+        ),
+        sa.Column(
+            "experts",
+            postgresql.JSONB(astext_type=sa.Text()),
+            nullable=False,
+            comment="选中的专家列表",
+        ),
+        sa.Column(
+            "options",
+            postgresql.JSONB(astext_type=sa.Text()),
+            nullable=True,
+            comment="各专家执行选项",
+        ),
+        sa.Column(
+            "skip_debate",
+            sa.Boolean(),
+            nullable=False,
+            server_default="false",
+            comment="是否跳过辩论",
+        ),
+        sa.Column(
+            "status",
+            sa.String(length=20),
+            nullable=False,
+            comment="running / completed / partial / failed",
+        ),
+        sa.Column("created_at", sa.DateTime(), nullable=False, comment="创建时间"),
+        sa.Column("completed_at", sa.DateTime(), nullable=True, comment="完成时间"),
+        sa.Column("duration_ms", sa.Integer(), nullable=True, comment="最近一次执行耗时（毫秒）"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.add_column(
+        "research_sessions",
+        sa.Column(
+            "batch_id",
+            postgresql.UUID(as_uuid=True),
+            nullable=True,
+            comment="所属批量研究标识，单标的研究为空",
+        ),
+    )
+    op.create_foreign_key(
+        "fk_research_sessions_batch_id",
+        "research_sessions",
+        "research_batches",
+        ["batch_id"],
+        ["id"],
+        ondelete="SET NULL",
+    )
+    op.create_index(
+        op.f("ix_research_sessions_batch_id"),
+        "research_sessions",
+        ["batch_id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_research_sessions_batch_id"), table_name="research_sessions")
+    op.drop_constraint("fk_research_sessions_batch_id", "research_sessions", type_="foreignkey")
+    op.drop_column("research_sessions", "batch_id")
+    op.drop_table("research_batches")
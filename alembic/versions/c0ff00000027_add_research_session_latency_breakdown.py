@@ -0,0 +1,36 @@
+"""add_research_session_latency_breakdown
+
+research_sessions 新增 latency_breakdown（JSONB）：各阶段完成时间点（毫秒）与辩论模式、
+是否重新论证等指标，用于对比增量辩论与标准辩论的端到端耗时。
+
+Revision ID: c0ff00000027
+Revises: c0ff00000026
+Create Date: 2026-10-18
+
+"""
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+revision = "c0ff00000027"
+down_revision = "c0ff00000026"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "research_sessions",
+        sa.Column(
+            "latency_breakdown",
+            postgresql.JSONB(astext_type=sa.Text()),
+            nullable=True,
+            comment="各阶段完成时间点（毫秒）与辩论模式等耗时指标",
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("research_sessions", "latency_breakdown")
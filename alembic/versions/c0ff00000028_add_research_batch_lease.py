@@ -0,0 +1,41 @@
+"""add_research_batch_lease
+
+research_batches 新增执行租约 lease_owner / heartbeat_at：执行方定期续约，
+续跑接口仅在租约空闲或过期时接管批次，避免原连接仍在执行时重复执行。
+
+Revision ID: c0ff00000028
+Revises: c0ff00000027
+Create Date: 2026-10-18
+
+"""
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+revision = "c0ff00000028"
+down_revision = "c0ff00000027"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "research_batches",
+        sa.Column(
+            "lease_owner",
+            postgresql.UUID(as_uuid=True),
+            nullable=True,
+            comment="执行租约持有方",
+        ),
+    )
+    op.add_column(
+        "research_batches",
+        sa.Column("heartbeat_at", sa.DateTime(), nullable=True, comment="执行租约最近续约时间"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("research_batches", "heartbeat_at")
+    op.drop_column("research_batches", "lease_owner")
@@ -23,7 +23,7 @@ async def lifespan(app: FastAPI):
     """
     应用生命周期管理
     - startup: 启动定时任务调度器，初始化 LLM 注册表并从数据库加载配置
-    - shutdown: 关闭定时任务调度器
+    - shutdown: 关闭定时任务调度器，刷出审计日志队列，关闭 LLM HTTP 客户端
     """
     # 启动事件
     logger.info("Application starting up...")
@@ -35,8 +35,11 @@ async def lifespan(app: FastAPI):
 
     # 从数据库加载持久化的调度配置并自动注册
     from src.modules.data_engineering.application.job_registry import get_job_registry
+    from src.modules.research.application.job_registry import (
+        get_job_registry as get_research_job_registry,
+    )
 
-    job_registry = get_job_registry()
+    job_registry = {**get_job_registry(), **get_research_job_registry()}
     await scheduler_service.load_persisted_jobs(job_registry)
 
     # 初始化 LLM 注册表（委托 Application 层服务，不直接依赖 Infrastructure）
@@ -61,6 +64,14 @@ async def lifespan(app: FastAPI):
     # 关闭调度器
     await scheduler_service.shutdown_scheduler()
 
+    # 刷出调用审计日志队列中剩余的记录
+    from src.shared.infrastructure.audit_log_writer import close_audit_log_writers
+
+    await close_audit_log_writers()
+
+    # 关闭 LLM Provider 共享的 HTTP 客户端
+    await LLMPlatformStartup.shutdown()
+
     # 关闭 Knowledge Center Neo4j Driver
     close_knowledge_center_driver()
     logger.info("Application shutdown completed.")
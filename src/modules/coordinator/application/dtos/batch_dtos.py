@@ -0,0 +1,19 @@
+"""
+批量研究 DTO：单个标的的执行结果。
+"""
+
+from typing import Literal
+
+from pydantic import BaseModel
+
+from src.modules.coordinator.domain.dtos.research_dtos import ResearchResult
+
+
+class BatchItemResult(BaseModel):
+    """批量研究中单个标的的执行结果，按完成顺序产出。"""
+
+    symbol: str
+    status: Literal["completed", "failed"]
+    session_id: str = ""  # 研究会话 ID；编排异常未返回结果时为空
+    result: ResearchResult | None = None  # 研究结果；全部专家失败或编排异常时为 None
+    error: str | None = None
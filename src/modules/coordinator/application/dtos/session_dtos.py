@@ -46,6 +46,10 @@ class SessionDetailDTO(BaseModel):
     created_at: datetime = Field(..., description="创建时间")
     completed_at: datetime | None = Field(None, description="完成时间")
     duration_ms: int | None = Field(None, description="总耗时（毫秒）")
+    latency_breakdown: dict[str, Any] | None = Field(
+        None,
+        description="各阶段完成时间点（距开始毫秒数，如 experts_done_ms、debate_done_ms）与辩论模式",
+    )
     node_executions: list[NodeExecutionItemDTO] = Field(
         default_factory=list,
         description="节点执行记录列表，按 started_at 升序",
@@ -35,6 +35,7 @@ class SessionDetailQuery:
             created_at=session.created_at,
             completed_at=session.completed_at,
             duration_ms=session.duration_ms,
+            latency_breakdown=session.latency_breakdown,
             node_executions=[
                 NodeExecutionItemDTO(
                     id=str(e.id),
@@ -0,0 +1,300 @@
+"""
+ResearchBatchService：批量研究应用服务。
+
+对一组标的执行相同专家组合的研究编排：固定数量的 worker 并发处理各标的，结果按完成顺序产出；
+每个标的的 ResearchSession 带 batch_id，中断（进程崩溃、客户端断开）后续跑时跳过已完成的标的。
+各标的共用同一组 Gateway，LLM 调度与博查调用预算、Web 搜索缓存均为全进程共享。
+
+执行期间持有批次租约并定期续约；续跑须先获取租约，原执行仍在续约时拒绝续跑。
+"""
+
+import asyncio
+import logging
+from collections.abc import AsyncIterator, Awaitable, Callable
+from datetime import datetime, timedelta
+from typing import Any
+from uuid import UUID, uuid4
+
+from src.modules.coordinator.application.dtos.batch_dtos import BatchItemResult
+from src.modules.coordinator.application.research_orchestration_service import (
+    parse_expert_types,
+)
+from src.modules.coordinator.domain.dtos.research_dtos import (
+    ResearchRequest,
+    ResearchResult,
+)
+from src.modules.coordinator.domain.exceptions import (
+    BatchNotFoundError,
+    BatchNotResumableError,
+)
+from src.modules.coordinator.domain.model.research_batch import ResearchBatch
+from src.modules.coordinator.domain.ports.research_batch_repository import (
+    IResearchBatchRepository,
+)
+from src.shared.domain.exceptions import BadRequestException
+
+logger = logging.getLogger(__name__)
+
+
+class ResearchBatchService:
+    """
+    批量研究应用服务。
+
+    职责：校验并创建批次、计算续跑时待处理的标的、以有界 worker 池执行并逐个产出结果、更新批次状态。
+    run_symbol 执行单个标的的研究编排（由 Composition Root 提供，每次调用使用独立的数据库会话）。
+    lease_seconds 内未续约的租约视为过期；执行中每 heartbeat_seconds 续约一次。
+    """
+
+    def __init__(
+        self,
+        batch_repo: IResearchBatchRepository,
+        run_symbol: Callable[[ResearchRequest], Awaitable[ResearchResult]],
+        concurrency: int = 4,
+        max_symbols: int = 100,
+        lease_seconds: float = 60,
+        heartbeat_seconds: float = 15,
+    ) -> None:
+        self._batch_repo = batch_repo
+        self._run_symbol = run_symbol
+        self._concurrency = max(1, concurrency)
+        self._max_symbols = max_symbols
+        self._lease_seconds = lease_seconds
+        self._heartbeat_seconds = heartbeat_seconds
+        # 被取消的流式迭代交出的清理任务（持有引用直至完成）
+        self._cleanups: set[asyncio.Task] = set()
+
+    async def create(
+        self,
+        symbols: list[str],
+        experts: list[str],
+        options: dict[str, dict[str, Any]] | None = None,
+        skip_debate: bool = False,
+    ) -> ResearchBatch:
+        """
+        校验入参并持久化新批次（标的去重、保持请求顺序）。
+
+        Raises:
+            BadRequestException: symbols 为空或超过上限、experts 为空或含非法类型
+        """
+        unique_symbols = list(dict.fromkeys(s.strip() for s in symbols if s and s.strip()))
+        if not unique_symbols:
+            raise BadRequestException(message="symbols 为必填，至少指定一个标的")
+        if len(unique_symbols) > self._max_symbols:
+            raise BadRequestException(
+                message=f"单批最多 {self._max_symbols} 个标的，当前 {len(unique_symbols)} 个"
+            )
+        if not experts:
+            raise BadRequestException(message="experts 为必填，至少指定一个专家")
+        expert_types = parse_expert_types(experts)
+
+        now = datetime.utcnow()
+        batch = ResearchBatch(
+            id=uuid4(),
+            symbols=unique_symbols,
+            experts=[e.value for e in expert_types],
+            options=options or {},
+            skip_debate=skip_debate,
+            created_at=now,
+            lease_owner=uuid4(),
+            heartbeat_at=now,
+        )
+        await self._batch_repo.save_batch(batch)
+        return batch
+
+    async def get_resumable(self, batch_id: UUID) -> ResearchBatch:
+        """
+        查询待续跑的批次并获取其执行租约。
+
+        Raises:
+            BatchNotFoundError: 批次不存在
+            BatchNotResumableError: 批次已全部完成（400），或仍在执行、租约未过期（409）
+        """
+        batch = await self._batch_repo.get_batch_by_id(batch_id)
+        if batch is None:
+            raise BatchNotFoundError(message=f"批量研究 {batch_id} 不存在")
+        if batch.status == "completed":
+            raise BatchNotResumableError()
+        owner, now = uuid4(), datetime.utcnow()
+        expired_before = now - timedelta(seconds=self._lease_seconds)
+        if not await self._batch_repo.claim_lease(batch.id, owner, now, expired_before):
+            raise BatchNotResumableError(
+                message="该批量研究正在执行中，请等待其结束或中断后再续跑",
+                status_code=409,
+            )
+        batch.lease_owner, batch.heartbeat_at = owner, now
+        return batch
+
+    async def completed_symbols(self, batch: ResearchBatch) -> set[str]:
+        """批次下已有 completed 会话的标的（续跑时跳过）。"""
+        sessions = await self._batch_repo.list_batch_sessions(batch.id)
+        return {s.symbol for s in sessions if s.status == "completed"}
+
+    async def run(
+        self, batch: ResearchBatch, skip_symbols: set[str] | None = None
+    ) -> AsyncIterator[BatchItemResult]:
+        """
+        以有界 worker 池执行批次中除 skip_symbols 外的标的，按完成顺序产出结果；
+        全部处理结束后更新批次状态（batch 实体同步更新）。
+
+        迭代被提前关闭时取消仍在执行的标的，批次保持 running，可经续跑补齐。
+        执行期间为 batch 持有的租约续约，结束或提前关闭（含迭代被取消）时释放；
+        租约被其他执行方接管时停止执行并抛出 BatchNotResumableError（409）。
+        """
+        skip_symbols = skip_symbols or set()
+        pending = [s for s in batch.symbols if s not in skip_symbols]
+        started_at = datetime.utcnow()
+        if batch.status != "running":
+            batch.restart()
+            await self._batch_repo.update_batch(batch)
+
+        queue: asyncio.Queue[str] = asyncio.Queue()
+        for symbol in pending:
+            queue.put_nowait(symbol)
+        results: asyncio.Queue[BatchItemResult | None] = asyncio.Queue()
+
+        async def worker() -> None:
+            while not queue.empty():
+                symbol = queue.get_nowait()
+                results.put_nowait(await self._run_one(batch, symbol))
+
+        workers = [
+            asyncio.create_task(worker()) for _ in range(min(self._concurrency, len(pending)))
+        ]
+        # 续约失败（租约被其他执行方接管）时心跳向 results 放入 None，本次执行随即停止
+        heartbeat = asyncio.create_task(self._heartbeat(batch, results))
+        completed = len([s for s in batch.symbols if s in skip_symbols])
+        finished = lease_lost = False
+        try:
+            for _ in pending:
+                item = await results.get()
+                if item is None:
+                    lease_lost = True
+                    break
+                if item.status == "completed":
+                    completed += 1
+                yield item
+            else:
+                finished = True
+        finally:
+            heartbeat.cancel()
+            for task in workers:
+                task.cancel()
+            # 流式响应断开时 Starlette 以 cancel scope 取消迭代，清理中的每个 await 都会再次被取消：
+            # 清理放入独立任务并 shield，保证 worker 与心跳退出、批次状态写入、租约释放
+            cleanup = asyncio.create_task(
+                self._finish_run(
+                    batch, workers, heartbeat, completed, started_at, finished=finished
+                )
+            )
+            self._cleanups.add(cleanup)
+            cleanup.add_done_callback(self._cleanups.discard)
+            await asyncio.shield(cleanup)
+
+        if lease_lost:
+            raise BatchNotResumableError(
+                message="该批量研究已被其他执行方接管，本次执行停止",
+                status_code=409,
+            )
+
+    async def _finish_run(
+        self,
+        batch: ResearchBatch,
+        workers: list[asyncio.Task],
+        heartbeat: asyncio.Task,
+        completed: int,
+        started_at: datetime,
+        finished: bool,
+    ) -> None:
+        """
+        等待已取消的 worker 与心跳退出（心跳须先退出：续约与状态更新共用批次仓储的数据库会话），
+        全部标的处理完时写入批次状态，最后释放租约。
+        """
+        await asyncio.gather(*workers, heartbeat, return_exceptions=True)
+        try:
+            if finished:
+                completed_at = datetime.utcnow()
+                duration_ms = int((completed_at - started_at).total_seconds() * 1000)
+                batch.finish(completed, completed_at, duration_ms)
+                await self._batch_repo.update_batch(batch)
+                logger.info(
+                    "批量研究结束: batch_id=%s, status=%s, 完成 %d/%d, 耗时 %dms",
+                    batch.id,
+                    batch.status,
+                    completed,
+                    len(batch.symbols),
+                    duration_ms,
+                )
+        finally:
+            await self._release_lease(batch)
+
+    async def _heartbeat(
+        self, batch: ResearchBatch, results: "asyncio.Queue[BatchItemResult | None]"
+    ) -> None:
+        """
+        每 heartbeat_seconds 续约一次，直到被取消；续约出错只记录日志（租约过期前可重试）。
+        租约已被其他执行方接管时放弃租约并向 results 放入 None，通知 run 停止。
+        """
+        if batch.lease_owner is None:
+            return
+        while True:
+            await asyncio.sleep(self._heartbeat_seconds)
+            # 续约在独立任务中执行并等待其结束：取消只打断等待，不打断进行中的数据库语句
+            renew = asyncio.create_task(self._renew_lease(batch))
+            try:
+                renewed = await asyncio.shield(renew)
+            except asyncio.CancelledError:
+                await asyncio.gather(renew, return_exceptions=True)
+                raise
+            if renewed is False:
+                logger.warning("批量研究租约已被其他执行方接管，停止执行: batch_id=%s", batch.id)
+                batch.lease_owner, batch.heartbeat_at = None, None
+                results.put_nowait(None)
+                return
+
+    async def _renew_lease(self, batch: ResearchBatch) -> bool | None:
+        """续约并返回是否仍持有租约；出错时返回 None。"""
+        now = datetime.utcnow()
+        try:
+            renewed = await self._batch_repo.renew_lease(batch.id, batch.lease_owner, now)
+        except Exception as e:
+            logger.warning("批量研究租约续约失败: batch_id=%s, 错误=%s", batch.id, e)
+            return None
+        if renewed:
+            batch.heartbeat_at = now
+        return renewed
+
+    async def _release_lease(self, batch: ResearchBatch) -> None:
+        if batch.lease_owner is None:
+            return
+        try:
+            await self._batch_repo.release_lease(batch.id, batch.lease_owner)
+        except Exception as e:
+            # 释放失败时租约在 lease_seconds 后自然过期
+            logger.warning("批量研究租约释放失败: batch_id=%s, 错误=%s", batch.id, e)
+        batch.lease_owner, batch.heartbeat_at = None, None
+
+    async def _run_one(self, batch: ResearchBatch, symbol: str) -> BatchItemResult:
+        request = ResearchRequest(
+            symbol=symbol,
+            experts=parse_expert_types(batch.experts),
+            options=batch.options,
+            skip_debate=batch.skip_debate,
+            batch_id=batch.id,
+        )
+        try:
+            result = await self._run_symbol(request)
+        except Exception as e:
+            logger.warning(
+                "批量研究标的执行失败: batch_id=%s, symbol=%s, 错误=%s", batch.id, symbol, e
+            )
+            return BatchItemResult(symbol=symbol, status="failed", error=str(e) or type(e).__name__)
+        if result.overall_status == "failed":
+            return BatchItemResult(
+                symbol=symbol,
+                status="failed",
+                session_id=result.session_id,
+                error="全部专家执行失败",
+            )
+        return BatchItemResult(
+            symbol=symbol, status="completed", session_id=result.session_id, result=result
+        )
@@ -24,6 +24,19 @@ from src.modules.coordinator.domain.ports.research_session_repository import (
 from src.shared.domain.exceptions import BadRequestException
 
 
+def parse_expert_types(experts: list[str]) -> list[ExpertType]:
+    """将专家类型字符串转为 ExpertType，含非法值时抛出 BadRequestException。"""
+    valid_values = {e.value for e in ExpertType}
+    expert_types: list[ExpertType] = []
+    for ex in experts:
+        if ex not in valid_values:
+            raise BadRequestException(
+                message=f"experts 含非法值: {ex}，合法值为 {sorted(valid_values)}"
+            )
+        expert_types.append(ExpertType(ex))
+    return expert_types
+
+
 class ResearchOrchestrationService:
     """
     研究编排应用服务。
@@ -69,14 +82,7 @@ class ResearchOrchestrationService:
         if not experts:
             raise BadRequestException(message="experts 为必填，至少指定一个专家")
 
-        valid_values = {e.value for e in ExpertType}
-        expert_types: list[ExpertType] = []
-        for ex in experts:
-            if ex not in valid_values:
-                raise BadRequestException(
-                    message=f"experts 含非法值: {ex}，合法值为 {sorted(valid_values)}"
-                )
-            expert_types.append(ExpertType(ex))
+        expert_types = parse_expert_types(experts)
 
         # 3. 构建 ResearchRequest 并调用 Port
         request = ResearchRequest(
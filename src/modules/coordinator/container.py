@@ -4,13 +4,21 @@ Coordinator 模块 Composition Root。
 组装 ResearchGatewayAdapter、DebateGatewayAdapter、JudgeGatewayAdapter
 → LangGraphResearchOrchestrator → ResearchOrchestrationService。
 并注册 IResearchSessionRepository → PgResearchSessionRepository，注入到编排器以支持执行追踪。
+批量研究：ResearchBatchService 经 PgResearchBatchRepository 持久化批次，各标的独立会话执行编排。
 """
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.modules.coordinator.application.research_batch_service import (
+    ResearchBatchService,
+)
 from src.modules.coordinator.application.research_orchestration_service import (
     ResearchOrchestrationService,
 )
+from src.modules.coordinator.domain.dtos.research_dtos import (
+    ResearchRequest,
+    ResearchResult,
+)
 from src.modules.coordinator.infrastructure.adapters.debate_gateway_adapter import (
     DebateGatewayAdapter,
 )
@@ -20,12 +28,17 @@ from src.modules.coordinator.infrastructure.adapters.judge_gateway_adapter impor
 from src.modules.coordinator.infrastructure.adapters.research_gateway_adapter import (
     ResearchGatewayAdapter,
 )
+from src.modules.coordinator.infrastructure.config import coordinator_config
 from src.modules.coordinator.infrastructure.orchestration.langgraph_orchestrator import (
     LangGraphResearchOrchestrator,
 )
+from src.modules.coordinator.infrastructure.persistence.research_batch_repository import (
+    PgResearchBatchRepository,
+)
 from src.modules.coordinator.infrastructure.persistence.research_session_repository import (
     PgResearchSessionRepository,
 )
+from src.modules.llm_platform.domain.dtos.llm_scheduler_dtos import LLMRequestPriority
 from src.shared.infrastructure.db.session import AsyncSessionLocal
 
 
@@ -54,3 +67,33 @@ class CoordinatorContainer:
             session_repo=session_repo,
         )
         return ResearchOrchestrationService(orchestrator, session_repo=session_repo)
+
+    def research_batch_service(self) -> ResearchBatchService:
+        """
+        组装批量研究服务：各标的共用同一组 Gateway Adapter，
+        每个标的的编排使用独立 AsyncSession 持久化 ResearchSession / NodeExecution（worker 间并发写入）；
+        编排内的 LLM 调用以 BATCH 优先级排队，让位于交互式研究请求。
+        """
+        gateway = ResearchGatewayAdapter(AsyncSessionLocal)
+        debate_gateway = DebateGatewayAdapter(AsyncSessionLocal)
+        judge_gateway = JudgeGatewayAdapter(AsyncSessionLocal)
+
+        async def run_symbol(request: ResearchRequest) -> ResearchResult:
+            async with AsyncSessionLocal() as session:
+                orchestrator = LangGraphResearchOrchestrator(
+                    gateway,
+                    debate_gateway=debate_gateway,
+                    judge_gateway=judge_gateway,
+                    session_repo=PgResearchSessionRepository(session),
+                    llm_priority=LLMRequestPriority.BATCH,
+                )
+                return await orchestrator.run(request)
+
+        return ResearchBatchService(
+            PgResearchBatchRepository(self._session),
+            run_symbol,
+            concurrency=coordinator_config.RESEARCH_BATCH_CONCURRENCY,
+            max_symbols=coordinator_config.RESEARCH_BATCH_MAX_SYMBOLS,
+            lease_seconds=coordinator_config.RESEARCH_BATCH_LEASE_SECONDS,
+            heartbeat_seconds=coordinator_config.RESEARCH_BATCH_HEARTBEAT_SECONDS,
+        )
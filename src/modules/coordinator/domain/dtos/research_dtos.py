@@ -23,6 +23,7 @@ class ResearchRequest(BaseModel):
     pre_populated_results: dict[str, Any] | None = None  # 重试时传入已成功专家的 result_data
     parent_session_id: UUID | None = None  # 重试时关联的源 session ID
     retry_count: int = 0  # 重试计数，首次执行为 0
+    batch_id: UUID | None = None  # 批量研究时所属批次 ID
 
 
 class ExpertResultItem(BaseModel):
@@ -42,3 +42,29 @@ class SessionNotRetryableError(AppException):
             code="SESSION_NOT_RETRYABLE",
             status_code=status_code,
         )
+
+
+class BatchNotFoundError(AppException):
+    """指定的批量研究不存在时抛出。"""
+
+    def __init__(self, message: str = "批量研究不存在"):
+        super().__init__(
+            message=message,
+            code="BATCH_NOT_FOUND",
+            status_code=404,
+        )
+
+
+class BatchNotResumableError(AppException):
+    """批量研究已全部完成、或仍在其他连接中执行（持有有效租约）时抛出。"""
+
+    def __init__(
+        self,
+        message: str = "该批量研究已全部完成，无需续跑",
+        status_code: int = 400,
+    ):
+        super().__init__(
+            message=message,
+            code="BATCH_NOT_RESUMABLE",
+            status_code=status_code,
+        )
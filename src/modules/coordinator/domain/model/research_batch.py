@@ -0,0 +1,50 @@
+"""
+批量研究领域实体。
+
+一次批量研究对一组标的执行相同专家组合的研究编排，每个标的对应一个 batch_id 关联的 ResearchSession；
+状态转换：running → completed / partial / failed。
+
+执行方持有租约（lease_owner + heartbeat_at）并定期续约；进程崩溃或连接断开后租约过期，
+续跑接口才能接管，避免同一批次被两个连接同时执行。
+"""
+
+from datetime import datetime
+from typing import Any, Literal
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+
+class ResearchBatch(BaseModel):
+    """批量研究实体，保存请求参数以便中断后续跑。"""
+
+    id: UUID
+    symbols: list[str]
+    experts: list[str]
+    options: dict[str, Any] = Field(default_factory=dict)
+    skip_debate: bool = False
+    status: Literal["running", "completed", "partial", "failed"] = "running"
+    created_at: datetime
+    completed_at: datetime | None = None
+    duration_ms: int | None = None
+    lease_owner: UUID | None = None
+    heartbeat_at: datetime | None = None
+
+    def restart(self) -> None:
+        """续跑时调用，恢复为 running。"""
+        self.status = "running"
+        self.completed_at = None
+        self.duration_ms = None
+
+    def finish(self, completed_count: int, completed_at: datetime, duration_ms: int) -> None:
+        """
+        全部标的处理结束时调用：全部完成为 completed，部分完成为 partial，均未完成为 failed。
+        """
+        if completed_count >= len(self.symbols):
+            self.status = "completed"
+        elif completed_count > 0:
+            self.status = "partial"
+        else:
+            self.status = "failed"
+        self.completed_at = completed_at
+        self.duration_ms = duration_ms
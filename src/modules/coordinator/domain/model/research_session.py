@@ -25,6 +25,8 @@ class ResearchSession(BaseModel):
     duration_ms: int | None = None
     retry_count: int = 0
     parent_session_id: UUID | None = None
+    batch_id: UUID | None = None
+    latency_breakdown: dict[str, Any] | None = None  # 各阶段完成时间点（毫秒）与辩论模式等指标
 
     def complete(self, completed_at: datetime, duration_ms: int) -> None:
         """全部节点成功完成时调用，更新为 completed。"""
@@ -2,6 +2,8 @@
 IDebateGateway：Coordinator 调用 Debate 模块的 Port。
 
 仅定义接口签名，由 Infrastructure 的 DebateGatewayAdapter 实现。
+run_advocacy / advocacy_outdated / run_resolution 供增量辩论分阶段调用：达到法定专家数后提前论证，
+后到结果未实质改变输入时沿用早先论证。默认实现不拆分阶段（论证推迟到 run_resolution 时整体执行）。
 """
 
 from abc import ABC, abstractmethod
@@ -24,3 +26,28 @@ class IDebateGateway(ABC):
             辩论结果 dict（如 DebateOutcomeDTO.model_dump()）
         """
         raise NotImplementedError
+
+    async def run_advocacy(self, symbol: str, expert_results: dict[str, Any]) -> dict[str, Any]:
+        """
+        论证阶段：基于当前已到达的专家结果生成多空论证。
+
+        Returns:
+            论证结果 dict，原样交给 run_resolution
+        """
+        return {"expert_results": dict(expert_results)}
+
+    def advocacy_outdated(
+        self, advocated_results: dict[str, Any], expert_results: dict[str, Any]
+    ) -> bool:
+        """
+        后到的专家结果是否实质改变辩论输入（需要重新论证）。
+
+        Args:
+            advocated_results: 发起论证时使用的专家结果
+            expert_results: 全部专家结果
+        """
+        return advocated_results != expert_results
+
+    async def run_resolution(self, symbol: str, advocacy: dict[str, Any]) -> dict[str, Any]:
+        """消解阶段：基于 run_advocacy 的结果完成辩论，返回与 run_debate 相同结构的 dict。"""
+        return await self.run_debate(symbol=symbol, expert_results=advocacy["expert_results"])
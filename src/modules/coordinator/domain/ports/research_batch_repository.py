@@ -0,0 +1,58 @@
+"""
+批量研究持久化 Port。
+
+由批量研究应用服务使用，实现位于 infrastructure/persistence。
+"""
+
+from abc import ABC, abstractmethod
+from datetime import datetime
+from uuid import UUID
+
+from src.modules.coordinator.domain.model.research_batch import ResearchBatch
+from src.modules.coordinator.domain.model.research_session import (
+    ResearchSession,
+)
+
+
+class IResearchBatchRepository(ABC):
+    """批量研究仓储抽象。"""
+
+    @abstractmethod
+    async def save_batch(self, batch: ResearchBatch) -> None:
+        """持久化新批次（创建）。"""
+        ...
+
+    @abstractmethod
+    async def update_batch(self, batch: ResearchBatch) -> None:
+        """更新批次（状态、completed_at、duration_ms）。"""
+        ...
+
+    @abstractmethod
+    async def claim_lease(
+        self, batch_id: UUID, owner: UUID, now: datetime, expired_before: datetime
+    ) -> bool:
+        """
+        条件获取执行租约：无人持有或 heartbeat_at 早于 expired_before 时写入 owner 与 now。
+        返回是否获取成功（检查与写入须为同一条件更新，避免两个续跑请求同时成功）。
+        """
+        ...
+
+    @abstractmethod
+    async def renew_lease(self, batch_id: UUID, owner: UUID, now: datetime) -> bool:
+        """续约：仍由 owner 持有时更新 heartbeat_at，返回是否仍持有。"""
+        ...
+
+    @abstractmethod
+    async def release_lease(self, batch_id: UUID, owner: UUID) -> None:
+        """释放 owner 持有的租约。"""
+        ...
+
+    @abstractmethod
+    async def get_batch_by_id(self, batch_id: UUID) -> ResearchBatch | None:
+        """按 ID 查询批次，不存在返回 None。"""
+        ...
+
+    @abstractmethod
+    async def list_batch_sessions(self, batch_id: UUID) -> list[ResearchSession]:
+        """查询批次下的全部研究会话，按 created_at 升序。"""
+        ...
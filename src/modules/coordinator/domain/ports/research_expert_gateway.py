@@ -33,3 +33,21 @@ class IResearchExpertGateway(ABC):
             专家的分析结果字典，统一为 dict[str, Any]
         """
         ...
+
+    async def prefetch(
+        self,
+        symbol: str,
+        expert_types: list[ExpertType],
+        options: dict[str, Any] | None = None,
+    ) -> None:
+        """
+        在专家并行执行前预取多个专家共用的数据，供本次研究会话内复用。
+
+        默认不预取；失败不应中断编排（专家执行时自行查询）。
+
+        Args:
+            symbol: 股票代码
+            expert_types: 本次执行的专家类型
+            options: 与 run_expert 相同结构的各专家参数（按专家类型取值）
+        """
+        return None
@@ -24,7 +24,7 @@ class IResearchSessionRepository(ABC):
 
     @abstractmethod
     async def update_session(self, session: ResearchSession) -> None:
-        """更新会话（状态、completed_at、duration_ms）。"""
+        """更新会话（状态、completed_at、duration_ms、latency_breakdown）。"""
         ...
 
     @abstractmethod
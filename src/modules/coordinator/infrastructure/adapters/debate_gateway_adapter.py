@@ -1,16 +1,27 @@
 """
 DebateGatewayAdapter：实现 IDebateGateway，将会话隔离、per-expert 字段映射、过滤调试字段，
 调用 DebateContainer → DebateService，返回 dict。
+
+增量辩论时分阶段调用 DebateService.advocate / resolve，由 DebateInputDriftDetector 判定后到结果
+是否实质改变辩论输入。
 """
 
 from typing import Any
 
 from src.modules.coordinator.domain.ports.debate_gateway import IDebateGateway
+from src.modules.coordinator.infrastructure.config import coordinator_config
 from src.modules.debate.container import DebateContainer
+from src.modules.debate.domain.dtos.bull_bear_argument import (
+    BearArgument,
+    BullArgument,
+)
 from src.modules.debate.domain.dtos.debate_input import (
     DebateInput,
     ExpertSummary,
 )
+from src.modules.debate.domain.services.debate_input_drift import (
+    DebateInputDriftDetector,
+)
 
 # 专家类型到 (signal_key, confidence_key, reasoning_key, risk_key) 的映射；
 # risk 可能为 list，需 join 为字符串
@@ -115,19 +126,52 @@ class DebateGatewayAdapter(IDebateGateway):
         Debate 模块不依赖 DB，run_debate 内不创建 AsyncSession。
         """
         self._session_factory = session_factory
+        self._drift_detector = DebateInputDriftDetector(
+            shift_threshold=coordinator_config.DEBATE_INCREMENTAL_SHIFT_THRESHOLD
+        )
 
     async def run_debate(self, symbol: str, expert_results: dict[str, Any]) -> dict[str, Any]:
         """
         仅包含成功的专家结果（由调用方保证）；过滤调试字段，按映射表归一化为 ExpertSummary，
         调用 DebateService.run 后返回 .model_dump()。
         """
-        summaries: dict[str, ExpertSummary] = {}
-        for expert_key, payload in expert_results.items():
-            summary = _expert_result_to_summary(expert_key, payload)
-            if summary is not None:
-                summaries[expert_key] = summary
-        debate_input = DebateInput(symbol=symbol, expert_summaries=summaries)
-        container = DebateContainer()
-        service = container.debate_service()
+        debate_input = _to_debate_input(symbol, expert_results)
+        service = DebateContainer().debate_service()
         outcome = await service.run(debate_input)
         return outcome.model_dump()
+
+    async def run_advocacy(self, symbol: str, expert_results: dict[str, Any]) -> dict[str, Any]:
+        """调用 DebateService.advocate，返回多空论证的 dict 形式。"""
+        debate_input = _to_debate_input(symbol, expert_results)
+        bull, bear = await DebateContainer().debate_service().advocate(debate_input)
+        return {"bull": bull.model_dump(), "bear": bear.model_dump()}
+
+    def advocacy_outdated(
+        self, advocated_results: dict[str, Any], expert_results: dict[str, Any]
+    ) -> bool:
+        """归一化为 DebateInput 后由 DebateInputDriftDetector 判定（symbol 不参与比较）。"""
+        return self._drift_detector.is_material_change(
+            _to_debate_input("", advocated_results), _to_debate_input("", expert_results)
+        )
+
+    async def run_resolution(self, symbol: str, advocacy: dict[str, Any]) -> dict[str, Any]:
+        """调用 DebateService.resolve，返回 DebateOutcomeDTO 的 dict 形式。"""
+        outcome = (
+            await DebateContainer()
+            .debate_service()
+            .resolve(
+                symbol,
+                BullArgument(**advocacy["bull"]),
+                BearArgument(**advocacy["bear"]),
+            )
+        )
+        return outcome.model_dump()
+
+
+def _to_debate_input(symbol: str, expert_results: dict[str, Any]) -> DebateInput:
+    summaries: dict[str, ExpertSummary] = {}
+    for expert_key, payload in expert_results.items():
+        summary = _expert_result_to_summary(expert_key, payload)
+        if summary is not None:
+            summaries[expert_key] = summary
+    return DebateInput(symbol=symbol, expert_summaries=summaries)
@@ -15,6 +15,18 @@ from src.modules.coordinator.domain.ports.research_expert_gateway import (
     IResearchExpertGateway,
 )
 from src.modules.research.container import ResearchContainer
+from src.modules.research.infrastructure.session_data import (
+    ResearchDataPrefetcher,
+)
+
+# 需要股票基础信息的专家
+_STOCK_BASIC_INFO_EXPERTS = {
+    ExpertType.VALUATION_MODELER,
+    ExpertType.MACRO_INTELLIGENCE,
+    ExpertType.CATALYST_DETECTIVE,
+}
+# 估值建模师读取的财务指标期数（见 ValuationModelerService）
+_VALUATION_FINANCE_LIMIT = 8
 
 
 class ResearchGatewayAdapter(IResearchExpertGateway):
@@ -33,6 +45,36 @@ class ResearchGatewayAdapter(IResearchExpertGateway):
         """
         self._session_factory = session_factory
 
+    @staticmethod
+    def _financial_auditor_limit(opts: dict[str, Any]) -> int:
+        return int(opts.get("financial_auditor", {}).get("limit", 8))
+
+    async def prefetch(
+        self,
+        symbol: str,
+        expert_types: list[ExpertType],
+        options: dict[str, Any] | None = None,
+    ) -> None:
+        """
+        并发预取多个专家共用的股票基础信息与财务指标，写入当前会话数据上下文。
+        只有一个专家需要的数据（含期数不同的财务指标）不预取，由其自行查询。
+        """
+        options = options or {}
+        selected = set(expert_types)
+        finance_limits = []
+        if ExpertType.FINANCIAL_AUDITOR in selected:
+            finance_limits.append(
+                self._financial_auditor_limit(options.get(ExpertType.FINANCIAL_AUDITOR.value, {}))
+            )
+        if ExpertType.VALUATION_MODELER in selected:
+            finance_limits.append(_VALUATION_FINANCE_LIMIT)
+
+        await ResearchDataPrefetcher(self._session_factory).prefetch(
+            symbol,
+            stock_basic_info=len(selected & _STOCK_BASIC_INFO_EXPERTS) > 1,
+            finance_limits=finance_limits if len(set(finance_limits)) < len(finance_limits) else (),
+        )
+
     def _parse_analysis_date(self, value: Any) -> date:
         """将 options 中的 analysis_date（str 或 date）解析为 date。"""
         if value is None:
@@ -69,10 +111,9 @@ class ResearchGatewayAdapter(IResearchExpertGateway):
                     return result
 
                 case ExpertType.FINANCIAL_AUDITOR:
-                    expert_opts = opts.get("financial_auditor", {})
-                    limit = expert_opts.get("limit", 8)
+                    limit = self._financial_auditor_limit(opts)
                     auditor_svc = research.financial_auditor_service()
-                    result = await auditor_svc.run(symbol=symbol, limit=int(limit))
+                    result = await auditor_svc.run(symbol=symbol, limit=limit)
                     return result
 
                 case ExpertType.VALUATION_MODELER:
@@ -0,0 +1,29 @@
+"""
+Coordinator 模块专属配置。
+"""
+
+from pydantic_settings import BaseSettings
+
+
+class CoordinatorConfig(BaseSettings):
+    """Coordinator 模块配置：批量研究的并发 worker 数、单批标的上限与执行租约、增量辩论。"""
+
+    # 批量研究：同时执行研究编排的标的数（各标的内部专家仍并行，LLM 与博查调用受全进程预算约束）
+    RESEARCH_BATCH_CONCURRENCY: int = 4
+    RESEARCH_BATCH_MAX_SYMBOLS: int = 100
+    # 批量研究执行租约：执行中每 HEARTBEAT 秒续约一次，超过 LEASE 秒未续约视为执行方已中断，才允许续跑
+    RESEARCH_BATCH_LEASE_SECONDS: int = 60
+    RESEARCH_BATCH_HEARTBEAT_SECONDS: int = 15
+    # 增量辩论：已完成专家数达到法定数（不超过选中专家数）即提前发起多空论证，不等待最慢的专家；
+    # 后到结果使置信度加权多空倾向变动达到阈值（或跨越偏空/中性/偏多区间）时重新论证（额外消耗 token，默认关闭）
+    DEBATE_INCREMENTAL_ENABLED: bool = False
+    DEBATE_INCREMENTAL_QUORUM: int = 3
+    DEBATE_INCREMENTAL_SHIFT_THRESHOLD: float = 0.25
+
+    class Config:
+        case_sensitive = True
+        env_file = ".env"
+        extra = "ignore"
+
+
+coordinator_config = CoordinatorConfig()
@@ -1,14 +1,23 @@
 """
 LangGraph 研究编排图构建。
 
-包含：通用专家节点工厂、5 个专家节点、Send 路由函数、聚合节点、debate 节点、图编译。
-当提供 session_repo 时，专家节点、debate、judge 均用 persist_node_execution 包装以持久化节点执行。
+包含：数据预取节点、通用专家节点工厂、5 个专家节点、Send 路由函数、聚合节点、debate 节点、图编译。
+persist=True 时，专家节点、debate、judge 均用 persist_node_execution 包装以持久化节点执行。
+
+图结构只由 (with_debate, with_judge, persist) 决定，编译结果按该组合缓存、进程内复用；
+Gateway、session_repo 等每次请求的依赖不进入闭包，而是经 config["configurable"] 传入
+（键见 research_graph_config），节点执行时读取。
+
+传入 incremental_debate 时，专家节点完成即把结果交给增量辩论（达到法定数提前论证），
+debate 节点改由其完成辩论；传入 timeline 时各节点记录完成时间点。
 """
 
 import logging
 from collections.abc import Callable
+from functools import lru_cache
 from typing import Any
 
+from langchain_core.runnables import RunnableConfig
 from langgraph.graph import END, START, StateGraph
 from langgraph.types import Send
 
@@ -22,9 +31,15 @@ from src.modules.coordinator.domain.ports.research_session_repository import (
 from src.modules.coordinator.infrastructure.orchestration.graph_state import (
     ResearchGraphState,
 )
+from src.modules.coordinator.infrastructure.orchestration.incremental_debate import (
+    IncrementalDebate,
+)
 from src.modules.coordinator.infrastructure.orchestration.node_persistence_wrapper import (
     persist_node_execution,
 )
+from src.modules.coordinator.infrastructure.orchestration.pipeline_timeline import (
+    PipelineTimeline,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -38,10 +53,62 @@ EXPERT_NODE_NAMES = {
 }
 
 
-def create_expert_node(
-    expert_type: ExpertType,
+def research_graph_config(
     gateway: IResearchExpertGateway,
-) -> Callable[[ResearchGraphState], dict[str, Any]]:
+    debate_gateway: Any = None,
+    judge_gateway: Any = None,
+    session_repo: IResearchSessionRepository | None = None,
+    incremental_debate: IncrementalDebate | None = None,
+    timeline: PipelineTimeline | None = None,
+) -> RunnableConfig:
+    """构造一次图执行的 config：各节点从 config["configurable"] 读取本次请求的依赖。"""
+    return {
+        "configurable": {
+            "gateway": gateway,
+            "debate_gateway": debate_gateway,
+            "judge_gateway": judge_gateway,
+            "session_repo": session_repo,
+            "incremental_debate": incremental_debate,
+            "timeline": timeline,
+        }
+    }
+
+
+def _dependency(config: RunnableConfig, name: str) -> Any:
+    return (config.get("configurable") or {}).get(name)
+
+
+def _mark(config: RunnableConfig, event: str) -> None:
+    timeline = _dependency(config, "timeline")
+    if timeline is not None:
+        timeline.mark(event)
+
+
+def create_prefetch_node() -> Callable[..., Any]:
+    """
+    数据预取节点工厂：专家 fan-out 前调用 gateway.prefetch，并发加载多个专家共用的数据
+    到会话数据上下文。预取失败只记录日志，不影响专家执行（专家自行查询）。
+    """
+
+    async def prefetch_node(state: ResearchGraphState, config: RunnableConfig) -> dict[str, Any]:
+        selected = [ExpertType(v) for v in state.get("selected_experts") or []]
+        if selected:
+            try:
+                await _dependency(config, "gateway").prefetch(
+                    symbol=state["symbol"],
+                    expert_types=selected,
+                    options=state.get("options") or {},
+                )
+            except Exception as e:
+                logger.warning("研究数据预取失败，专家将自行查询: %s", e)
+        _mark(config, "prefetch_done")
+        return {}
+
+    prefetch_node.__name__ = "prefetch_node"
+    return prefetch_node
+
+
+def create_expert_node(expert_type: ExpertType) -> Callable[..., Any]:
     """
     专家节点工厂：为指定专家类型生成图节点函数。
 
@@ -49,14 +116,18 @@ def create_expert_node(
     """
     node_name = EXPERT_NODE_NAMES[expert_type]
 
-    async def expert_node(state: ResearchGraphState) -> dict[str, Any]:
+    async def expert_node(state: ResearchGraphState, config: RunnableConfig) -> dict[str, Any]:
         options = state.get("options") or {}
         expert_opts = options.get(expert_type.value, {})
-        result = await gateway.run_expert(
+        result = await _dependency(config, "gateway").run_expert(
             expert_type=expert_type,
             symbol=state["symbol"],
             options=expert_opts,
         )
+        _mark(config, f"{expert_type.value}_done")
+        incremental = _dependency(config, "incremental_debate")
+        if incremental is not None:
+            incremental.on_expert_result(expert_type.value, result)
         return {"results": {expert_type.value: result}}
 
     expert_node.__name__ = node_name
@@ -67,7 +138,7 @@ def route_to_experts(state: ResearchGraphState) -> list[Send]:
     """
     路由函数：读取 selected_experts，为每个选中的专家返回 Send(node_name, state)。
 
-    用于 add_conditional_edges(START, route_to_experts)，实现按需并行 fan-out。
+    用于 add_conditional_edges("prefetch_node", route_to_experts)，实现按需并行 fan-out。
     """
     selected = state.get("selected_experts") or []
     sends: list[Send] = []
@@ -78,10 +149,11 @@ def route_to_experts(state: ResearchGraphState) -> list[Send]:
     return sends
 
 
-def create_aggregator_node() -> Callable[[ResearchGraphState], dict[str, Any]]:
+def create_aggregator_node() -> Callable[..., dict[str, Any]]:
     """聚合节点：根据 results 设置 overall_status。专家失败时流程已停止，无需处理 errors。"""
 
-    def aggregator_node(state: ResearchGraphState) -> dict[str, Any]:
+    def aggregator_node(state: ResearchGraphState, config: RunnableConfig) -> dict[str, Any]:
+        _mark(config, "experts_done")
         results = state.get("results") or {}
         overall_status = "completed" if results else "failed"
         return {"overall_status": overall_status}
@@ -89,15 +161,14 @@ def create_aggregator_node() -> Callable[[ResearchGraphState], dict[str, Any]]:
     return aggregator_node
 
 
-def create_debate_node(
-    debate_gateway: Any,
-) -> Callable[[ResearchGraphState], dict[str, Any]]:
+def create_debate_node() -> Callable[..., Any]:
     """
     debate 节点工厂：读取 results/overall_status，全部失败时跳过辩论；
-    否则调用 IDebateGateway.run_debate；异常时记录日志并降级（debate_outcome 为空 dict）。
+    否则调用 IDebateGateway.run_debate（增量辩论时由 IncrementalDebate.finalize 完成）；
+    异常时记录日志并降级（debate_outcome 为空 dict）。
     """
 
-    async def debate_node(state: ResearchGraphState) -> dict[str, Any]:
+    async def debate_node(state: ResearchGraphState, config: RunnableConfig) -> dict[str, Any]:
         overall_status = state.get("overall_status") or "failed"
         results = state.get("results") or {}
         symbol = state.get("symbol") or ""
@@ -105,26 +176,32 @@ def create_debate_node(
         if overall_status == "failed" or not results:
             return {"debate_outcome": {}}
 
+        incremental = _dependency(config, "incremental_debate")
         try:
-            outcome = await debate_gateway.run_debate(symbol=symbol, expert_results=results)
+            if incremental is not None:
+                outcome = await incremental.finalize(results)
+            else:
+                outcome = await _dependency(config, "debate_gateway").run_debate(
+                    symbol=symbol, expert_results=results
+                )
             return {"debate_outcome": outcome}
         except Exception as e:
             logger.warning("辩论节点执行失败，降级为空结果: %s", e)
             return {"debate_outcome": {}}
+        finally:
+            _mark(config, "debate_done")
 
     debate_node.__name__ = "debate_node"
     return debate_node
 
 
-def create_judge_node(
-    judge_gateway: Any,
-) -> Callable[[ResearchGraphState], dict[str, Any]]:
+def create_judge_node() -> Callable[..., Any]:
     """
     judge 节点工厂：读取 debate_outcome，为空时跳过裁决；
     否则调用 IJudgeGateway.run_verdict；异常时记录日志并降级（verdict 为空 dict）。
     """
 
-    async def judge_node(state: ResearchGraphState) -> dict[str, Any]:
+    async def judge_node(state: ResearchGraphState, config: RunnableConfig) -> dict[str, Any]:
         debate_outcome = state.get("debate_outcome") or {}
         symbol = state.get("symbol") or ""
 
@@ -132,55 +209,57 @@ def create_judge_node(
             return {"verdict": {}}
 
         try:
-            verdict = await judge_gateway.run_verdict(symbol=symbol, debate_outcome=debate_outcome)
+            verdict = await _dependency(config, "judge_gateway").run_verdict(
+                symbol=symbol, debate_outcome=debate_outcome
+            )
             return {"verdict": verdict}
         except Exception as e:
             logger.warning("裁决节点执行失败，降级为空结果: %s", e)
             return {"verdict": {}}
+        finally:
+            _mark(config, "judge_done")
 
     judge_node.__name__ = "judge_node"
     return judge_node
 
 
 def build_research_graph(
-    gateway: IResearchExpertGateway,
-    debate_gateway: Any = None,
-    judge_gateway: Any = None,
-    session_repo: IResearchSessionRepository | None = None,
+    with_debate: bool = False,
+    with_judge: bool = False,
+    persist: bool = False,
 ) -> Any:
     """
-    构建并编译研究编排图。
+    构建并编译研究编排图（每次调用都重新编译，请求路径上应使用 get_research_graph）。
 
-    - debate_gateway 和 judge_gateway 均不为 None：aggregator -> debate_node -> judge_node -> END
-    - 仅 debate_gateway 不为 None：aggregator -> debate_node -> END
-    - debate_gateway 为 None：aggregator -> END（不接入辩论与裁决）
-    - session_repo 不为 None 时，专家节点、debate、judge 均用 persist_node_execution 包装以持久化节点执行。
+    - with_debate 且 with_judge：aggregator -> debate_node -> judge_node -> END
+    - 仅 with_debate：aggregator -> debate_node -> END
+    - 非 with_debate：aggregator -> END（不接入辩论与裁决，with_judge 无效）
+    - persist 时，专家节点、debate、judge 均用 persist_node_execution 包装以持久化节点执行。
+    - START -> prefetch_node（预取专家共用数据）-> 按 selected_experts 并行 fan-out 到专家节点。
     """
     builder = StateGraph(ResearchGraphState)
 
     def _wrap_if_persist(fn: Callable, node_type: str) -> Callable:
-        if session_repo is not None:
-            return persist_node_execution(fn, node_type, session_repo)
+        if persist:
+            return persist_node_execution(fn, node_type)
         return fn
 
     # 注册 5 个专家节点
     for expert_type in ExpertType:
         node_name = EXPERT_NODE_NAMES[expert_type]
-        node_fn = create_expert_node(expert_type, gateway)
+        node_fn = create_expert_node(expert_type)
         node_fn = _wrap_if_persist(node_fn, expert_type.value)
         builder.add_node(node_name, node_fn)
 
     # 聚合节点
     builder.add_node("aggregator_node", create_aggregator_node())
 
-    if debate_gateway is not None:
-        debate_fn = create_debate_node(debate_gateway)
-        debate_fn = _wrap_if_persist(debate_fn, "debate")
+    if with_debate:
+        debate_fn = _wrap_if_persist(create_debate_node(), "debate")
         builder.add_node("debate_node", debate_fn)
         builder.add_edge("aggregator_node", "debate_node")
-        if judge_gateway is not None:
-            judge_fn = create_judge_node(judge_gateway)
-            judge_fn = _wrap_if_persist(judge_fn, "judge")
+        if with_judge:
+            judge_fn = _wrap_if_persist(create_judge_node(), "judge")
             builder.add_node("judge_node", judge_fn)
             builder.add_edge("debate_node", "judge_node")
             builder.add_edge("judge_node", END)
@@ -189,11 +268,30 @@ def build_research_graph(
     else:
         builder.add_edge("aggregator_node", END)
 
-    # START -> 路由函数（返回 Send 列表，动态 fan-out 到选中的专家节点）
-    builder.add_conditional_edges(START, route_to_experts)
+    # START -> 预取节点 -> 路由函数（返回 Send 列表，动态 fan-out 到选中的专家节点）
+    builder.add_node("prefetch_node", create_prefetch_node())
+    builder.add_edge(START, "prefetch_node")
+    builder.add_conditional_edges("prefetch_node", route_to_experts)
 
     # 各专家节点 -> 聚合节点
     for node_name in EXPERT_NODE_NAMES.values():
         builder.add_edge(node_name, "aggregator_node")
 
     return builder.compile()
+
+
+def get_research_graph(with_debate: bool, with_judge: bool, persist: bool) -> Any:
+    """
+    获取编译好的研究编排图（按结构组合缓存，至多 6 个变体）。
+
+    编译后的图不含检查点、不持有请求状态，可被并发请求共用。
+    """
+    # 不辩论时裁决节点不接入图，归并为同一变体
+    return _compiled_research_graph(
+        bool(with_debate), bool(with_debate and with_judge), bool(persist)
+    )
+
+
+@lru_cache(maxsize=None)
+def _compiled_research_graph(with_debate: bool, with_judge: bool, persist: bool) -> Any:
+    return build_research_graph(with_debate=with_debate, with_judge=with_judge, persist=persist)
@@ -0,0 +1,101 @@
+"""
+增量辩论：专家结果陆续到达时提前发起多空论证，不让最慢的专家阻塞整个辩论。
+
+编排器为一次研究创建 IncrementalDebate，经 config["configurable"]["incremental_debate"] 传给图节点：
+- 专家节点成功后调用 on_expert_result；已完成专家数达到法定数时后台发起论证（IDebateGateway.run_advocacy）；
+- debate 节点在全部专家完成后调用 finalize：后到结果未实质改变输入（IDebateGateway.advocacy_outdated）
+  时沿用提前生成的论证，否则取消并基于全部结果重新论证；随后执行消解阶段（run_resolution）。
+"""
+
+import asyncio
+import logging
+from typing import Any
+
+from src.modules.coordinator.domain.ports.debate_gateway import IDebateGateway
+from src.modules.coordinator.infrastructure.orchestration.pipeline_timeline import (
+    PipelineTimeline,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class IncrementalDebate:
+    """单次研究的增量辩论状态（在同一事件循环内使用）。"""
+
+    def __init__(
+        self,
+        debate_gateway: IDebateGateway,
+        symbol: str,
+        quorum: int,
+        timeline: PipelineTimeline | None = None,
+        initial_results: dict[str, Any] | None = None,
+    ) -> None:
+        """
+        Args:
+            quorum: 发起论证所需的已完成专家数（调用方按实际专家数截断）
+            initial_results: 已有的专家结果（重试时复用的成功结果），计入法定数
+        """
+        self._gateway = debate_gateway
+        self._symbol = symbol
+        self._quorum = max(1, quorum)
+        self._timeline = timeline or PipelineTimeline()
+        self._results: dict[str, Any] = dict(initial_results or {})
+        self._advocated: dict[str, Any] | None = None
+        self._task: asyncio.Task | None = None
+        self._timeline.set("debate_mode", "incremental")
+        self._timeline.set("debate_quorum", self._quorum)
+
+    def on_expert_result(self, expert_key: str, result: Any) -> None:
+        """记录一个专家结果；达到法定数且尚未发起论证时后台发起。"""
+        self._results[expert_key] = result
+        if self._task is None and len(self._results) >= self._quorum:
+            self._advocated = dict(self._results)
+            self._task = asyncio.create_task(
+                self._gateway.run_advocacy(symbol=self._symbol, expert_results=self._advocated)
+            )
+            self._timeline.mark("advocacy_started")
+            self._timeline.set("advocacy_experts", sorted(self._advocated))
+
+    async def finalize(self, expert_results: dict[str, Any]) -> dict[str, Any]:
+        """
+        全部专家完成后完成辩论：沿用或重新生成多空论证，再执行消解阶段。
+        论证或消解异常向上传播，由 debate 节点降级处理。
+        """
+        advocacy: dict[str, Any] | None = None
+        if self._task is not None:
+            if self._gateway.advocacy_outdated(self._advocated or {}, expert_results):
+                self.cancel()
+                logger.info(
+                    "后到专家结果实质改变辩论输入，重新论证: symbol=%s, 提前论证专家=%s",
+                    self._symbol,
+                    sorted(self._advocated or {}),
+                )
+            else:
+                try:
+                    advocacy = await self._task
+                except Exception as e:
+                    logger.warning("提前发起的多空论证失败，基于全部结果重新论证: %s", e)
+
+        if advocacy is None:
+            if self._task is not None:
+                self._timeline.set("advocacy_reissued", True)
+                self._timeline.mark("advocacy_reissued")
+            else:
+                self._timeline.mark("advocacy_started")
+            advocacy = await self._gateway.run_advocacy(
+                symbol=self._symbol, expert_results=expert_results
+            )
+        else:
+            self._timeline.set("advocacy_reissued", False)
+        self._timeline.mark("advocacy_done")
+        return await self._gateway.run_resolution(symbol=self._symbol, advocacy=advocacy)
+
+    def cancel(self) -> None:
+        """取消仍在进行的提前论证（研究异常结束或跳过辩论时调用）。"""
+        if self._task is None:
+            return
+        if not self._task.done():
+            self._task.cancel()
+        elif not self._task.cancelled():
+            # 已结束的论证不再使用，取出异常避免 "exception was never retrieved" 警告
+            self._task.exception()
@@ -25,11 +25,20 @@ from src.modules.coordinator.domain.ports.research_orchestration import (
 from src.modules.coordinator.domain.ports.research_session_repository import (
     IResearchSessionRepository,
 )
+from src.modules.coordinator.infrastructure.config import coordinator_config
 from src.modules.coordinator.infrastructure.orchestration.graph_builder import (
-    build_research_graph,
+    get_research_graph,
+    research_graph_config,
+)
+from src.modules.coordinator.infrastructure.orchestration.incremental_debate import (
+    IncrementalDebate,
+)
+from src.modules.coordinator.infrastructure.orchestration.pipeline_timeline import (
+    PipelineTimeline,
 )
 from src.shared.infrastructure.execution_context import (
     ExecutionContext,
+    SessionDataContext,
     current_execution_ctx,
 )
 
@@ -42,7 +51,9 @@ class LangGraphResearchOrchestrator(IResearchOrchestrationPort):
 
     接收 IResearchExpertGateway，可选 IDebateGateway、IJudgeGateway、IResearchSessionRepository；
     skip_debate 时辩论与裁决均跳过；在 run() 中创建 ResearchSession、设置 ExecutionContext、
-    执行图、更新 session 状态并重置 context，最后将 state 转为 ResearchResult。
+    执行图、更新 session 状态（含各阶段耗时 latency_breakdown）并重置 context，最后将 state 转为 ResearchResult。
+    incremental_debate 为 True 时（默认取 DEBATE_INCREMENTAL_ENABLED）达到法定专家数即提前发起多空论证。
+    llm_priority 写入 ExecutionContext，作为本次编排内 LLM 调用的默认调度优先级（批量研究传 BATCH）。
     """
 
     def __init__(
@@ -51,17 +62,27 @@ class LangGraphResearchOrchestrator(IResearchOrchestrationPort):
         debate_gateway: Any = None,
         judge_gateway: Any = None,
         session_repo: IResearchSessionRepository | None = None,
+        incremental_debate: bool | None = None,
+        llm_priority: int = 0,
     ) -> None:
         self._gateway = gateway
         self._debate_gateway = debate_gateway
         self._judge_gateway = judge_gateway
         self._session_repo = session_repo
+        self._llm_priority = llm_priority
+        self._incremental_debate = (
+            coordinator_config.DEBATE_INCREMENTAL_ENABLED
+            if incremental_debate is None
+            else incremental_debate
+        )
 
     async def run(self, request: ResearchRequest) -> ResearchResult:
         """执行研究编排，返回汇总结果。"""
         started_at = datetime.utcnow()
+        timeline = PipelineTimeline()
         session: ResearchSession | None = None
         token = None
+        incremental: IncrementalDebate | None = None
 
         if self._session_repo is not None:
             session = ResearchSession(
@@ -70,22 +91,41 @@ class LangGraphResearchOrchestrator(IResearchOrchestrationPort):
                 status="running",
                 selected_experts=[e.value for e in request.experts],
                 options=request.options,
-                trigger_source="api",
+                trigger_source="batch" if request.batch_id else "api",
                 created_at=started_at,
                 retry_count=request.retry_count,
                 parent_session_id=request.parent_session_id,
+                batch_id=request.batch_id,
             )
             await self._session_repo.save_session(session)
-            token = current_execution_ctx.set(ExecutionContext(session_id=str(session.id)))
+            # 会话数据上下文：预取节点加载的共用数据供本会话内各专家复用
+            token = current_execution_ctx.set(
+                ExecutionContext(
+                    session_id=str(session.id),
+                    data=SessionDataContext(),
+                    priority=self._llm_priority,
+                )
+            )
 
         try:
             debate_gw = None if request.skip_debate else self._debate_gateway
             judge_gw = None if request.skip_debate else self._judge_gateway
-            graph = build_research_graph(
-                self._gateway,
-                debate_gateway=debate_gw,
-                judge_gateway=judge_gw,
-                session_repo=self._session_repo,
+            if debate_gw is not None and self._incremental_debate:
+                expert_count = len(request.experts) + len(request.pre_populated_results or {})
+                incremental = IncrementalDebate(
+                    debate_gw,
+                    symbol=request.symbol,
+                    quorum=min(coordinator_config.DEBATE_INCREMENTAL_QUORUM, expert_count),
+                    timeline=timeline,
+                    initial_results=request.pre_populated_results,
+                )
+            elif debate_gw is not None:
+                timeline.set("debate_mode", "standard")
+            # 图结构按 (辩论, 裁决, 持久化) 组合编译一次后复用，本次请求的依赖经 config 传入
+            graph = get_research_graph(
+                with_debate=debate_gw is not None,
+                with_judge=judge_gw is not None,
+                persist=self._session_repo is not None,
             )
 
             initial_state = {
@@ -95,7 +135,17 @@ class LangGraphResearchOrchestrator(IResearchOrchestrationPort):
                 "results": request.pre_populated_results or {},
             }
 
-            final_state = await graph.ainvoke(initial_state)
+            final_state = await graph.ainvoke(
+                initial_state,
+                config=research_graph_config(
+                    self._gateway,
+                    debate_gateway=debate_gw,
+                    judge_gateway=judge_gw,
+                    session_repo=self._session_repo,
+                    incremental_debate=incremental,
+                    timeline=timeline,
+                ),
+            )
 
             results = final_state.get("results") or {}
             overall_status = final_state.get("overall_status") or "failed"
@@ -149,7 +199,10 @@ class LangGraphResearchOrchestrator(IResearchOrchestrationPort):
 
             completed_at = datetime.utcnow()
             duration_ms = int((completed_at - started_at).total_seconds() * 1000)
+            latency_breakdown = timeline.as_dict()
+            logger.info("研究编排耗时: symbol=%s, %s", request.symbol, latency_breakdown)
             if session and self._session_repo is not None:
+                session.latency_breakdown = latency_breakdown
                 if overall_status == "completed":
                     session.complete(completed_at, duration_ms)
                 else:
@@ -170,6 +223,7 @@ class LangGraphResearchOrchestrator(IResearchOrchestrationPort):
             completed_at = datetime.utcnow()
             duration_ms = int((completed_at - started_at).total_seconds() * 1000)
             if session is not None and self._session_repo is not None:
+                session.latency_breakdown = timeline.as_dict()
                 session.fail(completed_at, duration_ms)
                 try:
                     await self._session_repo.update_session(session)
@@ -177,5 +231,7 @@ class LangGraphResearchOrchestrator(IResearchOrchestrationPort):
                     logger.warning("研究异常后会话状态更新失败: %s", update_err)
             raise
         finally:
+            if incremental is not None:
+                incremental.cancel()
             if token is not None:
                 current_execution_ctx.reset(token)
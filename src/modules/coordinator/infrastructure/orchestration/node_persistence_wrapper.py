@@ -1,7 +1,8 @@
 """
 节点执行持久化包装：包装 LangGraph 节点函数，在执行前后记录 NodeExecution。
 
-写入失败不阻塞主流程，仅记录 error 日志。
+IResearchSessionRepository 在执行时从 config["configurable"]["session_repo"] 读取，
+包装后的节点不持有请求级依赖，可随编译后的图缓存复用。写入失败不阻塞主流程，仅记录 error 日志。
 """
 
 import math
@@ -10,6 +11,7 @@ from datetime import datetime
 from typing import Any
 from uuid import uuid4
 
+from langchain_core.runnables import RunnableConfig
 from loguru import logger
 
 from src.modules.coordinator.domain.model.node_execution import NodeExecution
@@ -72,19 +74,21 @@ def _extract_result_and_narrative(
 
 
 def persist_node_execution(
-    node_fn: Callable[[ResearchGraphState], Any],
+    node_fn: Callable[[ResearchGraphState, RunnableConfig], Any],
     node_type: str,
-    session_repo: IResearchSessionRepository,
-) -> Callable[[ResearchGraphState], Any]:
+) -> Callable[[ResearchGraphState, RunnableConfig], Any]:
     """
     包装节点函数：记录 started_at → 执行 → 成功时记录 result/narrative，失败时记录 error → 写入 NodeExecution。
-    写入失败不阻塞，仅打 warning。
+    config 中无 session_repo 或无执行上下文时直接执行节点；写入失败不阻塞，仅打 warning。
     """
 
-    async def wrapper(state: ResearchGraphState) -> dict[str, Any]:
+    async def wrapper(state: ResearchGraphState, config: RunnableConfig) -> dict[str, Any]:
         ctx = current_execution_ctx.get()
-        if not ctx:
-            return await node_fn(state)
+        session_repo: IResearchSessionRepository | None = (config.get("configurable") or {}).get(
+            "session_repo"
+        )
+        if not ctx or session_repo is None:
+            return await node_fn(state, config)
 
         from uuid import UUID
 
@@ -98,7 +102,7 @@ def persist_node_execution(
             started_at=started_at,
         )
         try:
-            result = await node_fn(state)
+            result = await node_fn(state, config)
             completed_at = datetime.utcnow()
             duration_ms = int((completed_at - started_at).total_seconds() * 1000)
 
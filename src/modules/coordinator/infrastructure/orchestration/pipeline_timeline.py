@@ -0,0 +1,35 @@
+"""
+研究流水线耗时时间线：记录一次研究中各阶段相对开始时刻的完成时间（毫秒）。
+
+编排器每次执行创建一个实例，经 config["configurable"]["timeline"] 传给各节点；
+结束时写入 ResearchSession.latency_breakdown，用于分析最慢专家对辩论、裁决的拖累。
+"""
+
+import time
+from typing import Any
+
+
+class PipelineTimeline:
+    """单次研究的阶段时间点与相关指标。"""
+
+    def __init__(self) -> None:
+        self._started = time.monotonic()
+        self._entries: dict[str, Any] = {}
+
+    def elapsed_ms(self) -> int:
+        """距开始的毫秒数。"""
+        return int((time.monotonic() - self._started) * 1000)
+
+    def mark(self, event: str) -> int:
+        """记录事件 event 的发生时间（距开始毫秒数，同名事件以最后一次为准）。"""
+        elapsed = self.elapsed_ms()
+        self._entries[f"{event}_ms"] = elapsed
+        return elapsed
+
+    def set(self, key: str, value: Any) -> None:
+        """记录非时间类指标（如辩论模式、是否重新论证）。"""
+        self._entries[key] = value
+
+    def as_dict(self) -> dict[str, Any]:
+        """全部记录，附带 total_ms。"""
+        return {**self._entries, "total_ms": self.elapsed_ms()}
@@ -0,0 +1,39 @@
+"""
+批量研究 ORM 模型，映射表 research_batches。
+"""
+
+import uuid
+
+from sqlalchemy import Boolean, Column, DateTime, Integer, String
+from sqlalchemy.dialects.postgresql import JSONB, UUID
+
+from src.shared.infrastructure.db.base import Base
+
+
+class ResearchBatchModel(Base):
+    """批量研究表：一组标的的研究请求参数与整体状态，各标的会话经 research_sessions.batch_id 关联。"""
+
+    __tablename__ = "research_batches"
+
+    id = Column(
+        UUID(as_uuid=True),
+        primary_key=True,
+        default=uuid.uuid4,
+        comment="批次唯一标识",
+    )
+    symbols = Column(JSONB, nullable=False, comment="标的列表（按请求顺序）")
+    experts = Column(JSONB, nullable=False, comment="选中的专家列表")
+    options = Column(JSONB, nullable=True, comment="各专家执行选项")
+    skip_debate = Column(
+        Boolean, nullable=False, default=False, server_default="false", comment="是否跳过辩论"
+    )
+    status = Column(
+        String(20),
+        nullable=False,
+        comment="running / completed / partial / failed",
+    )
+    created_at = Column(DateTime, nullable=False, comment="创建时间")
+    completed_at = Column(DateTime, nullable=True, comment="完成时间")
+    duration_ms = Column(Integer, nullable=True, comment="最近一次执行耗时（毫秒）")
+    lease_owner = Column(UUID(as_uuid=True), nullable=True, comment="执行租约持有方")
+    heartbeat_at = Column(DateTime, nullable=True, comment="执行租约最近续约时间")
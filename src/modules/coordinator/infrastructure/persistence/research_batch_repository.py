@@ -0,0 +1,130 @@
+"""
+批量研究 PostgreSQL 仓储实现。
+"""
+
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy import or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.modules.coordinator.domain.model.research_batch import ResearchBatch
+from src.modules.coordinator.domain.model.research_session import (
+    ResearchSession,
+)
+from src.modules.coordinator.domain.ports.research_batch_repository import (
+    IResearchBatchRepository,
+)
+from src.modules.coordinator.infrastructure.persistence.research_batch_model import (
+    ResearchBatchModel,
+)
+from src.modules.coordinator.infrastructure.persistence.research_session_model import (
+    ResearchSessionModel,
+)
+from src.modules.coordinator.infrastructure.persistence.research_session_repository import (
+    _session_model_to_entity,
+)
+
+
+def _batch_model_to_entity(m: ResearchBatchModel) -> ResearchBatch:
+    """ORM 转批量研究实体。"""
+    return ResearchBatch(
+        id=m.id,
+        symbols=list(m.symbols or []),
+        experts=list(m.experts or []),
+        options=dict(m.options) if m.options else {},
+        skip_debate=bool(m.skip_debate),
+        status=m.status,
+        created_at=m.created_at,
+        completed_at=m.completed_at,
+        duration_ms=m.duration_ms,
+        lease_owner=m.lease_owner,
+        heartbeat_at=m.heartbeat_at,
+    )
+
+
+class PgResearchBatchRepository(IResearchBatchRepository):
+    """批量研究的 PostgreSQL 实现。"""
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def save_batch(self, batch: ResearchBatch) -> None:
+        self._session.add(
+            ResearchBatchModel(
+                id=batch.id,
+                symbols=batch.symbols,
+                experts=batch.experts,
+                options=batch.options,
+                skip_debate=batch.skip_debate,
+                status=batch.status,
+                created_at=batch.created_at,
+                completed_at=batch.completed_at,
+                duration_ms=batch.duration_ms,
+                lease_owner=batch.lease_owner,
+                heartbeat_at=batch.heartbeat_at,
+            )
+        )
+        await self._session.commit()
+
+    async def update_batch(self, batch: ResearchBatch) -> None:
+        await self._session.execute(
+            update(ResearchBatchModel)
+            .where(ResearchBatchModel.id == batch.id)
+            .values(
+                status=batch.status,
+                completed_at=batch.completed_at,
+                duration_ms=batch.duration_ms,
+            )
+        )
+        await self._session.commit()
+
+    async def claim_lease(
+        self, batch_id: UUID, owner: UUID, now: datetime, expired_before: datetime
+    ) -> bool:
+        result = await self._session.execute(
+            update(ResearchBatchModel)
+            .where(
+                ResearchBatchModel.id == batch_id,
+                or_(
+                    ResearchBatchModel.lease_owner.is_(None),
+                    ResearchBatchModel.heartbeat_at.is_(None),
+                    ResearchBatchModel.heartbeat_at < expired_before,
+                ),
+            )
+            .values(lease_owner=owner, heartbeat_at=now)
+        )
+        await self._session.commit()
+        return result.rowcount == 1
+
+    async def renew_lease(self, batch_id: UUID, owner: UUID, now: datetime) -> bool:
+        result = await self._session.execute(
+            update(ResearchBatchModel)
+            .where(ResearchBatchModel.id == batch_id, ResearchBatchModel.lease_owner == owner)
+            .values(heartbeat_at=now)
+        )
+        await self._session.commit()
+        return result.rowcount == 1
+
+    async def release_lease(self, batch_id: UUID, owner: UUID) -> None:
+        await self._session.execute(
+            update(ResearchBatchModel)
+            .where(ResearchBatchModel.id == batch_id, ResearchBatchModel.lease_owner == owner)
+            .values(lease_owner=None, heartbeat_at=None)
+        )
+        await self._session.commit()
+
+    async def get_batch_by_id(self, batch_id: UUID) -> ResearchBatch | None:
+        result = await self._session.execute(
+            select(ResearchBatchModel).where(ResearchBatchModel.id == batch_id)
+        )
+        model = result.scalar_one_or_none()
+        return _batch_model_to_entity(model) if model else None
+
+    async def list_batch_sessions(self, batch_id: UUID) -> list[ResearchSession]:
+        result = await self._session.execute(
+            select(ResearchSessionModel)
+            .where(ResearchSessionModel.batch_id == batch_id)
+            .order_by(ResearchSessionModel.created_at.asc())
+        )
+        return [_session_model_to_entity(m) for m in result.scalars().all()]
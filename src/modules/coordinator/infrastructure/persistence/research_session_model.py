@@ -7,6 +7,10 @@ import uuid
 from sqlalchemy import Column, DateTime, ForeignKey, Integer, String
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 
+# 外键 batch_id 的目标表需注册到同一 MetaData
+from src.modules.coordinator.infrastructure.persistence.research_batch_model import (  # noqa: F401
+    ResearchBatchModel,
+)
 from src.shared.infrastructure.db.base import Base
 
 
@@ -29,7 +33,9 @@ class ResearchSessionModel(Base):
     )
     selected_experts = Column(JSONB, nullable=True, comment="选中的专家列表")
     options = Column(JSONB, nullable=True, comment="执行选项")
-    trigger_source = Column(String(50), nullable=True, comment="触发来源（api / scheduler）")
+    trigger_source = Column(
+        String(50), nullable=True, comment="触发来源（api / batch / scheduler）"
+    )
     created_at = Column(DateTime, nullable=False, comment="创建时间")
     completed_at = Column(DateTime, nullable=True, comment="完成时间")
     duration_ms = Column(Integer, nullable=True, comment="总耗时（毫秒）")
@@ -46,3 +52,13 @@ class ResearchSessionModel(Base):
         nullable=True,
         comment="父会话标识，重试时指向源 session",
     )
+    batch_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("research_batches.id", ondelete="SET NULL"),
+        nullable=True,
+        index=True,
+        comment="所属批量研究标识，单标的研究为空",
+    )
+    latency_breakdown = Column(
+        JSONB, nullable=True, comment="各阶段完成时间点（毫秒）与辩论模式等耗时指标"
+    )
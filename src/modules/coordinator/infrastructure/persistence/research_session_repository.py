@@ -37,6 +37,8 @@ def _session_model_to_entity(m: ResearchSessionModel) -> ResearchSession:
         duration_ms=m.duration_ms,
         retry_count=m.retry_count or 0,
         parent_session_id=m.parent_session_id,
+        batch_id=m.batch_id,
+        latency_breakdown=dict(m.latency_breakdown) if m.latency_breakdown else None,
     )
 
 
@@ -54,6 +56,8 @@ def _session_entity_to_model(s: ResearchSession) -> ResearchSessionModel:
         duration_ms=s.duration_ms,
         retry_count=s.retry_count,
         parent_session_id=s.parent_session_id,
+        batch_id=s.batch_id,
+        latency_breakdown=s.latency_breakdown,
     )
 
 
@@ -110,6 +114,7 @@ class PgResearchSessionRepository(IResearchSessionRepository):
                 status=session.status,
                 completed_at=session.completed_at,
                 duration_ms=session.duration_ms,
+                latency_breakdown=session.latency_breakdown,
             )
         )
         await self._session.commit()
@@ -4,8 +4,9 @@ Coordinator REST 接口：统一导出 router，prefix=/coordinator。
 
 from fastapi import APIRouter
 
-from . import research_routes, session_routes
+from . import batch_routes, research_routes, session_routes
 
 router = APIRouter(prefix="/coordinator", tags=["Coordinator"])
 router.include_router(research_routes.router)
+router.include_router(batch_routes.router)
 router.include_router(session_routes.router)
@@ -0,0 +1,133 @@
+"""
+批量研究 REST 接口：POST /research/batch、POST /research/batch/{batch_id}/resume。
+
+以 SSE 按完成顺序推送各标的结果：batch（批次信息）→ result（每个标的一条）→ done（批次状态）；
+推送开始后的异常以 error 事件告知。客户端断开时取消未完成的标的，可经续跑接口补齐。
+"""
+
+import logging
+from contextlib import aclosing
+from typing import Any, AsyncIterator
+from uuid import UUID
+
+from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, Field
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.modules.coordinator.application.dtos.batch_dtos import BatchItemResult
+from src.modules.coordinator.application.research_batch_service import (
+    ResearchBatchService,
+)
+from src.modules.coordinator.container import CoordinatorContainer
+from src.modules.coordinator.domain.model.research_batch import ResearchBatch
+from src.modules.coordinator.presentation.rest.research_routes import _build_response
+from src.shared.infrastructure.db.session import AsyncSessionLocal
+from src.shared.infrastructure.llm_stream import sse_event, to_http_exception
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter()
+
+
+class ResearchBatchRequest(BaseModel):
+    """批量研究请求体。"""
+
+    symbols: list[str] = Field(..., description="股票代码列表（重复项只执行一次）")
+    experts: list[str] = Field(
+        ...,
+        description="专家类型列表，如 ['technical_analyst', 'macro_intelligence']",
+    )
+    options: dict[str, dict[str, Any]] = Field(
+        default_factory=dict,
+        description="各专家可选参数（对所有标的生效）",
+    )
+    skip_debate: bool = Field(False, description="为 true 时跳过辩论阶段")
+
+
+def _item_payload(item: BatchItemResult) -> dict[str, Any]:
+    return {
+        "symbol": item.symbol,
+        "status": item.status,
+        "session_id": item.session_id,
+        "error": item.error,
+        "data": _build_response(item.result).model_dump(mode="json") if item.result else None,
+    }
+
+
+def _stream_batch(
+    db: AsyncSession,
+    service: ResearchBatchService,
+    batch: ResearchBatch,
+    skip_symbols: set[str],
+) -> StreamingResponse:
+    """以 SSE 推送批次执行结果；批次仓储使用的会话在推送结束时关闭。"""
+
+    async def events() -> AsyncIterator[str]:
+        try:
+            yield sse_event(
+                "batch",
+                {
+                    "batch_id": str(batch.id),
+                    "total": len(batch.symbols),
+                    "completed_symbols": [s for s in batch.symbols if s in skip_symbols],
+                },
+            )
+            async with aclosing(service.run(batch, skip_symbols)) as items:
+                async for item in items:
+                    yield sse_event("result", _item_payload(item))
+            yield sse_event("done", {"batch_id": str(batch.id), "status": batch.status})
+        except Exception as e:
+            http_error = to_http_exception(e)
+            yield sse_event(
+                "error", {"status_code": http_error.status_code, "detail": http_error.detail}
+            )
+        finally:
+            await db.close()
+
+    return StreamingResponse(events(), media_type="text/event-stream")
+
+
+@router.post(
+    "/research/batch",
+    summary="批量研究",
+    description="对一组标的执行相同专家组合的研究编排，以 SSE 按完成顺序推送各标的结果。",
+)
+async def post_research_batch(body: ResearchBatchRequest) -> StreamingResponse:
+    """创建批次并执行：symbols + experts + options → 有界并发逐个研究 → 流式返回。"""
+    db = AsyncSessionLocal()
+    service = CoordinatorContainer(db).research_batch_service()
+    try:
+        batch = await service.create(
+            symbols=body.symbols,
+            experts=body.experts,
+            options=body.options or {},
+            skip_debate=body.skip_debate,
+        )
+    except Exception as e:
+        await db.close()
+        raise to_http_exception(e)
+    return _stream_batch(db, service, batch, set())
+
+
+@router.post(
+    "/research/batch/{batch_id}/resume",
+    summary="批量研究续跑",
+    description="中断后续跑批次：跳过已有 completed 会话的标的，其余标的重新执行并以 SSE 推送。",
+)
+async def post_research_batch_resume(batch_id: str) -> StreamingResponse:
+    """续跑批次：仅执行尚未完成的标的。"""
+    try:
+        bid = UUID(batch_id)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="batch_id 格式无效，必须为 UUID")
+
+    db = AsyncSessionLocal()
+    service = CoordinatorContainer(db).research_batch_service()
+    try:
+        batch = await service.get_resumable(bid)
+        skip_symbols = await service.completed_symbols(batch)
+    except Exception as e:
+        await db.close()
+        raise to_http_exception(e)
+    return _stream_batch(db, service, batch, skip_symbols)
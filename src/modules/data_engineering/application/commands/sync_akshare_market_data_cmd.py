@@ -1,6 +1,7 @@
 """AkShare 市场数据同步编排 Command。"""
 
 from datetime import date
+from typing import Optional
 
 from loguru import logger
 
@@ -44,6 +45,7 @@ from src.modules.data_engineering.domain.ports.repositories.previous_limit_up_re
 from src.modules.data_engineering.domain.ports.repositories.sector_capital_flow_repo import (
     ISectorCapitalFlowRepository,
 )
+from src.modules.data_engineering.domain.ports.trading_calendar import ITradingCalendar
 
 
 class SyncAkShareMarketDataCmd:
@@ -64,6 +66,7 @@ class SyncAkShareMarketDataCmd:
         previous_limit_up_repo: IPreviousLimitUpRepository,
         dragon_tiger_repo: IDragonTigerRepository,
         sector_capital_flow_repo: ISectorCapitalFlowRepository,
+        trading_calendar: Optional[ITradingCalendar] = None,
     ):
         """
         初始化编排命令，构建 5 个子 Command。
@@ -77,7 +80,9 @@ class SyncAkShareMarketDataCmd:
             previous_limit_up_repo: 昨日涨停仓储
             dragon_tiger_repo: 龙虎榜仓储
             sector_capital_flow_repo: 板块资金流向仓储
+            trading_calendar: 交易日历，提供时非交易日直接跳过全部子任务
         """
+        self.trading_calendar = trading_calendar
         # 构建子 Command
         self.limit_up_cmd = SyncLimitUpPoolCmd(sentiment_provider, limit_up_pool_repo)
         self.broken_board_cmd = SyncBrokenBoardCmd(sentiment_provider, broken_board_repo)
@@ -101,6 +106,10 @@ class SyncAkShareMarketDataCmd:
         Returns:
             AkShareSyncResult: 聚合的同步结果摘要
         """
+        if self.trading_calendar and not await self.trading_calendar.is_trading_day(trade_date):
+            logger.info(f"{trade_date} 非交易日，跳过 AkShare 市场数据同步")
+            return AkShareSyncResult(trade_date=trade_date)
+
         logger.info(f"开始编排 AkShare 市场数据同步：{trade_date}")
 
         errors = []
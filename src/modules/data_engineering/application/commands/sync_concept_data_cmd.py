@@ -1,17 +1,27 @@
+import asyncio
 import time
+from typing import Optional
 
 from loguru import logger
 
 from src.modules.data_engineering.application.dtos.sync_result_dtos import (
     ConceptSyncResult,
 )
-from src.modules.data_engineering.domain.model.concept import Concept, ConceptStock
+from src.modules.data_engineering.domain.dtos.concept_dtos import (
+    ConceptInfoDTO,
+    ConceptWithStocksDTO,
+)
+from src.modules.data_engineering.domain.model.concept import ConceptStock
 from src.modules.data_engineering.domain.ports.providers.concept_data_provider import (
     IConceptDataProvider,
 )
 from src.modules.data_engineering.domain.ports.repositories.concept_repo import (
     IConceptRepository,
 )
+from src.modules.data_engineering.domain.services.concept_membership_differ import (
+    ConceptMembershipDiffer,
+)
+from src.modules.data_engineering.infrastructure.config import de_config
 from src.shared.application.use_cases import BaseUseCase
 
 
@@ -22,9 +32,9 @@ class SyncConceptDataCmd(BaseUseCase):
 
     执行流程：
     1. 获取概念列表
-    2. 逐概念获取成份股（错误隔离）
-    3. UPSERT 概念记录
-    4. 全量替换成份股映射
+    2. 按批次并发获取成份股（并发数受信号量约束，调用频率由 akshare 令牌桶限速，错误隔离）
+    3. 按成份股内容哈希跳过成员未变化的概念
+    4. 每批在单个事务中 UPSERT 有变化的概念并按差异替换成份股映射（差异写入变更日志）
     5. 报告结果
     """
 
@@ -32,9 +42,14 @@ class SyncConceptDataCmd(BaseUseCase):
         self,
         concept_provider: IConceptDataProvider,
         concept_repo: IConceptRepository,
+        concurrency: Optional[int] = None,
+        write_batch_size: Optional[int] = None,
     ):
         self.concept_provider = concept_provider
         self.concept_repo = concept_repo
+        self.differ = ConceptMembershipDiffer()
+        self.concurrency = max(1, concurrency or de_config.SYNC_CONCEPT_CONCURRENCY)
+        self.write_batch_size = max(1, write_batch_size or de_config.SYNC_CONCEPT_WRITE_BATCH_SIZE)
 
     async def execute(self) -> ConceptSyncResult:
         """
@@ -63,49 +78,54 @@ class SyncConceptDataCmd(BaseUseCase):
             raise
 
         total_concepts = len(concept_infos)
-        logger.info(f"获取到 {total_concepts} 个概念板块，开始获取成份股")
+        logger.info(
+            f"获取到 {total_concepts} 个概念板块，开始获取成份股"
+            f"（并发 {self.concurrency}，每批 {self.write_batch_size} 个概念）"
+        )
 
-        # 2. 逐概念获取成份股并立即事务提交（错误隔离）
+        # 2. 按批次并发获取成份股，每批一次事务落库
         success_count = 0
         failed_count = 0
+        unchanged_count = 0
         total_stocks = 0
-
-        for idx, concept_info in enumerate(concept_infos, 1):
-            try:
-                # 获取成份股
-                constituents = await self.concept_provider.fetch_concept_constituents(
-                    concept_info.name
-                )
-
-                # 在单个事务中完成概念和成份股的落库
-                concept = Concept(code=concept_info.code, name=concept_info.name)
-                stocks = [
-                    ConceptStock(
-                        concept_code=concept_info.code,
-                        third_code=constituent.stock_code,
-                        stock_name=constituent.stock_name,
-                    )
-                    for constituent in constituents
-                ]
-
-                total_rows = await self.concept_repo.upsert_concept_with_stocks(concept, stocks)
-
-                success_count += 1
-                total_stocks += len(constituents)
-
-                logger.info(
-                    f"[{idx}/{total_concepts}] ✓ 概念「{concept_info.name}」({concept_info.code}) "
-                    f"事务提交：总计 {total_rows} 行"
+        concept_states = await self.concept_repo.get_concept_states()
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        for batch_start in range(0, total_concepts, self.write_batch_size):
+            batch = concept_infos[batch_start : batch_start + self.write_batch_size]
+            fetched = await asyncio.gather(
+                *(
+                    self._fetch_concept(semaphore, batch_start + offset, total_concepts, info)
+                    for offset, info in enumerate(batch, 1)
                 )
+            )
+            items = [item for item in fetched if item is not None]
+            failed_count += len(batch) - len(items)
+            changed, unchanged = self.differ.split_changed(items, concept_states)
+            unchanged_count += len(unchanged)
+            success_count += len(unchanged)
+            total_stocks += sum(len(item.stocks) for item in unchanged)
+            if not changed:
+                continue
 
+            try:
+                diff = await self.concept_repo.replace_concepts_with_stocks(changed)
             except Exception as e:
-                failed_count += 1
+                failed_count += len(changed)
                 logger.error(
-                    f"[{idx}/{total_concepts}] ✗ 概念「{concept_info.name}」({concept_info.code}) "
-                    f"同步失败：{str(e)}，跳过"
+                    f"[{batch_start + 1}-{batch_start + len(batch)}/{total_concepts}] "
+                    f"✗ 批次写入失败：{str(e)}，跳过"
                 )
                 continue
 
+            success_count += len(changed)
+            total_stocks += sum(len(item.stocks) for item in changed)
+            logger.info(
+                f"[{batch_start + 1}-{batch_start + len(batch)}/{total_concepts}] "
+                f"✓ 批次事务提交：有变化概念 {diff.concepts} 个（未变化 {len(unchanged)} 个），成份股新增 {diff.inserted}、"
+                f"移除 {diff.deleted}、更名 {diff.renamed}"
+            )
+
         logger.info(
             f"概念成份股获取完成：成功 {success_count}/{total_concepts}，"
             f"失败 {failed_count}，总成份股映射 {total_stocks} 条"
@@ -116,13 +136,47 @@ class SyncConceptDataCmd(BaseUseCase):
             total_concepts=total_concepts,
             success_concepts=success_count,
             failed_concepts=failed_count,
+            unchanged_concepts=unchanged_count,
             total_stocks=total_stocks,
             elapsed_time=elapsed_time,
         )
 
         logger.info(
             f"概念数据同步完成：成功 {success_count}/{total_concepts}，"
-            f"失败 {failed_count}，总成份股 {total_stocks} 条，耗时 {elapsed_time:.2f}s"
+            f"失败 {failed_count}，未变化 {unchanged_count}，总成份股 {total_stocks} 条，耗时 {elapsed_time:.2f}s"
         )
 
         return result
+
+    async def _fetch_concept(
+        self,
+        semaphore: asyncio.Semaphore,
+        idx: int,
+        total: int,
+        concept_info: ConceptInfoDTO,
+    ) -> Optional[ConceptWithStocksDTO]:
+        """获取单个概念的成份股，失败时记录日志并返回 None（错误隔离）。"""
+        async with semaphore:
+            try:
+                constituents = await self.concept_provider.fetch_concept_constituents(
+                    concept_info.name
+                )
+            except Exception as e:
+                logger.error(
+                    f"[{idx}/{total}] ✗ 概念「{concept_info.name}」({concept_info.code}) "
+                    f"成份股获取失败：{str(e)}，跳过"
+                )
+                return None
+
+        return ConceptWithStocksDTO(
+            code=concept_info.code,
+            name=concept_info.name,
+            stocks=[
+                ConceptStock(
+                    concept_code=concept_info.code,
+                    third_code=constituent.stock_code,
+                    stock_name=constituent.stock_name,
+                )
+                for constituent in constituents
+            ],
+        )
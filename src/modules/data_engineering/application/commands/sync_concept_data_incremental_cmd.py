@@ -12,6 +12,9 @@ from src.modules.data_engineering.domain.ports.providers.concept_data_provider i
 from src.modules.data_engineering.domain.ports.repositories.concept_repo import (
     IConceptRepository,
 )
+from src.modules.data_engineering.domain.services.concept_membership_differ import (
+    ConceptMembershipDiffer,
+)
 from src.shared.application.use_cases import BaseUseCase
 
 
@@ -22,7 +25,7 @@ class SyncConceptDataIncrementalCmd(BaseUseCase):
 
     执行流程：
     1. 获取概念列表
-    2. 逐个概念获取成份股并立即落库
+    2. 逐个概念获取成份股，成份股内容哈希未变化的概念跳过写库，其余立即按差异落库
     3. 报告结果
     """
 
@@ -33,6 +36,7 @@ class SyncConceptDataIncrementalCmd(BaseUseCase):
     ):
         self.concept_provider = concept_provider
         self.concept_repo = concept_repo
+        self.differ = ConceptMembershipDiffer()
 
     async def execute(self) -> ConceptSyncResult:
         """
@@ -66,7 +70,9 @@ class SyncConceptDataIncrementalCmd(BaseUseCase):
         # 2. 逐个概念获取成份股并立即落库
         success_count = 0
         failed_count = 0
+        unchanged_count = 0
         total_stocks = 0
+        concept_states = await self.concept_repo.get_concept_states()
 
         for idx, concept_info in enumerate(concept_infos, 1):
             try:
@@ -86,6 +92,17 @@ class SyncConceptDataIncrementalCmd(BaseUseCase):
                     for constituent in constituents
                 ]
 
+                stored = concept_states.get(concept.code)
+                if stored == (concept.name, self.differ.membership_hash(stocks)):
+                    success_count += 1
+                    unchanged_count += 1
+                    total_stocks += len(constituents)
+                    logger.debug(
+                        f"[{idx}/{total_concepts}] 概念「{concept_info.name}」({concept_info.code}) "
+                        f"成份股未变化，跳过"
+                    )
+                    continue
+
                 total_rows = await self.concept_repo.upsert_concept_with_stocks(concept, stocks)
 
                 success_count += 1
@@ -109,13 +126,14 @@ class SyncConceptDataIncrementalCmd(BaseUseCase):
             total_concepts=total_concepts,
             success_concepts=success_count,
             failed_concepts=failed_count,
+            unchanged_concepts=unchanged_count,
             total_stocks=total_stocks,
             elapsed_time=elapsed_time,
         )
 
         logger.info(
             f"增量概念数据同步完成：成功 {success_count}/{total_concepts}，"
-            f"失败 {failed_count}，总成份股 {total_stocks} 条，耗时 {elapsed_time:.2f}s"
+            f"失败 {failed_count}，未变化 {unchanged_count}，总成份股 {total_stocks} 条，耗时 {elapsed_time:.2f}s"
         )
 
         return result
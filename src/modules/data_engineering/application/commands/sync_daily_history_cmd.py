@@ -30,11 +30,18 @@ class SyncDailyHistoryCmd:
         self.data_provider = data_provider
 
     async def execute(
-        self, limit: int = 10, offset: int = 0, symbol: str | None = None
+        self,
+        limit: int = 10,
+        offset: int = 0,
+        symbol: str | None = None,
+        third_codes: list[str] | None = None,
     ) -> DailyHistorySyncResult:
         """
         执行同步逻辑（支持分页和指定股票）
 
+        third_codes 非空时仅在该代码列表内分页（用于回补规划器选出的缺失股票），
+        否则在全部股票中分页。
+
         改为纯串行调用，限速完全由 TushareClient 的 _rate_limited_call 统一处理。
         移除了 Semaphore 和 sleep 等 Application 层的限速代码。
         """
@@ -47,6 +54,11 @@ class SyncDailyHistoryCmd:
                     synced_stocks=0, total_rows=0, message=f"未找到股票代码 {symbol}"
                 )
             target_stocks = [stock]
+        elif third_codes is not None:
+            # 在指定代码列表内分页
+            target_stocks = await self.stock_repo.get_by_third_codes(
+                third_codes[offset : offset + limit]
+            )
         else:
             # 分页同步多只股票
             target_stocks = await self.stock_repo.get_all(skip=offset, limit=limit)
@@ -0,0 +1,247 @@
+"""
+并发流水线式日线历史同步。
+
+将「拉取 → 写库」拆成两个阶段：
+- 拉取阶段：N 个 worker 并发调用 `IMarketQuoteProvider.fetch_daily`，
+  共享进程级 Tushare 滑动窗口限速器的配额（限速在 TushareClient 内统一处理）；
+- 写库阶段：单个 writer 从有界队列消费拉取结果并调用 `save_all`，
+  保证同一个 AsyncSession 不被并发使用。
+
+批次可能乱序完成，断点（offset）只推进到「连续完成」的最高批次边界，
+因此中断后从 offset 恢复不会漏掉任何股票。
+"""
+
+import asyncio
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, List, Optional
+
+from loguru import logger
+
+from src.modules.data_engineering.application.dtos.sync_result_dtos import (
+    DailyHistorySyncResult,
+)
+from src.modules.data_engineering.domain.model.stock import StockInfo
+from src.modules.data_engineering.domain.model.stock_daily import StockDaily
+from src.modules.data_engineering.domain.ports.providers.market_quote_provider import (
+    IMarketQuoteProvider,
+)
+from src.modules.data_engineering.domain.ports.repositories.market_quote_repo import (
+    IMarketQuoteRepository,
+)
+from src.modules.data_engineering.domain.ports.repositories.stock_basic_repo import (
+    IStockBasicRepository,
+)
+
+# 断点回调：(本批成功股票数, 新 offset)，在 writer 协程中串行调用
+CheckpointCallback = Callable[[int, int], Awaitable[None]]
+
+
+@dataclass
+class _BatchProgress:
+    """单批次进度。"""
+
+    offset: int
+    size: int
+    done: int = 0
+    synced_stocks: int = 0
+
+    @property
+    def is_done(self) -> bool:
+        return self.done >= self.size
+
+
+@dataclass
+class BatchCheckpointTracker:
+    """
+    乱序完成批次的断点追踪器。
+
+    每批按注册顺序编号，只有当某批及其之前所有批次都完成时，
+    才会通过 `mark_done` 返回可提交的批次，保证 offset 单调且不越过未完成批次。
+    """
+
+    batch_size: int
+    _batches: List[_BatchProgress] = field(default_factory=list)
+    _next_commit: int = 0
+
+    def register(self, offset: int, size: int) -> int:
+        """注册一个批次，返回批次序号。"""
+        self._batches.append(_BatchProgress(offset=offset, size=size))
+        return len(self._batches) - 1
+
+    def mark_done(self, batch_index: int, synced: bool) -> List[_BatchProgress]:
+        """
+        标记某批次中的一只股票处理完毕。
+
+        Returns:
+            本次调用后新变为「连续完成」的批次列表（按顺序），可依次提交断点
+        """
+        batch = self._batches[batch_index]
+        batch.done += 1
+        if synced:
+            batch.synced_stocks += 1
+
+        committable: List[_BatchProgress] = []
+        while self._next_commit < len(self._batches) and self._batches[self._next_commit].is_done:
+            committable.append(self._batches[self._next_commit])
+            self._next_commit += 1
+        return committable
+
+    def next_offset(self, batch: _BatchProgress) -> int:
+        """批次提交后的下一个 offset（与串行模式一致：offset + batch_size）。"""
+        return batch.offset + self.batch_size
+
+
+@dataclass
+class _FetchResult:
+    batch_index: int
+    stock: StockInfo
+    dailies: Optional[List[StockDaily]]
+
+
+class SyncDailyHistoryPipelineCmd:
+    """
+    并发流水线日线历史同步用例。
+
+    与 `SyncDailyHistoryCmd` 的单股串行处理不同，本用例一次性覆盖从 offset 开始的全部股票：
+    拉取 worker 通过有界队列领先写库阶段运行，总耗时由 Tushare 配额而非各环节延迟之和决定。
+    """
+
+    def __init__(
+        self,
+        stock_repo: IStockBasicRepository,
+        daily_repo: IMarketQuoteRepository,
+        data_provider: IMarketQuoteProvider,
+        concurrency: int = 4,
+        queue_size: int = 16,
+    ):
+        self.stock_repo = stock_repo
+        self.daily_repo = daily_repo
+        self.data_provider = data_provider
+        self.concurrency = max(1, concurrency)
+        self.queue_size = max(1, queue_size)
+
+    async def execute(
+        self,
+        batch_size: int,
+        offset: int = 0,
+        on_checkpoint: Optional[CheckpointCallback] = None,
+        third_codes: Optional[List[str]] = None,
+    ) -> DailyHistorySyncResult:
+        """
+        从 offset 开始同步全部剩余股票的历史日线。
+
+        Args:
+            batch_size: 断点粒度（每批股票数），与 SyncTask.batch_size 一致
+            offset: 起始偏移量
+            on_checkpoint: 批次连续完成时的回调，用于持久化 SyncTask 进度
+            third_codes: 非空时仅在该代码列表内分页，否则覆盖全部股票
+
+        Returns:
+            全部批次的汇总结果
+        """
+        tracker = BatchCheckpointTracker(batch_size=batch_size)
+        work_queue: asyncio.Queue = asyncio.Queue()
+
+        # 1. 预先分页加载股票列表（只读、串行，避免与 writer 并发使用 session）
+        current_offset = offset
+        total_stocks = 0
+        while True:
+            if third_codes is not None:
+                page = third_codes[current_offset : current_offset + batch_size]
+                stocks = await self.stock_repo.get_by_third_codes(page) if page else []
+            else:
+                stocks = await self.stock_repo.get_all(skip=current_offset, limit=batch_size)
+            if not stocks:
+                break
+            batch_index = tracker.register(offset=current_offset, size=len(stocks))
+            for stock in stocks:
+                work_queue.put_nowait((batch_index, stock))
+            total_stocks += len(stocks)
+            current_offset += batch_size
+
+        if total_stocks == 0:
+            logger.warning(f"未找到需要同步的股票 (offset={offset})")
+            return DailyHistorySyncResult(
+                synced_stocks=0,
+                total_rows=0,
+                message=f"未找到需要同步的股票 (offset={offset})",
+            )
+
+        logger.info(
+            f"开始并发同步 {total_stocks} 只股票的历史日线数据 "
+            f"(offset={offset}, concurrency={self.concurrency}, queue_size={self.queue_size})"
+        )
+
+        write_queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        workers = [
+            asyncio.create_task(self._fetch_worker(work_queue, write_queue))
+            for _ in range(min(self.concurrency, total_stocks))
+        ]
+
+        try:
+            synced_stocks, total_rows = await self._write_loop(
+                write_queue, tracker, total_stocks, on_checkpoint
+            )
+        finally:
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+
+        return DailyHistorySyncResult(
+            synced_stocks=synced_stocks,
+            total_rows=total_rows,
+            message=f"成功同步 {synced_stocks} 只股票，共 {total_rows} 条日线记录",
+        )
+
+    async def _fetch_worker(self, work_queue: asyncio.Queue, write_queue: asyncio.Queue) -> None:
+        """拉取 worker：不断从任务队列取股票，拉取结果送入有界写队列。"""
+        while True:
+            try:
+                batch_index, stock = work_queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+
+            dailies: Optional[List[StockDaily]] = None
+            if not stock.third_code:
+                logger.warning(f"股票 {stock.name} 缺少 third_code，跳过")
+            else:
+                try:
+                    dailies = await self.data_provider.fetch_daily(third_code=stock.third_code)
+                except Exception as e:
+                    logger.error(f"拉取 {stock.third_code} 失败: {str(e)}")
+
+            # 写队列满时阻塞，形成背压，避免拉取结果在内存中无限堆积
+            await write_queue.put(_FetchResult(batch_index, stock, dailies))
+
+    async def _write_loop(
+        self,
+        write_queue: asyncio.Queue,
+        tracker: BatchCheckpointTracker,
+        total_stocks: int,
+        on_checkpoint: Optional[CheckpointCallback],
+    ) -> tuple[int, int]:
+        """写库阶段：串行消费拉取结果，写库并按连续完成的批次推进断点。"""
+        synced_stocks = 0
+        total_rows = 0
+
+        for _ in range(total_stocks):
+            item: _FetchResult = await write_queue.get()
+            synced = False
+
+            if item.dailies:
+                try:
+                    saved_count = await self.daily_repo.save_all(item.dailies)
+                    total_rows += saved_count
+                    synced_stocks += 1
+                    synced = True
+                    logger.info(f"成功保存 {item.stock.third_code} 的 {saved_count} 条日线记录")
+                except Exception as e:
+                    logger.error(f"保存 {item.stock.third_code} 失败: {str(e)}")
+            elif item.stock.third_code:
+                logger.warning(f"{item.stock.third_code} 没有返回日线数据")
+
+            for batch in tracker.mark_done(item.batch_index, synced):
+                if on_checkpoint is not None:
+                    await on_checkpoint(batch.synced_stocks, tracker.next_offset(batch))
+
+        return synced_stocks, total_rows
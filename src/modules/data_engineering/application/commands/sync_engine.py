@@ -9,13 +9,20 @@ from src.modules.data_engineering.application.commands.sync_daily_by_date_cmd im
 from src.modules.data_engineering.application.commands.sync_daily_history_cmd import (
     SyncDailyHistoryCmd,
 )
+from src.modules.data_engineering.application.commands.sync_daily_history_pipeline_cmd import (
+    SyncDailyHistoryPipelineCmd,
+)
 from src.modules.data_engineering.application.commands.sync_finance_history_cmd import (
     SyncFinanceHistoryCmd,
 )
 from src.modules.data_engineering.application.dtos.sync_result_dtos import (
+    DailyHistoryByDateSyncResult,
     DailyHistorySyncResult,
     FinanceHistorySyncResult,
 )
+from src.modules.data_engineering.domain.dtos.sync_plan_dtos import (
+    DailyHistorySyncPlan,
+)
 from src.modules.data_engineering.domain.model.enums import (
     SyncJobType,
     SyncTaskStatus,
@@ -39,6 +46,10 @@ from src.modules.data_engineering.domain.ports.repositories.stock_basic_repo imp
 from src.modules.data_engineering.domain.ports.repositories.sync_task_repo import (
     ISyncTaskRepository,
 )
+from src.modules.data_engineering.domain.ports.trading_calendar import ITradingCalendar
+from src.modules.data_engineering.domain.services.daily_history_sync_planner import (
+    DailyHistorySyncPlanner,
+)
 from src.modules.data_engineering.infrastructure.config import de_config
 
 
@@ -51,6 +62,9 @@ class SyncEngine:
     - 断点续跑（从 RUNNING/PAUSED 任务的 offset 恢复）
     - 同类型任务互斥（同一时间只能有一个 RUNNING 任务）
     - 失败记录追踪（单只股票失败不中断整批）
+    - 日线历史并发流水线（concurrency > 1 时启用，共享 Tushare 限速配额）
+    - 日线历史按交易日全市场回补，及按股票/按交易日策略自动规划
+    - 注入交易日历时，增量补偿与按交易日回补只处理真实交易日
     """
 
     def __init__(
@@ -61,6 +75,7 @@ class SyncEngine:
         finance_repo: IFinancialDataRepository,
         quote_provider: IMarketQuoteProvider,
         finance_provider: IFinancialDataProvider,
+        trading_calendar: Optional[ITradingCalendar] = None,
     ):
         self.sync_task_repo = sync_task_repo
         self.stock_repo = stock_repo
@@ -68,6 +83,7 @@ class SyncEngine:
         self.finance_repo = finance_repo
         self.quote_provider = quote_provider
         self.finance_provider = finance_provider
+        self.trading_calendar = trading_calendar
 
     async def run_history_sync(self, job_type: SyncJobType, config: Dict[str, Any]) -> SyncTask:
         """
@@ -75,12 +91,13 @@ class SyncEngine:
 
         支持：
         1. 同类型任务互斥：若已存在 RUNNING 任务，拒绝启动并返回已有任务
-        2. 断点续跑：若存在 RUNNING/PAUSED 任务，从其 current_offset 恢复
+        2. 断点续跑：若存在 RUNNING/PAUSED 且覆盖范围（起始日期、third_codes）一致的任务，
+           从其 current_offset 恢复
         3. 自动分批循环：直到某批返回 0 条结果，标记 COMPLETED
 
         Args:
-            job_type: 任务类型（DAILY_HISTORY / FINANCE_HISTORY）
-            config: 任务配置（如 batch_size、start_date、end_date）
+            job_type: 任务类型（DAILY_HISTORY / DAILY_HISTORY_BY_DATE / FINANCE_HISTORY）
+            config: 任务配置（如 batch_size、start_date、end_date、third_codes）
 
         Returns:
             完成或失败的 SyncTask
@@ -123,13 +140,18 @@ class SyncEngine:
                 return latest_task
 
         # 2. 判断是否需要恢复任务（断点续跑）
-        # 如果存在之前的任务且处于可恢复状态，则从上次的 offset 继续同步
-        if latest_task and latest_task.is_resumable():
+        # 从覆盖范围一致的 RUNNING/PAUSED 任务的 offset 继续同步；全量同步与按股票回补共用任务类型，
+        # 最近任务范围不同时查找范围一致的更早暂停任务，避免其被另一类任务挤掉而无法续跑
+        resume_task = await self._find_resumable_task(job_type, latest_task, config)
+        if resume_task is not None:
             logger.info(
-                f"发现可恢复任务，执行断点续跑: task_id={latest_task.id}, "
-                f"current_offset={latest_task.current_offset}, job_type={job_type.value}"
+                f"发现可恢复任务，执行断点续跑: task_id={resume_task.id}, "
+                f"current_offset={resume_task.current_offset}, job_type={job_type.value}"
             )
-            task = latest_task
+            task = resume_task
+            # 结束日期可随调用日期后移，沿用本次请求的 end_date
+            if config.get("end_date"):
+                task.config = {**(task.config or {}), "end_date": config["end_date"]}
             task.start()  # 更新状态为 RUNNING
             await self.sync_task_repo.update(task)
         else:
@@ -145,6 +167,10 @@ class SyncEngine:
             task = await self.sync_task_repo.create(task)
             logger.info(f"创建新任务：task_id={task.id}")
 
+        concurrency = self._get_concurrency(job_type, task)
+        if concurrency > 1:
+            return await self._run_daily_history_pipeline(task, concurrency)
+
         # 4. 循环分批同步，直到某批返回 0 条结果
         try:
             while True:
@@ -157,13 +183,9 @@ class SyncEngine:
                 result = await self._execute_batch(job_type, task)
 
                 # 判断是否完成
-                processed_count = (
-                    result.synced_stocks
-                    if hasattr(result, "synced_stocks")
-                    else result.batch_size if hasattr(result, "batch_size") else 0
-                )
+                processed_count = self._get_processed_count(result)
                 if processed_count == 0:
-                    logger.info("本批未处理任何股票，标记任务为 COMPLETED")
+                    logger.info("本批未处理任何数据，标记任务为 COMPLETED")
                     task.complete()
                     await self.sync_task_repo.update(task)
                     break
@@ -188,9 +210,62 @@ class SyncEngine:
         logger.info(f"历史同步完成：task_id={task.id}, total_processed={task.total_processed}")
         return task
 
+    async def _find_resumable_task(
+        self, job_type: SyncJobType, latest_task: Optional[SyncTask], config: Dict[str, Any]
+    ) -> Optional[SyncTask]:
+        """查找覆盖范围与 config 一致的可恢复任务：优先最近任务，其次更早的 PAUSED 任务。"""
+        if latest_task and latest_task.is_resumable() and latest_task.has_same_scope(config):
+            return latest_task
+        for task in await self.sync_task_repo.list_paused_by_job_type(job_type):
+            if task.has_same_scope(config):
+                return task
+        return None
+
+    async def _run_daily_history_pipeline(self, task: SyncTask, concurrency: int) -> SyncTask:
+        """
+        以并发流水线方式执行日线历史同步（内部方法）
+
+        拉取 worker 并发运行，写库与断点持久化在同一个 writer 协程中串行完成；
+        批次乱序完成时，offset 只推进到连续完成的批次边界。
+        """
+        queue_size = task.config.get("queue_size") or de_config.SYNC_DAILY_HISTORY_QUEUE_SIZE
+        use_case = SyncDailyHistoryPipelineCmd(
+            stock_repo=self.stock_repo,
+            daily_repo=self.daily_repo,
+            data_provider=self.quote_provider,
+            concurrency=concurrency,
+            queue_size=queue_size,
+        )
+
+        async def _checkpoint(processed_count: int, new_offset: int) -> None:
+            task.update_progress(processed_count, new_offset)
+            await self.sync_task_repo.update(task)
+            logger.info(
+                f"批次断点已提交: 当前总进度: {task.total_processed} | 下次 offset: {new_offset}"
+            )
+
+        try:
+            result = await use_case.execute(
+                batch_size=task.batch_size,
+                offset=task.current_offset,
+                on_checkpoint=_checkpoint,
+                third_codes=task.config.get("third_codes"),
+            )
+            logger.info(result.message)
+            task.complete()
+            await self.sync_task_repo.update(task)
+        except Exception as e:
+            logger.error(f"历史同步失败：{str(e)}", exc_info=True)
+            task.fail()
+            await self.sync_task_repo.update(task)
+            raise
+
+        logger.info(f"历史同步完成：task_id={task.id}, total_processed={task.total_processed}")
+        return task
+
     async def _execute_batch(
         self, job_type: SyncJobType, task: SyncTask
-    ) -> Union[DailyHistorySyncResult, FinanceHistorySyncResult]:
+    ) -> Union[DailyHistorySyncResult, DailyHistoryByDateSyncResult, FinanceHistorySyncResult]:
         """
         执行单批同步（内部方法）
 
@@ -205,8 +280,12 @@ class SyncEngine:
             return await use_case.execute(
                 limit=task.batch_size,
                 offset=task.current_offset,
+                third_codes=task.config.get("third_codes"),
             )
 
+        elif job_type == SyncJobType.DAILY_HISTORY_BY_DATE:
+            return await self._execute_by_date_batch(task)
+
         elif job_type == SyncJobType.FINANCE_HISTORY:
             use_case = SyncFinanceHistoryCmd(
                 stock_repo=self.stock_repo,
@@ -225,6 +304,113 @@ class SyncEngine:
         else:
             raise ValueError(f"不支持的 job_type: {job_type}")
 
+    async def _execute_by_date_batch(self, task: SyncTask) -> DailyHistoryByDateSyncResult:
+        """
+        按交易日执行单批全市场回补（内部方法）
+
+        交易日列表由 config 中的 start_date/end_date 确定性生成，offset 即列表下标；
+        单日失败不中断整批，与增量补偿逻辑一致。
+        """
+        start_date = task.config.get("start_date") or de_config.SYNC_DAILY_HISTORY_START_DATE
+        end_date = task.config.get("end_date") or datetime.now().strftime("%Y%m%d")
+        trade_dates = await self._get_trade_dates(
+            datetime.strptime(start_date, "%Y%m%d").date(),
+            datetime.strptime(end_date, "%Y%m%d").date(),
+        )
+        batch_dates = trade_dates[task.current_offset : task.current_offset + task.batch_size]
+        if not batch_dates:
+            return DailyHistoryByDateSyncResult(
+                synced_dates=0, total_rows=0, message="无剩余交易日"
+            )
+
+        use_case = SyncDailyByDateCmd(
+            daily_repo=self.daily_repo,
+            data_provider=self.quote_provider,
+        )
+        total_rows = 0
+        for date_obj in batch_dates:
+            date_str = date_obj.strftime("%Y%m%d")
+            try:
+                result = await use_case.execute(trade_date=date_str)
+                total_rows += result.count
+                logger.info(f"成功回补 {date_str}，{result.count} 条记录")
+            except Exception as e:
+                logger.error(f"回补 {date_str} 失败：{str(e)}")
+                continue
+
+        return DailyHistoryByDateSyncResult(
+            synced_dates=len(batch_dates),
+            total_rows=total_rows,
+            message=f"处理 {len(batch_dates)} 个交易日，共 {total_rows} 条日线记录",
+        )
+
+    async def plan_daily_history_backfill(
+        self, start_date: Optional[str] = None, end_date: Optional[str] = None
+    ) -> DailyHistorySyncPlan:
+        """
+        规划日线历史回补策略
+
+        统计区间内缺失日线的股票数与交易日数，交由 DailyHistorySyncPlanner
+        比较两种策略的预估 API 调用数。
+
+        Args:
+            start_date: 起始日期（YYYYMMDD），默认 SYNC_DAILY_HISTORY_START_DATE
+            end_date: 结束日期（YYYYMMDD），默认 today
+
+        Returns:
+            回补计划
+        """
+        start_date = start_date or de_config.SYNC_DAILY_HISTORY_START_DATE
+        end_date = end_date or datetime.now().strftime("%Y%m%d")
+        start_obj = datetime.strptime(start_date, "%Y%m%d").date()
+        end_obj = datetime.strptime(end_date, "%Y%m%d").date()
+
+        listed = await self.stock_repo.get_all_third_codes()
+        covered = set(await self.daily_repo.get_third_codes_with_dailies(start_obj, end_obj))
+        missing = [code for code in listed if code not in covered]
+        trade_days = len(await self._get_trade_dates(start_obj, end_obj))
+
+        plan = DailyHistorySyncPlanner().plan(
+            start_date=start_date,
+            end_date=end_date,
+            listed_tickers=len(listed),
+            missing_tickers=missing,
+            trade_days=trade_days,
+        )
+        logger.info(
+            f"日线历史回补规划：strategy={plan.job_type.value}, "
+            f"missing_tickers={len(missing)}/{len(listed)}, trade_days={trade_days}, "
+            f"per_ticker_calls={plan.per_ticker_calls}, per_date_calls={plan.per_date_calls}"
+        )
+        return plan
+
+    async def run_daily_history_backfill(
+        self,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        config: Optional[Dict[str, Any]] = None,
+    ) -> SyncTask:
+        """
+        自动选择策略执行日线历史回补
+
+        按股票策略仅覆盖缺失股票（写入 config.third_codes），
+        按交易日策略覆盖区间内全部交易日。
+
+        Args:
+            start_date: 起始日期（YYYYMMDD）
+            end_date: 结束日期（YYYYMMDD）
+            config: 额外任务配置（如 concurrency）
+
+        Returns:
+            完成或失败的 SyncTask
+        """
+        plan = await self.plan_daily_history_backfill(start_date, end_date)
+        task_config: Dict[str, Any] = dict(config or {})
+        task_config.update({"start_date": plan.start_date, "end_date": plan.end_date})
+        if plan.job_type == SyncJobType.DAILY_HISTORY:
+            task_config["third_codes"] = plan.missing_tickers
+        return await self.run_history_sync(job_type=plan.job_type, config=task_config)
+
     async def run_incremental_daily_sync(self, target_date: Optional[str] = None) -> dict[str, any]:
         """
         执行日线增量同步（含遗漏检测与自动补偿）
@@ -235,6 +421,7 @@ class SyncEngine:
         3. 若有间隔，则逐日补同步缺失的日期区间
         4. 无遗漏，则仅同步目标日期
         5. DB 为空时，记录警告并仅同步目标日期
+        6. 注入交易日历时，缺失区间只包含交易日，目标日期非交易日时不同步目标日期
 
         Args:
             target_date: 目标日期（格式：YYYYMMDD），默认为 today
@@ -249,11 +436,17 @@ class SyncEngine:
 
         logger.info(f"开始日线增量同步：target_date={target_date}")
 
+        target_is_trading_day = True
+        if self.trading_calendar:
+            target_is_trading_day = await self.trading_calendar.is_trading_day(target_date_obj)
+
         # 查询数据库中最新的交易日期
         latest_trade_date = await self.daily_repo.get_latest_trade_date()
 
         if not latest_trade_date:
             logger.warning("数据库中无日线数据，建议先执行历史全量同步。仅同步目标日期。")
+            if not target_is_trading_day:
+                return self._non_trading_day_result(target_date)
             use_case = SyncDailyByDateCmd(
                 daily_repo=self.daily_repo,
                 data_provider=self.quote_provider,
@@ -267,9 +460,11 @@ class SyncEngine:
             }
 
         # 计算需要补偿的日期区间
-        missing_dates = self._calculate_missing_dates(latest_trade_date, target_date_obj)
+        missing_dates = await self._calculate_missing_dates(latest_trade_date, target_date_obj)
 
         if not missing_dates:
+            if not target_is_trading_day:
+                return self._non_trading_day_result(target_date)
             logger.info(f"无遗漏日期，仅同步目标日期 {target_date}")
             use_case = SyncDailyByDateCmd(
                 daily_repo=self.daily_repo,
@@ -285,7 +480,7 @@ class SyncEngine:
 
         # 补偿缺失日期 + 目标日期
         logger.info(f"检测到遗漏日期：{len(missing_dates)} 天，开始补偿同步")
-        all_dates = missing_dates + [target_date_obj]
+        all_dates = missing_dates + ([target_date_obj] if target_is_trading_day else [])
         synced_dates = []
         total_count = 0
 
@@ -314,28 +509,83 @@ class SyncEngine:
             "message": f"成功补偿 {len(synced_dates)} 个交易日，共 {total_count} 条记录",
         }
 
-    def _calculate_missing_dates(self, latest_date: date, target_date: date) -> List[date]:
+    async def _calculate_missing_dates(self, latest_date: date, target_date: date) -> List[date]:
         """
-        计算缺失的日期区间
+        计算 (latest_date, target_date) 开区间内缺失的日期
 
-        注意：这里简单地计算所有日历日，实际上只有交易日才有数据。
-        但对于数据同步而言，调用 API 时若非交易日会返回空，不影响正确性。
+        注入交易日历时只返回交易日；否则退化为全部日历日
+        （非交易日调用 API 返回空，不影响正确性，但会浪费 Tushare 配额）。
         """
         if target_date <= latest_date:
             return []
 
+        start = latest_date + timedelta(days=1)
+        end = target_date - timedelta(days=1)
+        if self.trading_calendar:
+            return await self.trading_calendar.get_trading_days(start, end)
+
         missing_dates = []
-        current = latest_date + timedelta(days=1)
-        while current < target_date:
+        current = start
+        while current <= end:
             missing_dates.append(current)
             current += timedelta(days=1)
 
         return missing_dates
 
+    async def _get_trade_dates(self, start_date: date, end_date: date) -> List[date]:
+        """
+        生成区间内的交易日（含两端）
+
+        注入交易日历时使用真实交易日；否则仅跳过周末，节假日调用 API 返回空。
+        """
+        if self.trading_calendar:
+            return await self.trading_calendar.get_trading_days(start_date, end_date)
+
+        trade_dates = []
+        current = start_date
+        while current <= end_date:
+            if current.weekday() < 5:
+                trade_dates.append(current)
+            current += timedelta(days=1)
+        return trade_dates
+
+    @staticmethod
+    def _non_trading_day_result(target_date: str) -> dict[str, any]:
+        logger.info(f"{target_date} 非交易日，跳过日线增量同步")
+        return {
+            "status": "success",
+            "synced_dates": [],
+            "total_count": 0,
+            "message": f"{target_date} 非交易日，无需同步",
+        }
+
+    @staticmethod
+    def _get_processed_count(
+        result: Union[
+            DailyHistorySyncResult, DailyHistoryByDateSyncResult, FinanceHistorySyncResult
+        ],
+    ) -> int:
+        """提取单批处理量，为 0 时表示同步完成"""
+        if isinstance(result, DailyHistorySyncResult):
+            return result.synced_stocks
+        if isinstance(result, DailyHistoryByDateSyncResult):
+            return result.synced_dates
+        if isinstance(result, FinanceHistorySyncResult):
+            return result.batch_size
+        return 0
+
+    def _get_concurrency(self, job_type: SyncJobType, task: SyncTask) -> int:
+        """获取并发度：仅日线历史同步支持流水线模式，其余任务始终串行"""
+        if job_type != SyncJobType.DAILY_HISTORY:
+            return 1
+        return int(task.config.get("concurrency") or de_config.SYNC_DAILY_HISTORY_CONCURRENCY)
+
     def _get_default_batch_size(self, job_type: SyncJobType) -> int:
         """获取默认批大小（从配置读取）"""
         if job_type == SyncJobType.DAILY_HISTORY:
             return de_config.SYNC_DAILY_HISTORY_BATCH_SIZE
+        elif job_type == SyncJobType.DAILY_HISTORY_BY_DATE:
+            return de_config.SYNC_DAILY_BY_DATE_BATCH_SIZE
         elif job_type == SyncJobType.FINANCE_HISTORY:
             return de_config.SYNC_FINANCE_HISTORY_BATCH_SIZE
         else:
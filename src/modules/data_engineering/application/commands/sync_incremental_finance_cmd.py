@@ -1,5 +1,5 @@
 from datetime import date, datetime, timedelta
-from typing import Set
+from typing import Optional, Set
 
 from loguru import logger
 
@@ -22,6 +22,7 @@ from src.modules.data_engineering.domain.ports.repositories.stock_basic_repo imp
 from src.modules.data_engineering.domain.ports.repositories.sync_task_repo import (
     ISyncTaskRepository,
 )
+from src.modules.data_engineering.domain.ports.trading_calendar import ITradingCalendar
 from src.modules.data_engineering.infrastructure.config import de_config
 
 
@@ -33,6 +34,8 @@ class SyncIncrementalFinanceCmd:
     - 策略 A（高优先级）：今日披露名单驱动
     - 策略 B（低优先级）：长尾轮询（缺数补齐）
     - 策略 C（前置步骤）：失败重试（从 DB 读取未解决的失败记录）
+
+    注入交易日历时，非交易日（无新披露）直接跳过整次同步。
     """
 
     def __init__(
@@ -41,11 +44,13 @@ class SyncIncrementalFinanceCmd:
         stock_repo: IStockBasicRepository,
         sync_task_repo: ISyncTaskRepository,
         data_provider: IFinancialDataProvider,
+        trading_calendar: Optional[ITradingCalendar] = None,
     ):
         self.finance_repo = finance_repo
         self.stock_repo = stock_repo
         self.sync_task_repo = sync_task_repo
         self.data_provider = data_provider
+        self.trading_calendar = trading_calendar
 
     def _get_target_period(self, current_date: date) -> str:
         """根据当前日期确定目标报告期"""
@@ -86,6 +91,15 @@ class SyncIncrementalFinanceCmd:
             actual_date = current_date.strftime("%Y%m%d")
 
         target_period = self._get_target_period(current_date)
+
+        if self.trading_calendar and not await self.trading_calendar.is_trading_day(current_date):
+            logger.info(f"{actual_date} 非交易日，跳过财务增量同步")
+            return IncrementalFinanceSyncResult(
+                status="skipped",
+                target_period=target_period,
+                message=f"{actual_date} 非交易日，无需同步",
+            )
+
         logger.info(f"开始财务增量同步：当前日期={actual_date}，目标报告期={target_period}")
 
         # 策略 C（前置）: 失败重试（从 DB 读取未解决的失败记录）
@@ -0,0 +1,52 @@
+"""
+列式日线结果（bar frame）
+
+按字段保存 NumPy 数组，供指标计算、全市场统计等按列消费的场景使用，
+避免逐行构造 DTO。行顺序与查询结果一致。
+"""
+
+from dataclasses import dataclass
+from typing import Sequence
+
+import numpy as np
+
+from src.modules.data_engineering.domain.model.daily_bar_row import DailyBarRow
+
+_FLOAT_FIELDS = ("open", "high", "low", "close", "vol", "amount", "pct_chg")
+
+
+@dataclass(frozen=True)
+class DailyBarFrame:
+    """日线列式结果：字符串/日期列为 object 数组，数值列为 float64 数组。"""
+
+    third_code: np.ndarray
+    stock_name: np.ndarray
+    trade_date: np.ndarray
+    open: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    vol: np.ndarray
+    amount: np.ndarray
+    pct_chg: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.trade_date)
+
+    @classmethod
+    def from_rows(cls, rows: Sequence[DailyBarRow]) -> "DailyBarFrame":
+        """由投影行构建；空结果返回各列长度为 0 的 frame。"""
+        if not rows:
+            empty_obj = np.empty(0, dtype=object)
+            return cls(
+                third_code=empty_obj,
+                stock_name=empty_obj,
+                trade_date=empty_obj,
+                **{f: np.empty(0, dtype=np.float64) for f in _FLOAT_FIELDS},
+            )
+        columns = list(zip(*rows))
+        data = {}
+        for name, values in zip(DailyBarRow._fields, columns):
+            dtype = np.float64 if name in _FLOAT_FIELDS else object
+            data[name] = np.asarray(values, dtype=dtype)
+        return cls(**data)
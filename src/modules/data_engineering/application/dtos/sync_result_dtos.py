@@ -26,6 +26,14 @@ class DailyHistorySyncResult(BaseModel):
     message: str = Field(default="", description="结果描述")
 
 
+class DailyHistoryByDateSyncResult(BaseModel):
+    """按交易日全市场回补历史日线的单批结果。"""
+
+    synced_dates: int = Field(default=0, description="本批处理交易日数")
+    total_rows: int = Field(default=0, description="已同步行数")
+    message: str = Field(default="", description="结果描述")
+
+
 class FinanceHistorySyncResult(BaseModel):
     """历史财务全量同步单批结果。"""
 
@@ -60,6 +68,7 @@ class ConceptSyncResult(BaseModel):
     total_concepts: int = Field(default=0, description="总概念数")
     success_concepts: int = Field(default=0, description="成功同步概念数")
     failed_concepts: int = Field(default=0, description="失败概念数")
+    unchanged_concepts: int = Field(default=0, description="成份股未变化、跳过写库的概念数")
     total_stocks: int = Field(default=0, description="总成份股映射数")
     elapsed_time: float = Field(default=0.0, description="耗时（秒）")
 
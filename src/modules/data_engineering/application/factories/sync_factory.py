@@ -7,6 +7,9 @@ from src.modules.data_engineering.application.commands.sync_engine import (
 from src.modules.data_engineering.application.commands.sync_incremental_finance_cmd import (
     SyncIncrementalFinanceCmd,
 )
+from src.modules.data_engineering.application.services.trading_calendar_service import (
+    TradingCalendarService,
+)
 from src.modules.data_engineering.infrastructure.external_apis.tushare.client import (
     TushareClient,
 )
@@ -22,6 +25,9 @@ from src.modules.data_engineering.infrastructure.persistence.repositories.pg_sto
 from src.modules.data_engineering.infrastructure.persistence.repositories.pg_sync_task_repo import (
     SyncTaskRepositoryImpl,
 )
+from src.modules.data_engineering.infrastructure.persistence.repositories.pg_trade_calendar_repo import (
+    PgTradeCalendarRepository,
+)
 from src.shared.infrastructure.db.session import AsyncSessionLocal
 
 
@@ -54,6 +60,10 @@ class SyncUseCaseFactory:
 
                 quote_provider = TushareClient()
                 finance_provider = TushareClient()
+                trading_calendar = TradingCalendarService(
+                    calendar_repo=PgTradeCalendarRepository(session),
+                    provider_factory=lambda: quote_provider,
+                )
 
                 # 装配 SyncEngine
                 engine = SyncEngine(
@@ -63,6 +73,7 @@ class SyncUseCaseFactory:
                     finance_repo=finance_repo,
                     quote_provider=quote_provider,
                     finance_provider=finance_provider,
+                    trading_calendar=trading_calendar,
                 )
 
                 yield engine
@@ -92,12 +103,17 @@ class SyncUseCaseFactory:
                 stock_repo = StockRepositoryImpl(session)
                 finance_repo = StockFinanceRepositoryImpl(session)
                 finance_provider = TushareClient()
+                trading_calendar = TradingCalendarService(
+                    calendar_repo=PgTradeCalendarRepository(session),
+                    provider_factory=lambda: finance_provider,
+                )
 
                 use_case = SyncIncrementalFinanceCmd(
                     finance_repo=finance_repo,
                     stock_repo=stock_repo,
                     sync_task_repo=sync_task_repo,
                     data_provider=finance_provider,
+                    trading_calendar=trading_calendar,
                 )
 
                 yield use_case
@@ -10,10 +10,12 @@ from src.modules.data_engineering.presentation.jobs.akshare_market_data_jobs imp
     sync_akshare_market_data_job,
 )
 from src.modules.data_engineering.presentation.jobs.sync_scheduler import (
+    maintain_stock_daily_partitions_job,
     sync_concept_data_job,
     sync_daily_data_job,
     sync_incremental_finance_job,
     sync_stock_basic_job,
+    sync_trade_calendar_job,
 )
 
 
@@ -29,4 +31,6 @@ def get_job_registry() -> Dict[str, Callable]:
         "sync_concept_data": sync_concept_data_job,
         "sync_stock_basic": sync_stock_basic_job,
         "sync_akshare_market_data": sync_akshare_market_data_job,
+        "sync_trade_calendar": sync_trade_calendar_job,
+        "maintain_stock_daily_partitions": maintain_stock_daily_partitions_job,
     }
@@ -7,7 +7,7 @@ from datetime import date
 from typing import List
 
 from src.modules.data_engineering.application.dtos.daily_bar_dto import DailyBarDTO
-from src.modules.data_engineering.domain.model.stock_daily import StockDaily
+from src.modules.data_engineering.application.dtos.daily_bar_frame import DailyBarFrame
 from src.modules.data_engineering.domain.ports.repositories.market_quote_repo import (
     IMarketQuoteRepository,
 )
@@ -30,19 +30,10 @@ class GetDailyBarsByDateUseCase:
         执行查询。trade_date 为交易日期。
         返回该日期所有股票的日线 DTO 列表。
         """
-        dailies: List[StockDaily] = await self._repo.get_all_by_trade_date(trade_date=trade_date)
-        return [
-            DailyBarDTO(
-                third_code=d.third_code,
-                stock_name=d.stock_name,
-                trade_date=d.trade_date,
-                open=d.open,
-                high=d.high,
-                low=d.low,
-                close=d.close,
-                vol=d.vol,
-                amount=d.amount,
-                pct_chg=getattr(d, "pct_chg", 0.0) or 0.0,
-            )
-            for d in dailies
-        ]
+        rows = await self._repo.get_all_by_trade_date(trade_date=trade_date)
+        return [DailyBarDTO(**r._asdict()) for r in rows]
+
+    async def execute_frame(self, trade_date: date) -> DailyBarFrame:
+        """执行查询并以列式 DailyBarFrame 返回，供全市场按列统计直接消费。"""
+        rows = await self._repo.get_all_by_trade_date(trade_date=trade_date)
+        return DailyBarFrame.from_rows(rows)
@@ -7,7 +7,7 @@ from datetime import date
 from typing import List
 
 from src.modules.data_engineering.application.dtos.daily_bar_dto import DailyBarDTO
-from src.modules.data_engineering.domain.model.stock_daily import StockDaily
+from src.modules.data_engineering.application.dtos.daily_bar_frame import DailyBarFrame
 from src.modules.data_engineering.domain.ports.repositories.market_quote_repo import (
     IMarketQuoteRepository,
 )
@@ -32,23 +32,43 @@ class GetDailyBarsForTickerUseCase:
         执行查询。ticker 为第三方代码（如 000001.SZ）。
         返回按 trade_date 升序的日线 DTO 列表。
         """
-        dailies: List[StockDaily] = await self._repo.get_by_third_code_and_date_range(
+        rows = await self._repo.get_by_third_code_and_date_range(
             third_code=ticker,
             start_date=start_date,
             end_date=end_date,
         )
-        return [
-            DailyBarDTO(
-                third_code=d.third_code,
-                stock_name=getattr(d, "stock_name", "") or "",
-                trade_date=d.trade_date,
-                open=d.open,
-                high=d.high,
-                low=d.low,
-                close=d.close,
-                vol=d.vol,
-                amount=d.amount,
-                pct_chg=getattr(d, "pct_chg", 0.0) or 0.0,
-            )
-            for d in dailies
-        ]
+        return [DailyBarDTO(**r._asdict()) for r in rows]
+
+    async def execute_frame(
+        self,
+        ticker: str,
+        start_date: date,
+        end_date: date,
+    ) -> DailyBarFrame:
+        """
+        执行查询并以列式 DailyBarFrame 返回（按 trade_date 升序），
+        供按列计算指标的调用方直接消费，不逐行构造 DTO。
+        """
+        rows = await self._repo.get_by_third_code_and_date_range(
+            third_code=ticker,
+            start_date=start_date,
+            end_date=end_date,
+        )
+        return DailyBarFrame.from_rows(rows)
+
+    async def execute_frame_for_tickers(
+        self,
+        tickers: List[str],
+        start_date: date,
+        end_date: date,
+    ) -> DailyBarFrame:
+        """
+        批量查询多个标的的日线，以列式 DailyBarFrame 返回（按 third_code、trade_date 升序），
+        供全市场批量指标计算按标的切分后逐段计算。
+        """
+        rows = await self._repo.get_by_third_codes_and_date_range(
+            third_codes=tickers,
+            start_date=start_date,
+            end_date=end_date,
+        )
+        return DailyBarFrame.from_rows(rows)
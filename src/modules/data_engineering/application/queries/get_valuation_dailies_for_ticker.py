@@ -4,11 +4,11 @@
 """
 
 from datetime import date
-from typing import List, Optional
+from typing import Dict, List, Optional, Sequence, Tuple
 
+import numpy as np
 from pydantic import BaseModel, Field
 
-from src.modules.data_engineering.domain.model.stock_daily import StockDaily
 from src.modules.data_engineering.domain.ports.repositories.market_quote_repo import (
     IMarketQuoteRepository,
 )
@@ -31,6 +31,10 @@ class ValuationDailyDTO(BaseModel):
     model_config = {"frozen": True}
 
 
+# 估值历史分位计算所需字段，与 stock_daily 覆盖索引的列一致（可走 index-only scan）
+VALUATION_PERCENTILE_FIELDS: Tuple[str, ...] = ("trade_date", "close", "pe_ttm", "pb", "ps_ttm")
+
+
 class GetValuationDailiesForTickerUseCase:
     """
     按标的（third_code）与日期区间查询估值日线，返回含估值字段的 DTO 列表。
@@ -50,20 +54,35 @@ class GetValuationDailiesForTickerUseCase:
         执行查询。ticker 为第三方代码（如 000001.SZ）。
         返回按 trade_date 升序的估值日线 DTO 列表。
         """
-        dailies: List[StockDaily] = await self._repo.get_valuation_dailies(
+        rows = await self._repo.get_valuation_dailies(
+            third_code=ticker,
+            start_date=start_date,
+            end_date=end_date,
+        )
+        return [ValuationDailyDTO(**r._asdict()) for r in rows]
+
+    async def execute_fields(
+        self,
+        ticker: str,
+        start_date: date,
+        end_date: date,
+        fields: Sequence[str] = VALUATION_PERCENTILE_FIELDS,
+    ) -> Dict[str, np.ndarray]:
+        """
+        按字段投影查询估值历史，返回 {字段名: 数组}（按 trade_date 升序）。
+        trade_date 为 object 数组，数值字段为 float64 数组（空值为 NaN）。
+        """
+        columns = await self._repo.get_field_history(
             third_code=ticker,
             start_date=start_date,
             end_date=end_date,
+            fields=fields,
         )
-        return [
-            ValuationDailyDTO(
-                trade_date=d.trade_date,
-                close=d.close,
-                pe_ttm=d.pe_ttm,
-                pb=d.pb,
-                ps_ttm=d.ps_ttm,
-                dv_ratio=d.dv_ratio,
-                total_mv=d.total_mv,
+        return {
+            name: (
+                np.asarray(values, dtype=object)
+                if name == "trade_date"
+                else np.asarray(values, dtype=np.float64)
             )
-            for d in dailies
-        ]
+            for name, values in columns.items()
+        }
@@ -3,6 +3,7 @@
 负责基础数据的同步，包括：
 - 概念数据同步（akshare → PostgreSQL）
 - 股票基础信息同步（TuShare → PostgreSQL）
+- 交易日历同步（TuShare → PostgreSQL）
 """
 
 from src.modules.data_engineering.application.commands.sync_concept_data_cmd import (
@@ -16,6 +17,7 @@ from src.modules.data_engineering.application.factories.sync_factory import (
 )
 from src.modules.data_engineering.application.services.base import SyncServiceBase
 from src.modules.data_engineering.container import DataEngineeringContainer
+from src.shared.infrastructure.db.session import AsyncSessionLocal
 
 
 class BasicDataSyncService(SyncServiceBase):
@@ -127,3 +129,30 @@ class BasicDataSyncService(SyncServiceBase):
         )
 
         return sync_result
+
+    async def run_trade_calendar_sync(self) -> dict:
+        """
+        执行交易日历同步（TuShare → PostgreSQL）。
+
+        从已持久化的最后一个日历日增量拉取至次年年底，并重载进程内交易日历缓存。
+
+        Returns:
+            同步结果摘要字典，包含:
+            - synced_count: 写入的日历条目数
+            - message: 状态消息
+        """
+
+        async def _do_sync() -> dict:
+            async with AsyncSessionLocal() as session:
+                container = DataEngineeringContainer(session)
+                synced_count = await container.get_trading_calendar().refresh()
+                return {
+                    "synced_count": synced_count,
+                    "message": f"交易日历同步完成，写入 {synced_count} 条",
+                }
+
+        return await self._execute_with_tracking(
+            job_id="sync_trade_calendar",
+            operation=_do_sync,
+            success_message="交易日历同步完成",
+        )
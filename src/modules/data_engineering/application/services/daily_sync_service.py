@@ -3,6 +3,7 @@
 负责日线数据的同步，包括：
 - 日线增量同步（每日新增数据）
 - 日线历史全量同步（初始化或修复时使用）
+- 日线分区维护（提前创建未来年度分区）
 """
 
 from datetime import datetime
@@ -12,9 +13,11 @@ from src.modules.data_engineering.application.factories.sync_factory import (
     SyncUseCaseFactory,
 )
 from src.modules.data_engineering.application.services.base import SyncServiceBase
+from src.modules.data_engineering.container import DataEngineeringContainer
 from src.modules.data_engineering.domain.model.enums import SyncJobType
 from src.modules.data_engineering.domain.model.sync_task import SyncTask
 from src.modules.data_engineering.infrastructure.config import de_config
+from src.shared.infrastructure.db.session import AsyncSessionLocal
 
 
 class DailySyncService(SyncServiceBase):
@@ -104,6 +107,7 @@ class DailySyncService(SyncServiceBase):
             async with SyncUseCaseFactory.create_sync_engine() as engine:
                 config = {
                     "batch_size": de_config.SYNC_DAILY_HISTORY_BATCH_SIZE,
+                    "concurrency": de_config.SYNC_DAILY_HISTORY_CONCURRENCY,
                 }
                 return await engine.run_history_sync(
                     job_type=SyncJobType.DAILY_HISTORY,
@@ -115,3 +119,66 @@ class DailySyncService(SyncServiceBase):
             operation=_do_sync,
             success_message="日线历史全量同步完成",
         )
+
+    async def run_history_backfill(
+        self, start_date: Optional[str] = None, end_date: Optional[str] = None
+    ) -> SyncTask:
+        """
+        执行日线历史回补（自动选择按股票 / 按交易日策略）。
+
+        缺失股票较少时按股票仅回补缺失标的；缺失面广时按交易日拉取全市场，
+        每个交易日仅需 3 次 Tushare 调用。
+
+        Args:
+            start_date: 起始日期 (YYYYMMDD)，默认 SYNC_DAILY_HISTORY_START_DATE
+            end_date: 结束日期 (YYYYMMDD)，默认为当天
+
+        Returns:
+            SyncTask 对象
+        """
+
+        async def _do_sync() -> SyncTask:
+            async with SyncUseCaseFactory.create_sync_engine() as engine:
+                return await engine.run_daily_history_backfill(
+                    start_date=start_date,
+                    end_date=end_date or datetime.now().strftime("%Y%m%d"),
+                    config={"concurrency": de_config.SYNC_DAILY_HISTORY_CONCURRENCY},
+                )
+
+        return await self._execute_with_tracking(
+            job_id="sync_daily_history_backfill",
+            operation=_do_sync,
+            success_message="日线历史回补完成",
+        )
+
+    async def run_partition_maintenance(self) -> dict:
+        """
+        维护 stock_daily 年度分区：确保当年及未来 STOCK_DAILY_PARTITION_YEARS_AHEAD 年的分区存在。
+
+        Returns:
+            结果摘要字典，包含:
+            - created_partitions: 本次新建的分区名列表
+            - message: 状态消息
+        """
+
+        async def _do_maintain() -> dict:
+            current_year = datetime.now().year
+            years = range(
+                current_year, current_year + de_config.STOCK_DAILY_PARTITION_YEARS_AHEAD + 1
+            )
+            async with AsyncSessionLocal() as session:
+                container = DataEngineeringContainer(session)
+                created = await container.get_market_quote_repository().ensure_year_partitions(
+                    years
+                )
+                await session.commit()
+            return {
+                "created_partitions": created,
+                "message": f"日线分区维护完成，新建 {len(created)} 个分区",
+            }
+
+        return await self._execute_with_tracking(
+            job_id="maintain_stock_daily_partitions",
+            operation=_do_maintain,
+            success_message="日线分区维护完成",
+        )
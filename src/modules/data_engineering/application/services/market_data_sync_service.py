@@ -16,6 +16,7 @@ from src.modules.data_engineering.application.dtos.sync_result_dtos import (
 )
 from src.modules.data_engineering.application.services.base import SyncServiceBase
 from src.modules.data_engineering.container import DataEngineeringContainer
+from src.shared.infrastructure.db.session import AsyncSessionLocal
 
 
 class MarketDataSyncService(SyncServiceBase):
@@ -88,12 +89,13 @@ class MarketDataSyncService(SyncServiceBase):
             trade_date = datetime.now().date()
 
         async def _do_sync() -> AkShareSyncResult:
-            # 使用 Container 获取 Command
-            container = DataEngineeringContainer()
-            sync_cmd = container.get_sync_akshare_market_data_cmd()
+            async with AsyncSessionLocal() as session:
+                # 使用 Container 获取 Command（含交易日历，非交易日直接跳过）
+                container = DataEngineeringContainer(session)
+                sync_cmd = container.get_sync_akshare_market_data_cmd()
 
-            # 执行同步
-            return await sync_cmd.execute(trade_date=trade_date)
+                # 执行同步
+                return await sync_cmd.execute(trade_date=trade_date)
 
         return await self._execute_with_tracking(
             job_id="sync_akshare_market_data",
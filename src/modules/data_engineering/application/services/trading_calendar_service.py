@@ -0,0 +1,222 @@
+"""交易日历服务。
+
+交易日历持久化在 de_trade_calendar 表中，首次使用时从 Tushare trade_cal 全量加载，
+之后由定时任务增量刷新。进程内维护一份按日期升序排列的交易日数组，
+所有查询都通过 bisect 完成，不再逐个自然日访问数据库或第三方接口。
+
+日历缺失（数据库为空且 Tushare 不可用）时降级为「周一至周五」的工作日判断，
+保证同步任务不会因日历不可用而中断。
+"""
+
+import asyncio
+import time
+from bisect import bisect_left, bisect_right
+from datetime import date, datetime, timedelta
+from typing import Callable, Dict, List, Optional
+
+from loguru import logger
+
+from src.modules.data_engineering.domain.ports.providers.trade_calendar_provider import (
+    ITradeCalendarProvider,
+)
+from src.modules.data_engineering.domain.ports.repositories.trade_calendar_repo import (
+    ITradeCalendarRepository,
+)
+from src.modules.data_engineering.domain.ports.trading_calendar import ITradingCalendar
+from src.modules.data_engineering.infrastructure.config import de_config
+
+
+def _weekdays_between(start_date: date, end_date: date) -> List[date]:
+    """闭区间内的周一至周五（日历不可用时的降级逻辑）。"""
+    days = []
+    current = start_date
+    while current <= end_date:
+        if current.weekday() < 5:
+            days.append(current)
+        current += timedelta(days=1)
+    return days
+
+
+class TradingCalendarCache:
+    """
+    进程内交易日历缓存。
+
+    `open_days` 为升序交易日数组，`covered_until` 为日历已覆盖的最后一个自然日；
+    覆盖范围之外的日期由调用方降级处理。
+    """
+
+    def __init__(self, ttl_seconds: float) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.open_days: List[date] = []
+        self.covered_until: Optional[date] = None
+        self.loaded_at: Optional[float] = None
+        # TTL 内已尝试从数据源补齐到的日期，避免数据源不可用时反复请求
+        self.checked_until: Optional[date] = None
+        self.lock = asyncio.Lock()
+
+    def is_fresh(self) -> bool:
+        return self.loaded_at is not None and time.monotonic() - self.loaded_at < self.ttl_seconds
+
+    def replace(self, open_days: List[date], covered_until: Optional[date]) -> None:
+        self.open_days = sorted(open_days)
+        self.covered_until = covered_until
+        self.loaded_at = time.monotonic()
+        self.checked_until = None
+
+    def covers(self, day: date) -> bool:
+        return (
+            bool(self.open_days)
+            and self.covered_until is not None
+            and self.open_days[0] <= day <= self.covered_until
+        )
+
+    def contains(self, day: date) -> bool:
+        idx = bisect_left(self.open_days, day)
+        return idx < len(self.open_days) and self.open_days[idx] == day
+
+    def between(self, start_date: date, end_date: date) -> List[date]:
+        lo = bisect_left(self.open_days, start_date)
+        hi = bisect_right(self.open_days, end_date)
+        return self.open_days[lo:hi]
+
+    def previous(self, day: date) -> Optional[date]:
+        idx = bisect_left(self.open_days, day)
+        return self.open_days[idx - 1] if idx > 0 else None
+
+
+# 交易日历缓存：全进程共享，按交易所区分
+_calendar_caches: Dict[str, TradingCalendarCache] = {}
+
+
+def _get_calendar_cache(exchange: str) -> TradingCalendarCache:
+    """获取进程内共享的交易日历缓存。"""
+    cache = _calendar_caches.get(exchange)
+    if cache is None:
+        cache = TradingCalendarCache(ttl_seconds=de_config.TRADE_CALENDAR_REFRESH_HOURS * 3600)
+        _calendar_caches[exchange] = cache
+    return cache
+
+
+class TradingCalendarService(ITradingCalendar):
+    """
+    基于持久化交易日历 + 进程内缓存的 ITradingCalendar 实现。
+
+    Args:
+        calendar_repo: 交易日历仓储
+        provider_factory: 按需创建交易日历数据源（仅在需要从 Tushare 刷新时调用）
+        exchange: 交易所代码，默认取配置
+        cache: 缓存实例，默认使用进程内共享缓存
+    """
+
+    def __init__(
+        self,
+        calendar_repo: ITradeCalendarRepository,
+        provider_factory: Optional[Callable[[], ITradeCalendarProvider]] = None,
+        exchange: Optional[str] = None,
+        cache: Optional[TradingCalendarCache] = None,
+    ) -> None:
+        self.calendar_repo = calendar_repo
+        self.provider_factory = provider_factory
+        self.exchange = exchange or de_config.TRADE_CALENDAR_EXCHANGE
+        self.cache = cache or _get_calendar_cache(self.exchange)
+
+    async def is_trading_day(self, day: date) -> bool:
+        await self._ensure_loaded(day)
+        if not self.cache.covers(day):
+            return day.weekday() < 5
+        return self.cache.contains(day)
+
+    async def get_trading_days(self, start_date: date, end_date: date) -> List[date]:
+        if start_date > end_date:
+            return []
+        await self._ensure_loaded(end_date)
+        if not self.cache.open_days or self.cache.covered_until is None:
+            return _weekdays_between(start_date, end_date)
+
+        # 覆盖范围内走缓存，两端超出覆盖范围的部分降级为工作日
+        first, last = self.cache.open_days[0], self.cache.covered_until
+        days: List[date] = []
+        if start_date < first:
+            days.extend(_weekdays_between(start_date, min(end_date, first - timedelta(days=1))))
+        days.extend(self.cache.between(max(start_date, first), min(end_date, last)))
+        if end_date > last:
+            days.extend(_weekdays_between(max(start_date, last + timedelta(days=1)), end_date))
+        return days
+
+    async def get_previous_trading_day(self, day: date) -> Optional[date]:
+        await self._ensure_loaded(day)
+        if not self.cache.covers(day):
+            previous = day - timedelta(days=1)
+            while previous.weekday() >= 5:
+                previous -= timedelta(days=1)
+            return previous
+        return self.cache.previous(day)
+
+    async def refresh(self, end_date: Optional[date] = None) -> int:
+        """
+        从 Tushare 增量拉取交易日历并持久化，随后重载缓存。
+
+        从已持久化的最后一个自然日开始拉取（无数据时从配置的起始日期全量拉取），
+        默认拉取到次年年底（交易所通常在年底前公布次年安排）。
+
+        Returns:
+            本次写入的日历条目数
+        """
+        if self.provider_factory is None:
+            logger.warning("未配置交易日历数据源，跳过刷新")
+            return 0
+
+        latest = await self.calendar_repo.get_latest_cal_date(self.exchange)
+        start = latest.strftime("%Y%m%d") if latest else de_config.TRADE_CALENDAR_START_DATE
+        end_date = end_date or date(datetime.now().year + 1, 12, 31)
+        end = end_date.strftime("%Y%m%d")
+
+        days = await self.provider_factory().fetch_trade_calendar(
+            start_date=start, end_date=end, exchange=self.exchange
+        )
+        saved = await self.calendar_repo.save_all(days)
+        logger.info(f"交易日历刷新完成: exchange={self.exchange}, {start} ~ {end}, 写入 {saved} 条")
+
+        await self._load_from_repo()
+        return saved
+
+    async def _ensure_loaded(self, day: date) -> None:
+        """保证缓存新鲜且覆盖指定日期；DB 覆盖不足时尝试从 Tushare 补齐（TTL 内只尝试一次）。"""
+        if self._is_settled(day):
+            return
+
+        async with self.cache.lock:
+            if self._is_settled(day):
+                return
+            refresh_until = max(day, date(datetime.now().year, 12, 31))
+            try:
+                if not self.cache.is_fresh():
+                    await self._load_from_repo()
+                if self._is_beyond_coverage(day):
+                    await self.refresh(end_date=refresh_until)
+            except Exception as e:
+                logger.warning(f"交易日历加载失败，降级为工作日判断: {str(e)}")
+                if self.cache.loaded_at is None:
+                    self.cache.loaded_at = time.monotonic()
+            finally:
+                # 记录已尝试补齐的区间，避免 TTL 内每次查询都重试
+                if self._is_beyond_coverage(day):
+                    self.cache.checked_until = max(
+                        refresh_until, self.cache.checked_until or refresh_until
+                    )
+
+    def _is_settled(self, day: date) -> bool:
+        """缓存新鲜，且已覆盖该日期或 TTL 内已尝试过补齐。"""
+        if not self.cache.is_fresh():
+            return False
+        if not self._is_beyond_coverage(day):
+            return True
+        return self.cache.checked_until is not None and day <= self.cache.checked_until
+
+    def _is_beyond_coverage(self, day: date) -> bool:
+        return self.cache.covered_until is None or day > self.cache.covered_until
+
+    async def _load_from_repo(self) -> None:
+        open_days = await self.calendar_repo.get_open_dates(self.exchange)
+        covered_until = await self.calendar_repo.get_latest_cal_date(self.exchange)
+        self.cache.replace(open_days, covered_until)
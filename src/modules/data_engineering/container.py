@@ -61,6 +61,9 @@ from src.modules.data_engineering.application.queries.get_stock_basic_info impor
 from src.modules.data_engineering.application.queries.get_valuation_dailies_for_ticker import (
     GetValuationDailiesForTickerUseCase,
 )
+from src.modules.data_engineering.application.services.trading_calendar_service import (
+    TradingCalendarService,
+)
 from src.modules.data_engineering.domain.ports.providers.concept_data_provider import (
     IConceptDataProvider,
 )
@@ -85,6 +88,9 @@ from src.modules.data_engineering.domain.ports.repositories.dragon_tiger_repo im
 from src.modules.data_engineering.domain.ports.repositories.limit_up_pool_repo import (
     ILimitUpPoolRepository,
 )
+from src.modules.data_engineering.domain.ports.repositories.market_quote_repo import (
+    IMarketQuoteRepository,
+)
 from src.modules.data_engineering.domain.ports.repositories.previous_limit_up_repo import (
     IPreviousLimitUpRepository,
 )
@@ -97,6 +103,9 @@ from src.modules.data_engineering.infrastructure.external_apis.akshare.client im
 from src.modules.data_engineering.infrastructure.external_apis.akshare.market_data_client import (
     AkShareMarketDataClient,
 )
+from src.modules.data_engineering.infrastructure.external_apis.tushare.client import (
+    TushareClient,
+)
 from src.modules.data_engineering.infrastructure.persistence.repositories.pg_broken_board_repo import (
     PgBrokenBoardRepository,
 )
@@ -124,6 +133,9 @@ from src.modules.data_engineering.infrastructure.persistence.repositories.pg_sec
 from src.modules.data_engineering.infrastructure.persistence.repositories.pg_stock_repo import (
     StockRepositoryImpl,
 )
+from src.modules.data_engineering.infrastructure.persistence.repositories.pg_trade_calendar_repo import (
+    PgTradeCalendarRepository,
+)
 
 
 class DataEngineeringContainer:
@@ -156,6 +168,20 @@ class DataEngineeringContainer:
             PgSectorCapitalFlowRepository(session)
         )
 
+        # 交易日历（进程内共享缓存，TushareClient 仅在需要刷新时创建）
+        self._trading_calendar = TradingCalendarService(
+            calendar_repo=PgTradeCalendarRepository(session),
+            provider_factory=TushareClient,
+        )
+
+    def get_trading_calendar(self) -> TradingCalendarService:
+        """获取交易日历服务（实现 ITradingCalendar，另提供 refresh 供定时任务使用）。"""
+        return self._trading_calendar
+
+    def get_market_quote_repository(self) -> IMarketQuoteRepository:
+        """获取日线仓储（供分区维护等存储层任务使用）。"""
+        return self._market_quote_repo
+
     def get_daily_bars_use_case(self) -> GetDailyBarsForTickerUseCase:
         """组装按标的查询日线的 UseCase。"""
         return GetDailyBarsForTickerUseCase(market_quote_repo=self._market_quote_repo)
@@ -210,6 +236,7 @@ class DataEngineeringContainer:
             previous_limit_up_repo=self._previous_limit_up_repo,
             dragon_tiger_repo=self._dragon_tiger_repo,
             sector_capital_flow_repo=self._sector_capital_flow_repo,
+            trading_calendar=self._trading_calendar,
         )
 
     def get_limit_up_pool_by_date_use_case(self) -> GetLimitUpPoolByDateUseCase:
@@ -1,6 +1,10 @@
+from datetime import datetime
+from typing import Optional
+
 from pydantic import BaseModel, Field
 
 from src.modules.data_engineering.domain.model.concept import ConceptStock
+from src.modules.data_engineering.domain.model.enums import ConceptChangeType
 
 
 class ConceptInfoDTO(BaseModel):
@@ -32,3 +36,29 @@ class ConceptWithStocksDTO(BaseModel):
     code: str = Field(..., description="概念板块代码")
     name: str = Field(..., description="概念板块名称")
     stocks: list[ConceptStock] = Field(default_factory=list, description="该概念下的成份股列表")
+
+
+class ConceptMappingDiffDTO(BaseModel):
+    """
+    成份股映射差异写入结果 DTO
+    批量替换成份股映射时，与库中现有映射比对后实际发生的变更条数
+    """
+
+    concepts: int = Field(default=0, description="写入（UPSERT）的概念数")
+    inserted: int = Field(default=0, description="新增的成份股映射数")
+    deleted: int = Field(default=0, description="移除的成份股映射数")
+    renamed: int = Field(default=0, description="股票名称变更的映射数")
+
+
+class ConceptMembershipChangeDTO(BaseModel):
+    """
+    成份股映射变更日志 DTO
+    供知识图谱、市场洞察等下游按变更日志 id 增量应用概念成份股变化
+    """
+
+    id: int = Field(..., description="变更日志 id（单调递增，作为消费游标）")
+    concept_code: str = Field(..., description="概念板块代码")
+    third_code: str = Field(..., description="股票代码，系统标准 third_code 格式")
+    stock_name: Optional[str] = Field(default=None, description="股票名称")
+    change_type: ConceptChangeType = Field(..., description="变更类型")
+    changed_at: datetime = Field(..., description="变更时间")
@@ -0,0 +1,24 @@
+"""
+历史同步规划 DTO。
+
+描述日线历史回补在「按股票」与「按交易日」两种策略之间的选择结果及其依据。
+"""
+
+from pydantic import BaseModel, Field
+
+from src.modules.data_engineering.domain.model.enums import SyncJobType
+
+
+class DailyHistorySyncPlan(BaseModel):
+    """日线历史回补规划结果。"""
+
+    job_type: SyncJobType = Field(..., description="选定的同步策略对应的任务类型")
+    start_date: str = Field(..., description="回补起始日期（YYYYMMDD）")
+    end_date: str = Field(..., description="回补结束日期（YYYYMMDD）")
+    listed_tickers: int = Field(default=0, description="上市股票总数")
+    missing_tickers: list[str] = Field(
+        default_factory=list, description="区间内无任何日线数据的股票代码"
+    )
+    trade_days: int = Field(default=0, description="区间内交易日数")
+    per_ticker_calls: int = Field(default=0, description="按股票策略预估 API 调用数")
+    per_date_calls: int = Field(default=0, description="按交易日策略预估 API 调用数")
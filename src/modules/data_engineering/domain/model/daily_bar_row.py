@@ -0,0 +1,36 @@
+"""
+日线只读投影行
+
+分析类读路径（技术指标、全市场日报、估值分位）只需要日线的少数列，
+仓储以列投影查询直接返回轻量 NamedTuple，不再构造 ORM 实体与 StockDaily 领域实体。
+"""
+
+from datetime import date
+from typing import NamedTuple, Optional
+
+
+class DailyBarRow(NamedTuple):
+    """日线行情投影：开高低收量、成交额、涨跌幅（空值已归零）。"""
+
+    third_code: str
+    stock_name: str
+    trade_date: date
+    open: float
+    high: float
+    low: float
+    close: float
+    vol: float
+    amount: float
+    pct_chg: float
+
+
+class ValuationDailyRow(NamedTuple):
+    """估值日线投影：收盘价与估值指标（估值指标保留空值）。"""
+
+    trade_date: date
+    close: float
+    pe_ttm: Optional[float]
+    pb: Optional[float]
+    ps_ttm: Optional[float]
+    dv_ratio: Optional[float]
+    total_mv: Optional[float]
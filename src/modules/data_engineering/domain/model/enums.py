@@ -32,6 +32,7 @@ class SyncJobType(str, Enum):
     """同步任务类型枚举"""
 
     DAILY_HISTORY = "DAILY_HISTORY"  # 历史日线全量同步
+    DAILY_HISTORY_BY_DATE = "DAILY_HISTORY_BY_DATE"  # 历史日线按交易日全市场回补
     FINANCE_HISTORY = "FINANCE_HISTORY"  # 历史财务全量同步
     DAILY_INCREMENTAL = "DAILY_INCREMENTAL"  # 日线增量同步
     FINANCE_INCREMENTAL = "FINANCE_INCREMENTAL"  # 财务增量同步
@@ -46,3 +47,11 @@ class SyncTaskStatus(str, Enum):
     COMPLETED = "COMPLETED"  # 已完成
     FAILED = "FAILED"  # 失败
     PAUSED = "PAUSED"  # 已暂停
+
+
+class ConceptChangeType(str, Enum):
+    """概念成份股映射变更类型枚举"""
+
+    ADDED = "ADDED"  # 新增映射
+    REMOVED = "REMOVED"  # 移除映射
+    RENAMED = "RENAMED"  # 股票名称变更
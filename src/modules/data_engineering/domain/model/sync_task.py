@@ -6,7 +6,7 @@
 """
 
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, ClassVar, Dict, Optional, Tuple
 
 from pydantic import ConfigDict, Field
 
@@ -39,6 +39,10 @@ class SyncTask(BaseEntity):
 
     model_config = ConfigDict(from_attributes=True)
 
+    # 决定 offset 所索引列表的配置键：同类型任务仅在这些键一致时才可断点续跑。
+    # end_date 不参与：调用方常以当天为结束日期，区间向后延伸不改变已处理部分的 offset
+    SCOPE_KEYS: ClassVar[Tuple[str, ...]] = ("start_date", "third_codes")
+
     def start(self) -> None:
         """启动任务：更新状态为 RUNNING 并记录启动时间"""
         self.status = SyncTaskStatus.RUNNING
@@ -76,3 +80,13 @@ class SyncTask(BaseEntity):
     def is_resumable(self) -> bool:
         """判断任务是否可恢复（RUNNING 或 PAUSED 状态）"""
         return self.status in (SyncTaskStatus.RUNNING, SyncTaskStatus.PAUSED)
+
+    def has_same_scope(self, config: Dict[str, Any]) -> bool:
+        """
+        判断任务覆盖范围是否与给定配置一致。
+
+        全量同步不带 third_codes；按股票回补带 third_codes 与起始日期。
+        范围不一致时续跑会用错 offset 所对应的列表，必须新建任务。
+        """
+        task_config = self.config or {}
+        return all(task_config.get(key) == config.get(key) for key in self.SCOPE_KEYS)
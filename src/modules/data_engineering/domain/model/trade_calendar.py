@@ -0,0 +1,16 @@
+from datetime import date
+from typing import Optional
+
+from pydantic import BaseModel, Field
+
+
+class TradeCalendarDay(BaseModel):
+    """
+    交易日历条目
+    表示某交易所某个自然日是否开市
+    """
+
+    exchange: str = Field(default="SSE", description="交易所代码（SSE/SZSE 等）")
+    cal_date: date = Field(..., description="日历日期")
+    is_open: bool = Field(..., description="是否交易日")
+    pretrade_date: Optional[date] = Field(None, description="上一个交易日")
@@ -0,0 +1,18 @@
+from abc import ABC, abstractmethod
+from typing import List
+
+from src.modules.data_engineering.domain.model.trade_calendar import TradeCalendarDay
+
+
+class ITradeCalendarProvider(ABC):
+    @abstractmethod
+    async def fetch_trade_calendar(
+        self, start_date: str, end_date: str, exchange: str = "SSE"
+    ) -> List[TradeCalendarDay]:
+        """
+        获取交易所交易日历
+        :param start_date: 开始日期（YYYYMMDD）
+        :param end_date: 结束日期（YYYYMMDD）
+        :param exchange: 交易所代码
+        :return: 区间内每个自然日的开市状态
+        """
@@ -1,6 +1,11 @@
 from abc import ABC, abstractmethod
+from typing import Optional
 
-from src.modules.data_engineering.domain.dtos.concept_dtos import ConceptWithStocksDTO
+from src.modules.data_engineering.domain.dtos.concept_dtos import (
+    ConceptMappingDiffDTO,
+    ConceptMembershipChangeDTO,
+    ConceptWithStocksDTO,
+)
 from src.modules.data_engineering.domain.model.concept import Concept, ConceptStock
 
 
@@ -35,6 +40,23 @@ class IConceptRepository(ABC):
             int: 总影响的行数（概念1行 + 成份股行数）
         """
 
+    @abstractmethod
+    async def replace_concepts_with_stocks(
+        self, items: list[ConceptWithStocksDTO]
+    ) -> ConceptMappingDiffDTO:
+        """
+        在一个事务中批量 UPSERT 多个概念并替换其成份股映射
+
+        与库中现有映射比对后只写差异：新增缺失映射、删除已移出的映射、更新名称变化的映射，
+        未变化的行不改写；同时更新概念的成份股内容哈希，并将每条差异写入变更日志。
+
+        Args:
+            items: 概念及其最新成份股列表
+
+        Returns:
+            ConceptMappingDiffDTO: 实际变更条数
+        """
+
     @abstractmethod
     async def replace_concept_stocks(self, concept_code: str, stocks: list[ConceptStock]) -> int:
         """
@@ -101,3 +123,58 @@ class IConceptRepository(ABC):
         Returns:
             list[ConceptWithStocksDTO]: 概念及成份股聚合列表
         """
+
+    @abstractmethod
+    async def get_concept_states(self) -> dict[str, tuple[str, Optional[str]]]:
+        """
+        查询所有概念的名称与成份股内容哈希（用于跳过成员未变化的概念）
+
+        Returns:
+            dict[str, tuple[str, Optional[str]]]: {concept_code: (name, membership_hash)}
+        """
+
+    @abstractmethod
+    async def get_membership_changes(
+        self, after_id: int, limit: int
+    ) -> list[ConceptMembershipChangeDTO]:
+        """
+        按 id 升序查询指定游标之后的成份股映射变更日志
+
+        Args:
+            after_id: 已消费到的变更日志 id（不含）
+            limit: 最多返回条数
+
+        Returns:
+            list[ConceptMembershipChangeDTO]: 变更日志列表
+        """
+
+    @abstractmethod
+    async def get_latest_change_id(self) -> int:
+        """
+        查询当前最大的变更日志 id（无记录时为 0）
+
+        Returns:
+            int: 最大变更日志 id
+        """
+
+    @abstractmethod
+    async def get_change_cursor(self, consumer: str) -> Optional[int]:
+        """
+        查询下游消费者已应用到的变更日志 id
+
+        Args:
+            consumer: 消费者标识
+
+        Returns:
+            Optional[int]: 游标位置，从未消费过时为 None
+        """
+
+    @abstractmethod
+    async def save_change_cursor(self, consumer: str, change_id: int) -> None:
+        """
+        保存下游消费者已应用到的变更日志 id
+
+        Args:
+            consumer: 消费者标识
+            change_id: 已应用的变更日志 id
+        """
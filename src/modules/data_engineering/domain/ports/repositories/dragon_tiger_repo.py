@@ -11,12 +11,13 @@ class IDragonTigerRepository(ABC):
     """
 
     @abstractmethod
-    async def save_all(self, details: list[DragonTigerDetail]) -> int:
+    async def save_all(self, details: list[DragonTigerDetail], bulk: bool | None = None) -> int:
         """
         批量 UPSERT 龙虎榜记录（以 trade_date + third_code + reason 为唯一键）
 
         Args:
             details: 龙虎榜详情列表
+            bulk: 是否走 COPY 批量写入；None 时按行数阈值自动选择
 
         Returns:
             int: 影响的行数
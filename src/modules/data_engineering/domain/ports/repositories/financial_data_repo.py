@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List
+from typing import List, Optional
 
 from src.modules.data_engineering.domain.model.financial_report import (
     StockFinance,
@@ -8,8 +8,10 @@ from src.modules.data_engineering.domain.model.financial_report import (
 
 class IFinancialDataRepository(ABC):
     @abstractmethod
-    async def save_all(self, finances: List[StockFinance]) -> int:
-        pass
+    async def save_all(self, finances: List[StockFinance], bulk: Optional[bool] = None) -> int:
+        """
+        批量 UPSERT；bulk 为 True 时走 COPY 暂存表写入，None 时按行数阈值自动选择
+        """
 
     @abstractmethod
     async def get_by_third_code_recent(self, third_code: str, limit: int) -> List[StockFinance]:
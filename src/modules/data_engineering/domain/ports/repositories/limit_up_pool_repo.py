@@ -11,12 +11,13 @@ class ILimitUpPoolRepository(ABC):
     """
 
     @abstractmethod
-    async def save_all(self, stocks: list[LimitUpPoolStock]) -> int:
+    async def save_all(self, stocks: list[LimitUpPoolStock], bulk: bool | None = None) -> int:
         """
         批量 UPSERT 涨停池记录（以 trade_date + third_code 为唯一键）
 
         Args:
             stocks: 涨停池股票列表
+            bulk: 是否走 COPY 批量写入；None 时按行数阈值自动选择
 
         Returns:
             int: 影响的行数
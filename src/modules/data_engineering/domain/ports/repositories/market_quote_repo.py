@@ -1,20 +1,38 @@
 from abc import ABC, abstractmethod
 from datetime import date
-from typing import List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Sequence
 
+from src.modules.data_engineering.domain.model.daily_bar_row import DailyBarRow, ValuationDailyRow
 from src.modules.data_engineering.domain.model.stock_daily import StockDaily
 
 
 class IMarketQuoteRepository(ABC):
     @abstractmethod
-    async def save_all(self, dailies: List[StockDaily]) -> int:
-        pass
+    async def save_all(self, dailies: List[StockDaily], bulk: Optional[bool] = None) -> int:
+        """
+        批量 UPSERT；bulk 为 True 时走 COPY 暂存表写入，None 时按行数阈值自动选择
+        """
+
+    @abstractmethod
+    async def ensure_year_partitions(self, years: Iterable[int]) -> List[str]:
+        """
+        确保指定年份的日线存储分区存在（按年分区），供写入前与定时任务提前创建未来分区。
+
+        Returns:
+            本次新建的分区名列表
+        """
 
     @abstractmethod
     async def get_by_third_code_and_date_range(
         self, third_code: str, start_date: date, end_date: date
-    ) -> List[StockDaily]:
-        """按第三方代码与日期区间查询日线，供 Application 层只读使用。"""
+    ) -> List[DailyBarRow]:
+        """按第三方代码与日期区间查询日线投影行（按交易日期升序），供 Application 层只读使用。"""
+
+    @abstractmethod
+    async def get_by_third_codes_and_date_range(
+        self, third_codes: List[str], start_date: date, end_date: date
+    ) -> List[DailyBarRow]:
+        """按多个第三方代码与日期区间查询日线投影行（按代码、交易日期升序），供批量计算使用。"""
 
     @abstractmethod
     async def get_latest_by_third_code(self, third_code: str) -> Optional[StockDaily]:
@@ -38,16 +56,39 @@ class IMarketQuoteRepository(ABC):
     @abstractmethod
     async def get_valuation_dailies(
         self, third_code: str, start_date: date, end_date: date
-    ) -> List[StockDaily]:
+    ) -> List[ValuationDailyRow]:
         """
-        按第三方代码与日期区间查询日线（含估值字段），供估值分析使用。
-        返回的 StockDaily 包含 pe_ttm、pb、ps_ttm、dv_ratio、total_mv 等估值字段。
+        按第三方代码与日期区间查询估值日线投影行，供估值分析使用。
+        包含收盘价与 pe_ttm、pb、ps_ttm、dv_ratio、total_mv 等估值字段，按交易日期升序。
         """
 
     @abstractmethod
-    async def get_all_by_trade_date(self, trade_date: date) -> List[StockDaily]:
+    async def get_field_history(
+        self,
+        third_code: str,
+        start_date: date,
+        end_date: date,
+        fields: Sequence[str],
+    ) -> Dict[str, List[Any]]:
+        """
+        按字段投影查询日线历史（如 trade_date、close、pe_ttm、pb、ps_ttm），只读取所需列。
+
+        Returns:
+            {字段名: 按交易日期升序的取值列表}，空值保留为 None；字段不受支持时抛出 ValueError
+        """
+
+    @abstractmethod
+    async def get_all_by_trade_date(self, trade_date: date) -> List[DailyBarRow]:
         """
         查询指定交易日的全市场日线数据
         :param trade_date: 交易日期
-        :return: 该日期的所有股票日线数据列表
+        :return: 该日期的所有股票日线投影行（含股票名称）
+        """
+
+    @abstractmethod
+    async def get_third_codes_with_dailies(self, start_date: date, end_date: date) -> List[str]:
+        """
+        查询日期区间内至少有一条日线数据的股票代码（去重）
+
+        用于日线历史回补规划：与上市股票列表求差集得到缺失股票。
         """
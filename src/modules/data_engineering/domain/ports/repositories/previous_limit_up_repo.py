@@ -11,12 +11,13 @@ class IPreviousLimitUpRepository(ABC):
     """
 
     @abstractmethod
-    async def save_all(self, stocks: list[PreviousLimitUpStock]) -> int:
+    async def save_all(self, stocks: list[PreviousLimitUpStock], bulk: bool | None = None) -> int:
         """
         批量 UPSERT 昨日涨停表现记录（以 trade_date + third_code 为唯一键）
 
         Args:
             stocks: 昨日涨停表现股票列表
+            bulk: 是否走 COPY 批量写入；None 时按行数阈值自动选择
 
         Returns:
             int: 影响的行数
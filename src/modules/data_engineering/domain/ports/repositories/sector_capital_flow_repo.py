@@ -11,12 +11,13 @@ class ISectorCapitalFlowRepository(ABC):
     """
 
     @abstractmethod
-    async def save_all(self, flows: list[SectorCapitalFlow]) -> int:
+    async def save_all(self, flows: list[SectorCapitalFlow], bulk: bool | None = None) -> int:
         """
         批量 UPSERT 板块资金流向记录（以 trade_date + sector_name + sector_type 为唯一键）
 
         Args:
             flows: 板块资金流向列表
+            bulk: 是否走 COPY 批量写入；None 时按行数阈值自动选择
 
         Returns:
             int: 影响的行数
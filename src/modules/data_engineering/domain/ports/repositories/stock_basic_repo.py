@@ -30,6 +30,10 @@ class IStockBasicRepository(ABC):
     async def get_all(self, skip: int = 0, limit: int = 100) -> List[StockInfo]:
         pass
 
+    @abstractmethod
+    async def get_all_third_codes(self) -> List[str]:
+        """获取全部股票的 third_code（仅投影代码列，不构造领域对象）"""
+
     @abstractmethod
     async def get_missing_finance_stocks(
         self, target_period: str, check_threshold_date: date, limit: int = 200
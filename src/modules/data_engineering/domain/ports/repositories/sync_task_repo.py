@@ -66,6 +66,20 @@ class ISyncTaskRepository(ABC):
             最近的任务实体，不存在时返回 None
         """
 
+    @abstractmethod
+    async def list_paused_by_job_type(self, job_type: SyncJobType) -> List[SyncTask]:
+        """
+        查找指定类型的全部 PAUSED 任务（按 started_at 降序）
+
+        用于断点续跑场景：最近一次任务覆盖范围不同时，查找范围一致的更早暂停任务。
+
+        Args:
+            job_type: 任务类型
+
+        Returns:
+            PAUSED 任务列表，不存在时返回空列表
+        """
+
     @abstractmethod
     async def create_failure(self, record: SyncFailureRecord) -> SyncFailureRecord:
         """
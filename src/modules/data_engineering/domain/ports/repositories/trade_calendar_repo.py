@@ -0,0 +1,27 @@
+from abc import ABC, abstractmethod
+from datetime import date
+from typing import List, Optional
+
+from src.modules.data_engineering.domain.model.trade_calendar import TradeCalendarDay
+
+
+class ITradeCalendarRepository(ABC):
+    @abstractmethod
+    async def save_all(self, days: List[TradeCalendarDay]) -> int:
+        """批量 UPSERT 交易日历（以 exchange + cal_date 为唯一键）"""
+
+    @abstractmethod
+    async def get_open_dates(self, exchange: str) -> List[date]:
+        """
+        查询交易所全部交易日（is_open=True），按日期升序返回
+        :param exchange: 交易所代码
+        :return: 交易日列表
+        """
+
+    @abstractmethod
+    async def get_latest_cal_date(self, exchange: str) -> Optional[date]:
+        """
+        查询已持久化日历覆盖到的最后一个自然日
+        :param exchange: 交易所代码
+        :return: 最后日历日期，无数据返回 None
+        """
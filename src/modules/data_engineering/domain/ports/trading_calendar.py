@@ -0,0 +1,38 @@
+"""
+交易日历查询接口
+
+对外暴露交易日判断与区间枚举能力，供同步任务跳过周末与节假日。
+"""
+
+from abc import ABC, abstractmethod
+from datetime import date
+from typing import List, Optional
+
+
+class ITradingCalendar(ABC):
+    """交易日历查询接口"""
+
+    @abstractmethod
+    async def is_trading_day(self, day: date) -> bool:
+        """
+        判断指定日期是否为交易日
+        :param day: 日期
+        :return: 是否交易日
+        """
+
+    @abstractmethod
+    async def get_trading_days(self, start_date: date, end_date: date) -> List[date]:
+        """
+        获取闭区间 [start_date, end_date] 内的全部交易日，按日期升序返回
+        :param start_date: 开始日期
+        :param end_date: 结束日期
+        :return: 交易日列表
+        """
+
+    @abstractmethod
+    async def get_previous_trading_day(self, day: date) -> Optional[date]:
+        """
+        获取严格早于指定日期的最近一个交易日
+        :param day: 日期
+        :return: 上一个交易日，无则返回 None
+        """
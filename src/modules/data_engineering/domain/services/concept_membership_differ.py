@@ -0,0 +1,51 @@
+"""
+概念成份股差异比对领域服务
+"""
+
+import hashlib
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from src.modules.data_engineering.domain.dtos.concept_dtos import ConceptWithStocksDTO
+from src.modules.data_engineering.domain.model.concept import ConceptStock
+
+
+class ConceptMembershipDiffer:
+    """
+    概念成份股差异比对器
+
+    以成份股集合（third_code + stock_name，与顺序无关）的内容哈希标识一个概念的成员构成；
+    与库中保存的哈希一致且名称未变的概念无需写库，只有发生变化的概念才进入
+    成份股映射的逐行差异写入（新增 / 移除 / 更名）。
+    """
+
+    @staticmethod
+    def membership_hash(stocks: Iterable[ConceptStock]) -> str:
+        """
+        计算成份股集合的内容哈希（SHA-256 十六进制）
+        :param stocks: 成份股列表（重复的 third_code 以后出现者为准）
+        :return: 哈希字符串
+        """
+        members = {stock.third_code: stock.stock_name for stock in stocks}
+        payload = "\n".join(f"{code}\t{members[code]}" for code in sorted(members))
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def split_changed(
+        self,
+        items: List[ConceptWithStocksDTO],
+        current: Dict[str, Tuple[str, Optional[str]]],
+    ) -> Tuple[List[ConceptWithStocksDTO], List[ConceptWithStocksDTO]]:
+        """
+        按库中现状拆分出有变化与无变化的概念
+        :param items: 最新获取的概念及成份股
+        :param current: 库中现状 {concept_code: (name, membership_hash)}
+        :return: (有变化的概念, 无变化的概念)
+        """
+        changed: List[ConceptWithStocksDTO] = []
+        unchanged: List[ConceptWithStocksDTO] = []
+        for item in items:
+            stored = current.get(item.code)
+            if stored is not None and stored == (item.name, self.membership_hash(item.stocks)):
+                unchanged.append(item)
+            else:
+                changed.append(item)
+        return changed, unchanged
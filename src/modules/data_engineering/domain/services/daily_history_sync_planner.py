@@ -0,0 +1,59 @@
+"""
+日线历史回补策略规划领域服务
+"""
+
+from typing import List
+
+from src.modules.data_engineering.domain.dtos.sync_plan_dtos import (
+    DailyHistorySyncPlan,
+)
+from src.modules.data_engineering.domain.model.enums import SyncJobType
+
+# 每个股票 / 每个交易日都需要 daily、adj_factor、daily_basic 三次调用
+CALLS_PER_UNIT = 3
+
+
+class DailyHistorySyncPlanner:
+    """
+    日线历史回补规划器
+
+    按股票回补的成本与缺失股票数成正比，按交易日回补的成本与交易日数成正比
+    （每次调用返回全市场）。选择预估 API 调用数更少的策略；
+    成本相同时优先按交易日，写入批次更大、更利于批量 upsert。
+    """
+
+    def plan(
+        self,
+        start_date: str,
+        end_date: str,
+        listed_tickers: int,
+        missing_tickers: List[str],
+        trade_days: int,
+    ) -> DailyHistorySyncPlan:
+        """
+        生成回补计划
+        :param start_date: 回补起始日期（YYYYMMDD）
+        :param end_date: 回补结束日期（YYYYMMDD）
+        :param listed_tickers: 上市股票总数
+        :param missing_tickers: 区间内缺失日线数据的股票代码
+        :param trade_days: 区间内交易日数
+        :return: 回补计划
+        """
+        per_ticker_calls = len(missing_tickers) * CALLS_PER_UNIT
+        per_date_calls = trade_days * CALLS_PER_UNIT
+
+        if per_date_calls <= per_ticker_calls:
+            job_type = SyncJobType.DAILY_HISTORY_BY_DATE
+        else:
+            job_type = SyncJobType.DAILY_HISTORY
+
+        return DailyHistorySyncPlan(
+            job_type=job_type,
+            start_date=start_date,
+            end_date=end_date,
+            listed_tickers=listed_tickers,
+            missing_tickers=missing_tickers,
+            trade_days=trade_days,
+            per_ticker_calls=per_ticker_calls,
+            per_date_calls=per_date_calls,
+        )
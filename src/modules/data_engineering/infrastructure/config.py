@@ -14,11 +14,30 @@ class DataEngineeringConfig(BaseSettings):
     TUSHARE_RATE_LIMIT_MAX_CALLS: int = 195
     TUSHARE_RATE_LIMIT_WINDOW_SECONDS: float = 60.0
     SYNC_DAILY_HISTORY_BATCH_SIZE: int = 50
+    # 日线历史同步并发度：1 为串行模式；>1 启用拉取/写库流水线，worker 共享 Tushare 限速配额
+    SYNC_DAILY_HISTORY_CONCURRENCY: int = 1
+    SYNC_DAILY_HISTORY_QUEUE_SIZE: int = 16
+    # 按交易日回补：每批处理的交易日数（断点粒度）与默认起始日期
+    SYNC_DAILY_BY_DATE_BATCH_SIZE: int = 20
+    SYNC_DAILY_HISTORY_START_DATE: str = "20000101"
     SYNC_FINANCE_HISTORY_BATCH_SIZE: int = 100
     SYNC_FINANCE_HISTORY_START_DATE: str = "20200101"
     SYNC_INCREMENTAL_MISSING_LIMIT: int = 300
     SYNC_FAILURE_MAX_RETRIES: int = 3
     SYNC_TASK_STALE_TIMEOUT_MINUTES: int = 10
+    # 单次写入行数达到该阈值时改用 COPY 暂存表批量 upsert（仓储 save_all 可按次显式指定）
+    SYNC_BULK_COPY_THRESHOLD: int = 5000
+    # stock_daily 按年分区：定时任务提前创建的未来年度分区数
+    STOCK_DAILY_PARTITION_YEARS_AHEAD: int = 1
+    # AkShare 限速突发容量（令牌桶容量，1 为严格按 request_interval 匀速发起）
+    AKSHARE_RATE_LIMIT_BURST: int = 1
+    # 概念成份股同步：并发拉取数与每个写库事务包含的概念数
+    SYNC_CONCEPT_CONCURRENCY: int = 4
+    SYNC_CONCEPT_WRITE_BATCH_SIZE: int = 50
+    # 交易日历：交易所、首次全量加载起点与内存缓存刷新间隔
+    TRADE_CALENDAR_EXCHANGE: str = "SSE"
+    TRADE_CALENDAR_START_DATE: str = "19901219"
+    TRADE_CALENDAR_REFRESH_HOURS: int = 24
 
     class Config:
         case_sensitive = True
@@ -1,19 +1,23 @@
 import asyncio
-import time
 
-from loguru import logger
+from src.modules.data_engineering.infrastructure.config import de_config
+from src.modules.data_engineering.infrastructure.external_apis.akshare.rate_limiter import (
+    TokenBucketRateLimiter,
+)
 
-# akshare 限速锁：全进程共享，确保 API 调用频率不超过限制
-_akshare_rate_lock: asyncio.Lock | None = None
-_akshare_last_call: float = 0.0
+# akshare 令牌桶限速器：全进程共享，确保 API 调用频率不超过限制
+_akshare_rate_limiter: TokenBucketRateLimiter | None = None
 
 
-def _get_akshare_rate_lock() -> asyncio.Lock:
-    """获取进程内共享的 akshare 限速锁"""
-    global _akshare_rate_lock
-    if _akshare_rate_lock is None:
-        _akshare_rate_lock = asyncio.Lock()
-    return _akshare_rate_lock
+def _get_akshare_rate_limiter(request_interval: float) -> TokenBucketRateLimiter:
+    """获取进程内共享的 akshare 令牌桶限速器（首次创建时按 request_interval 确定速率）"""
+    global _akshare_rate_limiter
+    if _akshare_rate_limiter is None:
+        _akshare_rate_limiter = TokenBucketRateLimiter(
+            rate=1.0 / request_interval,
+            capacity=de_config.AKSHARE_RATE_LIMIT_BURST,
+        )
+    return _akshare_rate_limiter
 
 
 class AkShareBaseClient:
@@ -49,7 +53,8 @@ class AkShareBaseClient:
     async def _rate_limited_call(self, func, *args, **kwargs):
         """
         带限速的 akshare API 调用，确保不触发限流
-        全进程共享限速锁，按配置的 request_interval 控制调用频率
+        全进程共享令牌桶，按 request_interval 控制调用发起频率；
+        仅在获取许可时短暂持锁，网络调用期间不持锁，并发调用可重叠执行
 
         Args:
             func: 同步函数（通常是 akshare API 函数）
@@ -59,15 +64,5 @@ class AkShareBaseClient:
         Returns:
             API 调用结果
         """
-        global _akshare_last_call
-        lock = _get_akshare_rate_lock()
-        async with lock:
-            now = time.monotonic()
-            elapsed = now - _akshare_last_call
-            if elapsed < self.request_interval and _akshare_last_call > 0:
-                wait_time = self.request_interval - elapsed
-                logger.debug(f"akshare 限速：等待 {wait_time:.2f}s")
-                await asyncio.sleep(wait_time)
-            result = await self._run_in_executor(func, *args, **kwargs)
-            _akshare_last_call = time.monotonic()
-            return result
+        await _get_akshare_rate_limiter(self.request_interval).acquire()
+        return await self._run_in_executor(func, *args, **kwargs)
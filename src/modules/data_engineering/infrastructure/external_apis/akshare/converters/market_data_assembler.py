@@ -0,0 +1,176 @@
+"""
+AkShare 市场数据装配器
+
+将 AkShare 返回的中文列名 DataFrame 列式转换为市场数据 DTO：
+代码转换、数值转换、空值处理均在列级别完成，不再逐行 `iterrows()`；
+数值列缺失或无法解析时取默认值。
+"""
+
+from typing import Any, Dict, List
+
+import pandas as pd
+
+from src.modules.data_engineering.domain.dtos.capital_flow_dtos import SectorCapitalFlowDTO
+from src.modules.data_engineering.domain.dtos.dragon_tiger_dtos import DragonTigerDetailDTO
+from src.modules.data_engineering.domain.dtos.market_sentiment_dtos import (
+    BrokenBoardDTO,
+    LimitUpPoolDTO,
+    PreviousLimitUpDTO,
+)
+from src.modules.data_engineering.infrastructure.external_apis.akshare.converters.stock_code_converter import (  # noqa: E501
+    convert_akshare_stock_code,
+)
+from src.modules.data_engineering.infrastructure.external_apis.frame_utils import (
+    frame_to_records,
+    validate_records,
+)
+
+
+def _float_col(df: pd.DataFrame, col: str, default: float = 0.0) -> pd.Series:
+    if col not in df.columns:
+        return pd.Series(default, index=df.index, dtype=float)
+    return pd.to_numeric(df[col], errors="coerce").fillna(default)
+
+
+def _int_col(df: pd.DataFrame, col: str, default: int) -> pd.Series:
+    if col not in df.columns:
+        return pd.Series(default, index=df.index, dtype=int)
+    return pd.to_numeric(df[col], errors="coerce").fillna(default).astype(int)
+
+
+def _str_col(df: pd.DataFrame, col: str) -> pd.Series:
+    if col not in df.columns:
+        return pd.Series("", index=df.index, dtype=object)
+    return df[col].astype(object).where(df[col].notna(), "").astype(str)
+
+
+def _optional_str_col(df: pd.DataFrame, col: str) -> pd.Series:
+    values = _str_col(df, col)
+    return values.where(values != "", None)
+
+
+def _third_code_col(df: pd.DataFrame) -> pd.Series:
+    """整列转换股票代码；无法识别的代码为 None。"""
+    return _str_col(df, "代码").str.strip().map(convert_akshare_stock_code)
+
+
+def _build(columns: Dict[str, pd.Series]) -> List[Dict[str, Any]]:
+    """按列组装行字典，并丢弃无法识别代码的行。"""
+    frame = pd.DataFrame(columns)
+    if "third_code" in frame.columns:
+        frame = frame[frame["third_code"].notna()]
+    return frame_to_records(frame)
+
+
+class AkShareMarketDataAssembler:
+    """AkShare 市场数据装配器"""
+
+    @staticmethod
+    def to_limit_up_pool_list(df: pd.DataFrame) -> List[LimitUpPoolDTO]:
+        if df is None or df.empty:
+            return []
+        records = _build(
+            {
+                "third_code": _third_code_col(df),
+                "stock_name": _str_col(df, "名称"),
+                "pct_chg": _float_col(df, "涨跌幅"),
+                "close": _float_col(df, "最新价"),
+                "amount": _float_col(df, "成交额"),
+                "turnover_rate": _float_col(df, "换手率"),
+                "consecutive_boards": _int_col(df, "连板数", 1),
+                "first_limit_up_time": _optional_str_col(df, "首次封板时间"),
+                "last_limit_up_time": _optional_str_col(df, "最后封板时间"),
+                "industry": _str_col(df, "所属行业"),
+            }
+        )
+        return validate_records(LimitUpPoolDTO, records)
+
+    @staticmethod
+    def to_broken_board_list(df: pd.DataFrame) -> List[BrokenBoardDTO]:
+        if df is None or df.empty:
+            return []
+        records = _build(
+            {
+                "third_code": _third_code_col(df),
+                "stock_name": _str_col(df, "名称"),
+                "pct_chg": _float_col(df, "涨跌幅"),
+                "close": _float_col(df, "最新价"),
+                "amount": _float_col(df, "成交额"),
+                "turnover_rate": _float_col(df, "换手率"),
+                "open_count": _int_col(df, "开板次数", 0),
+                "first_limit_up_time": _optional_str_col(df, "首次封板时间"),
+                "last_open_time": _optional_str_col(df, "最后开板时间"),
+                "industry": _str_col(df, "所属行业"),
+            }
+        )
+        return validate_records(BrokenBoardDTO, records)
+
+    @staticmethod
+    def to_previous_limit_up_list(df: pd.DataFrame) -> List[PreviousLimitUpDTO]:
+        if df is None or df.empty:
+            return []
+        records = _build(
+            {
+                "third_code": _third_code_col(df),
+                "stock_name": _str_col(df, "名称"),
+                "pct_chg": _float_col(df, "涨跌幅"),
+                "close": _float_col(df, "最新价"),
+                "amount": _float_col(df, "成交额"),
+                "turnover_rate": _float_col(df, "换手率"),
+                "yesterday_consecutive_boards": _int_col(df, "昨日连板数", 1),
+                "industry": _str_col(df, "所属行业"),
+            }
+        )
+        return validate_records(PreviousLimitUpDTO, records)
+
+    @staticmethod
+    def to_dragon_tiger_list(df: pd.DataFrame) -> List[DragonTigerDetailDTO]:
+        if df is None or df.empty:
+            return []
+
+        # 买卖席位：每侧最多 5 个，按列取出后逐行组装（席位名为空或 "-" 时跳过）
+        def seats(side: str, amount_key: str) -> List[List[dict]]:
+            pairs = [
+                (_str_col(df, f"{side}{i}席位").tolist(), _float_col(df, f"{side}{i}金额").tolist())
+                for i in range(1, 6)
+            ]
+            rows: List[List[dict]] = [[] for _ in range(len(df))]
+            for names, amounts in pairs:
+                for idx, (name, amt) in enumerate(zip(names, amounts)):
+                    if name and name != "-":
+                        rows[idx].append({"seat_name": name, amount_key: amt})
+            return rows
+
+        records = _build(
+            {
+                "third_code": _third_code_col(df),
+                "stock_name": _str_col(df, "名称"),
+                "pct_chg": _float_col(df, "涨跌幅"),
+                "close": _float_col(df, "收盘价"),
+                "reason": _str_col(df, "上榜原因"),
+                "net_amount": _float_col(df, "龙虎榜净买额"),
+                "buy_amount": _float_col(df, "龙虎榜买入额"),
+                "sell_amount": _float_col(df, "龙虎榜卖出额"),
+                "buy_seats": pd.Series(seats("买", "buy_amount"), index=df.index, dtype=object),
+                "sell_seats": pd.Series(seats("卖", "sell_amount"), index=df.index, dtype=object),
+            }
+        )
+        return validate_records(DragonTigerDetailDTO, records)
+
+    @staticmethod
+    def to_sector_capital_flow_list(
+        df: pd.DataFrame, sector_type: str
+    ) -> List[SectorCapitalFlowDTO]:
+        if df is None or df.empty:
+            return []
+        records = _build(
+            {
+                "sector_name": _str_col(df, "名称"),
+                "sector_type": pd.Series(sector_type, index=df.index, dtype=object),
+                "net_amount": _float_col(df, "今日主力净流入-净额"),
+                "inflow_amount": _float_col(df, "今日主力净流入-流入额"),
+                "outflow_amount": _float_col(df, "今日主力净流入-流出额"),
+                "pct_chg": _float_col(df, "今日涨跌幅"),
+            }
+        )
+        return validate_records(SectorCapitalFlowDTO, records, key_field="sector_name")
@@ -22,8 +22,8 @@ from src.modules.data_engineering.domain.ports.providers.sector_capital_flow_pro
 from src.modules.data_engineering.infrastructure.external_apis.akshare.base_client import (
     AkShareBaseClient,
 )
-from src.modules.data_engineering.infrastructure.external_apis.akshare.converters.stock_code_converter import (
-    convert_akshare_stock_code,
+from src.modules.data_engineering.infrastructure.external_apis.akshare.converters.market_data_assembler import (  # noqa: E501
+    AkShareMarketDataAssembler,
 )
 from src.shared.domain.exceptions import AppException
 
@@ -62,28 +62,7 @@ class AkShareMarketDataClient(
                 logger.warning(f"涨停池数据为空：{date_str}")
                 return []
 
-            result: list[LimitUpPoolDTO] = []
-            for _, row in df.iterrows():
-                raw_code = str(row.get("代码", "")).strip()
-                third_code = convert_akshare_stock_code(raw_code)
-                if not third_code:
-                    continue
-
-                result.append(
-                    LimitUpPoolDTO(
-                        third_code=third_code,
-                        stock_name=str(row.get("名称", "")),
-                        pct_chg=float(row.get("涨跌幅", 0.0)),
-                        close=float(row.get("最新价", 0.0)),
-                        amount=float(row.get("成交额", 0.0)),
-                        turnover_rate=float(row.get("换手率", 0.0)),
-                        consecutive_boards=int(row.get("连板数", 1)),
-                        first_limit_up_time=str(row.get("首次封板时间", "")) or None,
-                        last_limit_up_time=str(row.get("最后封板时间", "")) or None,
-                        industry=str(row.get("所属行业", "")),
-                    )
-                )
-
+            result = AkShareMarketDataAssembler.to_limit_up_pool_list(df)
             logger.info(f"成功获取 {len(result)} 条涨停池记录：{date_str}")
             return result
 
@@ -131,28 +110,7 @@ class AkShareMarketDataClient(
                 logger.warning(f"炸板池数据为空：{date_str}")
                 return []
 
-            result: list[BrokenBoardDTO] = []
-            for _, row in df.iterrows():
-                raw_code = str(row.get("代码", "")).strip()
-                third_code = convert_akshare_stock_code(raw_code)
-                if not third_code:
-                    continue
-
-                result.append(
-                    BrokenBoardDTO(
-                        third_code=third_code,
-                        stock_name=str(row.get("名称", "")),
-                        pct_chg=float(row.get("涨跌幅", 0.0)),
-                        close=float(row.get("最新价", 0.0)),
-                        amount=float(row.get("成交额", 0.0)),
-                        turnover_rate=float(row.get("换手率", 0.0)),
-                        open_count=int(row.get("开板次数", 0)),
-                        first_limit_up_time=str(row.get("首次封板时间", "")) or None,
-                        last_open_time=str(row.get("最后开板时间", "")) or None,
-                        industry=str(row.get("所属行业", "")),
-                    )
-                )
-
+            result = AkShareMarketDataAssembler.to_broken_board_list(df)
             logger.info(f"成功获取 {len(result)} 条炸板池记录：{date_str}")
             return result
 
@@ -200,26 +158,7 @@ class AkShareMarketDataClient(
                 logger.warning(f"昨日涨停表现数据为空：{date_str}")
                 return []
 
-            result: list[PreviousLimitUpDTO] = []
-            for _, row in df.iterrows():
-                raw_code = str(row.get("代码", "")).strip()
-                third_code = convert_akshare_stock_code(raw_code)
-                if not third_code:
-                    continue
-
-                result.append(
-                    PreviousLimitUpDTO(
-                        third_code=third_code,
-                        stock_name=str(row.get("名称", "")),
-                        pct_chg=float(row.get("涨跌幅", 0.0)),
-                        close=float(row.get("最新价", 0.0)),
-                        amount=float(row.get("成交额", 0.0)),
-                        turnover_rate=float(row.get("换手率", 0.0)),
-                        yesterday_consecutive_boards=int(row.get("昨日连板数", 1)),
-                        industry=str(row.get("所属行业", "")),
-                    )
-                )
-
+            result = AkShareMarketDataAssembler.to_previous_limit_up_list(df)
             logger.info(f"成功获取 {len(result)} 条昨日涨停表现记录：{date_str}")
             return result
 
@@ -278,45 +217,7 @@ class AkShareMarketDataClient(
                 logger.warning(f"龙虎榜数据为空：{date_str}")
                 return []
 
-            result: list[DragonTigerDetailDTO] = []
-            for _, row in df.iterrows():
-                raw_code = str(row.get("代码", "")).strip()
-                third_code = convert_akshare_stock_code(raw_code)
-                if not third_code:
-                    continue
-
-                buy_seats = []
-                sell_seats = []
-                for i in range(1, 6):
-                    buy_seat_name = row.get(f"买{i}席位", "")
-                    buy_amt = row.get(f"买{i}金额", 0.0)
-                    if buy_seat_name and buy_seat_name != "-":
-                        buy_seats.append(
-                            {"seat_name": str(buy_seat_name), "buy_amount": float(buy_amt)}
-                        )
-
-                    sell_seat_name = row.get(f"卖{i}席位", "")
-                    sell_amt = row.get(f"卖{i}金额", 0.0)
-                    if sell_seat_name and sell_seat_name != "-":
-                        sell_seats.append(
-                            {"seat_name": str(sell_seat_name), "sell_amount": float(sell_amt)}
-                        )
-
-                result.append(
-                    DragonTigerDetailDTO(
-                        third_code=third_code,
-                        stock_name=str(row.get("名称", "")),
-                        pct_chg=float(row.get("涨跌幅", 0.0)),
-                        close=float(row.get("收盘价", 0.0)),
-                        reason=str(row.get("上榜原因", "")),
-                        net_amount=float(row.get("龙虎榜净买额", 0.0)),
-                        buy_amount=float(row.get("龙虎榜买入额", 0.0)),
-                        sell_amount=float(row.get("龙虎榜卖出额", 0.0)),
-                        buy_seats=buy_seats,
-                        sell_seats=sell_seats,
-                    )
-                )
-
+            result = AkShareMarketDataAssembler.to_dragon_tiger_list(df)
             logger.info(f"成功获取 {len(result)} 条龙虎榜记录：{date_str}")
             return result
 
@@ -365,19 +266,7 @@ class AkShareMarketDataClient(
                 logger.warning(f"板块资金流向数据为空：{sector_type}")
                 return []
 
-            result: list[SectorCapitalFlowDTO] = []
-            for _, row in df.iterrows():
-                result.append(
-                    SectorCapitalFlowDTO(
-                        sector_name=str(row.get("名称", "")),
-                        sector_type=sector_type,
-                        net_amount=float(row.get("今日主力净流入-净额", 0.0)),
-                        inflow_amount=float(row.get("今日主力净流入-流入额", 0.0)),
-                        outflow_amount=float(row.get("今日主力净流入-流出额", 0.0)),
-                        pct_chg=float(row.get("今日涨跌幅", 0.0)),
-                    )
-                )
-
+            result = AkShareMarketDataAssembler.to_sector_capital_flow_list(df, sector_type)
             logger.info(f"成功获取 {len(result)} 条板块资金流向记录：{sector_type}")
             return result
 
@@ -0,0 +1,46 @@
+"""令牌桶限速器"""
+
+import asyncio
+import time
+
+
+class TokenBucketRateLimiter:
+    """令牌桶限速器（Token Bucket）
+
+    按固定速率补充令牌，桶容量决定允许的突发调用数。获取许可时仅在锁内预占令牌、
+    计算需要等待的时长，等待与实际网络调用都在锁外进行，因此多个并发调用可以
+    按限速节奏依次发出，而不必等待前一个请求返回。
+
+    使用示例：
+        limiter = TokenBucketRateLimiter(rate=3.0, capacity=1)
+        await limiter.acquire()  # 获取调用许可，必要时等待
+    """
+
+    def __init__(self, rate: float, capacity: int = 1):
+        """初始化令牌桶限速器
+
+        Args:
+            rate: 每秒补充的令牌数（即长期平均调用频率）
+            capacity: 桶容量（允许的最大突发调用数），默认 1 即严格匀速
+        """
+        self._rate = rate
+        self._capacity = max(1, capacity)
+        self._tokens = float(self._capacity)
+        self._updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """获取调用许可
+
+        令牌不足时预占（令牌可为负数），按欠缺的令牌数计算等待时长后在锁外等待，
+        保证并发调用按到达顺序均匀放行。
+        """
+        async with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self._capacity, self._tokens + (now - self._updated_at) * self._rate)
+            self._updated_at = now
+            self._tokens -= 1
+            wait_time = -self._tokens / self._rate if self._tokens < 0 else 0.0
+
+        if wait_time > 0:
+            await asyncio.sleep(wait_time)
@@ -0,0 +1,99 @@
+"""
+DataFrame 列式转换工具
+
+Tushare / AkShare 返回的 DataFrame 统一在列级别完成日期解析与空值处理，
+再一次性导出为行字典，避免逐行 `iterrows()` + 逐行 `pd.to_datetime` 的开销。
+"""
+
+from typing import Any, Dict, Iterable, List, Optional, Type, TypeVar
+
+import pandas as pd
+from loguru import logger
+from pydantic import BaseModel, TypeAdapter, ValidationError
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+_adapters: Dict[type, TypeAdapter] = {}
+
+
+def parse_date_column(series: pd.Series, fmt: str = "%Y%m%d") -> pd.Series:
+    """
+    整列解析日期，返回 `date` / None 组成的 object 列
+
+    优先按固定格式解析（Tushare 的 YYYYMMDD），存在无法按格式解析的非空值时
+    退化为整列自动推断格式，与逐行 `pd.to_datetime` 的结果保持一致。
+    """
+    parsed = pd.to_datetime(series, format=fmt, errors="coerce")
+    if (parsed.isna() & series.notna()).any():
+        parsed = pd.to_datetime(series, errors="coerce", format="mixed")
+    values = parsed.dt.date.to_numpy(dtype=object, copy=True)
+    values[parsed.isna().to_numpy()] = None
+    return pd.Series(values, index=series.index, dtype=object)
+
+
+def frame_to_records(
+    df: pd.DataFrame,
+    columns: Optional[Iterable[str]] = None,
+    rename: Optional[Dict[str, str]] = None,
+) -> List[Dict[str, Any]]:
+    """
+    将 DataFrame 按列批量转换为行字典列表，NaN/NaT 统一转为 None
+
+    Args:
+        df: 源 DataFrame
+        columns: 需要导出的列（不存在的列忽略），默认全部列
+        rename: 列名映射（源列名 -> 字段名）
+
+    Returns:
+        行字典列表，值为 Python 原生类型
+    """
+    if df is None or df.empty:
+        return []
+
+    rename = rename or {}
+    selected = [c for c in (columns if columns is not None else df.columns) if c in df.columns]
+    keys = [rename.get(c, c) for c in selected]
+    data = []
+    for col in selected:
+        series = df[col]
+        values = series.to_numpy(dtype=object, copy=True)
+        mask = series.isna().to_numpy()
+        if mask.any():
+            values[mask] = None
+        data.append(values)
+
+    return [dict(zip(keys, row)) for row in zip(*data)]
+
+
+def validate_records(
+    model: Type[ModelT], records: List[Dict[str, Any]], key_field: str = "third_code"
+) -> List[ModelT]:
+    """
+    批量校验行字典为 Pydantic 模型列表
+
+    整批一次性校验；存在非法行时退化为逐行校验，跳过非法行并记录告警，
+    与原逐行转换「单行失败不影响整批」的语义一致。
+    """
+    if not records:
+        return []
+
+    adapter = _adapters.get(model)
+    if adapter is None:
+        adapter = TypeAdapter(List[model])
+        _adapters[model] = adapter
+
+    try:
+        return adapter.validate_python(records)
+    except ValidationError:
+        pass
+
+    result: List[ModelT] = []
+    for record in records:
+        try:
+            result.append(model.model_validate(record))
+        except ValidationError as e:
+            logger.warning(
+                f"{model.__name__} 转换失败: {record.get(key_field, 'unknown')} - "
+                f"{e.error_count()} 个字段校验失败"
+            )
+    return result
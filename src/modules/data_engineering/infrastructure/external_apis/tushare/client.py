@@ -13,6 +13,7 @@ from src.modules.data_engineering.domain.model.financial_report import (
 )
 from src.modules.data_engineering.domain.model.stock import StockInfo
 from src.modules.data_engineering.domain.model.stock_daily import StockDaily
+from src.modules.data_engineering.domain.model.trade_calendar import TradeCalendarDay
 from src.modules.data_engineering.domain.ports.providers.financial_data_provider import (
     IFinancialDataProvider,
 )
@@ -22,6 +23,9 @@ from src.modules.data_engineering.domain.ports.providers.market_quote_provider i
 from src.modules.data_engineering.domain.ports.providers.stock_basic_provider import (
     IStockBasicProvider,
 )
+from src.modules.data_engineering.domain.ports.providers.trade_calendar_provider import (
+    ITradeCalendarProvider,
+)
 from src.modules.data_engineering.infrastructure.config import de_config
 from src.modules.data_engineering.infrastructure.external_apis.tushare.converters.finance_converter import (  # noqa: E501
     StockFinanceAssembler,
@@ -35,6 +39,9 @@ from src.modules.data_engineering.infrastructure.external_apis.tushare.converter
 from src.modules.data_engineering.infrastructure.external_apis.tushare.converters.stock_disclosure_assembler import (  # noqa: E501
     StockDisclosureAssembler,
 )
+from src.modules.data_engineering.infrastructure.external_apis.tushare.converters.trade_calendar_converter import (  # noqa: E501
+    TradeCalendarAssembler,
+)
 from src.modules.data_engineering.infrastructure.external_apis.tushare.rate_limiter import (
     SlidingWindowRateLimiter,
 )
@@ -55,7 +62,9 @@ def _get_tushare_rate_limiter() -> SlidingWindowRateLimiter:
     return _tushare_rate_limiter
 
 
-class TushareClient(IStockBasicProvider, IMarketQuoteProvider, IFinancialDataProvider):
+class TushareClient(
+    IStockBasicProvider, IMarketQuoteProvider, IFinancialDataProvider, ITradeCalendarProvider
+):
     """
     Tushare Client Adapter (Infrastructure Layer)
     Implements all data provider interfaces.
@@ -211,6 +220,39 @@ class TushareClient(IStockBasicProvider, IMarketQuoteProvider, IFinancialDataPro
                 details=str(e),
             )
 
+    async def fetch_trade_calendar(
+        self, start_date: str, end_date: str, exchange: str = "SSE"
+    ) -> List[TradeCalendarDay]:
+        """
+        获取交易所交易日历（trade_cal）
+        """
+        try:
+            logger.info(
+                f"开始从 Tushare 获取交易日历: exchange={exchange}, {start_date} ~ {end_date}"
+            )
+            df = await self._rate_limited_call(
+                self.pro.trade_cal,
+                exchange=exchange,
+                start_date=start_date,
+                end_date=end_date,
+                fields="exchange,cal_date,is_open,pretrade_date",
+            )
+
+            if df is None or df.empty:
+                logger.warning(f"Tushare 交易日历为空: {start_date} ~ {end_date}")
+                return []
+
+            return TradeCalendarAssembler.to_domain_list(df)
+
+        except Exception as e:
+            logger.error(f"获取交易日历失败: {str(e)}")
+            raise AppException(
+                status_code=502,
+                code="TUSHARE_FETCH_ERROR",
+                message="获取交易日历失败",
+                details=str(e),
+            )
+
     async def fetch_stock_basic(self) -> List[StockInfo]:
         """
         获取股票列表并转换为领域对象
@@ -1,11 +1,17 @@
-from typing import List, Optional
+from typing import List
 
 import pandas as pd
-from loguru import logger
 
 from src.modules.data_engineering.domain.model.disclosure import (
     StockDisclosure,
 )
+from src.modules.data_engineering.infrastructure.external_apis.frame_utils import (
+    frame_to_records,
+    parse_date_column,
+    validate_records,
+)
+
+_DATE_COLUMNS = ["ann_date", "end_date", "pre_date", "actual_date"]
 
 
 class StockDisclosureAssembler:
@@ -16,47 +22,18 @@ class StockDisclosureAssembler:
 
     @staticmethod
     def to_domain_list(df: pd.DataFrame) -> List[StockDisclosure]:
-        result = []
         if df is None or df.empty:
-            return result
-
-        df = df.where(pd.notnull(df), None)
-
-        for _, row in df.iterrows():
-            try:
-                disclosure = StockDisclosureAssembler._row_to_entity(row)
-                if disclosure:
-                    result.append(disclosure)
-            except Exception as e:
-                logger.warning(f"财报披露计划转换失败: {row.get('ts_code', 'unknown')} - {str(e)}")
-                continue
+            return []
 
-        return result
-
-    @staticmethod
-    def _row_to_entity(row: pd.Series) -> Optional[StockDisclosure]:
-        def parse_date(date_str):
-            if not date_str:
-                return None
-            try:
-                return pd.to_datetime(date_str).date()
-            except ValueError:
-                return None
-
-        third_code = row.get("ts_code")
         # Tushare may return None for dates
-        ann_date = parse_date(row.get("ann_date"))
-        end_date = parse_date(row.get("end_date"))
-        pre_date = parse_date(row.get("pre_date"))
-        actual_date = parse_date(row.get("actual_date"))
-
-        if not third_code or not end_date:
-            return None
-
-        return StockDisclosure(
-            third_code=third_code,
-            ann_date=ann_date,
-            end_date=end_date,
-            pre_date=pre_date,
-            actual_date=actual_date,
+        df = df.assign(
+            **{col: parse_date_column(df[col]) for col in _DATE_COLUMNS if col in df.columns}
+        )
+        if "end_date" not in df.columns:
+            return []
+        df = df[df["ts_code"].notna() & df["end_date"].notna()]
+
+        records = frame_to_records(
+            df, ["ts_code"] + _DATE_COLUMNS, rename={"ts_code": "third_code"}
         )
+        return validate_records(StockDisclosure, records)
@@ -0,0 +1,34 @@
+from typing import List
+
+import pandas as pd
+
+from src.modules.data_engineering.domain.model.trade_calendar import TradeCalendarDay
+from src.modules.data_engineering.infrastructure.external_apis.frame_utils import (
+    frame_to_records,
+    parse_date_column,
+    validate_records,
+)
+
+
+class TradeCalendarAssembler:
+    """
+    交易日历装配器
+    """
+
+    @staticmethod
+    def to_domain_list(df: pd.DataFrame) -> List[TradeCalendarDay]:
+        """
+        将 Tushare trade_cal DataFrame 转换为 TradeCalendarDay 列表
+        """
+        if df is None or df.empty:
+            return []
+
+        df = df.assign(
+            cal_date=parse_date_column(df["cal_date"]),
+            is_open=df["is_open"].astype(int).astype(bool),
+        )
+        if "pretrade_date" in df.columns:
+            df = df.assign(pretrade_date=parse_date_column(df["pretrade_date"]))
+
+        records = frame_to_records(df, ["exchange", "cal_date", "is_open", "pretrade_date"])
+        return validate_records(TradeCalendarDay, records, key_field="cal_date")
@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from sqlalchemy import Column, DateTime, Integer, String, UniqueConstraint
+from sqlalchemy import BigInteger, Column, DateTime, Integer, String, UniqueConstraint
 
 from src.shared.infrastructure.db.base import Base
 
@@ -16,6 +16,7 @@ class ConceptModel(Base):
     id = Column(Integer, primary_key=True, index=True)
     code = Column(String(20), unique=True, nullable=False, index=True, comment="概念板块代码")
     name = Column(String(100), nullable=False, comment="概念板块名称")
+    membership_hash = Column(String(64), nullable=True, comment="成份股集合内容哈希")
     created_at = Column(DateTime, nullable=False, default=datetime.now, comment="创建时间")
     updated_at = Column(
         DateTime, nullable=False, default=datetime.now, onupdate=datetime.now, comment="更新时间"
@@ -37,3 +38,34 @@ class ConceptStockModel(Base):
     created_at = Column(DateTime, nullable=False, default=datetime.now, comment="创建时间")
 
     __table_args__ = (UniqueConstraint("concept_code", "third_code", name="uq_concept_stock"),)
+
+
+class ConceptStockChangeLogModel(Base):
+    """
+    概念成份股映射变更日志数据库模型
+    映射 concept_stock_change_log 表，按自增 id 顺序供下游增量消费
+    """
+
+    __tablename__ = "concept_stock_change_log"
+
+    id = Column(BigInteger, primary_key=True, autoincrement=True)
+    concept_code = Column(String(20), nullable=False, comment="概念板块代码")
+    third_code = Column(String(20), nullable=False, comment="股票代码（系统标准格式）")
+    stock_name = Column(String(100), nullable=True, comment="股票名称")
+    change_type = Column(String(10), nullable=False, comment="变更类型 ADDED/REMOVED/RENAMED")
+    changed_at = Column(DateTime, nullable=False, default=datetime.now, comment="变更时间")
+
+
+class ConceptChangeCursorModel(Base):
+    """
+    概念变更日志消费游标数据库模型
+    映射 concept_change_cursor 表，记录各下游消费者已应用到的变更日志 id
+    """
+
+    __tablename__ = "concept_change_cursor"
+
+    consumer = Column(String(50), primary_key=True, comment="消费者标识")
+    last_change_id = Column(BigInteger, nullable=False, default=0, comment="已应用的变更日志 id")
+    updated_at = Column(
+        DateTime, nullable=False, default=datetime.now, onupdate=datetime.now, comment="更新时间"
+    )
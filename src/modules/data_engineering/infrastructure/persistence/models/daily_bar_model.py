@@ -1,11 +1,11 @@
-from sqlalchemy import Column, Date, Float, String
+from sqlalchemy import Column, Date, Float, Index, String
 
 from src.shared.infrastructure.db.base import Base
 
 
 class StockDailyModel(Base):
     """
-    股票日线行情数据库模型
+    股票日线行情数据库模型（按 trade_date 年度范围分区）
     Stock Daily Quotation Database Model
     """
 
@@ -50,3 +50,17 @@ class StockDailyModel(Base):
     circ_mv = Column(Float, nullable=True, comment="流通市值")
 
     source = Column(String(20), nullable=True, default="tushare", comment="数据来源")
+
+    __table_args__ = (
+        # trade_date 的 BRIN 索引：按交易日顺序写入时体积极小，服务跨年的区间扫描
+        Index("ix_stock_daily_trade_date_brin", "trade_date", postgresql_using="brin"),
+        # 估值历史分位查询的覆盖索引：只投影以下列时走 index-only scan
+        Index(
+            "ix_stock_daily_valuation_covering",
+            "third_code",
+            "trade_date",
+            postgresql_include=["close", "pe_ttm", "pb", "ps_ttm"],
+        ),
+        # 按 trade_date 年度范围分区，分区由迁移与定时任务维护
+        {"postgresql_partition_by": "RANGE (trade_date)"},
+    )
@@ -0,0 +1,22 @@
+from datetime import datetime
+
+from sqlalchemy import Boolean, Column, Date, DateTime, String
+
+from src.shared.infrastructure.db.base import Base
+
+
+class TradeCalendarModel(Base):
+    """
+    交易日历数据库模型
+    映射 de_trade_calendar 表
+    """
+
+    __tablename__ = "de_trade_calendar"
+
+    exchange = Column(String(10), primary_key=True, nullable=False, comment="交易所代码")
+    cal_date = Column(Date, primary_key=True, nullable=False, comment="日历日期")
+    is_open = Column(Boolean, nullable=False, comment="是否交易日")
+    pretrade_date = Column(Date, nullable=True, comment="上一个交易日")
+    updated_at = Column(
+        DateTime, nullable=False, default=datetime.now, onupdate=datetime.now, comment="更新时间"
+    )
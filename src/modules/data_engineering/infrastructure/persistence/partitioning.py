@@ -0,0 +1,97 @@
+"""
+按年范围分区的分区维护
+
+stock_daily 以 trade_date 按年 RANGE 分区（分区名 `<表名>_y<年份>`，区间 [当年 1 月 1 日, 次年 1 月 1 日)）。
+写入前按需创建缺失的年度分区，定时任务提前创建未来分区；已确认存在（已提交）的分区记录在进程内，
+避免每次写入都查询系统目录。
+"""
+
+from datetime import date
+from typing import Iterable, List, Set
+
+from loguru import logger
+from sqlalchemy import event, text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, SessionTransaction
+
+# 进程内已确认存在（已提交）的分区名
+_known_partitions: Set[str] = set()
+
+# session.info 中记录本事务内新建、尚未提交的分区名；提交后并入 _known_partitions，回滚则丢弃
+_PENDING_KEY = "pending_year_partitions"
+_LISTENING_KEY = "pending_year_partitions_listening"
+
+# 并发创建同名分区时的错误：duplicate_table / 系统目录唯一约束冲突
+_CONCURRENT_CREATE_SQLSTATES = {"42P07", "23505"}
+
+
+def year_partition_name(table: str, year: int) -> str:
+    return f"{table}_y{year}"
+
+
+def _promote_pending(session: Session) -> None:
+    _known_partitions.update(session.info.pop(_PENDING_KEY, ()))
+
+
+def _discard_pending(session: Session, transaction: SessionTransaction) -> None:
+    # 顶层事务结束（回滚或关闭会话）时仍未提交的分区随事务撤销；提交时已先由 after_commit 取走
+    if transaction.parent is None:
+        session.info.pop(_PENDING_KEY, None)
+
+
+def _track_pending(session: AsyncSession, name: str) -> None:
+    """记录本事务新建的分区，事务提交后才视为已确认存在。"""
+    sync_session = session.sync_session
+    if not sync_session.info.get(_LISTENING_KEY):
+        event.listen(sync_session, "after_commit", _promote_pending)
+        event.listen(sync_session, "after_transaction_end", _discard_pending)
+        sync_session.info[_LISTENING_KEY] = True
+    sync_session.info.setdefault(_PENDING_KEY, set()).add(name)
+
+
+def _is_concurrent_create(e: DBAPIError) -> bool:
+    sqlstate = getattr(e.orig, "sqlstate", None) or getattr(e.orig, "pgcode", None)
+    return sqlstate in _CONCURRENT_CREATE_SQLSTATES or "already exists" in str(e)
+
+
+async def ensure_year_partitions(
+    session: AsyncSession, table: str, years: Iterable[int]
+) -> List[str]:
+    """
+    确保指定年份的分区存在，返回本次新建的分区名（不提交事务，由调用方提交）
+
+    新建的分区在调用方事务提交后才记入进程内缓存，事务回滚时不缓存；
+    并发创建同一分区时，后到者在 savepoint 内失败并回滚，不影响当前事务，其余数据库错误照常抛出。
+    """
+    created: List[str] = []
+    pending = session.sync_session.info.get(_PENDING_KEY, set())
+    for year in sorted(set(years)):
+        name = year_partition_name(table, year)
+        if name in _known_partitions or name in pending:
+            continue
+
+        exists = await session.scalar(text("SELECT to_regclass(:name)"), {"name": name})
+        if exists is not None:
+            # 不是本事务新建的分区，系统目录可见即已提交
+            _known_partitions.add(name)
+            continue
+
+        try:
+            async with session.begin_nested():
+                await session.execute(
+                    text(
+                        f'CREATE TABLE IF NOT EXISTS "{name}" PARTITION OF "{table}" '
+                        f"FOR VALUES FROM ('{date(year, 1, 1)}') TO ('{date(year + 1, 1, 1)}')"
+                    )
+                )
+        except DBAPIError as e:
+            if not _is_concurrent_create(e):
+                raise
+            # 其他会话正在或已经创建同名分区；其事务可能尚未提交，不缓存，下次写入重新检查
+            logger.debug(f"分区 {name} 创建跳过: {str(e)}")
+            continue
+        created.append(name)
+        _track_pending(session, name)
+        logger.info(f"已创建分区 {name}")
+    return created
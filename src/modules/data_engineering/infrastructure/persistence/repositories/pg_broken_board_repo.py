@@ -2,12 +2,12 @@ from datetime import date
 
 from loguru import logger
 from sqlalchemy import select
-from sqlalchemy.dialects.postgresql import insert
 
 from src.modules.data_engineering.domain.model.broken_board import BrokenBoardStock
 from src.modules.data_engineering.domain.ports.repositories.broken_board_repo import (
     IBrokenBoardRepository,
 )
+from src.modules.data_engineering.infrastructure.config import de_config
 from src.modules.data_engineering.infrastructure.persistence.models.broken_board_model import (
     BrokenBoardModel,
 )
@@ -23,7 +23,7 @@ class PgBrokenBoardRepository(BaseRepository[BrokenBoardModel], IBrokenBoardRepo
     def __init__(self, session):
         super().__init__(BrokenBoardModel, session)
 
-    async def save_all(self, stocks: list[BrokenBoardStock]) -> int:
+    async def save_all(self, stocks: list[BrokenBoardStock], bulk: bool | None = None) -> int:
         """
         批量 UPSERT 炸板池记录（以 trade_date + third_code 为唯一键）
         """
@@ -32,27 +32,13 @@ class PgBrokenBoardRepository(BaseRepository[BrokenBoardModel], IBrokenBoardRepo
 
         stock_dicts = [stock.model_dump(exclude={"id"}, exclude_unset=True) for stock in stocks]
 
-        stmt = insert(BrokenBoardModel).values(stock_dicts)
-        stmt = stmt.on_conflict_do_update(
-            index_elements=["trade_date", "third_code"],
-            set_={
-                "stock_name": stmt.excluded.stock_name,
-                "pct_chg": stmt.excluded.pct_chg,
-                "close": stmt.excluded.close,
-                "amount": stmt.excluded.amount,
-                "turnover_rate": stmt.excluded.turnover_rate,
-                "open_count": stmt.excluded.open_count,
-                "first_limit_up_time": stmt.excluded.first_limit_up_time,
-                "last_open_time": stmt.excluded.last_open_time,
-                "industry": stmt.excluded.industry,
-                "updated_at": stmt.excluded.updated_at,
-            },
+        count = await self.upsert_all(
+            stock_dicts,
+            unique_fields=["trade_date", "third_code"],
+            exclude_fields=["id", "created_at"],
+            bulk=bulk,
+            bulk_threshold=de_config.SYNC_BULK_COPY_THRESHOLD,
         )
-
-        await self.session.execute(stmt)
-        await self.session.commit()
-
-        count = len(stocks)
         logger.debug(f"UPSERT {count} 条炸板池记录")
         return count
 
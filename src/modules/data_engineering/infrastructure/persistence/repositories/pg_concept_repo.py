@@ -1,20 +1,90 @@
 import uuid
+from datetime import datetime
+from typing import Optional
 
 from loguru import logger
-from sqlalchemy import delete, select
-from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy import String, bindparam, func, select, text, update
+from sqlalchemy.dialects.postgresql import ARRAY, insert
 
-from src.modules.data_engineering.domain.dtos.concept_dtos import ConceptWithStocksDTO
+from src.modules.data_engineering.domain.dtos.concept_dtos import (
+    ConceptMappingDiffDTO,
+    ConceptMembershipChangeDTO,
+    ConceptWithStocksDTO,
+)
 from src.modules.data_engineering.domain.model.concept import Concept, ConceptStock
 from src.modules.data_engineering.domain.ports.repositories.concept_repo import (
     IConceptRepository,
 )
+from src.modules.data_engineering.domain.services.concept_membership_differ import (
+    ConceptMembershipDiffer,
+)
 from src.modules.data_engineering.infrastructure.persistence.models.concept_model import (
+    ConceptChangeCursorModel,
     ConceptModel,
+    ConceptStockChangeLogModel,
     ConceptStockModel,
 )
 from src.shared.infrastructure.base_repository import BaseRepository
 
+# 成份股映射差异写入（单条集合语句）：desired 为本批概念的最新映射，
+# 删除本批概念下已不在 desired 中的行，UPSERT desired 中新增或名称变化的行（未变化行不改写），
+# 并把每条差异写入 concept_stock_change_log 供下游增量消费
+_APPLY_MEMBERSHIP_DIFF_SQL = text(
+    """
+    WITH desired AS (
+        SELECT * FROM unnest(
+            CAST(:concept_codes AS varchar[]),
+            CAST(:third_codes AS varchar[]),
+            CAST(:stock_names AS varchar[])
+        ) AS d(concept_code, third_code, stock_name)
+    ),
+    deleted AS (
+        DELETE FROM concept_stock cs
+        WHERE cs.concept_code = ANY(CAST(:batch_codes AS varchar[]))
+          AND NOT EXISTS (
+              SELECT 1 FROM desired d
+              WHERE d.concept_code = cs.concept_code AND d.third_code = cs.third_code
+          )
+        RETURNING cs.concept_code, cs.third_code, cs.stock_name
+    ),
+    upserted AS (
+        INSERT INTO concept_stock (concept_code, third_code, stock_name, created_at)
+        SELECT concept_code, third_code, stock_name, :now FROM desired
+        ON CONFLICT (concept_code, third_code) DO UPDATE
+            SET stock_name = EXCLUDED.stock_name
+            WHERE concept_stock.stock_name IS DISTINCT FROM EXCLUDED.stock_name
+        RETURNING concept_code, third_code, stock_name, (xmax = 0) AS inserted
+    ),
+    logged AS (
+        INSERT INTO concept_stock_change_log
+            (concept_code, third_code, stock_name, change_type, changed_at)
+        SELECT concept_code, third_code, stock_name, 'REMOVED', :now FROM deleted
+        UNION ALL
+        SELECT concept_code, third_code, stock_name,
+               CASE WHEN inserted THEN 'ADDED' ELSE 'RENAMED' END, :now
+        FROM upserted
+        RETURNING change_type
+    )
+    SELECT
+        count(*) FILTER (WHERE change_type = 'ADDED') AS inserted,
+        count(*) FILTER (WHERE change_type = 'REMOVED') AS deleted,
+        count(*) FILTER (WHERE change_type = 'RENAMED') AS renamed
+    FROM logged
+    """
+).bindparams(
+    bindparam("concept_codes", type_=ARRAY(String)),
+    bindparam("third_codes", type_=ARRAY(String)),
+    bindparam("stock_names", type_=ARRAY(String)),
+    bindparam("batch_codes", type_=ARRAY(String)),
+)
+
+
+# 变更日志写入方的事务级 advisory lock：bigserial id 在 INSERT 时分配而非提交时，
+# 若两个概念同步并发写入，较小 id 的事务可能晚于较大 id 提交，按 id 推进的消费者会永久跳过它。
+# 写入方串行化后，id 顺序即提交顺序，消费者读到的总是已提交的连续前缀
+_CHANGE_LOG_WRITER_LOCK_SQL = text("SELECT pg_advisory_xact_lock(:key)")
+_CHANGE_LOG_WRITER_LOCK_KEY = 0x636F6E6365707400
+
 
 class PgConceptRepository(BaseRepository[ConceptModel], IConceptRepository):
     """
@@ -27,7 +97,7 @@ class PgConceptRepository(BaseRepository[ConceptModel], IConceptRepository):
 
     async def upsert_concept_with_stocks(self, concept: Concept, stocks: list[ConceptStock]) -> int:
         """
-        在一个事务中完成概念 UPSERT 和成份股替换
+        在一个事务中完成概念 UPSERT 和成份股替换（按差异写入，见 replace_concepts_with_stocks）
 
         Args:
             concept: 概念对象
@@ -36,37 +106,103 @@ class PgConceptRepository(BaseRepository[ConceptModel], IConceptRepository):
         Returns:
             int: 总影响的行数（概念1行 + 成份股行数）
         """
-        # UPSERT 概念记录
-        concept_data = concept.model_dump(exclude={"id"}, exclude_unset=True)
-        concept_stmt = insert(ConceptModel).values(**concept_data)
+        await self.replace_concepts_with_stocks(
+            [ConceptWithStocksDTO(code=concept.code, name=concept.name, stocks=stocks)]
+        )
+        logger.debug(f"概念 {concept.code} 事务提交：概念1行，成份股{len(stocks)}行")
+        return 1 + len(stocks)
+
+    async def replace_concepts_with_stocks(
+        self, items: list[ConceptWithStocksDTO]
+    ) -> ConceptMappingDiffDTO:
+        """
+        在一个事务中批量 UPSERT 多个概念并替换其成份股映射
+
+        概念（含成份股内容哈希）以单条多行 UPSERT 写入；成份股映射以单条集合语句
+        （数据修改 CTE）与现有行比对，只删除移出的映射、插入新增映射、更新名称变化的映射，
+        并将差异写入变更日志。
+
+        Args:
+            items: 概念及其最新成份股列表
+
+        Returns:
+            ConceptMappingDiffDTO: 实际变更条数
+        """
+        if not items:
+            return ConceptMappingDiffDTO()
+
+        # 同一批次内按 code / (code, third_code) 去重，后出现者覆盖
+        concepts: dict[str, tuple[str, str]] = {}
+        desired: dict[tuple[str, str], str] = {}
+        for item in items:
+            concepts[item.code] = (item.name, ConceptMembershipDiffer.membership_hash(item.stocks))
+            for stock in item.stocks:
+                desired[(item.code, stock.third_code)] = stock.stock_name
+
+        now = datetime.now()
+        concept_stmt = insert(ConceptModel).values(
+            [
+                {
+                    "code": code,
+                    "name": name,
+                    "membership_hash": membership_hash,
+                    "created_at": now,
+                    "updated_at": now,
+                }
+                for code, (name, membership_hash) in concepts.items()
+            ]
+        )
         concept_stmt = concept_stmt.on_conflict_do_update(
             index_elements=["code"],
             set_={
                 "name": concept_stmt.excluded.name,
+                "membership_hash": concept_stmt.excluded.membership_hash,
                 "updated_at": concept_stmt.excluded.updated_at,
             },
         )
         await self.session.execute(concept_stmt)
 
-        # 替换该概念的成份股映射
-        await self.session.execute(
-            delete(ConceptStockModel).where(ConceptStockModel.concept_code == concept.code)
-        )
-
-        total_rows = 1  # 概念记录1行
-
-        if stocks:
-            mapping_dicts = [
-                stock.model_dump(exclude={"id"}, exclude_unset=True) for stock in stocks
-            ]
-            await self.session.execute(insert(ConceptStockModel).values(mapping_dicts))
-            total_rows += len(stocks)
-
-        # 统一提交事务
+        diff = await self._apply_membership_diff(list(concepts), desired, now)
+        diff.concepts = len(concepts)
         await self.session.commit()
 
-        logger.debug(f"概念 {concept.code} 事务提交：概念1行，成份股{len(stocks)}行")
-        return total_rows
+        logger.debug(
+            f"批量替换 {diff.concepts} 个概念的成份股映射：新增 {diff.inserted}，"
+            f"移除 {diff.deleted}，更名 {diff.renamed}"
+        )
+        return diff
+
+    async def _apply_membership_diff(
+        self,
+        batch_codes: list[str],
+        desired: dict[tuple[str, str], str],
+        now: datetime,
+    ) -> ConceptMappingDiffDTO:
+        """
+        将 batch_codes 范围内的成份股映射差异写入为 desired，并记录变更日志（不提交事务）
+
+        写入前获取变更日志写入锁（持有至事务结束），保证变更日志 id 按提交顺序递增。
+        """
+        await self.session.execute(
+            _CHANGE_LOG_WRITER_LOCK_SQL, {"key": _CHANGE_LOG_WRITER_LOCK_KEY}
+        )
+        row = (
+            await self.session.execute(
+                _APPLY_MEMBERSHIP_DIFF_SQL,
+                {
+                    "concept_codes": [key[0] for key in desired],
+                    "third_codes": [key[1] for key in desired],
+                    "stock_names": list(desired.values()),
+                    "batch_codes": batch_codes,
+                    "now": now,
+                },
+            )
+        ).one()
+        return ConceptMappingDiffDTO(
+            inserted=row.inserted,
+            deleted=row.deleted,
+            renamed=row.renamed,
+        )
 
     async def upsert_concept(self, concept: Concept) -> int:
         """
@@ -96,33 +232,29 @@ class PgConceptRepository(BaseRepository[ConceptModel], IConceptRepository):
 
     async def replace_concept_stocks(self, concept_code: str, stocks: list[ConceptStock]) -> int:
         """
-        替换指定概念的成份股映射（先清后建）
+        替换指定概念的成份股映射（按差异写入并记录变更日志）
 
         Args:
             concept_code: 概念板块代码
             stocks: 成份股列表
 
         Returns:
-            int: 插入的行数
+            int: 替换后的成份股映射行数
         """
-        # 先删除该概念的所有现有映射
+        desired = {(concept_code, stock.third_code): stock.stock_name for stock in stocks}
+        diff = await self._apply_membership_diff([concept_code], desired, datetime.now())
         await self.session.execute(
-            delete(ConceptStockModel).where(ConceptStockModel.concept_code == concept_code)
+            update(ConceptModel)
+            .where(ConceptModel.code == concept_code)
+            .values(membership_hash=ConceptMembershipDiffer.membership_hash(stocks))
         )
-        logger.debug(f"已清空概念 {concept_code} 的成份股映射")
-
-        if not stocks:
-            await self.session.commit()
-            return 0
-
-        # 批量插入新映射
-        mapping_dicts = [stock.model_dump(exclude={"id"}, exclude_unset=True) for stock in stocks]
-        await self.session.execute(insert(ConceptStockModel).values(mapping_dicts))
         await self.session.commit()
 
-        inserted_count = len(stocks)
-        logger.debug(f"为概念 {concept_code} 插入 {inserted_count} 条成份股映射")
-        return inserted_count
+        logger.debug(
+            f"替换概念 {concept_code} 的成份股映射：新增 {diff.inserted}，"
+            f"移除 {diff.deleted}，更名 {diff.renamed}"
+        )
+        return len(desired)
 
     async def upsert_concepts(self, concepts: list[Concept]) -> int:
         """
@@ -160,32 +292,31 @@ class PgConceptRepository(BaseRepository[ConceptModel], IConceptRepository):
 
     async def replace_all_concept_stocks(self, mappings: list[ConceptStock]) -> int:
         """
-        全量替换 concept_stock 表（先清后建）
+        全量替换 concept_stock 表（按差异写入并记录变更日志）
+
+        未出现在 mappings 中的概念，其现有映射全部移除；
+        概念的成份股内容哈希被清空，下次概念同步时重新比对。
 
         Args:
             mappings: 概念-股票映射列表
 
         Returns:
-            int: 插入的行数
+            int: 替换后的映射行数
         """
-        # 先删除所有现有映射
-        await self.session.execute(delete(ConceptStockModel))
-        logger.debug("已清空 concept_stock 表")
-
-        if not mappings:
-            await self.session.commit()
-            return 0
-
-        # 批量插入新映射
-        mapping_dicts = [
-            mapping.model_dump(exclude={"id"}, exclude_unset=True) for mapping in mappings
-        ]
-        await self.session.execute(insert(ConceptStockModel).values(mapping_dicts))
+        desired = {(m.concept_code, m.third_code): m.stock_name for m in mappings}
+        existing_codes = (
+            await self.session.execute(select(ConceptStockModel.concept_code).distinct())
+        ).scalars()
+        batch_codes = set(existing_codes) | {key[0] for key in desired}
+
+        diff = await self._apply_membership_diff(sorted(batch_codes), desired, datetime.now())
+        await self.session.execute(update(ConceptModel).values(membership_hash=None))
         await self.session.commit()
 
-        inserted_count = len(mappings)
-        logger.debug(f"插入 {inserted_count} 条概念-股票映射")
-        return inserted_count
+        logger.debug(
+            f"全量替换概念-股票映射：新增 {diff.inserted}，移除 {diff.deleted}，更名 {diff.renamed}"
+        )
+        return len(desired)
 
     async def get_all_concepts(self) -> list[Concept]:
         """
@@ -287,3 +418,87 @@ class PgConceptRepository(BaseRepository[ConceptModel], IConceptRepository):
 
         logger.debug(f"查询到 {len(result_dtos)} 个概念及其成份股")
         return result_dtos
+
+    async def get_concept_states(self) -> dict[str, tuple[str, Optional[str]]]:
+        """
+        查询所有概念的名称与成份股内容哈希
+
+        Returns:
+            dict[str, tuple[str, Optional[str]]]: {concept_code: (name, membership_hash)}
+        """
+        result = await self.session.execute(
+            select(ConceptModel.code, ConceptModel.name, ConceptModel.membership_hash)
+        )
+        return {row.code: (row.name, row.membership_hash) for row in result}
+
+    async def get_membership_changes(
+        self, after_id: int, limit: int
+    ) -> list[ConceptMembershipChangeDTO]:
+        """
+        按 id 升序查询指定游标之后的成份股映射变更日志
+
+        写入方经 advisory lock 串行化，之后提交的变更日志 id 总大于已提交的，按 id 推进游标不会跳过记录。
+
+        Args:
+            after_id: 已消费到的变更日志 id（不含）
+            limit: 最多返回条数
+
+        Returns:
+            list[ConceptMembershipChangeDTO]: 变更日志列表
+        """
+        result = await self.session.execute(
+            select(ConceptStockChangeLogModel)
+            .where(ConceptStockChangeLogModel.id > after_id)
+            .order_by(ConceptStockChangeLogModel.id)
+            .limit(limit)
+        )
+        return [
+            ConceptMembershipChangeDTO.model_validate(model, from_attributes=True)
+            for model in result.scalars().all()
+        ]
+
+    async def get_latest_change_id(self) -> int:
+        """
+        查询当前最大的变更日志 id（无记录时为 0）
+
+        Returns:
+            int: 最大变更日志 id
+        """
+        latest = await self.session.scalar(select(func.max(ConceptStockChangeLogModel.id)))
+        return latest or 0
+
+    async def get_change_cursor(self, consumer: str) -> Optional[int]:
+        """
+        查询下游消费者已应用到的变更日志 id
+
+        Args:
+            consumer: 消费者标识
+
+        Returns:
+            Optional[int]: 游标位置，从未消费过时为 None
+        """
+        return await self.session.scalar(
+            select(ConceptChangeCursorModel.last_change_id).where(
+                ConceptChangeCursorModel.consumer == consumer
+            )
+        )
+
+    async def save_change_cursor(self, consumer: str, change_id: int) -> None:
+        """
+        保存下游消费者已应用到的变更日志 id
+
+        Args:
+            consumer: 消费者标识
+            change_id: 已应用的变更日志 id
+        """
+        now = datetime.now()
+        stmt = insert(ConceptChangeCursorModel).values(
+            consumer=consumer, last_change_id=change_id, updated_at=now
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["consumer"],
+            set_={"last_change_id": stmt.excluded.last_change_id, "updated_at": now},
+        )
+        await self.session.execute(stmt)
+        await self.session.commit()
+        logger.debug(f"概念变更日志消费游标 {consumer} → {change_id}")
@@ -2,12 +2,12 @@ from datetime import date
 
 from loguru import logger
 from sqlalchemy import select
-from sqlalchemy.dialects.postgresql import insert
 
 from src.modules.data_engineering.domain.model.dragon_tiger import DragonTigerDetail
 from src.modules.data_engineering.domain.ports.repositories.dragon_tiger_repo import (
     IDragonTigerRepository,
 )
+from src.modules.data_engineering.infrastructure.config import de_config
 from src.modules.data_engineering.infrastructure.persistence.models.dragon_tiger_model import (
     DragonTigerModel,
 )
@@ -23,7 +23,7 @@ class PgDragonTigerRepository(BaseRepository[DragonTigerModel], IDragonTigerRepo
     def __init__(self, session):
         super().__init__(DragonTigerModel, session)
 
-    async def save_all(self, details: list[DragonTigerDetail]) -> int:
+    async def save_all(self, details: list[DragonTigerDetail], bulk: bool | None = None) -> int:
         """
         批量 UPSERT 龙虎榜记录（以 trade_date + third_code + reason 为唯一键）
         """
@@ -32,26 +32,13 @@ class PgDragonTigerRepository(BaseRepository[DragonTigerModel], IDragonTigerRepo
 
         detail_dicts = [detail.model_dump(exclude={"id"}, exclude_unset=True) for detail in details]
 
-        stmt = insert(DragonTigerModel).values(detail_dicts)
-        stmt = stmt.on_conflict_do_update(
-            index_elements=["trade_date", "third_code", "reason"],
-            set_={
-                "stock_name": stmt.excluded.stock_name,
-                "pct_chg": stmt.excluded.pct_chg,
-                "close": stmt.excluded.close,
-                "net_amount": stmt.excluded.net_amount,
-                "buy_amount": stmt.excluded.buy_amount,
-                "sell_amount": stmt.excluded.sell_amount,
-                "buy_seats": stmt.excluded.buy_seats,
-                "sell_seats": stmt.excluded.sell_seats,
-                "updated_at": stmt.excluded.updated_at,
-            },
+        count = await self.upsert_all(
+            detail_dicts,
+            unique_fields=["trade_date", "third_code", "reason"],
+            exclude_fields=["id", "created_at"],
+            bulk=bulk,
+            bulk_threshold=de_config.SYNC_BULK_COPY_THRESHOLD,
         )
-
-        await self.session.execute(stmt)
-        await self.session.commit()
-
-        count = len(details)
         logger.debug(f"UPSERT {count} 条龙虎榜记录")
         return count
 
@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Optional
 
 from sqlalchemy import select
 
@@ -8,6 +8,7 @@ from src.modules.data_engineering.domain.model.financial_report import (
 from src.modules.data_engineering.domain.ports.repositories.financial_data_repo import (
     IFinancialDataRepository,
 )
+from src.modules.data_engineering.infrastructure.config import de_config
 from src.modules.data_engineering.infrastructure.persistence.models.finance_model import (
     StockFinanceModel,
 )
@@ -18,7 +19,7 @@ class StockFinanceRepositoryImpl(BaseRepository[StockFinanceModel], IFinancialDa
     def __init__(self, session):
         super().__init__(StockFinanceModel, session)
 
-    async def save_all(self, finances: List[StockFinance]) -> int:
+    async def save_all(self, finances: List[StockFinance], bulk: Optional[bool] = None) -> int:
         if not finances:
             return 0
 
@@ -42,6 +43,8 @@ class StockFinanceRepositoryImpl(BaseRepository[StockFinanceModel], IFinancialDa
         return await self.upsert_all(
             items=data_list,
             unique_fields=["third_code", "ann_date", "end_date"],
+            bulk=bulk,
+            bulk_threshold=de_config.SYNC_BULK_COPY_THRESHOLD,
         )
 
     async def get_by_third_code_recent(self, third_code: str, limit: int) -> List[StockFinance]:
@@ -2,12 +2,12 @@ from datetime import date
 
 from loguru import logger
 from sqlalchemy import select
-from sqlalchemy.dialects.postgresql import insert
 
 from src.modules.data_engineering.domain.model.limit_up_pool import LimitUpPoolStock
 from src.modules.data_engineering.domain.ports.repositories.limit_up_pool_repo import (
     ILimitUpPoolRepository,
 )
+from src.modules.data_engineering.infrastructure.config import de_config
 from src.modules.data_engineering.infrastructure.persistence.models.limit_up_pool_model import (
     LimitUpPoolModel,
 )
@@ -23,7 +23,7 @@ class PgLimitUpPoolRepository(BaseRepository[LimitUpPoolModel], ILimitUpPoolRepo
     def __init__(self, session):
         super().__init__(LimitUpPoolModel, session)
 
-    async def save_all(self, stocks: list[LimitUpPoolStock]) -> int:
+    async def save_all(self, stocks: list[LimitUpPoolStock], bulk: bool | None = None) -> int:
         """
         批量 UPSERT 涨停池记录（以 trade_date + third_code 为唯一键）
         使用 PostgreSQL ON CONFLICT DO UPDATE 实现幂等写入
@@ -33,27 +33,13 @@ class PgLimitUpPoolRepository(BaseRepository[LimitUpPoolModel], ILimitUpPoolRepo
 
         stock_dicts = [stock.model_dump(exclude={"id"}, exclude_unset=True) for stock in stocks]
 
-        stmt = insert(LimitUpPoolModel).values(stock_dicts)
-        stmt = stmt.on_conflict_do_update(
-            index_elements=["trade_date", "third_code"],
-            set_={
-                "stock_name": stmt.excluded.stock_name,
-                "pct_chg": stmt.excluded.pct_chg,
-                "close": stmt.excluded.close,
-                "amount": stmt.excluded.amount,
-                "turnover_rate": stmt.excluded.turnover_rate,
-                "consecutive_boards": stmt.excluded.consecutive_boards,
-                "first_limit_up_time": stmt.excluded.first_limit_up_time,
-                "last_limit_up_time": stmt.excluded.last_limit_up_time,
-                "industry": stmt.excluded.industry,
-                "updated_at": stmt.excluded.updated_at,
-            },
+        count = await self.upsert_all(
+            stock_dicts,
+            unique_fields=["trade_date", "third_code"],
+            exclude_fields=["id", "created_at"],
+            bulk=bulk,
+            bulk_threshold=de_config.SYNC_BULK_COPY_THRESHOLD,
         )
-
-        await self.session.execute(stmt)
-        await self.session.commit()
-
-        count = len(stocks)
         logger.debug(f"UPSERT {count} 条涨停池记录")
         return count
 
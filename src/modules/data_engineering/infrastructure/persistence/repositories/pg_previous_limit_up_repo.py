@@ -2,12 +2,12 @@ from datetime import date
 
 from loguru import logger
 from sqlalchemy import select
-from sqlalchemy.dialects.postgresql import insert
 
 from src.modules.data_engineering.domain.model.previous_limit_up import PreviousLimitUpStock
 from src.modules.data_engineering.domain.ports.repositories.previous_limit_up_repo import (
     IPreviousLimitUpRepository,
 )
+from src.modules.data_engineering.infrastructure.config import de_config
 from src.modules.data_engineering.infrastructure.persistence.models.previous_limit_up_model import (
     PreviousLimitUpModel,
 )
@@ -23,7 +23,7 @@ class PgPreviousLimitUpRepository(BaseRepository[PreviousLimitUpModel], IPreviou
     def __init__(self, session):
         super().__init__(PreviousLimitUpModel, session)
 
-    async def save_all(self, stocks: list[PreviousLimitUpStock]) -> int:
+    async def save_all(self, stocks: list[PreviousLimitUpStock], bulk: bool | None = None) -> int:
         """
         批量 UPSERT 昨日涨停表现记录（以 trade_date + third_code 为唯一键）
         """
@@ -32,25 +32,13 @@ class PgPreviousLimitUpRepository(BaseRepository[PreviousLimitUpModel], IPreviou
 
         stock_dicts = [stock.model_dump(exclude={"id"}, exclude_unset=True) for stock in stocks]
 
-        stmt = insert(PreviousLimitUpModel).values(stock_dicts)
-        stmt = stmt.on_conflict_do_update(
-            index_elements=["trade_date", "third_code"],
-            set_={
-                "stock_name": stmt.excluded.stock_name,
-                "pct_chg": stmt.excluded.pct_chg,
-                "close": stmt.excluded.close,
-                "amount": stmt.excluded.amount,
-                "turnover_rate": stmt.excluded.turnover_rate,
-                "yesterday_consecutive_boards": stmt.excluded.yesterday_consecutive_boards,
-                "industry": stmt.excluded.industry,
-                "updated_at": stmt.excluded.updated_at,
-            },
+        count = await self.upsert_all(
+            stock_dicts,
+            unique_fields=["trade_date", "third_code"],
+            exclude_fields=["id", "created_at"],
+            bulk=bulk,
+            bulk_threshold=de_config.SYNC_BULK_COPY_THRESHOLD,
         )
-
-        await self.session.execute(stmt)
-        await self.session.commit()
-
-        count = len(stocks)
         logger.debug(f"UPSERT {count} 条昨日涨停表现记录")
         return count
 
@@ -1,24 +1,53 @@
 from datetime import date
-from typing import List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Sequence
 
-from sqlalchemy import func, select
-from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy import func, literal, select
 
+from src.modules.data_engineering.domain.model.daily_bar_row import DailyBarRow, ValuationDailyRow
 from src.modules.data_engineering.domain.model.stock_daily import StockDaily
 from src.modules.data_engineering.domain.ports.repositories.market_quote_repo import (
     IMarketQuoteRepository,
 )
+from src.modules.data_engineering.infrastructure.config import de_config
 from src.modules.data_engineering.infrastructure.persistence.models.daily_bar_model import (
     StockDailyModel,
 )
+from src.modules.data_engineering.infrastructure.persistence.partitioning import (
+    ensure_year_partitions,
+)
 from src.shared.infrastructure.base_repository import BaseRepository
 
+# 可按字段投影查询的日线列（不含代码与来源等非数值列）
+_HISTORY_FIELDS = frozenset(
+    c.name for c in StockDailyModel.__table__.columns if c.name not in ("third_code", "source")
+)
+
+
+def _bar_columns(stock_name) -> tuple:
+    """DailyBarRow 对应的投影列（数值空值在 SQL 中归零），顺序与 DailyBarRow 字段一致。"""
+    return (
+        StockDailyModel.third_code,
+        stock_name,
+        StockDailyModel.trade_date,
+        *(
+            func.coalesce(getattr(StockDailyModel, name), 0.0)
+            for name in ("open", "high", "low", "close", "vol", "amount", "pct_chg")
+        ),
+    )
+
 
 class StockDailyRepositoryImpl(BaseRepository[StockDailyModel], IMarketQuoteRepository):
     def __init__(self, session):
         super().__init__(StockDailyModel, session)
 
-    async def save_all(self, dailies: List[StockDaily]) -> int:
+    async def save_all(self, dailies: List[StockDaily], bulk: Optional[bool] = None) -> int:
+        """
+        批量 UPSERT 日线（以 third_code + trade_date 为唯一键，重复时保留最后一条）
+
+        行数达到 SYNC_BULK_COPY_THRESHOLD（或 bulk=True）时走 COPY 暂存表合并写入，
+        否则按 1000 行一批的多 VALUES INSERT ... ON CONFLICT 写入。
+        写入前确保涉及年份的分区存在；分区键包含在主键内，冲突目标不变。
+        """
         if not dailies:
             return 0
 
@@ -32,33 +61,28 @@ class StockDailyRepositoryImpl(BaseRepository[StockDailyModel], IMarketQuoteRepo
             key = (item.get("third_code"), item.get("trade_date"))
             deduplicated_data[key] = item
 
-        data_list = list(deduplicated_data.values())
-
-        # Batch processing
-        batch_size = 1000
-        total_saved = 0
+        # 按交易日排序：同一批次落在同一年度分区内，减少分区路由切换，也让 BRIN 区间更紧凑
+        data_list = sorted(deduplicated_data.values(), key=lambda item: item["trade_date"])
+        await self.ensure_year_partitions({item["trade_date"].year for item in data_list})
 
-        for i in range(0, len(data_list), batch_size):
-            batch = data_list[i : i + batch_size]
-
-            stmt = insert(StockDailyModel).values(batch)
-            stmt = stmt.on_conflict_do_update(
-                index_elements=["third_code", "trade_date"],
-                set_={col.name: col for col in stmt.excluded if col.name not in ["created_at"]},
-            )
-
-            await self.session.execute(stmt)
-            total_saved += len(batch)
+        await self.upsert_all(
+            items=data_list,
+            unique_fields=["third_code", "trade_date"],
+            bulk=bulk,
+            bulk_threshold=de_config.SYNC_BULK_COPY_THRESHOLD,
+        )
+        return len(data_list)
 
-        await self.session.commit()
-        return total_saved
+    async def ensure_year_partitions(self, years: Iterable[int]) -> List[str]:
+        """确保指定年份的 stock_daily 分区存在，返回新建的分区名。"""
+        return await ensure_year_partitions(self.session, StockDailyModel.__tablename__, years)
 
     async def get_by_third_code_and_date_range(
         self, third_code: str, start_date: date, end_date: date
-    ) -> List[StockDaily]:
-        """按第三方代码与日期区间查询日线，按交易日期升序返回。"""
+    ) -> List[DailyBarRow]:
+        """按第三方代码与日期区间查询日线（列投影），按交易日期升序返回。"""
         stmt = (
-            select(StockDailyModel)
+            select(*_bar_columns(literal("")))
             .where(
                 StockDailyModel.third_code == third_code,
                 StockDailyModel.trade_date >= start_date,
@@ -67,25 +91,25 @@ class StockDailyRepositoryImpl(BaseRepository[StockDailyModel], IMarketQuoteRepo
             .order_by(StockDailyModel.trade_date.asc())
         )
         result = await self.session.execute(stmt)
-        rows = result.scalars().all()
-        return [
-            StockDaily(
-                third_code=r.third_code,
-                trade_date=r.trade_date,
-                open=r.open or 0.0,
-                high=r.high or 0.0,
-                low=r.low or 0.0,
-                close=r.close or 0.0,
-                pre_close=r.pre_close or 0.0,
-                change=r.change or 0.0,
-                pct_chg=r.pct_chg or 0.0,
-                vol=r.vol or 0.0,
-                amount=r.amount or 0.0,
-                adj_factor=r.adj_factor,
-                source=r.source or "tushare",
+        return [DailyBarRow._make(r) for r in result.all()]
+
+    async def get_by_third_codes_and_date_range(
+        self, third_codes: List[str], start_date: date, end_date: date
+    ) -> List[DailyBarRow]:
+        """按多个第三方代码与日期区间查询日线（列投影），按代码、交易日期升序返回。"""
+        if not third_codes:
+            return []
+        stmt = (
+            select(*_bar_columns(literal("")))
+            .where(
+                StockDailyModel.third_code.in_(third_codes),
+                StockDailyModel.trade_date >= start_date,
+                StockDailyModel.trade_date <= end_date,
             )
-            for r in rows
-        ]
+            .order_by(StockDailyModel.third_code.asc(), StockDailyModel.trade_date.asc())
+        )
+        result = await self.session.execute(stmt)
+        return [DailyBarRow._make(r) for r in result.all()]
 
     async def get_latest_by_third_code(self, third_code: str) -> Optional[StockDaily]:
         """查询指定标的最新的一条日线数据"""
@@ -142,14 +166,21 @@ class StockDailyRepositoryImpl(BaseRepository[StockDailyModel], IMarketQuoteRepo
 
     async def get_valuation_dailies(
         self, third_code: str, start_date: date, end_date: date
-    ) -> List[StockDaily]:
+    ) -> List[ValuationDailyRow]:
         """
-        按第三方代码与日期区间查询日线（含估值字段），用于估值分析。
-        返回的 StockDaily 包含完整的估值字段：pe_ttm、pb、ps_ttm、dv_ratio、total_mv 等。
-        按交易日期升序返回。
+        按第三方代码与日期区间查询估值日线（列投影），用于估值分析。
+        仅返回收盘价与 pe_ttm、pb、ps_ttm、dv_ratio、total_mv，按交易日期升序返回。
         """
         stmt = (
-            select(StockDailyModel)
+            select(
+                StockDailyModel.trade_date,
+                func.coalesce(StockDailyModel.close, 0.0),
+                StockDailyModel.pe_ttm,
+                StockDailyModel.pb,
+                StockDailyModel.ps_ttm,
+                StockDailyModel.dv_ratio,
+                StockDailyModel.total_mv,
+            )
             .where(
                 StockDailyModel.third_code == third_code,
                 StockDailyModel.trade_date >= start_date,
@@ -158,71 +189,64 @@ class StockDailyRepositoryImpl(BaseRepository[StockDailyModel], IMarketQuoteRepo
             .order_by(StockDailyModel.trade_date.asc())
         )
         result = await self.session.execute(stmt)
-        rows = result.scalars().all()
-        return [
-            StockDaily(
-                third_code=r.third_code,
-                trade_date=r.trade_date,
-                open=r.open or 0.0,
-                high=r.high or 0.0,
-                low=r.low or 0.0,
-                close=r.close or 0.0,
-                pre_close=r.pre_close or 0.0,
-                change=r.change or 0.0,
-                pct_chg=r.pct_chg or 0.0,
-                vol=r.vol or 0.0,
-                amount=r.amount or 0.0,
-                adj_factor=r.adj_factor,
-                turnover_rate=r.turnover_rate,
-                turnover_rate_f=r.turnover_rate_f,
-                volume_ratio=r.volume_ratio,
-                pe=r.pe,
-                pe_ttm=r.pe_ttm,
-                pb=r.pb,
-                ps=r.ps,
-                ps_ttm=r.ps_ttm,
-                dv_ratio=r.dv_ratio,
-                dv_ttm=r.dv_ttm,
-                total_share=r.total_share,
-                float_share=r.float_share,
-                free_share=r.free_share,
-                total_mv=r.total_mv,
-                circ_mv=r.circ_mv,
-                source=r.source or "tushare",
+        return [ValuationDailyRow._make(r) for r in result.all()]
+
+    async def get_field_history(
+        self,
+        third_code: str,
+        start_date: date,
+        end_date: date,
+        fields: Sequence[str],
+    ) -> Dict[str, List[Any]]:
+        """
+        按字段投影查询日线历史，按交易日期升序、以列为单位返回（空值保留为 None）。
+        仅查询 fields 指定的列；fields 覆盖在 ix_stock_daily_valuation_covering 内时走 index-only scan。
+        """
+        unknown = [f for f in fields if f not in _HISTORY_FIELDS]
+        if unknown:
+            raise ValueError(f"不支持的日线字段: {unknown}")
+        if not fields:
+            return {}
+
+        stmt = (
+            select(*(getattr(StockDailyModel, f) for f in fields))
+            .where(
+                StockDailyModel.third_code == third_code,
+                StockDailyModel.trade_date >= start_date,
+                StockDailyModel.trade_date <= end_date,
             )
-            for r in rows
-        ]
+            .order_by(StockDailyModel.trade_date.asc())
+        )
+        result = await self.session.execute(stmt)
+        rows = result.all()
+        columns = list(zip(*rows)) if rows else [() for _ in fields]
+        return {f: list(col) for f, col in zip(fields, columns)}
 
-    async def get_all_by_trade_date(self, trade_date: date) -> List[StockDaily]:
-        """查询指定交易日的全市场日线数据"""
+    async def get_all_by_trade_date(self, trade_date: date) -> List[DailyBarRow]:
+        """查询指定交易日的全市场日线（列投影，附带股票名称）"""
         from src.modules.data_engineering.infrastructure.persistence.models.stock_model import (
             StockModel,
         )
 
         stmt = (
-            select(StockDailyModel, StockModel.name)
+            select(*_bar_columns(func.coalesce(StockModel.name, "")))
+            .select_from(StockDailyModel)
             .join(StockModel, StockDailyModel.third_code == StockModel.third_code, isouter=True)
             .where(StockDailyModel.trade_date == trade_date)
             .order_by(StockDailyModel.third_code.asc())
         )
         result = await self.session.execute(stmt)
-        rows = result.all()
-        return [
-            StockDaily(
-                third_code=r.third_code,
-                stock_name=stock_name or "",
-                trade_date=r.trade_date,
-                open=r.open or 0.0,
-                high=r.high or 0.0,
-                low=r.low or 0.0,
-                close=r.close or 0.0,
-                pre_close=r.pre_close or 0.0,
-                change=r.change or 0.0,
-                pct_chg=r.pct_chg or 0.0,
-                vol=r.vol or 0.0,
-                amount=r.amount or 0.0,
-                adj_factor=r.adj_factor,
-                source=r.source or "tushare",
+        return [DailyBarRow._make(r) for r in result.all()]
+
+    async def get_third_codes_with_dailies(self, start_date: date, end_date: date) -> List[str]:
+        """查询日期区间内至少有一条日线数据的股票代码（去重）"""
+        stmt = (
+            select(StockDailyModel.third_code)
+            .where(
+                StockDailyModel.trade_date >= start_date,
+                StockDailyModel.trade_date <= end_date,
             )
-            for r, stock_name in rows
-        ]
+            .distinct()
+        )
+        result = await self.session.execute(stmt)
+        return list(result.scalars().all())
@@ -2,12 +2,12 @@ from datetime import date
 
 from loguru import logger
 from sqlalchemy import select
-from sqlalchemy.dialects.postgresql import insert
 
 from src.modules.data_engineering.domain.model.sector_capital_flow import SectorCapitalFlow
 from src.modules.data_engineering.domain.ports.repositories.sector_capital_flow_repo import (
     ISectorCapitalFlowRepository,
 )
+from src.modules.data_engineering.infrastructure.config import de_config
 from src.modules.data_engineering.infrastructure.persistence.models.sector_capital_flow_model import (
     SectorCapitalFlowModel,
 )
@@ -25,7 +25,7 @@ class PgSectorCapitalFlowRepository(
     def __init__(self, session):
         super().__init__(SectorCapitalFlowModel, session)
 
-    async def save_all(self, flows: list[SectorCapitalFlow]) -> int:
+    async def save_all(self, flows: list[SectorCapitalFlow], bulk: bool | None = None) -> int:
         """
         批量 UPSERT 板块资金流向记录（以 trade_date + sector_name + sector_type 为唯一键）
         """
@@ -34,22 +34,13 @@ class PgSectorCapitalFlowRepository(
 
         flow_dicts = [flow.model_dump(exclude={"id"}, exclude_unset=True) for flow in flows]
 
-        stmt = insert(SectorCapitalFlowModel).values(flow_dicts)
-        stmt = stmt.on_conflict_do_update(
-            index_elements=["trade_date", "sector_name", "sector_type"],
-            set_={
-                "net_amount": stmt.excluded.net_amount,
-                "inflow_amount": stmt.excluded.inflow_amount,
-                "outflow_amount": stmt.excluded.outflow_amount,
-                "pct_chg": stmt.excluded.pct_chg,
-                "updated_at": stmt.excluded.updated_at,
-            },
+        count = await self.upsert_all(
+            flow_dicts,
+            unique_fields=["trade_date", "sector_name", "sector_type"],
+            exclude_fields=["id", "created_at"],
+            bulk=bulk,
+            bulk_threshold=de_config.SYNC_BULK_COPY_THRESHOLD,
         )
-
-        await self.session.execute(stmt)
-        await self.session.commit()
-
-        count = len(flows)
         logger.debug(f"UPSERT {count} 条板块资金流向记录")
         return count
 
@@ -106,6 +106,13 @@ class StockRepositoryImpl(BaseRepository[StockModel], IStockBasicRepository):
         result = await self.session.execute(select(StockModel).offset(skip).limit(limit))
         return [StockInfo.model_validate(model) for model in result.scalars().all()]
 
+    async def get_all_third_codes(self) -> List[str]:
+        """获取全部股票的 third_code"""
+        result = await self.session.execute(
+            select(StockModel.third_code).order_by(StockModel.third_code.asc())
+        )
+        return list(result.scalars().all())
+
     async def save(self, stock: StockInfo) -> StockInfo:
         """保存单个股票信息 (Create or Update)"""
         stock_data = stock.model_dump(exclude_unset=True)
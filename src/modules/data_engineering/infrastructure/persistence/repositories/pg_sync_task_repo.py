@@ -100,6 +100,20 @@ class SyncTaskRepositoryImpl(BaseRepository[SyncTaskModel], ISyncTaskRepository)
         model = result.scalar_one_or_none()
         return self._to_sync_task_domain(model) if model else None
 
+    async def list_paused_by_job_type(self, job_type: SyncJobType) -> List[SyncTask]:
+        """查找指定类型的全部 PAUSED 任务（按 started_at 降序）"""
+        result = await self.session.execute(
+            select(SyncTaskModel)
+            .where(
+                and_(
+                    SyncTaskModel.job_type == job_type.value,
+                    SyncTaskModel.status == SyncTaskStatus.PAUSED.value,
+                )
+            )
+            .order_by(desc(SyncTaskModel.started_at))
+        )
+        return [self._to_sync_task_domain(m) for m in result.scalars().all()]
+
     # ========== SyncFailureRecord 相关方法 ==========
 
     async def create_failure(self, record: SyncFailureRecord) -> SyncFailureRecord:
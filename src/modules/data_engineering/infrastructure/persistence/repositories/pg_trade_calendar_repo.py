@@ -0,0 +1,72 @@
+from datetime import date, datetime
+from typing import List, Optional
+
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert
+
+from src.modules.data_engineering.domain.model.trade_calendar import TradeCalendarDay
+from src.modules.data_engineering.domain.ports.repositories.trade_calendar_repo import (
+    ITradeCalendarRepository,
+)
+from src.modules.data_engineering.infrastructure.persistence.models.trade_calendar_model import (
+    TradeCalendarModel,
+)
+from src.shared.infrastructure.base_repository import BaseRepository
+
+
+class PgTradeCalendarRepository(BaseRepository[TradeCalendarModel], ITradeCalendarRepository):
+    """
+    PostgreSQL 交易日历仓储实现
+    实现 ITradeCalendarRepository 接口
+
+    仓储与调用方共享会话，所有语句都在 savepoint 内执行：失败时只回滚 savepoint，
+    交易日历服务降级处理后，调用方的事务仍可继续使用。
+    """
+
+    def __init__(self, session):
+        super().__init__(TradeCalendarModel, session)
+
+    async def save_all(self, days: List[TradeCalendarDay]) -> int:
+        """批量 UPSERT 交易日历（以 exchange + cal_date 为唯一键）"""
+        if not days:
+            return 0
+
+        now = datetime.now()
+        rows = [{**day.model_dump(), "updated_at": now} for day in days]
+
+        batch_size = 1000
+        async with self.session.begin_nested():
+            for i in range(0, len(rows), batch_size):
+                stmt = insert(TradeCalendarModel).values(rows[i : i + batch_size])
+                stmt = stmt.on_conflict_do_update(
+                    index_elements=["exchange", "cal_date"],
+                    set_={
+                        "is_open": stmt.excluded.is_open,
+                        "pretrade_date": stmt.excluded.pretrade_date,
+                        "updated_at": stmt.excluded.updated_at,
+                    },
+                )
+                await self.session.execute(stmt)
+
+        await self.session.commit()
+        return len(rows)
+
+    async def get_open_dates(self, exchange: str) -> List[date]:
+        """查询交易所全部交易日，按日期升序返回"""
+        stmt = (
+            select(TradeCalendarModel.cal_date)
+            .where(TradeCalendarModel.exchange == exchange, TradeCalendarModel.is_open.is_(True))
+            .order_by(TradeCalendarModel.cal_date.asc())
+        )
+        async with self.session.begin_nested():
+            result = await self.session.execute(stmt)
+            return list(result.scalars().all())
+
+    async def get_latest_cal_date(self, exchange: str) -> Optional[date]:
+        """查询已持久化日历覆盖到的最后一个自然日"""
+        stmt = select(func.max(TradeCalendarModel.cal_date)).where(
+            TradeCalendarModel.exchange == exchange
+        )
+        async with self.session.begin_nested():
+            result = await self.session.execute(stmt)
+            return result.scalar_one_or_none()
@@ -28,6 +28,12 @@ async def sync_daily_data_job(target_date: str | None = None):
     await service.run_incremental_sync(target_date)
 
 
+async def maintain_stock_daily_partitions_job():
+    """定时任务：提前创建 stock_daily 未来年度分区。"""
+    service = DailySyncService()
+    await service.run_partition_maintenance()
+
+
 async def sync_finance_history_job():
     """定时任务：同步历史财务数据（全量历史）。"""
     service = FinanceSyncService()
@@ -55,3 +61,9 @@ async def sync_stock_basic_job():
     """定时任务：同步股票基础信息（TuShare → PostgreSQL）。"""
     service = BasicDataSyncService()
     await service.run_stock_basic_sync()
+
+
+async def sync_trade_calendar_job():
+    """定时任务：同步交易日历（TuShare → PostgreSQL）。"""
+    service = BasicDataSyncService()
+    await service.run_trade_calendar_sync()
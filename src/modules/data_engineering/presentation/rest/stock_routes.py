@@ -306,6 +306,48 @@ async def sync_daily_history_full():
         raise e
 
 
+@router.post("/sync/daily/backfill", response_model=BaseResponse[HistorySyncResponse])
+async def sync_daily_history_backfill(
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+):
+    """
+    日线历史回补（管理操作）
+
+    根据缺失股票数与区间交易日数自动选择按股票或按交易日（全市场）回补，
+    按交易日策略支持断点续跑。
+
+    异步运行：立即返回任务ID，任务在后台执行
+    """
+    from src.modules.data_engineering.application.services.daily_sync_service import (
+        DailySyncService,
+    )
+
+    logger.info(f"收到日线历史回补请求：start_date={start_date}, end_date={end_date}")
+    try:
+        service = DailySyncService()
+
+        # 创建后台任务，不等待完成
+        task = asyncio.create_task(
+            service.run_history_backfill(start_date=start_date, end_date=end_date)
+        )
+
+        return BaseResponse(
+            success=True,
+            code="DAILY_HISTORY_BACKFILL_STARTED",
+            message="日线历史回补已启动（后台运行）",
+            data=HistorySyncResponse(
+                task_id=f"background_task_{id(task)}",
+                status="running",
+                total_processed=0,
+                message="任务正在后台执行，请通过其他接口查询执行状态",
+            ),
+        )
+    except Exception as e:
+        logger.exception(f"启动日线历史回补失败：{str(e)}")
+        raise e
+
+
 @router.post("/sync/finance/full", response_model=BaseResponse[HistorySyncResponse])
 async def sync_finance_history_full():
     """
@@ -1,5 +1,7 @@
 """
 DebateService：编排三阶段辩论流程（Bull/Bear 并行 → Resolution 串行），返回 DebateOutcomeDTO。
+
+advocate / resolve 分别对应论证与消解两个阶段，供调用方在专家结果陆续到达时提前发起论证（增量辩论）。
 """
 
 import asyncio
@@ -9,6 +11,10 @@ from src.modules.debate.application.dtos.debate_outcome_dto import (
     BullCaseDTO,
     DebateOutcomeDTO,
 )
+from src.modules.debate.domain.dtos.bull_bear_argument import (
+    BearArgument,
+    BullArgument,
+)
 from src.modules.debate.domain.dtos.debate_input import DebateInput
 from src.modules.debate.domain.ports.bear_advocate_agent import (
     IBearAdvocateAgentPort,
@@ -44,17 +50,28 @@ class DebateService:
         执行三阶段辩论：Bull 与 Bear 并行，Resolution 串行。
         任一 Agent 抛异常时向上传播，由调用方处理。
         """
+        bull, bear = await self.advocate(debate_input)
+        return await self.resolve(debate_input.symbol, bull, bear)
+
+    async def advocate(self, debate_input: DebateInput) -> tuple[BullArgument, BearArgument]:
+        """论证阶段：Bull 与 Bear 并行。"""
         bull, bear = await asyncio.gather(
             self._bull_agent.advocate(debate_input),
             self._bear_agent.advocate(debate_input),
         )
+        return bull, bear
+
+    async def resolve(
+        self, symbol: str, bull: BullArgument, bear: BearArgument
+    ) -> DebateOutcomeDTO:
+        """消解阶段：基于多空论证执行 Resolution，组装 DebateOutcomeDTO。"""
         resolution = await self._resolution_agent.resolve(
-            symbol=debate_input.symbol,
+            symbol=symbol,
             bull=bull,
             bear=bear,
         )
         return DebateOutcomeDTO(
-            symbol=debate_input.symbol,
+            symbol=symbol,
             direction=resolution.direction,
             confidence=resolution.confidence,
             bull_case=BullCaseDTO(
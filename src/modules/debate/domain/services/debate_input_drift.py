@@ -0,0 +1,61 @@
+"""
+辩论输入漂移判定领域服务
+"""
+
+from src.modules.debate.domain.dtos.debate_input import DebateInput
+
+# 各专家信号的多空倾向关键词（信号枚举各不相同：BULLISH / Undervalued / Favorable / Positive 等）
+_BEARISH_KEYWORDS = ("BEAR", "OVERVALU", "UNFAVORABLE", "NEGATIVE")
+_BULLISH_KEYWORDS = ("BULL", "UNDERVALU", "FAVORABLE", "POSITIVE")
+
+
+class DebateInputDriftDetector:
+    """
+    判定后到的专家结果是否实质改变辩论输入。
+
+    以置信度加权的多空倾向（-1 ~ 1）概括一份辩论输入：
+    - 倾向所属区间（偏空 / 中性 / 偏多，中性带为 ±neutral_band）发生变化，或
+    - 倾向变动幅度达到 shift_threshold
+    即视为实质变化，基于早先输入的多空论证需要重新生成；否则沿用早先论证。
+    """
+
+    def __init__(self, shift_threshold: float = 0.25, neutral_band: float = 0.15) -> None:
+        self._shift_threshold = shift_threshold
+        self._neutral_band = neutral_band
+
+    @staticmethod
+    def stance(signal: str) -> int:
+        """信号的多空倾向：偏多 1、偏空 -1、中性或无法识别 0。"""
+        upper = (signal or "").upper()
+        if any(k in upper for k in _BEARISH_KEYWORDS):
+            return -1
+        if any(k in upper for k in _BULLISH_KEYWORDS):
+            return 1
+        return 0
+
+    def weighted_stance(self, debate_input: DebateInput) -> float:
+        """置信度加权的多空倾向；无专家或置信度全为 0 时为 0。"""
+        total = 0.0
+        weighted = 0.0
+        for summary in debate_input.expert_summaries.values():
+            weight = max(summary.confidence, 0.0)
+            total += weight
+            weighted += weight * self.stance(summary.signal)
+        return weighted / total if total > 0 else 0.0
+
+    def is_material_change(self, base: DebateInput, current: DebateInput) -> bool:
+        """current 相对 base（早先用于多空论证的输入）是否实质变化。"""
+        if base.expert_summaries == current.expert_summaries:
+            return False
+        before = self.weighted_stance(base)
+        after = self.weighted_stance(current)
+        return (
+            self._zone(before) != self._zone(after) or abs(after - before) >= self._shift_threshold
+        )
+
+    def _zone(self, value: float) -> int:
+        if value > self._neutral_band:
+            return 1
+        if value < -self._neutral_band:
+            return -1
+        return 0
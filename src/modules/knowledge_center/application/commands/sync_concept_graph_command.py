@@ -4,6 +4,8 @@
 编排从 data_engineering PostgreSQL 读取概念数据、转换并写入 Neo4j 图谱的完整流程
 """
 
+import time
+
 from loguru import logger
 
 from src.modules.knowledge_center.domain.dtos.graph_sync_dtos import SyncResult
@@ -22,6 +24,9 @@ class SyncConceptGraphCommand:
     2. 将数据转换为 ConceptGraphSyncDTO
     3. 先删除所有现有的 BELONGS_TO_CONCEPT 关系
     4. 调用 GraphRepository.merge_concepts 批量写入 Neo4j
+
+    增量同步（execute_incremental）按游标消费 data_engineering 的成份股映射变更日志，
+    只新增 / 移除发生变化的关系；从未同步过时退化为全量同步。
     """
 
     def __init__(
@@ -55,6 +60,9 @@ class SyncConceptGraphCommand:
         """
         logger.info(f"开始全量同步概念图谱数据: batch_size={batch_size}")
 
+        # 先记录当前变更日志位置：同步期间产生的变更留给之后的增量同步（重复应用是幂等的）
+        latest_change_id = await self._concept_adapter.get_latest_change_id()
+
         # 1. 从 data_engineering PostgreSQL 获取概念数据
         concepts = await self._concept_adapter.fetch_all_concepts_for_sync()
 
@@ -83,9 +91,71 @@ class SyncConceptGraphCommand:
             batch_size=batch_size,
         )
 
+        await self._concept_adapter.save_sync_cursor(latest_change_id)
+
         logger.info(
             f"概念图谱全量同步完成: total={result.total}, success={result.success}, "
             f"failed={result.failed}, duration={result.duration_ms:.2f}ms"
         )
 
         return result
+
+    async def execute_incremental(self, batch_size: int = 500, page_size: int = 5000) -> SyncResult:
+        """
+        执行概念图谱增量同步
+
+        按页读取游标之后的成份股映射变更日志，先移除已退出概念的关系、再写入新增关系，
+        每页全部应用成功后才推进游标；有概念写入失败时停止，下次从该页重新应用（幂等）。
+
+        Args:
+            batch_size: 每批提交到 Neo4j 的概念数
+            page_size: 每页读取的变更日志条数
+
+        Returns:
+            SyncResult：同步结果摘要（total/success 为已应用的变更日志条数，failed 为写入失败的概念数）
+        """
+        cursor = await self._concept_adapter.get_sync_cursor()
+        if cursor is None:
+            logger.info("概念图谱尚未全量同步过，执行全量同步")
+            return await self.execute(batch_size=batch_size)
+
+        logger.info(f"开始增量同步概念图谱数据: cursor={cursor}, batch_size={batch_size}")
+        start_time = time.time()
+        total = 0
+        failed = 0
+        error_details: list[str] = []
+
+        await self._graph_repo.ensure_constraints()
+
+        while True:
+            delta = await self._concept_adapter.fetch_concept_delta(cursor, page_size)
+            if delta.change_count == 0:
+                break
+
+            removed = await self._graph_repo.remove_concept_relationships(
+                delta.removed, batch_size=batch_size
+            )
+            merged = await self._graph_repo.merge_concepts(delta.added, batch_size=batch_size)
+            if merged.failed:
+                failed = merged.failed
+                error_details = merged.error_details
+                logger.warning(f"{merged.failed} 个概念关系写入失败，游标停留在 {cursor}")
+                break
+
+            cursor = delta.last_change_id
+            await self._concept_adapter.save_sync_cursor(cursor)
+            total += delta.change_count
+            logger.info(
+                f"已应用 {delta.change_count} 条概念变更：移除关系 {removed} 条，"
+                f"写入概念 {merged.success} 个，cursor={cursor}"
+            )
+
+        duration_ms = (time.time() - start_time) * 1000
+        logger.info(f"概念图谱增量同步完成: changes={total}, duration={duration_ms:.2f}ms")
+        return SyncResult(
+            total=total,
+            success=total,
+            failed=failed,
+            duration_ms=duration_ms,
+            error_details=error_details,
+        )
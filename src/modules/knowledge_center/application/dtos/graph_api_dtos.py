@@ -131,6 +131,9 @@ class SyncConceptsRequest(BaseModel):
     用于 POST /sync/concepts 端点。
     """
 
+    mode: Literal["full", "incremental"] = Field(
+        "full", description="概念同步模式：full（全量先删后建）或 incremental（按变更日志增量）"
+    )
     batch_size: int = Field(500, description="批量大小")
 
 
@@ -120,16 +120,23 @@ class GraphService:
         logger.info(f"GraphService: 增量同步完成，成功 {result.success} 条")
         return result
 
-    async def sync_concept_graph(self, batch_size: int = 500) -> SyncResult:
+    async def sync_concept_graph(self, batch_size: int = 500, mode: str = "full") -> SyncResult:
         """
-        全量同步概念图谱数据。
+        同步概念图谱数据。
 
         Args:
             batch_size: 批量大小
+            mode: full（全量先删后建）或 incremental（按成份股变更日志只应用增量）
 
         Returns:
             SyncResult：同步结果摘要
         """
+        if mode == "incremental":
+            logger.info("GraphService: 开始增量同步概念图谱")
+            result = await self._sync_concept_command.execute_incremental(batch_size=batch_size)
+            logger.info(f"GraphService: 概念图谱增量同步完成，应用 {result.success} 条变更")
+            return result
+
         logger.info("GraphService: 开始全量同步概念图谱")
         result = await self._sync_concept_command.execute(batch_size=batch_size)
         logger.info(f"GraphService: 概念图谱同步完成，成功 {result.success} 条")
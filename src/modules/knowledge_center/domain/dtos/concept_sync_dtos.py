@@ -16,3 +16,20 @@ class ConceptGraphSyncDTO(BaseModel):
     stock_third_codes: list[str] = Field(
         default_factory=list, description="该概念下的股票代码列表（系统标准格式）"
     )
+
+
+class ConceptGraphDeltaDTO(BaseModel):
+    """
+    概念图谱增量 DTO
+    由一页成份股映射变更日志折叠而来（同一映射以最后一次变更为准），
+    用于只对 Neo4j 应用新增 / 移除的 BELONGS_TO_CONCEPT 关系
+    """
+
+    added: list[ConceptGraphSyncDTO] = Field(
+        default_factory=list, description="需新增关系的概念及其股票代码"
+    )
+    removed: list[ConceptGraphSyncDTO] = Field(
+        default_factory=list, description="需移除关系的概念及其股票代码"
+    )
+    change_count: int = Field(default=0, description="本页变更日志条数")
+    last_change_id: int = Field(default=0, description="本页最后一条变更日志 id")
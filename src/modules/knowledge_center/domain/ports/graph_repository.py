@@ -130,6 +130,25 @@ class IGraphRepository(ABC):
             SyncResult：包含成功/失败数、耗时与错误详情
         """
 
+    @abstractmethod
+    async def remove_concept_relationships(
+        self,
+        concepts: list[ConceptGraphSyncDTO],
+        batch_size: int = 500,
+    ) -> int:
+        """
+        删除指定概念与指定股票之间的 BELONGS_TO_CONCEPT 关系。
+
+        用于概念成份股增量同步，仅移除已不属于该概念的股票关系，Concept 节点保留。
+
+        Args:
+            concepts: 概念及需移除关系的股票代码列表
+            batch_size: 每批提交的记录数，默认 500
+
+        Returns:
+            int：删除的关系数量
+        """
+
     @abstractmethod
     async def delete_all_concept_relationships(self) -> int:
         """
@@ -5,13 +5,18 @@
 
 from loguru import logger
 
+from src.modules.data_engineering.domain.model.enums import ConceptChangeType
 from src.modules.data_engineering.domain.ports.repositories.concept_repo import (
     IConceptRepository,
 )
 from src.modules.knowledge_center.domain.dtos.concept_sync_dtos import (
+    ConceptGraphDeltaDTO,
     ConceptGraphSyncDTO,
 )
 
+# 概念变更日志中知识图谱同步的消费者标识
+CONCEPT_GRAPH_CONSUMER = "knowledge_center.concept_graph"
+
 
 class ConceptDataAdapter:
     """
@@ -63,3 +68,84 @@ class ConceptDataAdapter:
 
         logger.info(f"成功转换 {len(sync_dtos)} 条 ConceptGraphSyncDTO")
         return sync_dtos
+
+    async def get_sync_cursor(self) -> int | None:
+        """
+        获取概念图谱已应用到的变更日志 id
+
+        Returns:
+            游标位置，从未同步过时为 None
+        """
+        return await self._concept_repo.get_change_cursor(CONCEPT_GRAPH_CONSUMER)
+
+    async def save_sync_cursor(self, change_id: int) -> None:
+        """
+        保存概念图谱已应用到的变更日志 id
+
+        Args:
+            change_id: 已应用的变更日志 id
+        """
+        await self._concept_repo.save_change_cursor(CONCEPT_GRAPH_CONSUMER, change_id)
+
+    async def get_latest_change_id(self) -> int:
+        """
+        获取当前最新的变更日志 id（全量同步前记录，作为之后增量同步的起点）
+
+        Returns:
+            最新变更日志 id，无变更时为 0
+        """
+        return await self._concept_repo.get_latest_change_id()
+
+    async def fetch_concept_delta(self, after_id: int, limit: int) -> ConceptGraphDeltaDTO:
+        """
+        读取一页变更日志并折叠为概念图谱增量
+
+        同一 (concept_code, third_code) 在页内多次变更时以最后一次为准；
+        股票名称变更不影响图谱关系，仅推进游标。
+
+        Args:
+            after_id: 已应用到的变更日志 id（不含）
+            limit: 本页最多读取的变更日志条数
+
+        Returns:
+            ConceptGraphDeltaDTO（change_count 为 0 表示没有新的变更）
+        """
+        changes = await self._concept_repo.get_membership_changes(after_id, limit)
+        if not changes:
+            return ConceptGraphDeltaDTO(last_change_id=after_id)
+
+        final_state: dict[tuple[str, str], bool] = {}
+        for change in changes:
+            if change.change_type == ConceptChangeType.RENAMED:
+                continue
+            final_state[(change.concept_code, change.third_code)] = (
+                change.change_type == ConceptChangeType.ADDED
+            )
+
+        added: dict[str, list[str]] = {}
+        removed: dict[str, list[str]] = {}
+        for (concept_code, third_code), is_member in final_state.items():
+            target = added if is_member else removed
+            target.setdefault(concept_code, []).append(third_code)
+
+        # 新增关系需要 Concept 节点名称（MERGE 时写入）
+        names = {}
+        if added:
+            names = {
+                code: name
+                for code, (name, _) in (await self._concept_repo.get_concept_states()).items()
+            }
+
+        return ConceptGraphDeltaDTO(
+            added=[
+                ConceptGraphSyncDTO(code=code, name=names.get(code, code), stock_third_codes=codes)
+                for code, codes in added.items()
+            ],
+            # 移除关系仅按代码匹配，名称不参与
+            removed=[
+                ConceptGraphSyncDTO(code=code, name=code, stock_third_codes=codes)
+                for code, codes in removed.items()
+            ],
+            change_count=len(changes),
+            last_change_id=changes[-1].id,
+        )
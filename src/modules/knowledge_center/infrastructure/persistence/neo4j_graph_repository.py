@@ -574,6 +574,47 @@ class Neo4jGraphRepository(IGraphRepository):
                 details={"error": str(e)},
             )
 
+    async def remove_concept_relationships(
+        self,
+        concepts: list[ConceptGraphSyncDTO],
+        batch_size: int = 500,
+    ) -> int:
+        """
+        删除指定概念与指定股票之间的 BELONGS_TO_CONCEPT 关系。
+
+        使用 UNWIND 批量匹配 (Stock)-[BELONGS_TO_CONCEPT]->(Concept) 并删除，Concept 节点保留。
+        """
+        if not concepts:
+            return 0
+
+        cypher = """
+        UNWIND $concepts AS concept
+        MATCH (c:CONCEPT {code: concept.code})
+        UNWIND concept.stock_third_codes AS stock_code
+        MATCH (:STOCK {third_code: stock_code})-[r:BELONGS_TO_CONCEPT]->(c)
+        DELETE r
+        RETURN count(r) AS deleted_count
+        """
+
+        deleted_count = 0
+        try:
+            with self._driver.session() as session:
+                for i in range(0, len(concepts), batch_size):
+                    batch_data = [
+                        concept.model_dump(mode="json") for concept in concepts[i : i + batch_size]
+                    ]
+                    record = session.run(cypher, concepts=batch_data).single()
+                    deleted_count += record["deleted_count"] if record else 0
+
+            logger.info(f"删除指定 BELONGS_TO_CONCEPT 关系：{deleted_count} 条")
+            return deleted_count
+        except Exception as e:
+            logger.error(f"删除指定 BELONGS_TO_CONCEPT 关系失败: {str(e)}")
+            raise GraphSyncError(
+                message="删除概念关系失败",
+                details={"error": str(e)},
+            )
+
     async def delete_all_concept_relationships(self) -> int:
         """
         删除所有 BELONGS_TO_CONCEPT 关系。
@@ -328,7 +328,7 @@ async def sync_stocks_incremental(
     "/sync/concepts",
     response_model=BaseResponse[SyncGraphResponse],
     summary="概念同步",
-    description="全量同步概念数据到 Neo4j 图谱",
+    description="同步概念数据到 Neo4j 图谱（full 全量 / incremental 按成份股变更日志增量）",
 )
 async def sync_concepts(
     request: SyncConceptsRequest,
@@ -345,8 +345,8 @@ async def sync_concepts(
         同步结果摘要
     """
     try:
-        logger.info("执行概念全量同步")
-        result = await service.sync_concept_graph(batch_size=request.batch_size)
+        logger.info(f"执行概念同步: mode={request.mode}")
+        result = await service.sync_concept_graph(batch_size=request.batch_size, mode=request.mode)
 
         return BaseResponse(
             success=True,
@@ -3,22 +3,52 @@ LLM 平台门面服务：统一大模型调用与调用审计。
 """
 
 import time
-from datetime import datetime
-from typing import TYPE_CHECKING, List, Optional
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, AsyncIterator, List, Optional
 from uuid import UUID, uuid4
 
 from loguru import logger
 
 from src.modules.llm_platform.domain.dtos.llm_call_log_dtos import LLMCallLog
+from src.modules.llm_platform.domain.dtos.llm_completion_cache_dtos import (
+    LLMCompletionCacheEntry,
+    LLMCompletionCacheStats,
+)
+from src.modules.llm_platform.domain.dtos.llm_route_dtos import LLMRouteStats
+from src.modules.llm_platform.domain.dtos.llm_scheduler_dtos import (
+    LLMLaneMetrics,
+    LLMRequestPriority,
+)
+from src.modules.llm_platform.domain.llm_completion_cache_utils import (
+    compute_completion_cache_key,
+)
 from src.modules.llm_platform.domain.ports.llm import ILLMProvider
+from src.modules.llm_platform.infrastructure.completion_cache import (
+    LLMCompletionMemoryCache,
+    get_llm_completion_memory_cache,
+    utc_now,
+)
+from src.modules.llm_platform.infrastructure.config import llm_config
 from src.modules.llm_platform.infrastructure.registry import LLMRegistry
+from src.modules.llm_platform.infrastructure.request_scheduler import (
+    LLMRequestScheduler,
+    get_llm_request_scheduler,
+)
+from src.modules.llm_platform.infrastructure.route_health import (
+    LLMRouteHealth,
+    get_llm_route_health,
+)
 from src.modules.llm_platform.infrastructure.router import LLMRouter
 from src.shared.infrastructure.execution_context import current_execution_ctx
+from src.shared.infrastructure.llm_stream import current_llm_stream_sink
 
 if TYPE_CHECKING:
     from src.modules.llm_platform.domain.ports.llm_call_log_repository import (
         ILLMCallLogRepository,
     )
+    from src.modules.llm_platform.domain.ports.llm_completion_cache_repository import (
+        ILLMCompletionCacheRepository,
+    )
 
 
 class LLMService(ILLMProvider):
@@ -27,16 +57,28 @@ class LLMService(ILLMProvider):
     对外提供统一的大模型调用能力，封装了底层的路由、注册和适配逻辑。
     其他模块应通过此服务使用大模型能力，而非直接依赖基础设施层。
     当注入 ILLMCallLogRepository 时，每次 generate 调用会审计写入日志（写入失败不阻塞主流程）。
+    所有调用经进程内共享的 LLMRequestScheduler 按模型别名做并发 / token 预算准入与优先级排队，
+    并由共享的 LLMRouteHealth 按期望耗时选择候选模型、熔断持续失败的模型。
+    参与缓存的调用先查补全缓存（进程内 LRU → 注入的 ILLMCompletionCacheRepository），命中则不调用模型。
+    generate_stream 逐段产出增量文本；请求上下文设置了 LLMStreamSink 时，generate 也改走流式生成并把增量写入通道。
     """
 
     def __init__(
         self,
         registry: LLMRegistry | None = None,
         call_log_repository: "ILLMCallLogRepository | None" = None,
+        scheduler: LLMRequestScheduler | None = None,
+        completion_cache_repository: "ILLMCompletionCacheRepository | None" = None,
+        memory_cache: LLMCompletionMemoryCache | None = None,
+        route_health: LLMRouteHealth | None = None,
     ) -> None:
         self.registry = registry or LLMRegistry()
-        self.router = LLMRouter(self.registry)
+        self.scheduler = scheduler or get_llm_request_scheduler()
+        self.route_health = route_health or get_llm_route_health()
+        self.router = LLMRouter(self.registry, scheduler=self.scheduler, health=self.route_health)
         self._call_log_repository = call_log_repository
+        self._completion_cache_repository = completion_cache_repository
+        self._memory_cache = memory_cache or get_llm_completion_memory_cache()
 
     async def generate(
         self,
@@ -47,6 +89,8 @@ class LLMService(ILLMProvider):
         tags: Optional[List[str]] = None,
         caller_module: str = "",
         caller_agent: Optional[str] = None,
+        priority: Optional[LLMRequestPriority] = None,
+        cache: Optional[bool] = None,
     ) -> str:
         """
         调用大模型生成文本。支持通过别名指定模型或通过标签进行动态路由。
@@ -59,6 +103,10 @@ class LLMService(ILLMProvider):
             tags: 模型筛选标签。
             caller_module: 调用方模块名（用于审计日志，可选）。
             caller_agent: 调用方 Agent 标识（用于审计日志，可选）。
+            priority: 调度优先级；定时 / 批量任务应传 BATCH，让位于交互式研究请求。
+                None 时取当前 ExecutionContext 的优先级（无上下文时为 INTERACTIVE）。
+            cache: 是否使用补全缓存。None 时 temperature 不高于 LLM_COMPLETION_CACHE_MAX_TEMPERATURE
+                即参与；True 为确定性调用方显式参与；False 禁用。
 
         Returns:
             大模型生成的文本内容。
@@ -66,10 +114,51 @@ class LLMService(ILLMProvider):
         Raises:
             Exception: 当没有匹配的模型或底层 API 调用失败时抛出。
         """
+        priority = self._resolve_priority(priority)
+        sink = current_llm_stream_sink.get()
+        if sink is not None:
+            parts: List[str] = []
+            async for chunk in self.generate_stream(
+                prompt,
+                system_message,
+                temperature,
+                alias=alias,
+                tags=tags,
+                caller_module=caller_module,
+                caller_agent=caller_agent,
+                priority=priority,
+                cache=cache,
+            ):
+                sink.push(chunk)
+                parts.append(chunk)
+            return "".join(parts)
+
         logger.info("LLM Generation request received. Alias=%s, Tags=%s", alias, tags)
         ctx = current_execution_ctx.get()
         session_uuid: UUID | None = UUID(ctx.session_id) if ctx else None
         started = time.perf_counter()
+        cache_key = (
+            self._cache_key(prompt, system_message, temperature, alias, tags)
+            if self._use_cache(cache, temperature)
+            else None
+        )
+        if cache_key is not None:
+            cached = await self._cache_lookup(cache_key)
+            if cached is not None:
+                logger.info("LLM 补全缓存命中，cache_key: {}", cache_key)
+                await self._write_call_log(
+                    session_id=session_uuid,
+                    caller_module=caller_module,
+                    caller_agent=caller_agent,
+                    prompt_text=prompt,
+                    system_message=system_message,
+                    completion_text=cached,
+                    temperature=temperature,
+                    latency_ms=int((time.perf_counter() - started) * 1000),
+                    status="cache_hit",
+                    error_message=None,
+                )
+                return cached
         try:
             result = await self.router.generate(
                 prompt,
@@ -77,9 +166,12 @@ class LLMService(ILLMProvider):
                 temperature,
                 alias=alias,
                 tags=tags,
+                priority=priority,
             )
             latency_ms = int((time.perf_counter() - started) * 1000)
             logger.info("LLM Generation completed successfully.")
+            if cache_key is not None:
+                await self._cache_store(cache_key, result, temperature, alias, tags)
             await self._write_call_log(
                 session_id=session_uuid,
                 caller_module=caller_module,
@@ -110,6 +202,192 @@ class LLMService(ILLMProvider):
             )
             raise
 
+    async def generate_stream(
+        self,
+        prompt: str,
+        system_message: Optional[str] = None,
+        temperature: float = 0.7,
+        alias: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        caller_module: str = "",
+        caller_agent: Optional[str] = None,
+        priority: Optional[LLMRequestPriority] = None,
+        cache: Optional[bool] = None,
+    ) -> AsyncIterator[str]:
+        """
+        流式调用大模型，逐段产出增量文本。参数同 generate。
+
+        首个增量产出前失败会切换候选模型，之后失败直接抛出；缓存命中时一次产出完整文本。
+        审计日志在流结束后写入，额外记录首个增量耗时（time_to_first_token_ms）。
+        """
+        logger.info("LLM Stream request received. Alias={}, Tags={}", alias, tags)
+        priority = self._resolve_priority(priority)
+        ctx = current_execution_ctx.get()
+        session_uuid: UUID | None = UUID(ctx.session_id) if ctx else None
+        started = time.perf_counter()
+        log_fields = dict(
+            session_id=session_uuid,
+            caller_module=caller_module,
+            caller_agent=caller_agent,
+            prompt_text=prompt,
+            system_message=system_message,
+            temperature=temperature,
+        )
+        cache_key = (
+            self._cache_key(prompt, system_message, temperature, alias, tags)
+            if self._use_cache(cache, temperature)
+            else None
+        )
+        if cache_key is not None:
+            cached = await self._cache_lookup(cache_key)
+            if cached is not None:
+                logger.info("LLM 补全缓存命中，cache_key: {}", cache_key)
+                latency_ms = int((time.perf_counter() - started) * 1000)
+                await self._write_call_log(
+                    **log_fields,
+                    completion_text=cached,
+                    latency_ms=latency_ms,
+                    time_to_first_token_ms=latency_ms,
+                    status="cache_hit",
+                    error_message=None,
+                )
+                yield cached
+                return
+
+        parts: List[str] = []
+        first_token_ms: Optional[int] = None
+        try:
+            async for chunk in self.router.generate_stream(
+                prompt,
+                system_message,
+                temperature,
+                alias=alias,
+                tags=tags,
+                priority=priority,
+            ):
+                if first_token_ms is None:
+                    first_token_ms = int((time.perf_counter() - started) * 1000)
+                parts.append(chunk)
+                yield chunk
+        except Exception as e:
+            logger.error("LLM Stream failed: {}", str(e))
+            await self._write_call_log(
+                **log_fields,
+                completion_text="".join(parts) or None,
+                latency_ms=int((time.perf_counter() - started) * 1000),
+                time_to_first_token_ms=first_token_ms,
+                status="failed",
+                error_message=str(e),
+            )
+            raise
+
+        result = "".join(parts)
+        latency_ms = int((time.perf_counter() - started) * 1000)
+        logger.info(
+            "LLM Stream completed. ttft_ms={}, latency_ms={}, length={}",
+            first_token_ms,
+            latency_ms,
+            len(result),
+        )
+        await self._write_call_log(
+            **log_fields,
+            completion_text=result,
+            latency_ms=latency_ms,
+            time_to_first_token_ms=first_token_ms,
+            status="success",
+            error_message=None,
+        )
+        if cache_key is not None:
+            await self._cache_store(cache_key, result, temperature, alias, tags)
+
+    def scheduler_metrics(self) -> List[LLMLaneMetrics]:
+        """各模型别名的调度指标：并发占用、排队深度（按优先级）、token 余量与排队等待时长。"""
+        return self.scheduler.metrics()
+
+    def route_stats(self) -> List[LLMRouteStats]:
+        """当前已注册模型配置的路由统计：熔断状态、滚动失败率与耗时分位数。"""
+        aliases = [c.alias for c in self.registry.get_all_configs()]
+        return self.route_health.stats(aliases)
+
+    def cache_stats(self) -> LLMCompletionCacheStats:
+        """补全缓存命中统计（进程内累计）。"""
+        return self._memory_cache.stats()
+
+    @staticmethod
+    def _resolve_priority(priority: Optional[LLMRequestPriority]) -> LLMRequestPriority:
+        """显式优先级优先；否则沿用当前执行上下文的优先级（如批量研究为 BATCH）。"""
+        if priority is not None:
+            return priority
+        ctx = current_execution_ctx.get()
+        return LLMRequestPriority(ctx.priority) if ctx else LLMRequestPriority.INTERACTIVE
+
+    @staticmethod
+    def _use_cache(cache: Optional[bool], temperature: float) -> bool:
+        if not llm_config.LLM_COMPLETION_CACHE_ENABLED:
+            return False
+        if cache is not None:
+            return cache
+        return temperature <= llm_config.LLM_COMPLETION_CACHE_MAX_TEMPERATURE
+
+    def _cache_key(
+        self,
+        prompt: str,
+        system_message: Optional[str],
+        temperature: float,
+        alias: Optional[str],
+        tags: Optional[List[str]],
+    ) -> str:
+        """缓存键包含路由目标当前解析到的模型，别名改指向新模型后不再命中旧补全。"""
+        models = self.router.resolved_models(alias, tags)
+        return compute_completion_cache_key(
+            prompt, system_message, temperature, alias, tags, models=models
+        )
+
+    async def _cache_lookup(self, cache_key: str) -> Optional[str]:
+        """先查内存层，再查数据库层（命中回填内存层）；数据库查询失败视为未命中。"""
+        cached = self._memory_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        entry = None
+        if self._completion_cache_repository is not None:
+            try:
+                entry = await self._completion_cache_repository.get(cache_key)
+            except Exception as e:
+                logger.warning("LLM 补全缓存查询失败，按未命中处理: {}", str(e))
+        if entry is None:
+            self._memory_cache.record_miss()
+            return None
+        self._memory_cache.record_db_hit()
+        self._memory_cache.put(cache_key, entry.completion_text, entry.expires_at)
+        return entry.completion_text
+
+    async def _cache_store(
+        self,
+        cache_key: str,
+        completion_text: str,
+        temperature: float,
+        alias: Optional[str],
+        tags: Optional[List[str]],
+    ) -> None:
+        """写入两层缓存，数据库写入失败仅打 warning 不阻塞。"""
+        created_at = utc_now()
+        expires_at = created_at + timedelta(hours=llm_config.LLM_COMPLETION_CACHE_TTL_HOURS)
+        self._memory_cache.put(cache_key, completion_text, expires_at)
+        self._memory_cache.record_store()
+        if self._completion_cache_repository is None:
+            return
+        entry = LLMCompletionCacheEntry(
+            cache_key=cache_key,
+            request_params={"alias": alias, "tags": tags, "temperature": temperature},
+            completion_text=completion_text,
+            created_at=created_at,
+            expires_at=expires_at,
+        )
+        try:
+            await self._completion_cache_repository.put(entry)
+        except Exception as e:
+            logger.warning("LLM 补全缓存写入失败，不阻塞返回: {}", str(e))
+
     async def _write_call_log(
         self,
         *,
@@ -123,6 +401,7 @@ class LLMService(ILLMProvider):
         latency_ms: int,
         status: str,
         error_message: Optional[str],
+        time_to_first_token_ms: Optional[int] = None,
     ) -> None:
         """写入调用日志，失败仅打 warning 不阻塞。"""
         if not self._call_log_repository:
@@ -142,6 +421,7 @@ class LLMService(ILLMProvider):
             total_tokens=None,
             temperature=temperature,
             latency_ms=latency_ms,
+            time_to_first_token_ms=time_to_first_token_ms,
             status=status,
             error_message=error_message,
             created_at=datetime.utcnow(),
@@ -27,3 +27,13 @@ class LLMPlatformStartup:
         except Exception as e:
             logger.error(f"Failed to initialize LLM Registry: {str(e)}")
             # 不阻断启动，但记录严重错误
+
+    @staticmethod
+    async def shutdown() -> None:
+        """关闭 LLM Provider 共享的 HTTP 客户端。"""
+        from src.modules.llm_platform.infrastructure.client_pool import (
+            get_llm_client_pool,
+        )
+
+        await get_llm_client_pool().aclose()
+        logger.info("LLM HTTP clients closed.")
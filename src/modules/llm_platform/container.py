@@ -32,6 +32,7 @@ from src.modules.llm_platform.infrastructure.persistence.repositories.web_search
     PgWebSearchCacheRepository,
 )
 from src.modules.llm_platform.infrastructure.registry import LLMRegistry
+from src.shared.config import settings
 
 
 class LLMPlatformContainer:
@@ -53,15 +54,26 @@ class LLMPlatformContainer:
     def llm_service(self) -> LLMService:
         """
         获取 LLM 门面服务，内部使用全局 LLMRegistry 单例。
-        若构造时提供了 session，则注入 PgLLMCallLogRepository 以记录调用审计日志。
+        若构造时提供了 session，则注入 PgLLMCallLogRepository 以记录调用审计日志（默认经异步批量写入器落库），
+        并注入 PgLLMCompletionCacheRepository 启用补全缓存的数据库层（无 session 时仅有进程内层）。
         """
         if self._session is not None:
             from src.modules.llm_platform.infrastructure.persistence.repositories.llm_call_log_repository import (  # noqa: E501
                 PgLLMCallLogRepository,
+                get_llm_call_log_writer,
+            )
+            from src.modules.llm_platform.infrastructure.persistence.repositories.llm_completion_cache_repository import (  # noqa: E501
+                PgLLMCompletionCacheRepository,
             )
 
-            call_log_repo = PgLLMCallLogRepository(self._session)
-            return LLMService(call_log_repository=call_log_repo)
+            call_log_repo = PgLLMCallLogRepository(
+                self._session,
+                writer=get_llm_call_log_writer() if settings.AUDIT_LOG_ASYNC_ENABLED else None,
+            )
+            return LLMService(
+                call_log_repository=call_log_repo,
+                completion_cache_repository=PgLLMCompletionCacheRepository(self._session),
+            )
         return LLMService()
 
     def config_service(self) -> ConfigService:
@@ -77,7 +89,8 @@ class LLMPlatformContainer:
         """
         获取 Web 搜索服务，内部构造博查搜索适配器。
         有 session 时用 CachingWebSearchProvider 包装以启用搜索结果缓存；无 session 时不启用缓存。
-        若构造时提供了 session，则注入 PgExternalAPICallLogRepository 以记录外部 API 调用日志。
+        若构造时提供了 session，则注入 PgExternalAPICallLogRepository 以记录外部 API 调用日志
+        （默认经异步批量写入器落库）。
         """
         adapter = BochaWebSearchAdapter(
             api_key=llm_config.BOCHA_API_KEY,
@@ -88,8 +101,14 @@ class LLMPlatformContainer:
             adapter = CachingWebSearchProvider(inner=adapter, cache_repo=cache_repo)
             from src.shared.infrastructure.persistence.external_api_call_log_repository import (
                 PgExternalAPICallLogRepository,
+                get_external_api_call_log_writer,
             )
 
-            api_call_log_repo = PgExternalAPICallLogRepository(self._session)
+            api_call_log_repo = PgExternalAPICallLogRepository(
+                self._session,
+                writer=(
+                    get_external_api_call_log_writer() if settings.AUDIT_LOG_ASYNC_ENABLED else None
+                ),
+            )
             return WebSearchService(provider=adapter, api_call_log_repository=api_call_log_repo)
         return WebSearchService(provider=adapter)
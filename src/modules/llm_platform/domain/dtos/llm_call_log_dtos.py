@@ -25,6 +25,7 @@ class LLMCallLog(BaseModel):
     total_tokens: int | None = None
     temperature: float = 0.0
     latency_ms: int = 0
-    status: str = "success"  # success | failed
+    time_to_first_token_ms: int | None = None  # 仅流式调用记录
+    status: str = "success"  # success | failed | cache_hit
     error_message: str | None = None
     created_at: datetime = Field(default_factory=datetime.utcnow)
@@ -0,0 +1,41 @@
+"""
+LLM 补全缓存 DTO：缓存条目与命中率统计。
+
+缓存条目用于 ILLMCompletionCacheRepository 的 get/put 契约；统计为进程内累计值。
+"""
+
+from datetime import datetime
+
+from pydantic import BaseModel, Field
+
+
+class LLMCompletionCacheEntry(BaseModel):
+    """
+    LLM 补全缓存条目。
+
+    Attributes:
+        cache_key: (路由目标, System Prompt, Prompt, temperature) 的 SHA-256 十六进制摘要，主键。
+        request_params: 路由与采样参数（alias / tags / temperature），便于调试，不含 Prompt 原文。
+        completion_text: 大模型生成的文本。
+        created_at: 缓存写入时间。
+        expires_at: 缓存过期时间。
+    """
+
+    cache_key: str
+    request_params: dict
+    completion_text: str
+    created_at: datetime
+    expires_at: datetime
+
+
+class LLMCompletionCacheStats(BaseModel):
+    """补全缓存命中统计（进程内累计，仅统计参与缓存的调用）。"""
+
+    memory_size: int = Field(0, description="内存层当前条目数")
+    memory_capacity: int = Field(0, description="内存层容量")
+    lookups: int = Field(0, description="缓存查询次数")
+    memory_hits: int = Field(0, description="内存层命中次数")
+    db_hits: int = Field(0, description="数据库层命中次数")
+    misses: int = Field(0, description="未命中次数")
+    stores: int = Field(0, description="写入次数")
+    hit_rate: float = Field(0.0, description="总命中率（内存 + 数据库）")
@@ -0,0 +1,32 @@
+"""
+LLM 路由健康 DTO：熔断状态与各模型别名的滚动延迟 / 错误统计。
+"""
+
+from enum import Enum
+from typing import Optional
+
+from pydantic import BaseModel, Field
+
+
+class LLMCircuitState(str, Enum):
+    """熔断器状态：CLOSED 正常放行；OPEN 熔断中直接跳过；HALF_OPEN 冷却结束，放行一次探测请求。"""
+
+    CLOSED = "CLOSED"
+    OPEN = "OPEN"
+    HALF_OPEN = "HALF_OPEN"
+
+
+class LLMRouteStats(BaseModel):
+    """单个模型别名的路由统计（进程内滚动窗口）。"""
+
+    alias: str
+    circuit_state: LLMCircuitState = LLMCircuitState.CLOSED
+    consecutive_failures: int = Field(0, description="连续失败次数")
+    reopen_in_seconds: Optional[float] = Field(None, description="熔断中时距可探测的剩余秒数")
+    samples: int = Field(0, description="窗口内调用数")
+    error_rate: float = Field(0.0, description="窗口内失败率")
+    latency_ms_p50: Optional[float] = Field(None, description="窗口内成功调用耗时中位数")
+    latency_ms_p95: Optional[float] = Field(None, description="窗口内成功调用耗时 P95")
+    expected_latency_ms: Optional[float] = Field(
+        None, description="期望耗时（P50 按失败率放大），样本不足时为空"
+    )
@@ -0,0 +1,33 @@
+"""
+LLM 请求调度 DTO：请求优先级与各模型别名的排队指标。
+"""
+
+from enum import IntEnum
+from typing import Optional
+
+from pydantic import BaseModel, Field
+
+
+class LLMRequestPriority(IntEnum):
+    """请求优先级，数值越小越先放行：交互式研究请求优先于批量任务。"""
+
+    INTERACTIVE = 0
+    BATCH = 1
+
+
+class LLMLaneMetrics(BaseModel):
+    """单个模型别名的调度指标（进程内累计）。"""
+
+    alias: str
+    max_concurrency: Optional[int] = Field(None, description="并发上限，None 表示不限")
+    tokens_per_minute: Optional[int] = Field(None, description="每分钟 token 预算，None 表示不限")
+    in_flight: int = Field(0, description="当前执行中的请求数")
+    queue_depth: int = Field(0, description="当前排队等待的请求数")
+    queue_depth_by_priority: dict[str, int] = Field(default_factory=dict)
+    tokens_available: Optional[float] = Field(
+        None, description="当前 token 桶余量（可为负，表示超支待偿）"
+    )
+    admitted_total: int = Field(0, description="累计放行请求数")
+    waited_total: int = Field(0, description="累计需要排队的请求数")
+    wait_ms_avg: float = Field(0.0, description="放行请求的平均排队时长（ms）")
+    wait_ms_max: float = Field(0.0, description="放行请求的最大排队时长（ms）")
@@ -20,6 +20,11 @@ class LLMConfig:
         priority (int): 优先级，数值越大优先级越高。
         tags (List[str]): 标签列表，用于通过特性筛选模型（如 ['fast', 'code']）。
         is_active (bool): 是否启用该配置。
+        max_concurrency (Optional[int]): 该模型同时执行的请求数上限，None 时使用平台默认值。
+        tokens_per_minute (Optional[int]): 该模型每分钟 token 预算（估算），None 表示不限。
+        max_connections (Optional[int]): HTTP 连接池上限；同一 (base_url, api_key) 的配置共用连接池，
+            取其中最大值，None 时使用平台默认值。
+        timeout_seconds (Optional[float]): 单次请求超时秒数，None 时使用平台默认值。
         id (Optional[int]): 数据库主键 ID。
         created_at (Optional[datetime]): 创建时间。
         updated_at (Optional[datetime]): 更新时间。
@@ -35,6 +40,10 @@ class LLMConfig:
     priority: int = 1
     tags: List[str] = field(default_factory=list)
     is_active: bool = True
+    max_concurrency: Optional[int] = None
+    tokens_per_minute: Optional[int] = None
+    max_connections: Optional[int] = None
+    timeout_seconds: Optional[float] = None
     id: Optional[int] = None
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
@@ -0,0 +1,45 @@
+"""
+LLM 补全缓存键计算。
+
+基于路由目标（alias，未指定时为排序后的 tags）及其当前解析到的模型、System Prompt、Prompt、
+temperature 生成确定性缓存键（SHA-256 十六进制），供 LLMService 与补全缓存仓储使用。
+别名改指向其他模型后缓存键随之改变，不会返回旧模型的补全。
+"""
+
+import hashlib
+from typing import List, Optional
+
+
+def compute_completion_cache_key(
+    prompt: str,
+    system_message: Optional[str],
+    temperature: float,
+    alias: Optional[str] = None,
+    tags: Optional[List[str]] = None,
+    models: Optional[List[str]] = None,
+) -> str:
+    """
+    生成确定性缓存键（SHA-256 十六进制，64 字符）。
+
+    Router 在指定 alias 时忽略 tags，路由目标同此口径；各字段以长度前缀拼接，避免分隔符歧义。
+
+    Args:
+        prompt: 用户提示词。
+        system_message: 系统预设消息，可为 None。
+        temperature: 采样温度。
+        alias: 模型别名。
+        tags: 模型筛选标签（alias 为空时参与计算）。
+        models: 路由目标当前解析到的候选模型（如 "alias=model_name"），顺序无关。
+
+    Returns:
+        64 字符十六进制字符串。
+    """
+    route = f"alias:{alias}" if alias else f"tags:{','.join(sorted(tags or []))}"
+    resolved = ",".join(sorted(models or []))
+    parts = (route, resolved, system_message or "", prompt, repr(float(temperature)))
+    digest = hashlib.sha256()
+    for part in parts:
+        data = part.encode("utf-8")
+        digest.update(len(data).to_bytes(8, "big"))
+        digest.update(data)
+    return digest.hexdigest()
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import AsyncIterator, Optional
 
 
 class ILLMProvider(ABC):
@@ -34,3 +34,21 @@ class ILLMProvider(ABC):
         """
 
         raise NotImplementedError
+
+    async def generate_stream(
+        self,
+        prompt: str,
+        system_message: Optional[str] = None,
+        temperature: float = 0.7,
+    ) -> AsyncIterator[str]:
+        """
+        Stream the response as incremental text chunks.
+
+        The default implementation yields the full result of `generate` as a
+        single chunk, so providers without native streaming still satisfy the
+        contract.
+
+        Raises:
+            LLMConnectionError: When the underlying API call fails or is unavailable.
+        """
+        yield await self.generate(prompt, system_message, temperature)
@@ -14,6 +14,9 @@ from src.modules.llm_platform.domain.web_search_dtos import (
     WebSearchResponse,
     WebSearchResultItem,
 )
+from src.modules.llm_platform.infrastructure.web_search_budget import (
+    get_web_search_budget,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -24,6 +27,7 @@ class BochaWebSearchAdapter(IWebSearchProvider):
 
     实现 IWebSearchProvider 接口，调用博查 AI Web Search API (POST /v1/web-search)
     将博查 API 的响应映射为标准的 WebSearchResponse DTO
+    每次调用占用全进程共享的博查调用预算（并发上限 + 限速），见 WebSearchBudget
 
     Attributes:
         api_key: 博查 API Key
@@ -74,7 +78,10 @@ class BochaWebSearchAdapter(IWebSearchProvider):
         logger.info(f"执行博查搜索，查询词: {request.query}, 请求体: {request_body}")
 
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
+            async with (
+                get_web_search_budget().slot(),
+                httpx.AsyncClient(timeout=self.timeout) as client,
+            ):
                 response = await client.post(
                     f"{self.base_url}/v1/web-search",
                     json=request_body,
@@ -1,4 +1,5 @@
-from typing import Optional
+from contextlib import nullcontext
+from typing import AsyncContextManager, AsyncIterator, Dict, List, Optional
 
 from loguru import logger
 from openai import APIConnectionError, APIError, AsyncOpenAI, RateLimitError
@@ -7,6 +8,7 @@ from src.modules.llm_platform.domain.exceptions import LLMConnectionError
 from src.modules.llm_platform.infrastructure.adapters.base import (
     BaseLLMProvider,
 )
+from src.modules.llm_platform.infrastructure.client_pool import LLMClientPool
 
 
 class OpenAIProvider(BaseLLMProvider):
@@ -15,9 +17,35 @@ class OpenAIProvider(BaseLLMProvider):
     支持 OpenAI 官方 API 以及兼容 OpenAI 协议的第三方服务（如 SiliconFlow）
     """
 
-    def __init__(self, api_key: str, base_url: str, model: str):
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str,
+        model: str,
+        client: Optional[AsyncOpenAI] = None,
+        client_pool: Optional[LLMClientPool] = None,
+    ):
+        """
+        :param client: 共享客户端（见 LLMClientPool）；未传入时创建独立客户端
+        :param client_pool: client 所属的客户端池，每次请求经其登记在途，客户端被淘汰后待请求结束再关闭
+        """
         super().__init__(model)
-        self.client = AsyncOpenAI(api_key=api_key, base_url=base_url)
+        self.client = client or AsyncOpenAI(api_key=api_key, base_url=base_url)
+        self._client_pool = client_pool
+
+    def _lease_client(self) -> AsyncContextManager[AsyncOpenAI]:
+        if self._client_pool is None:
+            return nullcontext(self.client)
+        return self._client_pool.lease(self.client)
+
+    @staticmethod
+    def _build_messages(prompt: str, system_message: Optional[str]) -> List[Dict[str, str]]:
+        messages = []
+        if system_message:
+            messages.append({"role": "system", "content": system_message})
+
+        messages.append({"role": "user", "content": prompt})
+        return messages
 
     async def generate(
         self,
@@ -28,11 +56,7 @@ class OpenAIProvider(BaseLLMProvider):
         """
         调用 LLM 生成文本
         """
-        messages = []
-        if system_message:
-            messages.append({"role": "system", "content": system_message})
-
-        messages.append({"role": "user", "content": prompt})
+        messages = self._build_messages(prompt, system_message)
 
         try:
             # 记录请求的关键信息（不含敏感 key）
@@ -40,12 +64,13 @@ class OpenAIProvider(BaseLLMProvider):
                 f"开始调用 LLM: {self.model} | Prompt 长度: {len(prompt)}, message: {messages}"
             )
 
-            response = await self.client.chat.completions.create(
-                model=self.model,
-                messages=messages,
-                temperature=temperature,
-                extra_body={"reasoning_split": True},
-            )
+            async with self._lease_client() as client:
+                response = await client.chat.completions.create(
+                    model=self.model,
+                    messages=messages,
+                    temperature=temperature,
+                    extra_body={"reasoning_split": True},
+                )
             content = response.choices[0].message.content
             # API 可能返回 None（如部分 tool/function 场景），契约要求返回 str，统一转为空字符串
             result = content if content is not None else ""
@@ -64,3 +89,43 @@ class OpenAIProvider(BaseLLMProvider):
         except Exception as e:
             logger.error(f"Unexpected LLM Error: {str(e)}")
             raise LLMConnectionError(f"Unexpected Error: {str(e)}")
+
+    async def generate_stream(
+        self,
+        prompt: str,
+        system_message: Optional[str] = None,
+        temperature: float = 0.7,
+    ) -> AsyncIterator[str]:
+        """
+        以流式方式调用 LLM，逐段产出增量文本（跳过空增量，如仅含 reasoning 的分片）
+        """
+        messages = self._build_messages(prompt, system_message)
+        logger.info(f"开始流式调用 LLM: {self.model} | Prompt 长度: {len(prompt)}")
+        length = 0
+        try:
+            async with self._lease_client() as client:
+                stream = await client.chat.completions.create(
+                    model=self.model,
+                    messages=messages,
+                    temperature=temperature,
+                    stream=True,
+                    extra_body={"reasoning_split": True},
+                )
+                async for chunk in stream:
+                    if not chunk.choices:
+                        continue
+                    content = chunk.choices[0].delta.content
+                    if content:
+                        length += len(content)
+                        yield content
+            logger.info(f"LLM 流式响应完成 | 长度: {length}")
+
+        except (APIConnectionError, RateLimitError) as e:
+            logger.error(f"LLM Connection/RateLimit Error: {str(e)}")
+            raise LLMConnectionError(f"LLM Service Unavailable: {str(e)}")
+        except APIError as e:
+            logger.error(f"LLM API Error: {str(e)}")
+            raise LLMConnectionError(f"LLM API Error: {str(e)}")
+        except Exception as e:
+            logger.error(f"Unexpected LLM Error: {str(e)}")
+            raise LLMConnectionError(f"Unexpected Error: {str(e)}")
@@ -0,0 +1,191 @@
+"""
+LLM Provider HTTP 客户端池（进程内单例）。
+
+按 (base_url, api_key) 共享 AsyncOpenAI 客户端及其 httpx 连接池：同一服务商账号下的多个模型别名
+复用 keep-alive 连接（安装 h2 时启用 HTTP/2 多路复用），注册表刷新时沿用未变化的客户端。
+各别名的超时通过 with_options 派生，派生客户端与原客户端共用同一连接池。
+
+连接上限变化或不再被任何配置使用的客户端被淘汰：从池中移除，待其在途请求（经 lease 登记）全部结束后关闭；
+在途请求迟迟不结束（如流式迭代被遗弃）时，最迟在 close_grace_seconds 后强制关闭。
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import AsyncIterator, Dict, Iterable, Optional, Set, Tuple
+
+import httpx
+from loguru import logger
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient
+
+from src.modules.llm_platform.infrastructure.config import llm_config
+
+ClientKey = Tuple[Optional[str], str]
+
+
+def _http2_available() -> bool:
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+@dataclass
+class _PooledClient:
+    client: AsyncOpenAI
+    max_connections: int
+
+
+class LLMClientPool:
+    """按 (base_url, api_key) 复用 AsyncOpenAI 客户端的连接池。"""
+
+    def __init__(
+        self,
+        http2: Optional[bool] = None,
+        close_grace_seconds: Optional[float] = None,
+    ) -> None:
+        if http2 is None:
+            http2 = llm_config.LLM_HTTP2_ENABLED
+        if http2 and not _http2_available():
+            logger.warning("未安装 h2，LLM Provider 客户端使用 HTTP/1.1 keep-alive 连接")
+            http2 = False
+        self._http2 = http2
+        self._close_grace_seconds = (
+            llm_config.LLM_CLIENT_CLOSE_GRACE_SECONDS
+            if close_grace_seconds is None
+            else close_grace_seconds
+        )
+        self._clients: Dict[ClientKey, _PooledClient] = {}
+        self._closing: Set[asyncio.Task] = set()
+        # 以 httpx 客户端计数在途请求：派生客户端（with_options）与原客户端共用同一个 httpx 客户端
+        self._in_flight: Dict[httpx.AsyncClient, int] = {}
+        self._retired: Dict[httpx.AsyncClient, AsyncOpenAI] = {}
+
+    def get(
+        self,
+        base_url: Optional[str],
+        api_key: str,
+        max_connections: Optional[int] = None,
+        timeout_seconds: Optional[float] = None,
+    ) -> AsyncOpenAI:
+        """
+        获取 (base_url, api_key) 对应的客户端；连接上限与池中客户端不一致时重建（旧客户端延迟关闭）。
+        :param timeout_seconds: 请求超时，与默认值不同时返回共用连接池的派生客户端
+        """
+        key = (base_url, api_key)
+        max_connections = max_connections or llm_config.LLM_HTTP_MAX_CONNECTIONS
+        pooled = self._clients.get(key)
+        if pooled is None or pooled.max_connections != max_connections:
+            if pooled is not None:
+                self._retire(pooled.client)
+            pooled = self._clients[key] = _PooledClient(
+                client=self._create(base_url, api_key, max_connections),
+                max_connections=max_connections,
+            )
+        if timeout_seconds and timeout_seconds != llm_config.LLM_HTTP_TIMEOUT_SECONDS:
+            return pooled.client.with_options(timeout=timeout_seconds)
+        return pooled.client
+
+    def retain(self, keys: Iterable[ClientKey]) -> None:
+        """只保留 keys 对应的客户端，其余淘汰（延迟关闭）。"""
+        keep = set(keys)
+        for key in [k for k in self._clients if k not in keep]:
+            self._retire(self._clients.pop(key).client)
+
+    @asynccontextmanager
+    async def lease(self, client: AsyncOpenAI) -> AsyncIterator[AsyncOpenAI]:
+        """登记一次使用 client 的在途请求；已淘汰的客户端在最后一个在途请求结束后关闭。"""
+        http_client = client._client
+        self._in_flight[http_client] = self._in_flight.get(http_client, 0) + 1
+        try:
+            yield client
+        finally:
+            remaining = self._in_flight.pop(http_client) - 1
+            if remaining:
+                self._in_flight[http_client] = remaining
+            elif http_client in self._retired:
+                self._close_retired(http_client, delay=0)
+
+    def in_flight(self, client: AsyncOpenAI) -> int:
+        """client（含共用连接池的派生客户端）当前的在途请求数。"""
+        return self._in_flight.get(client._client, 0)
+
+    def __len__(self) -> int:
+        return len(self._clients)
+
+    async def aclose(self) -> None:
+        """立即关闭池中与待关闭的全部客户端（应用关闭时调用）。"""
+        for task in list(self._closing):
+            task.cancel()
+        clients = [pooled.client for pooled in self._clients.values()]
+        clients += self._retired.values()
+        self._clients.clear()
+        self._retired.clear()
+        for client in clients:
+            await client.close()
+
+    def _create(self, base_url: Optional[str], api_key: str, max_connections: int) -> AsyncOpenAI:
+        timeout = llm_config.LLM_HTTP_TIMEOUT_SECONDS
+        http_client = DefaultAsyncHttpxClient(
+            http2=self._http2,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=min(
+                    max_connections, llm_config.LLM_HTTP_MAX_KEEPALIVE_CONNECTIONS
+                ),
+            ),
+            timeout=httpx.Timeout(timeout, connect=10.0),
+        )
+        logger.debug(
+            f"创建 LLM HTTP 客户端: base_url={base_url}, max_connections={max_connections}, "
+            f"http2={self._http2}"
+        )
+        return AsyncOpenAI(
+            api_key=api_key, base_url=base_url, timeout=timeout, http_client=http_client
+        )
+
+    def _retire(self, client: AsyncOpenAI) -> None:
+        http_client = client._client
+        self._retired[http_client] = client
+        if self._in_flight.get(http_client):
+            # 在途请求结束时关闭；close_grace_seconds 为其未能如期结束时的兜底
+            self._close_retired(http_client, delay=self._close_grace_seconds)
+        else:
+            self._close_retired(http_client, delay=0)
+
+    def _close_retired(self, http_client: httpx.AsyncClient, delay: float) -> None:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # 无事件循环（如同步上下文）时无法异步关闭，交由垃圾回收释放连接
+            return
+
+        async def close_later() -> None:
+            try:
+                if delay:
+                    await asyncio.sleep(delay)
+            finally:
+                client = self._retired.pop(http_client, None)
+                if client is not None:
+                    if self._in_flight.get(http_client):
+                        logger.warning(
+                            f"淘汰的 LLM HTTP 客户端超过 {delay}s 仍有 "
+                            f"{self._in_flight[http_client]} 个在途请求，强制关闭"
+                        )
+                    await client.close()
+
+        task = loop.create_task(close_later())
+        self._closing.add(task)
+        task.add_done_callback(self._closing.discard)
+
+
+_llm_client_pool: Optional[LLMClientPool] = None
+
+
+def get_llm_client_pool() -> LLMClientPool:
+    """获取进程内共享的 LLM Provider 客户端池。"""
+    global _llm_client_pool
+    if _llm_client_pool is None:
+        _llm_client_pool = LLMClientPool()
+    return _llm_client_pool
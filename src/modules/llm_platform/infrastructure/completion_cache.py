@@ -0,0 +1,94 @@
+"""
+LLM 补全缓存的进程内 LRU 层（进程内单例）。
+
+LLMService 先查本层，未命中再查数据库层（ILLMCompletionCacheRepository），仍未命中才调用模型；
+数据库层命中会回填本层。条目按写入时确定的 expires_at 过期，超出容量时淘汰最久未使用的条目。
+命中率计数在本层累计，覆盖两层查询结果。
+"""
+
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Optional, Tuple
+
+from src.modules.llm_platform.domain.dtos.llm_completion_cache_dtos import (
+    LLMCompletionCacheStats,
+)
+from src.modules.llm_platform.infrastructure.config import llm_config
+
+
+def utc_now() -> datetime:
+    """naive UTC 当前时间，与数据库 TIMESTAMP WITHOUT TIME ZONE 口径一致。"""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+class LLMCompletionMemoryCache:
+    """按 cache_key 缓存补全文本的 LRU，附带命中率计数。"""
+
+    def __init__(self, capacity: int):
+        self._capacity = capacity
+        self._entries: "OrderedDict[str, Tuple[str, datetime]]" = OrderedDict()
+        self._lookups = 0
+        self._memory_hits = 0
+        self._db_hits = 0
+        self._misses = 0
+        self._stores = 0
+
+    def get(self, cache_key: str) -> Optional[str]:
+        """查询未过期的补全文本并计入一次查询；过期条目顺带删除。"""
+        self._lookups += 1
+        item = self._entries.get(cache_key)
+        if item is None:
+            return None
+        text, expires_at = item
+        if expires_at <= utc_now():
+            del self._entries[cache_key]
+            return None
+        self._entries.move_to_end(cache_key)
+        self._memory_hits += 1
+        return text
+
+    def put(self, cache_key: str, text: str, expires_at: datetime) -> None:
+        if self._capacity <= 0:
+            return
+        self._entries[cache_key] = (text, expires_at)
+        self._entries.move_to_end(cache_key)
+        while len(self._entries) > self._capacity:
+            self._entries.popitem(last=False)
+
+    def record_db_hit(self) -> None:
+        self._db_hits += 1
+
+    def record_miss(self) -> None:
+        self._misses += 1
+
+    def record_store(self) -> None:
+        self._stores += 1
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> LLMCompletionCacheStats:
+        hits = self._memory_hits + self._db_hits
+        return LLMCompletionCacheStats(
+            memory_size=len(self._entries),
+            memory_capacity=self._capacity,
+            lookups=self._lookups,
+            memory_hits=self._memory_hits,
+            db_hits=self._db_hits,
+            misses=self._misses,
+            stores=self._stores,
+            hit_rate=round(hits / self._lookups, 4) if self._lookups else 0.0,
+        )
+
+
+_llm_completion_memory_cache: Optional[LLMCompletionMemoryCache] = None
+
+
+def get_llm_completion_memory_cache() -> LLMCompletionMemoryCache:
+    """获取进程内共享的补全缓存内存层。"""
+    global _llm_completion_memory_cache
+    if _llm_completion_memory_cache is None:
+        _llm_completion_memory_cache = LLMCompletionMemoryCache(
+            capacity=llm_config.LLM_COMPLETION_CACHE_MEMORY_SIZE
+        )
+    return _llm_completion_memory_cache
@@ -8,14 +8,44 @@ from pydantic_settings import BaseSettings
 
 
 class LLMPlatformConfig(BaseSettings):
-    """LLM 平台模块配置：模型供应商与博查 API 参数。"""
+    """LLM 平台模块配置：模型供应商、请求调度、补全缓存、路由、HTTP 客户端池与博查 API 参数。"""
 
     LLM_PROVIDER: str = "openai"
     LLM_API_KEY: str = "your_llm_api_key_here"
     LLM_BASE_URL: str = "https://api.openai.com/v1"
     LLM_MODEL: str = "gpt-3.5-turbo"
+    # LLM 请求调度：模型配置未设置并发上限时使用的默认值（0 表示不限）
+    LLM_DEFAULT_MAX_CONCURRENCY: int = 8
+    # 估算 token 数的字符比（中文为主的 Prompt 约 1.5~2 个字符 / token）
+    LLM_CHARS_PER_TOKEN: float = 2.0
+    # LLM 补全缓存：总开关、自动参与缓存的 temperature 上限、有效期与进程内 LRU 容量
+    LLM_COMPLETION_CACHE_ENABLED: bool = True
+    LLM_COMPLETION_CACHE_MAX_TEMPERATURE: float = 0.3
+    LLM_COMPLETION_CACHE_TTL_HOURS: int = 24
+    LLM_COMPLETION_CACHE_MEMORY_SIZE: int = 512
+    # 自适应路由：按期望耗时排序候选模型；滚动窗口长度与参与排序所需的最少样本数
+    LLM_ADAPTIVE_ROUTING: bool = True
+    LLM_ROUTE_WINDOW: int = 50
+    LLM_ROUTE_MIN_SAMPLES: int = 5
+    # 熔断：连续失败次数阈值与熔断冷却秒数
+    LLM_CIRCUIT_FAILURE_THRESHOLD: int = 3
+    LLM_CIRCUIT_OPEN_SECONDS: float = 30.0
+    # 对冲：主模型超过其 P95 耗时未返回时向下一个候选模型发起备用请求（额外消耗 token，默认关闭）
+    LLM_HEDGE_ENABLED: bool = False
+    # Provider HTTP 客户端池：连接上限 / 空闲保活连接数 / 请求超时默认值，HTTP/2（需安装 h2）
+    LLM_HTTP_MAX_CONNECTIONS: int = 100
+    LLM_HTTP_MAX_KEEPALIVE_CONNECTIONS: int = 20
+    LLM_HTTP_TIMEOUT_SECONDS: float = 600.0
+    LLM_HTTP2_ENABLED: bool = True
+    # 注册表刷新淘汰的客户端在其在途请求全部结束后关闭；在途请求超过该秒数仍未结束时强制关闭
+    # （兜底被遗弃的流式迭代，应不小于请求超时）
+    LLM_CLIENT_CLOSE_GRACE_SECONDS: float = 660.0
     BOCHA_API_KEY: str = ""
     BOCHA_BASE_URL: str = "https://api.bochaai.com"
+    # 博查 API 调用预算（全进程共享）：并发上限 / 每秒发起次数（0 表示不限速）/ 允许的突发数
+    BOCHA_MAX_CONCURRENCY: int = 4
+    BOCHA_RATE_PER_SECOND: float = 5.0
+    BOCHA_RATE_BURST: int = 4
 
     class Config:
         case_sensitive = True
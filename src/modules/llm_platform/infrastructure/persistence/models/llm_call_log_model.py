@@ -39,6 +39,9 @@ class LLMCallLogModel(Base):
     total_tokens = Column(Integer, nullable=True, comment="总 token 数")
     temperature = Column(Float, nullable=False, comment="温度参数")
     latency_ms = Column(Integer, nullable=False, comment="调用耗时（毫秒）")
-    status = Column(String(20), nullable=False, comment="success / failed")
+    time_to_first_token_ms = Column(
+        Integer, nullable=True, comment="首个增量文本耗时（毫秒，仅流式调用）"
+    )
+    status = Column(String(20), nullable=False, comment="success / failed / cache_hit")
     error_message = Column(Text, nullable=True, comment="错误信息")
     created_at = Column(DateTime, nullable=False, comment="记录时间")
@@ -0,0 +1,33 @@
+"""
+LLM 补全缓存 ORM 模型，映射 llm_completion_cache 表。
+"""
+
+from sqlalchemy import Column, DateTime, String, Text
+from sqlalchemy.dialects.postgresql import JSONB
+
+from src.modules.llm_platform.domain.dtos.llm_completion_cache_dtos import (
+    LLMCompletionCacheEntry,
+)
+from src.shared.infrastructure.db.base import Base
+
+
+class LLMCompletionCacheModel(Base):
+    """llm_completion_cache 表映射。"""
+
+    __tablename__ = "llm_completion_cache"
+
+    cache_key = Column(String(64), primary_key=True, comment="请求 SHA-256 哈希")
+    request_params = Column(JSONB, nullable=False, comment="路由与采样参数")
+    completion_text = Column(Text, nullable=False, comment="大模型生成的文本")
+    created_at = Column(DateTime, nullable=False, comment="写入时间")
+    expires_at = Column(DateTime, nullable=False, index=True, comment="过期时间")
+
+    def to_dto(self) -> LLMCompletionCacheEntry:
+        """转换为 Domain DTO。"""
+        return LLMCompletionCacheEntry(
+            cache_key=self.cache_key,
+            request_params=self.request_params or {},
+            completion_text=self.completion_text,
+            created_at=self.created_at,
+            expires_at=self.expires_at,
+        )
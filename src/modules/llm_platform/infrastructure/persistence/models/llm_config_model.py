@@ -1,4 +1,4 @@
-from sqlalchemy import Boolean, Column, DateTime, Integer, String, Text
+from sqlalchemy import Boolean, Column, DateTime, Float, Integer, String, Text
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.sql import func
 
@@ -19,6 +19,12 @@ class LLMConfigModel(Base):
     priority = Column(Integer, default=1)
     tags = Column(JSONB, default=list)
     is_active = Column(Boolean, default=True)
+    max_concurrency = Column(Integer, nullable=True, comment="并发上限，空表示使用平台默认值")
+    tokens_per_minute = Column(Integer, nullable=True, comment="每分钟 token 预算，空表示不限")
+    max_connections = Column(
+        Integer, nullable=True, comment="HTTP 连接池上限，空表示使用平台默认值"
+    )
+    timeout_seconds = Column(Float, nullable=True, comment="请求超时秒数，空表示使用平台默认值")
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now(), server_default=func.now())
 
@@ -39,6 +45,10 @@ class LLMConfigModel(Base):
             priority=self.priority,
             tags=self.tags or [],
             is_active=self.is_active,
+            max_concurrency=self.max_concurrency,
+            tokens_per_minute=self.tokens_per_minute,
+            max_connections=self.max_connections,
+            timeout_seconds=self.timeout_seconds,
             created_at=self.created_at,
             updated_at=self.updated_at,
         )
@@ -60,4 +70,8 @@ class LLMConfigModel(Base):
             priority=entity.priority,
             tags=entity.tags,
             is_active=entity.is_active,
+            max_concurrency=entity.max_concurrency,
+            tokens_per_minute=entity.tokens_per_minute,
+            max_connections=entity.max_connections,
+            timeout_seconds=entity.timeout_seconds,
         )
@@ -2,6 +2,7 @@
 LLM 调用日志 PostgreSQL 仓储实现。
 """
 
+from typing import TYPE_CHECKING, Optional
 from uuid import UUID
 
 from sqlalchemy import select
@@ -15,6 +16,9 @@ from src.modules.llm_platform.infrastructure.persistence.models.llm_call_log_mod
     LLMCallLogModel,
 )
 
+if TYPE_CHECKING:
+    from src.shared.infrastructure.audit_log_writer import AuditLogWriter
+
 
 def _dto_to_model(d: LLMCallLog) -> LLMCallLogModel:
     return LLMCallLogModel(
@@ -32,6 +36,7 @@ def _dto_to_model(d: LLMCallLog) -> LLMCallLogModel:
         total_tokens=d.total_tokens,
         temperature=d.temperature,
         latency_ms=d.latency_ms,
+        time_to_first_token_ms=d.time_to_first_token_ms,
         status=d.status,
         error_message=d.error_message,
         created_at=d.created_at,
@@ -54,6 +59,7 @@ def _model_to_dto(m: LLMCallLogModel) -> LLMCallLog:
         total_tokens=m.total_tokens,
         temperature=m.temperature,
         latency_ms=m.latency_ms,
+        time_to_first_token_ms=m.time_to_first_token_ms,
         status=m.status,
         error_message=m.error_message,
         created_at=m.created_at,
@@ -61,14 +67,29 @@ def _model_to_dto(m: LLMCallLogModel) -> LLMCallLog:
 
 
 class PgLLMCallLogRepository(ILLMCallLogRepository):
-    def __init__(self, session: AsyncSession) -> None:
+    """
+    LLM 调用日志仓储。
+    传入 writer 时 save 只把记录交给异步批量写入器，由其后台整批落库，不占用请求路径上的数据库往返。
+    """
+
+    def __init__(
+        self, session: AsyncSession, writer: "AuditLogWriter[LLMCallLog] | None" = None
+    ) -> None:
         self._session = session
+        self._writer = writer
 
     async def save(self, log: LLMCallLog) -> None:
+        if self._writer is not None:
+            await self._writer.submit(log)
+            return
         model = _dto_to_model(log)
         self._session.add(model)
         await self._session.commit()
 
+    async def save_many(self, logs: list[LLMCallLog]) -> None:
+        self._session.add_all([_dto_to_model(log) for log in logs])
+        await self._session.commit()
+
     async def get_by_session_id(self, session_id: UUID) -> list[LLMCallLog]:
         result = await self._session.execute(
             select(LLMCallLogModel)
@@ -77,3 +98,24 @@ class PgLLMCallLogRepository(ILLMCallLogRepository):
         )
         models = result.scalars().all()
         return [_model_to_dto(m) for m in models]
+
+
+_llm_call_log_writer: Optional["AuditLogWriter[LLMCallLog]"] = None
+
+
+def get_llm_call_log_writer() -> "AuditLogWriter[LLMCallLog]":
+    """获取进程内共享的 LLM 调用日志异步批量写入器（独立会话落库）。"""
+    global _llm_call_log_writer
+    if _llm_call_log_writer is None:
+        from src.shared.infrastructure.audit_log_writer import (
+            AuditLogWriter,
+            register_audit_log_writer,
+        )
+        from src.shared.infrastructure.db.session import AsyncSessionLocal
+
+        async def persist(logs: list[LLMCallLog]) -> None:
+            async with AsyncSessionLocal() as session:
+                await PgLLMCallLogRepository(session).save_many(logs)
+
+        _llm_call_log_writer = register_audit_log_writer(AuditLogWriter("llm_call_log", persist))
+    return _llm_call_log_writer
@@ -0,0 +1,57 @@
+"""
+PostgreSQL 实现的 LLM 补全缓存仓储。
+
+实现 ILLMCompletionCacheRepository：get 按 key 且未过期查询、put 使用 UPSERT、cleanup_expired 删除过期条目。
+"""
+
+from sqlalchemy import delete, func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.modules.llm_platform.domain.dtos.llm_completion_cache_dtos import (
+    LLMCompletionCacheEntry,
+)
+from src.modules.llm_platform.domain.ports.llm_completion_cache_repository import (
+    ILLMCompletionCacheRepository,
+)
+from src.modules.llm_platform.infrastructure.persistence.models.llm_completion_cache_model import (  # noqa: E501
+    LLMCompletionCacheModel,
+)
+
+
+class PgLLMCompletionCacheRepository(ILLMCompletionCacheRepository):
+    """基于 PostgreSQL 的 LLM 补全缓存仓储。"""
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def get(self, cache_key: str) -> LLMCompletionCacheEntry | None:
+        """按缓存键查询未过期的条目；过期或不存在返回 None。"""
+        stmt = (
+            select(LLMCompletionCacheModel)
+            .where(LLMCompletionCacheModel.cache_key == cache_key)
+            .where(LLMCompletionCacheModel.expires_at > func.now())
+        )
+        result = await self._session.execute(stmt)
+        row = result.scalars().first()
+        return row.to_dto() if row else None
+
+    async def put(self, entry: LLMCompletionCacheEntry) -> None:
+        """使用 UPSERT 写入或覆盖缓存条目。"""
+        values = entry.model_dump()
+        stmt = insert(LLMCompletionCacheModel).values(**values)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["cache_key"],
+            set_={k: v for k, v in values.items() if k != "cache_key"},
+        )
+        await self._session.execute(stmt)
+        await self._session.commit()
+
+    async def cleanup_expired(self) -> int:
+        """删除 expires_at <= now() 的条目，返回删除条数。"""
+        stmt = delete(LLMCompletionCacheModel).where(
+            LLMCompletionCacheModel.expires_at <= func.now()
+        )
+        result = await self._session.execute(stmt)
+        await self._session.commit()
+        return result.rowcount or 0
@@ -81,6 +81,10 @@ class PgLLMConfigRepository(ILLMConfigRepository):
                 "priority": config.priority,
                 "tags": config.tags,
                 "is_active": config.is_active,
+                "max_concurrency": config.max_concurrency,
+                "tokens_per_minute": config.tokens_per_minute,
+                "max_connections": config.max_connections,
+                "timeout_seconds": config.timeout_seconds,
             }
 
             # Use upsert (insert on conflict update)
@@ -97,6 +101,10 @@ class PgLLMConfigRepository(ILLMConfigRepository):
                     "priority": stmt.excluded.priority,
                     "tags": stmt.excluded.tags,
                     "is_active": stmt.excluded.is_active,
+                    "max_concurrency": stmt.excluded.max_concurrency,
+                    "tokens_per_minute": stmt.excluded.tokens_per_minute,
+                    "max_connections": stmt.excluded.max_connections,
+                    "timeout_seconds": stmt.excluded.timeout_seconds,
                     "updated_at": func.now(),
                 },
             ).returning(LLMConfigModel)
@@ -19,12 +19,13 @@ from src.modules.llm_platform.domain.ports.web_search_cache_repository import (
 from src.modules.llm_platform.infrastructure.persistence.models.web_search_cache_model import (
     WebSearchCacheModel,
 )
+from src.shared.infrastructure.db.session_lock import session_lock
 
 logger = logging.getLogger(__name__)
 
 
 class PgWebSearchCacheRepository(IWebSearchCacheRepository):
-    """基于 PostgreSQL 的 Web 搜索缓存仓储。"""
+    """基于 PostgreSQL 的 Web 搜索缓存仓储（并发搜索共用会话时按会话锁串行访问）。"""
 
     def __init__(self, session: AsyncSession) -> None:
         self._session = session
@@ -38,8 +39,9 @@ class PgWebSearchCacheRepository(IWebSearchCacheRepository):
             .where(WebSearchCacheModel.cache_key == cache_key)
             .where(WebSearchCacheModel.expires_at > func.now())
         )
-        result = await self._session.execute(stmt)
-        row = result.scalars().first()
+        async with session_lock(self._session):
+            result = await self._session.execute(stmt)
+            row = result.scalars().first()
         return row.to_dto() if row else None
 
     async def put(self, entry: WebSearchCacheEntry) -> None:
@@ -62,14 +64,16 @@ class PgWebSearchCacheRepository(IWebSearchCacheRepository):
                 "expires_at": entry.expires_at,
             },
         )
-        await self._session.execute(stmt)
-        await self._session.commit()
+        async with session_lock(self._session):
+            await self._session.execute(stmt)
+            await self._session.commit()
 
     async def cleanup_expired(self) -> int:
         """
         删除 expires_at <= now() 的条目，返回删除条数。
         """
         stmt = delete(WebSearchCacheModel).where(WebSearchCacheModel.expires_at <= func.now())
-        result = await self._session.execute(stmt)
-        await self._session.commit()
+        async with session_lock(self._session):
+            result = await self._session.execute(stmt)
+            await self._session.commit()
         return result.rowcount or 0
@@ -10,6 +10,10 @@ from src.modules.llm_platform.domain.ports.repositories.config_repo import (
 from src.modules.llm_platform.infrastructure.adapters.openai import (
     OpenAIProvider,
 )
+from src.modules.llm_platform.infrastructure.client_pool import (
+    ClientKey,
+    get_llm_client_pool,
+)
 
 
 class LLMRegistry:
@@ -41,7 +45,9 @@ class LLMRegistry:
     async def refresh(self):
         """
         从数据库重新加载所有激活的配置，并刷新 Provider 实例。
-        这是一个全量刷新操作，会清除旧的实例。
+        这是一个全量刷新操作：新的 Provider / 配置表构建完成后整体替换旧表，
+        刷新期间的请求始终看到完整的旧表或新表；Provider 复用客户端池中的 HTTP 客户端，
+        不再被任何配置使用的客户端由池延迟关闭。
         """
         if not self._repo:
             logger.warning("Repository not set for LLMRegistry, cannot refresh from DB")
@@ -51,14 +57,27 @@ class LLMRegistry:
         try:
             configs = await self._repo.get_active_configs()
 
-            # Clear and rebuild
-            self._providers.clear()
-            self._configs.clear()
+            # 共用客户端的配置取其中最大的连接上限
+            limits: Dict[ClientKey, Optional[int]] = {}
+            for config in configs:
+                key = (config.base_url, config.api_key)
+                limits[key] = max(
+                    (n for n in (limits.get(key), config.max_connections) if n), default=None
+                )
 
-            success_count = 0
+            providers: Dict[str, ILLMProvider] = {}
+            registered: Dict[str, LLMConfig] = {}
             for config in configs:
-                if self._register(config):
-                    success_count += 1
+                provider = self._create_provider(config, limits[(config.base_url, config.api_key)])
+                if provider is not None:
+                    providers[config.alias] = provider
+                    registered[config.alias] = config
+
+            # 整体替换（之间无 await），在途请求不会读到清空一半的注册表
+            LLMRegistry._providers = providers
+            LLMRegistry._configs = registered
+            get_llm_client_pool().retain((c.base_url, c.api_key) for c in registered.values())
+            success_count = len(providers)
 
             logger.info(
                 f"LLM Registry refreshed. Loaded {success_count} providers out of "
@@ -69,36 +88,43 @@ class LLMRegistry:
             # 这里选择记录错误而不是抛出异常，以防启动流程被中断
             # 系统将继续使用之前的旧配置（如果存在）
 
-    def _register(self, config: LLMConfig) -> bool:
+    def _create_provider(
+        self, config: LLMConfig, max_connections: Optional[int]
+    ) -> Optional[ILLMProvider]:
         """
-        注册单个 LLM 配置。
+        根据单个 LLM 配置创建 Provider 实例。
 
         Args:
             config (LLMConfig): 配置实体
+            max_connections (Optional[int]): 所用客户端的连接上限
 
         Returns:
-            bool: 注册成功返回 True，失败返回 False
+            Optional[ILLMProvider]: 创建失败或不支持的类型返回 None
         """
         try:
             logger.debug(f"Registering LLM provider: {config.alias} ({config.provider_type})")
             if config.provider_type.lower() == "openai":
-                provider = OpenAIProvider(
+                client_pool = get_llm_client_pool()
+                client = client_pool.get(
+                    config.base_url,
+                    config.api_key,
+                    max_connections=max_connections,
+                    timeout_seconds=config.timeout_seconds,
+                )
+                return OpenAIProvider(
                     api_key=config.api_key,
                     base_url=config.base_url,
                     model=config.model_name,
+                    client=client,
+                    client_pool=client_pool,
                 )
-            else:
-                logger.warning(
-                    f"Unsupported provider type: {config.provider_type} for alias {config.alias}"
-                )
-                return False
-
-            self._providers[config.alias] = provider
-            self._configs[config.alias] = config
-            return True
+            logger.warning(
+                f"Unsupported provider type: {config.provider_type} for alias {config.alias}"
+            )
+            return None
         except Exception as e:
             logger.error(f"LLM Provider {config.alias} 注册异常: {str(e)}")
-            return False
+            return None
 
     def get_provider(self, alias: str) -> Optional[ILLMProvider]:
         """
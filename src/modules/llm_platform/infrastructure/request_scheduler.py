@@ -0,0 +1,261 @@
+"""
+LLM 请求调度器（进程内单例）。
+
+对每个模型别名维护一条调度通道（lane），在调用 Provider 之前做准入控制：
+- 并发上限：同一别名同时执行的请求数不超过 max_concurrency；
+- 每分钟 token 预算：令牌桶容量为 tokens_per_minute、按每秒 tpm/60 匀速补充；放行时按
+  Prompt 估算值预扣，完成后按输出长度补扣（桶可为负，欠额由后续请求等待偿还）；
+- 超出限制的请求按优先级排队（交互式研究优先于批量任务，同优先级先到先得），
+  通道资源释放或令牌补足时按队首依次放行。
+
+token 数按字符数估算（未接入分词器），口径见 LLM_CHARS_PER_TOKEN。
+"""
+
+import asyncio
+import heapq
+import itertools
+import math
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import AsyncIterator, Callable, Dict, List, Optional, Tuple
+
+from loguru import logger
+
+from src.modules.llm_platform.domain.dtos.llm_scheduler_dtos import (
+    LLMLaneMetrics,
+    LLMRequestPriority,
+)
+from src.modules.llm_platform.domain.entities.llm_config import LLMConfig
+from src.modules.llm_platform.infrastructure.config import llm_config
+
+
+def estimate_tokens(*texts: Optional[str]) -> int:
+    """按字符数估算 token 数。"""
+    chars = sum(len(t) for t in texts if t)
+    return math.ceil(chars / llm_config.LLM_CHARS_PER_TOKEN) if chars else 0
+
+
+@dataclass
+class _Waiter:
+    future: asyncio.Future
+    tokens: int
+    enqueued_at: float
+
+
+@dataclass
+class _Lane:
+    """单个模型别名的调度通道。"""
+
+    alias: str
+    max_concurrency: Optional[int] = None
+    tokens_per_minute: Optional[int] = None
+    in_flight: int = 0
+    tokens: float = 0.0
+    refilled_at: float = 0.0
+    queue: List[Tuple[int, int, _Waiter]] = field(default_factory=list)
+    timer: Optional[asyncio.TimerHandle] = None
+    admitted_total: int = 0
+    waited_total: int = 0
+    wait_total: float = 0.0
+    wait_max: float = 0.0
+
+    def configure(
+        self, max_concurrency: Optional[int], tokens_per_minute: Optional[int], now: float
+    ):
+        self.max_concurrency = max_concurrency or None
+        tokens_per_minute = tokens_per_minute or None
+        if tokens_per_minute != self.tokens_per_minute:
+            # 首次启用预算时桶满；调整预算时余量不超过新容量
+            self.tokens = (
+                float(tokens_per_minute)
+                if self.tokens_per_minute is None
+                else min(self.tokens, float(tokens_per_minute or 0))
+            )
+            self.refilled_at = now
+        self.tokens_per_minute = tokens_per_minute
+
+    def refill(self, now: float) -> None:
+        if self.tokens_per_minute:
+            rate = self.tokens_per_minute / 60.0
+            self.tokens = min(
+                float(self.tokens_per_minute), self.tokens + (now - self.refilled_at) * rate
+            )
+        self.refilled_at = now
+
+    def has_slot(self) -> bool:
+        return self.max_concurrency is None or self.in_flight < self.max_concurrency
+
+    def token_deficit(self, tokens: int) -> float:
+        """放行 tokens 还差的 token 数；超过桶容量的大请求在桶满时放行。"""
+        if not self.tokens_per_minute:
+            return 0.0
+        return max(0.0, min(tokens, self.tokens_per_minute) - self.tokens)
+
+    def admit(self, tokens: int, waited: float) -> None:
+        self.in_flight += 1
+        if self.tokens_per_minute:
+            self.tokens -= tokens
+        self.admitted_total += 1
+        self.wait_total += waited
+        self.wait_max = max(self.wait_max, waited)
+
+    def metrics(self) -> LLMLaneMetrics:
+        pending = [w for _, _, w in self.queue if not w.future.done()]
+        by_priority: Dict[str, int] = {}
+        for priority, _, waiter in self.queue:
+            if not waiter.future.done():
+                name = LLMRequestPriority(priority).name
+                by_priority[name] = by_priority.get(name, 0) + 1
+        return LLMLaneMetrics(
+            alias=self.alias,
+            max_concurrency=self.max_concurrency,
+            tokens_per_minute=self.tokens_per_minute,
+            in_flight=self.in_flight,
+            queue_depth=len(pending),
+            queue_depth_by_priority=by_priority,
+            tokens_available=round(self.tokens, 1) if self.tokens_per_minute else None,
+            admitted_total=self.admitted_total,
+            waited_total=self.waited_total,
+            wait_ms_avg=(
+                round(self.wait_total / self.admitted_total * 1000, 2)
+                if self.admitted_total
+                else 0.0
+            ),
+            wait_ms_max=round(self.wait_max * 1000, 2),
+        )
+
+
+class LLMSlot:
+    """已放行的调用凭证：完成后用 charge 补扣实际输出的 token。"""
+
+    def __init__(self):
+        self.extra_tokens = 0
+
+    def charge(self, tokens: int) -> None:
+        self.extra_tokens += tokens
+
+
+class LLMRequestScheduler:
+    """按模型别名做并发与 token 预算准入控制的优先级调度器。"""
+
+    def __init__(
+        self,
+        default_max_concurrency: Optional[int] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._default_max_concurrency = default_max_concurrency
+        self._clock = clock
+        self._lanes: Dict[str, _Lane] = {}
+        self._seq = itertools.count()
+
+    def _lane(self, config: LLMConfig) -> _Lane:
+        lane = self._lanes.get(config.alias)
+        if lane is None:
+            lane = self._lanes[config.alias] = _Lane(alias=config.alias)
+        # 每次按最新配置校准（配置热更新后立即生效）
+        lane.configure(
+            config.max_concurrency or self._default_max_concurrency,
+            config.tokens_per_minute,
+            self._clock(),
+        )
+        return lane
+
+    @asynccontextmanager
+    async def slot(
+        self,
+        config: LLMConfig,
+        priority: LLMRequestPriority = LLMRequestPriority.INTERACTIVE,
+        tokens: int = 0,
+    ) -> AsyncIterator[LLMSlot]:
+        """
+        申请调用 config 对应模型的执行名额，退出时释放并补扣 LLMSlot.charge 的 token。
+        :param config: 模型配置（提供别名与并发 / token 预算）
+        :param priority: 请求优先级
+        :param tokens: 预扣的 token 估算值（通常为 Prompt 估算）
+        """
+        lane = self._lane(config)
+        await self._acquire(lane, int(priority), tokens)
+        slot = LLMSlot()
+        try:
+            yield slot
+        finally:
+            self._release(lane, slot.extra_tokens)
+
+    async def _acquire(self, lane: _Lane, priority: int, tokens: int) -> None:
+        now = self._clock()
+        lane.refill(now)
+        if not lane.queue and lane.has_slot() and lane.token_deficit(tokens) == 0:
+            lane.admit(tokens, 0.0)
+            return
+
+        waiter = _Waiter(asyncio.get_running_loop().create_future(), tokens, now)
+        heapq.heappush(lane.queue, (priority, next(self._seq), waiter))
+        lane.waited_total += 1
+        logger.debug(
+            f"LLM 请求排队: alias={lane.alias}, priority={LLMRequestPriority(priority).name}, "
+            f"in_flight={lane.in_flight}, queue={len(lane.queue)}"
+        )
+        self._dispatch(lane)
+        try:
+            await waiter.future
+        except asyncio.CancelledError:
+            # 已放行但调用方在恢复前被取消：归还名额
+            if waiter.future.done() and not waiter.future.cancelled():
+                self._release(lane, 0)
+            raise
+
+    def _release(self, lane: _Lane, extra_tokens: int) -> None:
+        lane.in_flight -= 1
+        lane.refill(self._clock())
+        if lane.tokens_per_minute:
+            lane.tokens -= extra_tokens
+        self._dispatch(lane)
+
+    def _dispatch(self, lane: _Lane) -> None:
+        """按队首依次放行，直到并发或令牌不足；令牌不足时定时重试。"""
+        now = self._clock()
+        lane.refill(now)
+        while lane.queue:
+            _, _, waiter = lane.queue[0]
+            if waiter.future.done():
+                heapq.heappop(lane.queue)
+                continue
+            if not lane.has_slot():
+                return
+            deficit = lane.token_deficit(waiter.tokens)
+            if deficit > 0:
+                self._schedule_retry(lane, deficit * 60.0 / lane.tokens_per_minute)
+                return
+            heapq.heappop(lane.queue)
+            lane.admit(waiter.tokens, now - waiter.enqueued_at)
+            waiter.future.set_result(None)
+
+    def _schedule_retry(self, lane: _Lane, delay: float) -> None:
+        if lane.timer is not None:
+            return
+
+        def retry() -> None:
+            lane.timer = None
+            self._dispatch(lane)
+
+        lane.timer = asyncio.get_running_loop().call_later(delay, retry)
+
+    def metrics(self) -> List[LLMLaneMetrics]:
+        """各模型别名的排队与等待指标。"""
+        for lane in self._lanes.values():
+            lane.refill(self._clock())
+        return [lane.metrics() for lane in self._lanes.values()]
+
+
+_llm_request_scheduler: Optional[LLMRequestScheduler] = None
+
+
+def get_llm_request_scheduler() -> LLMRequestScheduler:
+    """获取进程内共享的 LLM 请求调度器。"""
+    global _llm_request_scheduler
+    if _llm_request_scheduler is None:
+        _llm_request_scheduler = LLMRequestScheduler(
+            default_max_concurrency=llm_config.LLM_DEFAULT_MAX_CONCURRENCY or None
+        )
+    return _llm_request_scheduler
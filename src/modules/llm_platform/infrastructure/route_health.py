@@ -0,0 +1,189 @@
+"""
+LLM 路由健康度追踪（进程内单例）。
+
+按模型别名维护最近若干次调用的耗时与成败，供 LLMRouter：
+- 按期望耗时为按标签 / 默认路由的候选模型排序（样本不足的模型排在前面，以便积累样本）；
+- 熔断：连续失败达到阈值后熔断一段时间，期间直接跳过该模型；冷却结束后放行一次探测请求，
+  成功则恢复、失败则重新熔断；探测名额最长占用 open_seconds，超时未归还（如调用方异常退出）即收回；
+- 对冲：以主模型的 P95 耗时作为发起备用请求的等待时长。
+"""
+
+import math
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Callable, Deque, Dict, Iterable, List, Optional, Sequence
+
+from src.modules.llm_platform.domain.dtos.llm_route_dtos import (
+    LLMCircuitState,
+    LLMRouteStats,
+)
+from src.modules.llm_platform.domain.entities.llm_config import LLMConfig
+from src.modules.llm_platform.infrastructure.config import llm_config
+
+# 期望耗时按失败率放大时的失败率上限，避免全失败时除零
+_MAX_ERROR_RATE = 0.9
+
+
+def _percentile(sorted_values: Sequence[float], q: float) -> float:
+    """最近秩法分位数。"""
+    return sorted_values[max(0, math.ceil(q * len(sorted_values)) - 1)]
+
+
+@dataclass
+class _AliasHealth:
+    latencies: Deque[float]
+    outcomes: Deque[bool]
+    state: LLMCircuitState = LLMCircuitState.CLOSED
+    consecutive_failures: int = 0
+    opened_at: float = 0.0
+    probing: bool = False
+    probe_started_at: float = 0.0
+
+
+@dataclass
+class LLMRouteHealth:
+    """各模型别名的滚动耗时 / 成败统计与熔断器。"""
+
+    window: int = 50
+    min_samples: int = 5
+    failure_threshold: int = 3
+    open_seconds: float = 30.0
+    clock: Callable[[], float] = time.monotonic
+    _aliases: Dict[str, _AliasHealth] = field(default_factory=dict)
+
+    def _get(self, alias: str) -> _AliasHealth:
+        health = self._aliases.get(alias)
+        if health is None:
+            health = self._aliases[alias] = _AliasHealth(
+                latencies=deque(maxlen=self.window), outcomes=deque(maxlen=self.window)
+            )
+        return health
+
+    def _refresh_state(self, health: _AliasHealth) -> None:
+        if (
+            health.state is LLMCircuitState.OPEN
+            and self.clock() - health.opened_at >= self.open_seconds
+        ):
+            health.state = LLMCircuitState.HALF_OPEN
+            health.probing = False
+        elif (
+            health.state is LLMCircuitState.HALF_OPEN
+            and health.probing
+            and self.clock() - health.probe_started_at >= self.open_seconds
+        ):
+            # 探测请求未按时归还名额，收回后允许发起新的探测
+            health.probing = False
+
+    def is_open(self, alias: str) -> bool:
+        """熔断中（或半开且探测请求尚未返回）时为 True；不占用探测名额。"""
+        health = self._get(alias)
+        self._refresh_state(health)
+        return health.state is LLMCircuitState.OPEN or (
+            health.state is LLMCircuitState.HALF_OPEN and health.probing
+        )
+
+    def allow(self, alias: str) -> bool:
+        """是否放行一次调用；半开状态下放行的调用即探测请求。"""
+        if self.is_open(alias):
+            return False
+        health = self._get(alias)
+        if health.state is LLMCircuitState.HALF_OPEN:
+            health.probing = True
+            health.probe_started_at = self.clock()
+        return True
+
+    def record_success(self, alias: str, latency: float) -> None:
+        health = self._get(alias)
+        health.latencies.append(latency)
+        health.outcomes.append(True)
+        health.consecutive_failures = 0
+        health.state = LLMCircuitState.CLOSED
+        health.probing = False
+
+    def record_failure(self, alias: str) -> None:
+        health = self._get(alias)
+        health.outcomes.append(False)
+        health.consecutive_failures += 1
+        if (
+            health.state is LLMCircuitState.HALF_OPEN
+            or health.consecutive_failures >= self.failure_threshold
+        ):
+            health.state = LLMCircuitState.OPEN
+            health.opened_at = self.clock()
+        health.probing = False
+
+    def record_cancelled(self, alias: str) -> None:
+        """调用被取消（如对冲落败）：不计成败，仅归还探测名额。"""
+        self._get(alias).probing = False
+
+    def expected_latency(self, alias: str) -> Optional[float]:
+        """期望耗时（秒）= 成功耗时中位数 / (1 - 失败率)；样本不足时为 None。"""
+        health = self._get(alias)
+        if len(health.outcomes) < self.min_samples or not health.latencies:
+            return None
+        error_rate = min(_MAX_ERROR_RATE, health.outcomes.count(False) / len(health.outcomes))
+        return _percentile(sorted(health.latencies), 0.5) / (1.0 - error_rate)
+
+    def hedge_delay(self, alias: str) -> Optional[float]:
+        """对冲等待时长（秒）：成功耗时 P95；样本不足时为 None（不对冲）。"""
+        health = self._get(alias)
+        if len(health.latencies) < self.min_samples:
+            return None
+        return _percentile(sorted(health.latencies), 0.95)
+
+    def rank(self, configs: Iterable[LLMConfig]) -> List[LLMConfig]:
+        """按期望耗时升序排列（稳定排序，样本不足的模型视为 0 排在前面）。"""
+        return sorted(configs, key=lambda c: self.expected_latency(c.alias) or 0.0)
+
+    def stats(self, aliases: Optional[Iterable[str]] = None) -> List[LLMRouteStats]:
+        """指定别名（默认全部已记录别名）的路由统计。"""
+        result = []
+        for alias in aliases if aliases is not None else list(self._aliases):
+            health = self._get(alias)
+            self._refresh_state(health)
+            latencies = sorted(health.latencies)
+            expected = self.expected_latency(alias)
+            reopen_in = None
+            if health.state is LLMCircuitState.OPEN:
+                reopen_in = round(
+                    max(0.0, self.open_seconds - (self.clock() - health.opened_at)), 1
+                )
+            result.append(
+                LLMRouteStats(
+                    alias=alias,
+                    circuit_state=health.state,
+                    consecutive_failures=health.consecutive_failures,
+                    reopen_in_seconds=reopen_in,
+                    samples=len(health.outcomes),
+                    error_rate=(
+                        round(health.outcomes.count(False) / len(health.outcomes), 4)
+                        if health.outcomes
+                        else 0.0
+                    ),
+                    latency_ms_p50=(
+                        round(_percentile(latencies, 0.5) * 1000, 1) if latencies else None
+                    ),
+                    latency_ms_p95=(
+                        round(_percentile(latencies, 0.95) * 1000, 1) if latencies else None
+                    ),
+                    expected_latency_ms=round(expected * 1000, 1) if expected else None,
+                )
+            )
+        return result
+
+
+_llm_route_health: Optional[LLMRouteHealth] = None
+
+
+def get_llm_route_health() -> LLMRouteHealth:
+    """获取进程内共享的路由健康度追踪器。"""
+    global _llm_route_health
+    if _llm_route_health is None:
+        _llm_route_health = LLMRouteHealth(
+            window=llm_config.LLM_ROUTE_WINDOW,
+            min_samples=llm_config.LLM_ROUTE_MIN_SAMPLES,
+            failure_threshold=llm_config.LLM_CIRCUIT_FAILURE_THRESHOLD,
+            open_seconds=llm_config.LLM_CIRCUIT_OPEN_SECONDS,
+        )
+    return _llm_route_health
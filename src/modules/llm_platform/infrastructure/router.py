@@ -1,20 +1,42 @@
-from typing import TYPE_CHECKING, List, Optional
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING, AsyncIterator, List, Optional, Tuple
 
 from loguru import logger
 
+from src.modules.llm_platform.domain.dtos.llm_scheduler_dtos import (
+    LLMRequestPriority,
+)
 from src.modules.llm_platform.domain.exceptions import (
     LLMConnectionError,
     NoAvailableModelError,
 )
 from src.modules.llm_platform.domain.ports.llm import ILLMProvider
+from src.modules.llm_platform.infrastructure.config import llm_config
+from src.modules.llm_platform.infrastructure.request_scheduler import estimate_tokens
 
 if TYPE_CHECKING:
-    pass
+    from src.modules.llm_platform.infrastructure.request_scheduler import (
+        LLMRequestScheduler,
+    )
+    from src.modules.llm_platform.infrastructure.route_health import LLMRouteHealth
+
+_Candidate = Tuple[object, ILLMProvider]
 
 
 class LLMRouter(ILLMProvider):
-    def __init__(self, registry):
+    def __init__(
+        self,
+        registry,
+        scheduler: "LLMRequestScheduler | None" = None,
+        health: "LLMRouteHealth | None" = None,
+    ):
         self.registry = registry
+        # 注入调度器时，每个候选模型调用前先经其并发 / token 预算准入
+        self.scheduler = scheduler
+        # 注入健康度追踪时：按期望耗时排序候选、跳过熔断中的模型，并可对冲慢请求
+        self.health = health
 
     def _select_candidates(self, alias: Optional[str], tags: Optional[List[str]]) -> List:
         configs = self.registry.get_all_configs()
@@ -31,16 +53,16 @@ class LLMRouter(ILLMProvider):
             candidates = [c for c in configs if c.is_active]
             candidates.sort(key=lambda x: x.priority)
 
+        if not alias and self.health is not None and llm_config.LLM_ADAPTIVE_ROUTING:
+            candidates = self.health.rank(candidates)
+
         return candidates
 
-    async def generate(
-        self,
-        prompt: str,
-        system_message: Optional[str] = None,
-        temperature: float = 0.7,
-        alias: Optional[str] = None,
-        tags: Optional[List[str]] = None,
-    ) -> str:
+    def resolved_models(self, alias: Optional[str], tags: Optional[List[str]]) -> List[str]:
+        """路由目标当前匹配的候选模型（"alias=model_name"），供补全缓存键区分模型配置变更。"""
+        return [f"{c.alias}={c.model_name}" for c in self._select_candidates(alias, tags)]
+
+    def _resolve(self, alias: Optional[str], tags: Optional[List[str]]) -> List[_Candidate]:
         candidates = self._select_candidates(alias, tags)
 
         if not candidates:
@@ -48,16 +70,47 @@ class LLMRouter(ILLMProvider):
                 f"No LLM models found matching criteria: alias={alias}, tags={tags}"
             )
 
-        last_error = None
-
+        resolved = []
         for config in candidates:
             provider = self.registry.get_provider(config.alias)
-            if not provider:
+            if provider:
+                resolved.append((config, provider))
+        return resolved
+
+    def _allow(self, config) -> bool:
+        if self.health is None or self.health.allow(config.alias):
+            return True
+        logger.debug(f"LLM {config.alias} circuit open, skipped")
+        return False
+
+    async def generate(
+        self,
+        prompt: str,
+        system_message: Optional[str] = None,
+        temperature: float = 0.7,
+        alias: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        priority: LLMRequestPriority = LLMRequestPriority.INTERACTIVE,
+    ) -> str:
+        queue = self._resolve(alias, tags)
+        last_error: Optional[Exception] = None
+
+        while queue:
+            config, provider = queue.pop(0)
+            if not self._allow(config):
+                last_error = LLMConnectionError(f"LLM {config.alias} circuit open")
                 continue
 
+            hedge = self._take_hedge_backup(config, queue)
             try:
-                logger.debug(f"Routing request to LLM: {config.alias} (model: {config.model_name})")
-                return await provider.generate(prompt, system_message, temperature)
+                if hedge is None:
+                    return await self._attempt(
+                        config, provider, prompt, system_message, temperature, priority
+                    )
+                backup, delay = hedge
+                return await self._hedged(
+                    (config, provider), backup, delay, prompt, system_message, temperature, priority
+                )
             except LLMConnectionError as e:
                 logger.warning(f"LLM {config.alias} failed: {str(e)}. Failing over...")
                 last_error = e
@@ -68,3 +121,182 @@ class LLMRouter(ILLMProvider):
                 continue
 
         raise NoAvailableModelError(f"All candidate models failed. Last error: {str(last_error)}")
+
+    async def _attempt(
+        self,
+        config,
+        provider: ILLMProvider,
+        prompt: str,
+        system_message: Optional[str],
+        temperature: float,
+        priority: LLMRequestPriority,
+    ) -> str:
+        """单个候选模型的一次调用：调度准入 → 调用 → 记录耗时 / 成败（排队时间不计入耗时）。"""
+        logger.debug(f"Routing request to LLM: {config.alias} (model: {config.model_name})")
+        async with self._released_on_abort(config, priority, prompt, system_message) as slot:
+            started = time.monotonic()
+            try:
+                result = await provider.generate(prompt, system_message, temperature)
+            except asyncio.CancelledError:
+                if self.health is not None:
+                    self.health.record_cancelled(config.alias)
+                raise
+            except Exception:
+                if self.health is not None:
+                    self.health.record_failure(config.alias)
+                raise
+            if self.health is not None:
+                self.health.record_success(config.alias, time.monotonic() - started)
+            if slot is not None:
+                slot.charge(estimate_tokens(result))
+            return result
+
+    def _take_hedge_backup(
+        self, config, queue: List[_Candidate]
+    ) -> Optional[Tuple[_Candidate, float]]:
+        """开启对冲且主模型有 P95 样本时，从队列中取出下一个未熔断的候选作为备用。"""
+        if self.health is None or not llm_config.LLM_HEDGE_ENABLED:
+            return None
+        delay = self.health.hedge_delay(config.alias)
+        if delay is None:
+            return None
+        for i, (backup_config, _) in enumerate(queue):
+            if not self.health.is_open(backup_config.alias):
+                return queue.pop(i), delay
+        return None
+
+    async def _hedged(
+        self,
+        primary: _Candidate,
+        backup: _Candidate,
+        delay: float,
+        prompt: str,
+        system_message: Optional[str],
+        temperature: float,
+        priority: LLMRequestPriority,
+    ) -> str:
+        """
+        对冲调用：主模型 delay 秒内未返回（或提前失败）时向备用模型发起同一请求，
+        取先成功的结果并取消另一个；两者都失败时抛出最后一个错误。
+        """
+
+        def launch(candidate: _Candidate) -> asyncio.Task:
+            config, provider = candidate
+            return asyncio.create_task(
+                self._attempt(config, provider, prompt, system_message, temperature, priority)
+            )
+
+        tasks = [launch(primary)]
+        try:
+            await asyncio.wait(tasks, timeout=delay)
+            if tasks[0].done() and tasks[0].exception() is None:
+                return tasks[0].result()
+
+            backup_config = backup[0]
+            if self._allow(backup_config):
+                logger.info(
+                    f"LLM {primary[0].alias} 超过 P95 耗时 {delay * 1000:.0f}ms 未返回，"
+                    f"对冲请求 {backup_config.alias}"
+                )
+                tasks.append(launch(backup))
+
+            pending = set(tasks)
+            last_error: Optional[BaseException] = None
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        return task.result()
+                    last_error = task.exception()
+            raise last_error
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
+    async def generate_stream(
+        self,
+        prompt: str,
+        system_message: Optional[str] = None,
+        temperature: float = 0.7,
+        alias: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        priority: LLMRequestPriority = LLMRequestPriority.INTERACTIVE,
+    ) -> AsyncIterator[str]:
+        """
+        流式路由：首个增量产出前失败则切换下一个候选模型；已产出增量后失败直接抛出
+        （调用方已消费部分文本，切换模型会拼出不连贯的结果）。流式调用不对冲。
+        """
+        last_error: Optional[Exception] = None
+
+        for config, provider in self._resolve(alias, tags):
+            if not self._allow(config):
+                last_error = LLMConnectionError(f"LLM {config.alias} circuit open")
+                continue
+
+            started = False
+            try:
+                logger.debug(
+                    f"Routing stream request to LLM: {config.alias} (model: {config.model_name})"
+                )
+                async with self._released_on_abort(
+                    config, priority, prompt, system_message
+                ) as slot:
+                    parts: List[str] = []
+                    began_at = time.monotonic()
+                    try:
+                        async for chunk in provider.generate_stream(
+                            prompt, system_message, temperature
+                        ):
+                            started = True
+                            parts.append(chunk)
+                            yield chunk
+                    except Exception:
+                        if self.health is not None:
+                            self.health.record_failure(config.alias)
+                        raise
+                    except BaseException:
+                        if self.health is not None:
+                            self.health.record_cancelled(config.alias)
+                        raise
+                    finally:
+                        if slot is not None:
+                            slot.charge(estimate_tokens("".join(parts)))
+                    if self.health is not None:
+                        self.health.record_success(config.alias, time.monotonic() - began_at)
+                return
+            except Exception as e:
+                if started:
+                    raise
+                logger.warning(f"LLM {config.alias} stream failed: {str(e)}. Failing over...")
+                last_error = e
+                continue
+
+        raise NoAvailableModelError(f"All candidate models failed. Last error: {str(last_error)}")
+
+    @asynccontextmanager
+    async def _released_on_abort(self, config, priority, prompt, system_message):
+        """
+        申请调度名额；排队期间被取消或准入失败时归还 _allow 占用的探测名额
+        （进入后的成败由调用方记录）。
+        """
+        entered = False
+        try:
+            async with self._slot(config, priority, prompt, system_message) as slot:
+                entered = True
+                yield slot
+        except BaseException:
+            if not entered and self.health is not None:
+                self.health.record_cancelled(config.alias)
+            raise
+
+    @asynccontextmanager
+    async def _slot(self, config, priority, prompt, system_message):
+        """未注入调度器时直接放行（slot 为 None）。"""
+        if self.scheduler is None:
+            yield None
+            return
+        async with self.scheduler.slot(
+            config, priority, estimate_tokens(prompt, system_message)
+        ) as slot:
+            yield slot
@@ -0,0 +1,56 @@
+"""
+博查 Web 搜索调用预算（进程内单例）。
+
+所有请求共享同一组限额：同时在途的博查 API 调用数不超过 max_concurrency，调用发起速率按令牌桶
+限制为每秒 rate_per_second 次（容量即允许的突发数）。缓存命中不经过博查 API，不占用预算。
+"""
+
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional
+
+from src.modules.llm_platform.infrastructure.config import llm_config
+
+
+class WebSearchBudget:
+    """并发上限 + 令牌桶限速的调用预算。"""
+
+    def __init__(self, max_concurrency: int, rate_per_second: float, burst: int = 1):
+        self._semaphore = asyncio.Semaphore(max(1, max_concurrency))
+        self._rate = rate_per_second
+        self._capacity = max(1, burst)
+        self._tokens = float(self._capacity)
+        self._updated_at = time.monotonic()
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """占用一个调用名额：先等并发空位，再按速率等待发起时机。"""
+        async with self._semaphore:
+            if self._rate > 0:
+                await self._pace()
+            yield
+
+    async def _pace(self) -> None:
+        # 预占令牌（可为负）后在锁外等待，并发调用按到达顺序匀速放行
+        now = time.monotonic()
+        self._tokens = min(self._capacity, self._tokens + (now - self._updated_at) * self._rate)
+        self._updated_at = now
+        self._tokens -= 1
+        if self._tokens < 0:
+            await asyncio.sleep(-self._tokens / self._rate)
+
+
+_web_search_budget: Optional[WebSearchBudget] = None
+
+
+def get_web_search_budget() -> WebSearchBudget:
+    """获取进程内共享的博查搜索调用预算。"""
+    global _web_search_budget
+    if _web_search_budget is None:
+        _web_search_budget = WebSearchBudget(
+            max_concurrency=llm_config.BOCHA_MAX_CONCURRENCY,
+            rate_per_second=llm_config.BOCHA_RATE_PER_SECOND,
+            burst=llm_config.BOCHA_RATE_BURST,
+        )
+    return _web_search_budget
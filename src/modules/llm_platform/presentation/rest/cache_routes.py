@@ -0,0 +1,30 @@
+from fastapi import APIRouter, Depends
+
+from src.modules.llm_platform.application.services.llm_service import (
+    LLMService,
+)
+from src.modules.llm_platform.domain.dtos.llm_completion_cache_dtos import (
+    LLMCompletionCacheStats,
+)
+from src.shared.dtos import BaseResponse
+
+router = APIRouter(prefix="/llm-platform/cache", tags=["LLM Platform"])
+
+
+def get_llm_service() -> LLMService:
+    return LLMService()
+
+
+@router.get("/stats", response_model=BaseResponse[LLMCompletionCacheStats])
+async def get_cache_stats(service: LLMService = Depends(get_llm_service)):
+    """
+    查询 LLM 补全缓存命中统计。
+
+    返回进程内累计的查询次数、内存层 / 数据库层命中次数、未命中次数与总命中率。
+    """
+    return BaseResponse(
+        success=True,
+        code="LLM_CACHE_STATS_SUCCESS",
+        message="获取补全缓存统计成功",
+        data=service.cache_stats(),
+    )
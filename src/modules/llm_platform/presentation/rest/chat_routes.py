@@ -8,6 +8,7 @@ from src.modules.llm_platform.application.services.llm_service import (
     LLMService,
 )
 from src.shared.dtos import BaseResponse
+from src.shared.infrastructure.llm_stream import stream_llm_chunks
 
 router = APIRouter(prefix="/llm-platform/chat", tags=["LLM Platform"])
 
@@ -77,3 +78,30 @@ async def generate_text(request: ChatRequest, service: LLMService = Depends(get_
         logger.error(f"API: generate_text failed: {str(e)}")
         # 捕获可能的路由错误或调用错误
         raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.post("/generate/stream")
+async def generate_text_stream(
+    request: ChatRequest, service: LLMService = Depends(get_llm_service)
+):
+    """
+    调用大模型流式生成文本接口（Server-Sent Events）。
+
+    事件:
+    - delta: {"text": 增量文本}
+    - done: {"length": 完整文本长度}
+    - error: {"status_code", "detail"}（已开始推送后失败时）
+
+    异常:
+    - 500: 首个增量产出前失败（如无可用模型、所有候选模型调用失败）。
+    """
+    logger.info(f"API: generate_text_stream called. Alias={request.alias}, Tags={request.tags}")
+    return await stream_llm_chunks(
+        service.generate_stream(
+            prompt=request.prompt,
+            system_message=request.system_message,
+            temperature=request.temperature,
+            alias=request.alias,
+            tags=request.tags,
+        )
+    )
@@ -2,12 +2,16 @@ from typing import List, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, status
 from loguru import logger
-from pydantic import BaseModel, validator
+from pydantic import BaseModel, Field, validator
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.modules.llm_platform.application.services.config_service import (
     ConfigService,
 )
+from src.modules.llm_platform.application.services.llm_service import (
+    LLMService,
+)
+from src.modules.llm_platform.domain.dtos.llm_route_dtos import LLMRouteStats
 from src.modules.llm_platform.domain.entities.llm_config import LLMConfig
 from src.modules.llm_platform.domain.exceptions import (
     ConfigNotFoundException,
@@ -35,6 +39,14 @@ class LLMConfigBase(BaseModel):
     priority: int = 1
     tags: List[str] = []
     is_active: bool = True
+    max_concurrency: Optional[int] = Field(None, ge=1, description="并发上限，不填使用平台默认值")
+    tokens_per_minute: Optional[int] = Field(None, ge=1, description="每分钟 token 预算，不填不限")
+    max_connections: Optional[int] = Field(
+        None, ge=1, description="HTTP 连接池上限，不填使用平台默认值"
+    )
+    timeout_seconds: Optional[float] = Field(
+        None, gt=0, description="请求超时秒数，不填使用平台默认值"
+    )
 
 
 class LLMConfigCreate(LLMConfigBase):
@@ -51,6 +63,10 @@ class LLMConfigUpdate(BaseModel):
     priority: Optional[int] = None
     tags: Optional[List[str]] = None
     is_active: Optional[bool] = None
+    max_concurrency: Optional[int] = Field(None, ge=1)
+    tokens_per_minute: Optional[int] = Field(None, ge=1)
+    max_connections: Optional[int] = Field(None, ge=1)
+    timeout_seconds: Optional[float] = Field(None, gt=0)
 
 
 class LLMConfigResponse(LLMConfigBase):
@@ -88,6 +104,23 @@ async def get_configs(service: ConfigService = Depends(get_config_service)):
     )
 
 
+def get_llm_service() -> LLMService:
+    return LLMService()
+
+
+@router.get("/stats", response_model=BaseResponse[List[LLMRouteStats]])
+async def get_config_stats(service: LLMService = Depends(get_llm_service)):
+    """
+    获取各已注册大模型配置的路由统计：熔断状态、连续失败次数、滚动失败率、耗时 P50/P95 与期望耗时。
+    """
+    return BaseResponse(
+        success=True,
+        code="CONFIG_STATS_SUCCESS",
+        message="大模型路由统计获取成功",
+        data=service.route_stats(),
+    )
+
+
 @router.get("/{alias}", response_model=BaseResponse[LLMConfigResponse])
 async def get_config(alias: str, service: ConfigService = Depends(get_config_service)):
     """
@@ -0,0 +1,30 @@
+from typing import List
+
+from fastapi import APIRouter, Depends
+
+from src.modules.llm_platform.application.services.llm_service import (
+    LLMService,
+)
+from src.modules.llm_platform.domain.dtos.llm_scheduler_dtos import LLMLaneMetrics
+from src.shared.dtos import BaseResponse
+
+router = APIRouter(prefix="/llm-platform/scheduler", tags=["LLM Platform"])
+
+
+def get_llm_service() -> LLMService:
+    return LLMService()
+
+
+@router.get("/metrics", response_model=BaseResponse[List[LLMLaneMetrics]])
+async def get_scheduler_metrics(service: LLMService = Depends(get_llm_service)):
+    """
+    查询 LLM 请求调度指标。
+
+    返回每个已调用过的模型别名的并发占用、排队深度（按优先级）、token 余量与排队等待时长。
+    """
+    return BaseResponse(
+        success=True,
+        code="LLM_SCHEDULER_METRICS_SUCCESS",
+        message="获取调度指标成功",
+        data=service.scheduler_metrics(),
+    )
@@ -6,7 +6,7 @@
 import logging
 import time
 from datetime import date
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 from src.modules.market_insight.application.dtos.capital_flow_analysis_dtos import (
     CapitalFlowAnalysisDTO,
@@ -28,6 +28,7 @@ from src.modules.market_insight.domain.ports.repositories.limit_up_repo import (
     ILimitUpRepository,
 )
 from src.modules.market_insight.domain.ports.sentiment_data_port import ISentimentDataPort
+from src.modules.market_insight.domain.ports.trading_calendar_port import ITradingCalendarPort
 from src.modules.market_insight.domain.services.capital_flow_analyzer import (
     CapitalFlowAnalyzer,
 )
@@ -59,6 +60,7 @@ class GenerateDailyReportCmd:
         sentiment_analyzer: SentimentAnalyzer,
         capital_flow_analyzer: CapitalFlowAnalyzer,
         report_generator: MarkdownReportGenerator,
+        trading_calendar_port: Optional[ITradingCalendarPort] = None,
     ):
         self._concept_data_port = concept_data_port
         self._market_data_port = market_data_port
@@ -71,6 +73,7 @@ class GenerateDailyReportCmd:
         self._sentiment_analyzer = sentiment_analyzer
         self._capital_flow_analyzer = capital_flow_analyzer
         self._report_generator = report_generator
+        self._trading_calendar_port = trading_calendar_port
 
     async def execute(self, trade_date: date) -> DailyReportResult:
         """
@@ -80,6 +83,12 @@ class GenerateDailyReportCmd:
         """
         start_time = time.time()
 
+        if self._trading_calendar_port and not await self._trading_calendar_port.is_trading_day(
+            trade_date
+        ):
+            logger.info(f"非交易日，跳过每日复盘报告: {trade_date}")
+            return self._empty_result(trade_date, start_time)
+
         logger.info(f"开始生成每日复盘报告: {trade_date}")
 
         # 1. 获取全市场日线数据
@@ -87,16 +96,7 @@ class GenerateDailyReportCmd:
 
         if not daily_bars:
             logger.warning(f"无行情数据: {trade_date}（可能为非交易日）")
-            elapsed = time.time() - start_time
-            return DailyReportResult(
-                trade_date=trade_date,
-                concept_count=0,
-                limit_up_count=0,
-                report_path="",
-                elapsed_seconds=elapsed,
-                sentiment_metrics=None,
-                capital_flow_analysis=None,
-            )
+            return self._empty_result(trade_date, start_time)
 
         logger.info(f"获取到 {len(daily_bars)} 只股票的日线数据")
 
@@ -219,3 +219,16 @@ class GenerateDailyReportCmd:
                 capital_flow_analysis.model_dump() if capital_flow_analysis else None
             ),
         )
+
+    @staticmethod
+    def _empty_result(trade_date: date, start_time: float) -> DailyReportResult:
+        """无数据（非交易日）时的空结果"""
+        return DailyReportResult(
+            trade_date=trade_date,
+            concept_count=0,
+            limit_up_count=0,
+            report_path="",
+            elapsed_seconds=time.time() - start_time,
+            sentiment_metrics=None,
+            capital_flow_analysis=None,
+        )
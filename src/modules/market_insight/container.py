@@ -41,6 +41,9 @@ from src.modules.market_insight.infrastructure.adapters.de_market_data_adapter i
 from src.modules.market_insight.infrastructure.adapters.de_sentiment_data_adapter import (
     DeSentimentDataAdapter,
 )
+from src.modules.market_insight.infrastructure.adapters.de_trading_calendar_adapter import (
+    DeTradingCalendarAdapter,
+)
 from src.modules.market_insight.infrastructure.persistence.repositories.pg_concept_heat_repo import (
     PgConceptHeatRepository,
 )
@@ -74,6 +77,7 @@ class MarketInsightContainer:
             dragon_tiger_use_case=self._de_container.get_dragon_tiger_by_date_use_case(),
             sector_capital_flow_use_case=self._de_container.get_sector_capital_flow_by_date_use_case(),
         )
+        self._trading_calendar_port = DeTradingCalendarAdapter(self._de_container)
 
         # 初始化 Repositories
         self._concept_heat_repo = PgConceptHeatRepository(session)
@@ -118,6 +122,7 @@ class MarketInsightContainer:
             sentiment_analyzer=self._sentiment_analyzer,
             capital_flow_analyzer=self._capital_flow_analyzer,
             report_generator=self._report_generator,
+            trading_calendar_port=self._trading_calendar_port,
         )
 
     def get_concept_heat_query(self) -> GetConceptHeatQuery:
@@ -0,0 +1,19 @@
+"""
+交易日历查询接口
+用于从 data_engineering 判断指定日期是否为交易日
+"""
+
+from abc import ABC, abstractmethod
+from datetime import date
+
+
+class ITradingCalendarPort(ABC):
+    """交易日历查询接口"""
+
+    @abstractmethod
+    async def is_trading_day(self, trade_date: date) -> bool:
+        """
+        判断指定日期是否为交易日
+        :param trade_date: 日期
+        :return: 是否交易日
+        """
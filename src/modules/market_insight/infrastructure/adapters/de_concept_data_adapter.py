@@ -1,17 +1,64 @@
 """
 Data Engineering 概念数据适配器
 将 data_engineering 的概念数据转换为 market_insight 领域层 DTO
+
+概念 → 成分股映射在进程内维护一份索引：首次读取时全量加载，此后每次读取只按
+data_engineering 的成份股映射变更日志应用增量（新增 / 移除 / 更名），不再每次全表加载。
 """
 
-from typing import List
+import asyncio
+from typing import Dict, List, Optional
 
 from src.modules.data_engineering.container import DataEngineeringContainer
+from src.modules.data_engineering.domain.model.enums import ConceptChangeType
+from src.modules.data_engineering.domain.ports.repositories.concept_repo import (
+    IConceptRepository,
+)
 from src.modules.market_insight.domain.dtos.insight_dtos import (
     ConceptStockDTO,
     ConceptWithStocksDTO,
 )
 from src.modules.market_insight.domain.ports.concept_data_port import IConceptDataPort
 
+# 每次读取的变更日志条数
+_CHANGE_PAGE_SIZE = 10000
+
+
+class _ConceptMembershipIndex:
+    """进程内概念成分股索引：{concept_code: {third_code: stock_name}} + 已应用的变更日志 id"""
+
+    def __init__(self):
+        self.members: Optional[Dict[str, Dict[str, str]]] = None
+        self.cursor = 0
+        self.lock = asyncio.Lock()
+
+    async def refresh(self, concept_repo: IConceptRepository) -> None:
+        """首次全量加载，之后按变更日志 id 顺序应用增量。"""
+        if self.members is None:
+            # 先记录游标再全量加载：加载期间产生的变更会被再次应用（幂等）
+            cursor = await concept_repo.get_latest_change_id()
+            self.members = {
+                c.code: {s.third_code: s.stock_name for s in c.stocks}
+                for c in await concept_repo.get_all_concepts_with_stocks()
+            }
+            self.cursor = cursor
+            return
+
+        while True:
+            changes = await concept_repo.get_membership_changes(self.cursor, _CHANGE_PAGE_SIZE)
+            if not changes:
+                return
+            for change in changes:
+                stocks = self.members.setdefault(change.concept_code, {})
+                if change.change_type == ConceptChangeType.REMOVED:
+                    stocks.pop(change.third_code, None)
+                else:
+                    stocks[change.third_code] = change.stock_name or ""
+            self.cursor = changes[-1].id
+
+
+_concept_index = _ConceptMembershipIndex()
+
 
 class DeConceptDataAdapter(IConceptDataPort):
     """Data Engineering 概念数据适配器"""
@@ -24,19 +71,21 @@ class DeConceptDataAdapter(IConceptDataPort):
         获取所有概念板块及其成分股列表
         :return: 概念及成分股 DTO 列表
         """
-        de_concepts = await self._concept_repo.get_all_concepts_with_stocks()
+        async with _concept_index.lock:
+            await _concept_index.refresh(self._concept_repo)
+            members = _concept_index.members
+
+        # 概念名称以 concept 表为准（仅查概念表，不含成分股）
+        concept_states = await self._concept_repo.get_concept_states()
 
         return [
             ConceptWithStocksDTO(
-                code=c.code,
-                name=c.name,
+                code=code,
+                name=name,
                 stocks=[
-                    ConceptStockDTO(
-                        third_code=s.third_code,
-                        stock_name=s.stock_name,
-                    )
-                    for s in c.stocks
+                    ConceptStockDTO(third_code=third_code, stock_name=stock_name)
+                    for third_code, stock_name in members.get(code, {}).items()
                 ],
             )
-            for c in de_concepts
+            for code, (name, _) in concept_states.items()
         ]
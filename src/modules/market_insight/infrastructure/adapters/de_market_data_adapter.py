@@ -23,16 +23,25 @@ class DeMarketDataAdapter(IMarketDataPort):
         :param trade_date: 交易日期
         :return: 股票日线 DTO 列表
         """
-        de_bars = await self._get_daily_bars_by_date_use_case.execute(trade_date=trade_date)
+        frame = await self._get_daily_bars_by_date_use_case.execute_frame(trade_date=trade_date)
 
+        # 列式结果已完成空值归零与类型转换，按列 zip 后跳过逐行校验直接构造
+        columns = zip(
+            frame.third_code.tolist(),
+            frame.stock_name.tolist(),
+            frame.trade_date.tolist(),
+            frame.close.tolist(),
+            frame.pct_chg.tolist(),
+            frame.amount.tolist(),
+        )
         return [
-            StockDailyDTO(
-                third_code=bar.third_code,
-                stock_name=bar.stock_name or "",
-                trade_date=bar.trade_date,
-                close=bar.close,
-                pct_chg=bar.pct_chg,
-                amount=bar.amount,
+            StockDailyDTO.model_construct(
+                third_code=third_code,
+                stock_name=stock_name,
+                trade_date=bar_date,
+                close=close,
+                pct_chg=pct_chg,
+                amount=amount,
             )
-            for bar in de_bars
+            for third_code, stock_name, bar_date, close, pct_chg, amount in columns
         ]
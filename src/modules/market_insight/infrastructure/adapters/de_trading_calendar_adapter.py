@@ -0,0 +1,24 @@
+"""
+Data Engineering 交易日历适配器
+将 data_engineering 的交易日历能力暴露给 market_insight 领域层
+"""
+
+from datetime import date
+
+from src.modules.data_engineering.container import DataEngineeringContainer
+from src.modules.market_insight.domain.ports.trading_calendar_port import ITradingCalendarPort
+
+
+class DeTradingCalendarAdapter(ITradingCalendarPort):
+    """Data Engineering 交易日历适配器"""
+
+    def __init__(self, de_container: DataEngineeringContainer):
+        self._trading_calendar = de_container.get_trading_calendar()
+
+    async def is_trading_day(self, trade_date: date) -> bool:
+        """
+        判断指定日期是否为交易日
+        :param trade_date: 日期
+        :return: 是否交易日
+        """
+        return await self._trading_calendar.is_trading_day(trade_date)
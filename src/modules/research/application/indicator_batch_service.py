@@ -0,0 +1,184 @@
+"""
+全市场技术指标批量计算 Application 服务。
+按交易日对当日有日线的全部标的计算 TechnicalIndicatorsSnapshot 并写入快照仓储，
+技术分析时按 (标的, 交易日) 直接读取，不再逐次加载一年日线重算。
+
+指标以增量状态逐日推进：已有状态的标的只读取上次推进之后的新 K 线，每根 O(1) 更新；
+无状态的标的（首次运行 / 新上市）用回看窗口内的日线从头构建状态。
+"""
+
+from datetime import date, timedelta
+from typing import Dict, List
+
+from loguru import logger
+
+from src.modules.research.application.indicator_screener_service import (
+    invalidate_cross_section,
+)
+from src.modules.research.application.technical_analyst_service import (
+    BAR_LOOKBACK_DAYS,
+    MIN_BARS_REQUIRED,
+)
+from src.modules.research.domain.dtos.indicator_state import IndicatorState
+from src.modules.research.domain.dtos.indicators_snapshot import (
+    TechnicalIndicatorsSnapshot,
+)
+from src.modules.research.domain.exceptions import IndicatorStateMismatchError
+from src.modules.research.domain.ports.indicator_calculator import (
+    IIndicatorCalculator,
+)
+from src.modules.research.domain.ports.indicator_snapshot_repository import (
+    IIndicatorSnapshotRepository,
+)
+from src.modules.research.domain.ports.indicator_state_repository import (
+    IIndicatorStateRepository,
+)
+from src.modules.research.domain.ports.market_quote import IMarketQuotePort
+
+
+class IndicatorBatchService:
+    """
+    指标批量计算服务。
+    按标的分批处理：读取状态 → 按批一次查询所需日线 → 推进状态并生成快照 → 整批写回状态与快照。
+    状态已推进到目标日之后（回补历史交易日）的标的不改动状态，改用回看窗口全量计算。
+    """
+
+    def __init__(
+        self,
+        market_quote_port: IMarketQuotePort,
+        indicator_calculator: IIndicatorCalculator,
+        snapshot_repo: IIndicatorSnapshotRepository,
+        state_repo: IIndicatorStateRepository,
+    ):
+        self._market_quote = market_quote_port
+        self._indicator_calculator = indicator_calculator
+        self._snapshot_repo = snapshot_repo
+        self._state_repo = state_repo
+
+    async def run(
+        self, trade_date: date, batch_size: int = 500, verify: bool = False
+    ) -> Dict[str, int]:
+        """
+        计算并保存指定交易日的全市场指标快照。
+        :param trade_date: 交易日期
+        :param batch_size: 每批处理的标的数
+        :param verify: 校验模式：对每个由增量状态得到的快照，从状态起始日全量重算并断言相等，
+                       不一致时抛出 IndicatorStateMismatchError（该批不写库）
+        :return: {"tickers", "saved", "skipped", "advanced", "bootstrapped", "verified"} 计数
+        """
+        stats = dict.fromkeys(
+            ("tickers", "saved", "skipped", "advanced", "bootstrapped", "verified"), 0
+        )
+        tickers = await self._market_quote.get_tickers_traded_on(trade_date)
+        if not tickers:
+            logger.warning(f"{trade_date} 无日线数据，跳过指标批量计算")
+            return stats
+        stats["tickers"] = len(tickers)
+
+        for i in range(0, len(tickers), batch_size):
+            await self._run_batch(trade_date, tickers[i : i + batch_size], verify, stats)
+            logger.info(
+                f"指标批量计算 {trade_date}：{min(i + batch_size, len(tickers))}/{len(tickers)}，"
+                f"累计写入 {stats['saved']}"
+            )
+
+        logger.info(f"指标批量计算完成 {trade_date}：{stats}")
+        return stats
+
+    async def _run_batch(
+        self, trade_date: date, tickers: List[str], verify: bool, stats: Dict[str, int]
+    ) -> None:
+        states = await self._state_repo.get_many(tickers)
+        fresh = [t for t in tickers if t not in states]
+        advancing = {t: s for t, s in states.items() if s.last_trade_date < trade_date}
+        ahead = [t for t, s in states.items() if s.last_trade_date > trade_date]
+
+        changed = await self._bootstrap_states(trade_date, fresh)
+        changed.update(await self._advance_states(trade_date, advancing))
+        stats["bootstrapped"] += len(fresh)
+        stats["advanced"] += len(advancing)
+
+        snapshots: Dict[str, TechnicalIndicatorsSnapshot] = {}
+        from_state: Dict[str, IndicatorState] = {}
+        for ticker in tickers:
+            state = changed.get(ticker, states.get(ticker))
+            if state is None or state.last_trade_date > trade_date:
+                continue
+            if state.size < MIN_BARS_REQUIRED or state.last_trade_date != trade_date:
+                stats["skipped"] += 1
+                continue
+            snapshots[ticker] = self._indicator_calculator.snapshot(state)
+            from_state[ticker] = state
+
+        if ahead:
+            start_date = trade_date - timedelta(days=BAR_LOOKBACK_DAYS)
+            for columns in await self._market_quote.get_daily_bar_columns(
+                ahead, start_date, trade_date
+            ):
+                if len(columns) < MIN_BARS_REQUIRED or columns.last_trade_date != trade_date:
+                    stats["skipped"] += 1
+                    continue
+                snapshots[columns.ticker] = self._indicator_calculator.compute_columns(columns)
+
+        if verify and from_state:
+            await self._verify(trade_date, from_state, snapshots)
+            stats["verified"] += len(from_state)
+
+        await self._state_repo.save_all(changed)
+        stats["saved"] += await self._snapshot_repo.save_all(trade_date, snapshots)
+        invalidate_cross_section(trade_date)
+
+    async def _bootstrap_states(
+        self, trade_date: date, tickers: List[str]
+    ) -> Dict[str, IndicatorState]:
+        """无状态的标的：以回看窗口内的日线从空状态逐根构建（与 TechnicalAnalystService 同窗口）。"""
+        if not tickers:
+            return {}
+        start_date = trade_date - timedelta(days=BAR_LOOKBACK_DAYS)
+        built: Dict[str, IndicatorState] = {}
+        for columns in await self._market_quote.get_daily_bar_columns(
+            tickers, start_date, trade_date
+        ):
+            state = IndicatorState()
+            for bar in columns.to_bars():
+                state = self._indicator_calculator.update(state, bar)
+            built[columns.ticker] = state
+        return built
+
+    async def _advance_states(
+        self, trade_date: date, states: Dict[str, IndicatorState]
+    ) -> Dict[str, IndicatorState]:
+        """已有状态的标的：一次查询自最早 last_trade_date 之后的日线，各标的只推进其状态之后的新 K 线。"""
+        if not states:
+            return {}
+        start_date = min(s.last_trade_date for s in states.values()) + timedelta(days=1)
+        for columns in await self._market_quote.get_daily_bar_columns(
+            list(states), start_date, trade_date
+        ):
+            state = states[columns.ticker]
+            for bar in columns.since(state.last_trade_date, inclusive=False).to_bars():
+                state = self._indicator_calculator.update(state, bar)
+            states[columns.ticker] = state
+        return states
+
+    async def _verify(
+        self,
+        trade_date: date,
+        states: Dict[str, IndicatorState],
+        snapshots: Dict[str, TechnicalIndicatorsSnapshot],
+    ) -> None:
+        """从各状态起始日全量重算，断言与增量快照逐字段相等。"""
+        start_date = min(s.start_date for s in states.values())
+        for columns in await self._market_quote.get_daily_bar_columns(
+            list(states), start_date, trade_date
+        ):
+            state = states[columns.ticker]
+            expected = self._indicator_calculator.compute_columns(columns.since(state.start_date))
+            actual = snapshots[columns.ticker]
+            if actual != expected:
+                fields = [
+                    name
+                    for name, value in expected.model_dump().items()
+                    if getattr(actual, name) != value
+                ]
+                raise IndicatorStateMismatchError(columns.ticker, fields)
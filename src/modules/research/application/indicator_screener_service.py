@@ -0,0 +1,214 @@
+"""
+全市场技术指标条件选股 Application 服务。
+按交易日读取 stock_indicator_daily 的全市场截面（列式 NumPy 数组），在内存中按列求值筛选条件并排序，
+不逐标的调用技术分析（不触发大模型）。截面按交易日做进程内 LRU 缓存，批量任务重写某日快照后失效。
+
+筛选表达式为以 and 连接的比较子句，例如：
+    rsi_value < 30 and current_price > ma200
+    kdj_j < 0 and volume_ratio >= 2 and obv_trend == 'Rising'
+    current_price > ma20 * 1.05
+左侧为指标字段；右侧为数值、指标字段（可乘以系数）或引号包围的文本（仅文本字段，== / !=）。
+"""
+
+import operator
+import re
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import date
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+
+from src.modules.research.domain.dtos.indicator_cross_section import (
+    IndicatorCrossSection,
+)
+from src.modules.research.domain.dtos.screener_dtos import ScreenerItem, ScreenerResult
+from src.modules.research.domain.ports.indicator_snapshot_repository import (
+    IIndicatorSnapshotRepository,
+)
+from src.shared.domain.exceptions import BadRequestException
+
+# 进程内缓存的交易日截面数（每个截面约 5 千标的 × 30 列）
+CROSS_SECTION_CACHE_SIZE = 8
+# 结果中总会返回的字段
+_BASE_FIELDS = ("current_price", "change_percent")
+
+_OPERATORS: Dict[str, Callable[[np.ndarray, np.ndarray], np.ndarray]] = {
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+    "==": operator.eq,
+    "!=": operator.ne,
+}
+_CLAUSE = re.compile(r"^(?P<left>[a-z_][a-z0-9_]*)\s*(?P<op><=|>=|==|!=|<|>)\s*(?P<right>.+)$")
+_NUMBER = re.compile(r"^-?\d+(\.\d+)?$")
+_TEXT = re.compile(r"^'([^']*)'$|^\"([^\"]*)\"$")
+_SCALED_FIELD = re.compile(r"^(?P<field>[a-z_][a-z0-9_]*)(\s*\*\s*(?P<factor>-?\d+(\.\d+)?))?$")
+_AND = re.compile(r"\s+and\s+", re.IGNORECASE)
+
+
+@dataclass(frozen=True)
+class _Condition:
+    """单个比较子句：left op (right_field * factor | value)。"""
+
+    left: str
+    op: str
+    right_field: Optional[str] = None
+    factor: float = 1.0
+    value: object = None
+
+    def fields(self) -> List[str]:
+        return [self.left] + ([self.right_field] if self.right_field else [])
+
+
+class _CrossSectionCache:
+    """按交易日的截面 LRU 缓存（进程内）。"""
+
+    def __init__(self, maxsize: int):
+        self._maxsize = maxsize
+        self._items: "OrderedDict[date, IndicatorCrossSection]" = OrderedDict()
+
+    def get(self, trade_date: date) -> Optional[IndicatorCrossSection]:
+        section = self._items.get(trade_date)
+        if section is not None:
+            self._items.move_to_end(trade_date)
+        return section
+
+    def put(self, section: IndicatorCrossSection) -> None:
+        self._items[section.trade_date] = section
+        self._items.move_to_end(section.trade_date)
+        while len(self._items) > self._maxsize:
+            self._items.popitem(last=False)
+
+    def invalidate(self, trade_date: Optional[date] = None) -> None:
+        if trade_date is None:
+            self._items.clear()
+        else:
+            self._items.pop(trade_date, None)
+
+
+_cross_section_cache = _CrossSectionCache(CROSS_SECTION_CACHE_SIZE)
+
+
+def invalidate_cross_section(trade_date: Optional[date] = None) -> None:
+    """使某交易日（不传则全部）的缓存截面失效；指标快照写入后调用。"""
+    _cross_section_cache.invalidate(trade_date)
+
+
+def parse_expression(expression: str, section: IndicatorCrossSection) -> List[_Condition]:
+    """解析筛选表达式，字段须存在于截面中；表达式不合法时抛出 BadRequestException。"""
+    if not expression or not expression.strip():
+        raise BadRequestException(message="筛选表达式不能为空")
+
+    conditions = []
+    for clause in _AND.split(expression.strip()):
+        match = _CLAUSE.match(clause.strip())
+        if match is None:
+            raise BadRequestException(message=f"无法解析的筛选条件: {clause}")
+        left, op, right = match["left"], match["op"], match["right"].strip()
+
+        if left in section.text:
+            text = _TEXT.match(right)
+            if text is None or op not in ("==", "!="):
+                raise BadRequestException(
+                    message=f"文本字段 {left} 仅支持 == / != 引号文本: {clause}"
+                )
+            conditions.append(_Condition(left, op, value=text.group(1) or text.group(2) or ""))
+            continue
+        if left not in section.numeric:
+            raise BadRequestException(message=f"未知的指标字段: {left}")
+
+        if _NUMBER.match(right):
+            conditions.append(_Condition(left, op, value=float(right)))
+            continue
+        scaled = _SCALED_FIELD.match(right)
+        if scaled is None or scaled["field"] not in section.numeric:
+            raise BadRequestException(message=f"无法解析的比较对象: {right}")
+        factor = float(scaled["factor"]) if scaled["factor"] else 1.0
+        conditions.append(_Condition(left, op, right_field=scaled["field"], factor=factor))
+    return conditions
+
+
+def evaluate(conditions: List[_Condition], section: IndicatorCrossSection) -> np.ndarray:
+    """按列求值全部子句（逻辑与），返回布尔掩码；任一侧缺失（NaN）的标的不命中。"""
+    mask = np.ones(len(section), dtype=bool)
+    for cond in conditions:
+        compare = _OPERATORS[cond.op]
+        if cond.left in section.text:
+            mask &= compare(section.text[cond.left], cond.value).astype(bool)
+            continue
+        left = section.numeric[cond.left]
+        right = (
+            section.numeric[cond.right_field] * cond.factor
+            if cond.right_field
+            else np.float64(cond.value)
+        )
+        with np.errstate(invalid="ignore"):
+            mask &= compare(left, right) & ~np.isnan(left) & ~np.isnan(right)
+    return mask
+
+
+class IndicatorScreenerService:
+    """条件选股服务：截面读取（带缓存）→ 按列筛选 → 排序截断。"""
+
+    def __init__(self, snapshot_repo: IIndicatorSnapshotRepository):
+        self._snapshot_repo = snapshot_repo
+
+    async def screen(
+        self,
+        trade_date: date,
+        expression: str,
+        sort_by: Optional[str] = None,
+        descending: bool = True,
+        limit: int = 50,
+    ) -> ScreenerResult:
+        """
+        对某交易日全市场指标截面执行条件筛选。
+        :param trade_date: 交易日期（须已由批量任务写入指标快照）
+        :param expression: 筛选表达式（见模块说明）
+        :param sort_by: 排序的数值字段，不传则按代码升序
+        :param descending: 是否降序（缺失值始终排在最后）
+        :param limit: 返回条数上限
+        """
+        section = await self._load(trade_date)
+        conditions = parse_expression(expression, section)
+        if sort_by is not None and sort_by not in section.numeric:
+            raise BadRequestException(message=f"排序字段须为数值指标: {sort_by}")
+
+        matched = np.flatnonzero(evaluate(conditions, section))
+        if sort_by is not None:
+            keys = section.numeric[sort_by][matched]
+            # argsort 将 NaN 置于末尾；降序时对取负后的值升序排列
+            matched = matched[np.argsort(-keys if descending else keys, kind="stable")]
+        selected = matched[: max(limit, 0)]
+
+        fields = list(_BASE_FIELDS)
+        for name in [f for c in conditions for f in c.fields()] + ([sort_by] if sort_by else []):
+            if name not in fields:
+                fields.append(name)
+        columns = {f: (section.numeric.get(f), section.text.get(f)) for f in fields}
+
+        items = []
+        for i in selected.tolist():
+            values = {}
+            for name, (numeric, text) in columns.items():
+                if numeric is not None:
+                    value = float(numeric[i])
+                    values[name] = None if np.isnan(value) else value
+                else:
+                    values[name] = text[i]
+            items.append(ScreenerItem(ticker=section.tickers[i], values=values))
+
+        return ScreenerResult(
+            trade_date=trade_date, universe=len(section), matched=len(matched), items=items
+        )
+
+    async def _load(self, trade_date: date) -> IndicatorCrossSection:
+        section = _cross_section_cache.get(trade_date)
+        if section is None:
+            section = await self._snapshot_repo.get_cross_section(trade_date)
+            # 空截面（当日尚未计算）不缓存，批量任务完成后即可查到
+            if len(section):
+                _cross_section_cache.put(section)
+        return section
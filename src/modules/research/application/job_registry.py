@@ -0,0 +1,21 @@
+"""Research 模块任务注册表
+
+导出 Research 模块的定时任务映射，供 Foundation 调度器使用。
+"""
+
+from typing import Callable, Dict
+
+from src.modules.research.presentation.jobs.indicator_jobs import (
+    compute_stock_indicators_job,
+)
+
+
+def get_job_registry() -> Dict[str, Callable]:
+    """获取 Research 模块的任务注册表
+
+    Returns:
+        任务 ID 到任务函数的映射字典
+    """
+    return {
+        "compute_stock_indicators": compute_stock_indicators_job,
+    }
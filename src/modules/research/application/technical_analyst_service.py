@@ -17,12 +17,15 @@ from src.shared.domain.exceptions import BadRequestException
 
 # 计算 MACD(26)、布林带(20) 等核心指标所需的最低 K 线数量（约 6 周交易日）
 MIN_BARS_REQUIRED = 30
+# 计算指标时回看的自然日窗口（批量预计算使用相同窗口，保证口径一致）
+BAR_LOOKBACK_DAYS = 365
 
 
 class TechnicalAnalystService:
     """
     技术分析师服务。Coordinator 仅调用本服务获取技术面观点，不共用其他专家入口。
     编排：获取日线 → 通过 Port 计算技术指标 → 通过 Agent Port 分析 → 返回带 input/output 的完整响应。
+    分析日已有批量预计算的指标快照时直接读取，跳过日线加载与计算。
     """
 
     def __init__(
@@ -49,26 +52,28 @@ class TechnicalAnalystService:
         if analysis_date is None:
             raise BadRequestException(message="analysis_date 为必填")
 
-        start_date = analysis_date - timedelta(days=365)
-        bars = await self._market_quote.get_daily_bars(
-            ticker=ticker, start_date=start_date, end_date=analysis_date
-        )
-        if not bars:
-            raise BadRequestException(
-                message=(
-                    f"该标的 {ticker} 在区间 {start_date.isoformat()} ~ {analysis_date.isoformat()} "  # noqa: E501
-                    "内无日线数据，技术指标无法计算。请先通过 POST /api/v1/stocks/sync/daily "
-                    "同步该标的日线后再进行分析。"
-                )
+        snapshot = await self._indicator_calculator.get_stored(ticker, analysis_date)
+        if snapshot is None:
+            start_date = analysis_date - timedelta(days=BAR_LOOKBACK_DAYS)
+            bars = await self._market_quote.get_daily_bars(
+                ticker=ticker, start_date=start_date, end_date=analysis_date
             )
-        if len(bars) < MIN_BARS_REQUIRED:
-            raise BadRequestException(
-                message=(
-                    f"K 线数量不足：当前 {len(bars)} 根，至少需要 {MIN_BARS_REQUIRED} 根才能计算技术指标。"
-                    f"请扩大日期范围或先同步更多日线数据。"
+            if not bars:
+                raise BadRequestException(
+                    message=(
+                        f"该标的 {ticker} 在区间 {start_date.isoformat()} ~ {analysis_date.isoformat()} "  # noqa: E501
+                        "内无日线数据，技术指标无法计算。请先通过 POST /api/v1/stocks/sync/daily "
+                        "同步该标的日线后再进行分析。"
+                    )
                 )
-            )
-        snapshot = self._indicator_calculator.compute(bars)
+            if len(bars) < MIN_BARS_REQUIRED:
+                raise BadRequestException(
+                    message=(
+                        f"K 线数量不足：当前 {len(bars)} 根，至少需要 {MIN_BARS_REQUIRED} 根才能计算技术指标。"
+                        f"请扩大日期范围或先同步更多日线数据。"
+                    )
+                )
+            snapshot = self._indicator_calculator.compute(bars)
         agent_result = await self._analyst_agent.analyze(
             ticker=ticker,
             analysis_date=analysis_date.isoformat(),
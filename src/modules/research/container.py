@@ -13,6 +13,12 @@ from src.modules.research.application.catalyst_detective_service import (
 from src.modules.research.application.financial_auditor_service import (
     FinancialAuditorService,
 )
+from src.modules.research.application.indicator_batch_service import (
+    IndicatorBatchService,
+)
+from src.modules.research.application.indicator_screener_service import (
+    IndicatorScreenerService,
+)
 from src.modules.research.application.macro_intelligence_service import (
     MacroIntelligenceService,
 )
@@ -65,6 +71,12 @@ from src.modules.research.infrastructure.indicators.indicator_calculator_adapter
 from src.modules.research.infrastructure.macro_context.context_builder import (
     MacroContextBuilderImpl,
 )
+from src.modules.research.infrastructure.persistence.stock_indicator_daily_repository import (
+    PgIndicatorSnapshotRepository,
+)
+from src.modules.research.infrastructure.persistence.stock_indicator_state_repository import (
+    PgIndicatorStateRepository,
+)
 from src.modules.research.infrastructure.search_utils.result_filter import (
     SearchResultFilter,
 )
@@ -100,7 +112,9 @@ class ResearchContainer:
         market_quote_adapter = MarketQuoteAdapter(
             get_daily_bars_use_case=self._de_container.get_daily_bars_use_case()
         )
-        indicator_calculator = IndicatorCalculatorAdapter()
+        indicator_calculator = IndicatorCalculatorAdapter(
+            snapshot_repo=PgIndicatorSnapshotRepository(self._session)
+        )
         llm_adapter = LLMAdapter(llm_service=self._llm_container.llm_service())
         analyst_agent = TechnicalAnalystAgentAdapter(llm_port=llm_adapter)
         return TechnicalAnalystService(
@@ -109,6 +123,24 @@ class ResearchContainer:
             analyst_agent_port=analyst_agent,
         )
 
+    def indicator_batch_service(self) -> IndicatorBatchService:
+        """组装全市场指标批量计算服务：日线 Port、指标计算、指标快照与增量状态仓储。"""
+        market_quote_adapter = MarketQuoteAdapter(
+            get_daily_bars_use_case=self._de_container.get_daily_bars_use_case(),
+            get_daily_bars_by_date_use_case=self._de_container.get_daily_bars_by_date_use_case(),
+        )
+        snapshot_repo = PgIndicatorSnapshotRepository(self._session)
+        return IndicatorBatchService(
+            market_quote_port=market_quote_adapter,
+            indicator_calculator=IndicatorCalculatorAdapter(snapshot_repo=snapshot_repo),
+            snapshot_repo=snapshot_repo,
+            state_repo=PgIndicatorStateRepository(self._session),
+        )
+
+    def indicator_screener_service(self) -> IndicatorScreenerService:
+        """组装条件选股服务：指标快照仓储（按交易日读取全市场截面）。"""
+        return IndicatorScreenerService(snapshot_repo=PgIndicatorSnapshotRepository(self._session))
+
     def financial_auditor_service(self) -> FinancialAuditorService:
         """组装财务审计员服务：财务数据 Port、快照构建器、审计 Agent。"""
         financial_data_adapter = FinancialDataAdapter(
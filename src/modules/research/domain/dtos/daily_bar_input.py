@@ -3,8 +3,11 @@ Research 模块内使用的日线输入型 DTO。
 Adapter 将 data_engineering 的 DailyBarDTO 转为 DailyBarInput。
 """
 
+from dataclasses import dataclass
 from datetime import date
+from typing import List
 
+import numpy as np
 from pydantic import BaseModel
 
 
@@ -19,3 +22,64 @@ class DailyBarInput(BaseModel):
     vol: float
     amount: float = 0.0
     pct_chg: float = 0.0  # 涨跌幅（%），用于日涨跌幅展示，数据源无则传 0
+
+
+@dataclass(frozen=True)
+class DailyBarColumns:
+    """单个标的按交易日期升序的日线列数组（日期为 object 数组，数值为 float64），用于批量指标计算。"""
+
+    ticker: str
+    trade_date: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    vol: np.ndarray
+    pct_chg: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.close)
+
+    @property
+    def last_trade_date(self) -> date:
+        return self.trade_date[-1]
+
+    @property
+    def last_pct_chg(self) -> float:
+        return float(self.pct_chg[-1]) if len(self.pct_chg) else 0.0
+
+    def since(self, start_date: date, inclusive: bool = True) -> "DailyBarColumns":
+        """截取 start_date 起（inclusive=False 时为之后）的区段，返回视图不复制数据。"""
+        side = "left" if inclusive else "right"
+        start = int(np.searchsorted(self.trade_date, start_date, side=side))
+        return DailyBarColumns(
+            ticker=self.ticker,
+            trade_date=self.trade_date[start:],
+            high=self.high[start:],
+            low=self.low[start:],
+            close=self.close[start:],
+            vol=self.vol[start:],
+            pct_chg=self.pct_chg[start:],
+        )
+
+    def to_bars(self) -> List[DailyBarInput]:
+        """转为逐根 DailyBarInput（增量推进指标状态使用）。"""
+        return [
+            DailyBarInput.model_construct(
+                trade_date=trade_date,
+                open=close,
+                high=high,
+                low=low,
+                close=close,
+                vol=vol,
+                amount=0.0,
+                pct_chg=pct_chg,
+            )
+            for trade_date, high, low, close, vol, pct_chg in zip(
+                self.trade_date.tolist(),
+                self.high.tolist(),
+                self.low.tolist(),
+                self.close.tolist(),
+                self.vol.tolist(),
+                self.pct_chg.tolist(),
+            )
+        ]
@@ -0,0 +1,22 @@
+"""
+某交易日全市场技术指标截面（列式），供条件选股在内存中按列筛选与排序。
+"""
+
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Dict
+
+import numpy as np
+
+
+@dataclass(frozen=True)
+class IndicatorCrossSection:
+    """按标的代码升序的列数组：数值指标为 float64（缺失为 NaN），文本指标为 object 数组。"""
+
+    trade_date: date
+    tickers: np.ndarray
+    numeric: Dict[str, np.ndarray] = field(default_factory=dict)
+    text: Dict[str, np.ndarray] = field(default_factory=dict)
+
+    def __len__(self) -> int:
+        return len(self.tickers)
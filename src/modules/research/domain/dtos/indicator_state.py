@@ -0,0 +1,51 @@
+"""
+单个标的的增量技术指标状态。
+保存递推类指标（EMA / MACD / KDJ / Wilder 平滑 / OBV）的末值与种子、以及滚动窗口类指标所需的
+最近若干根 K 线（环形缓冲），新 K 线到来时按 O(1) 推进，无需重放全部历史。
+可直接 JSON 序列化持久化，由 Infrastructure 的 streaming_calculator 维护字段含义。
+"""
+
+from datetime import date
+from typing import List, Optional
+
+from pydantic import BaseModel, Field
+
+
+class IndicatorState(BaseModel):
+    """增量指标状态；空状态（size=0）表示尚未消费任何 K 线。"""
+
+    start_date: Optional[date] = Field(default=None, description="状态起始交易日（首根 K 线）")
+    last_trade_date: Optional[date] = Field(default=None, description="最后消费的交易日")
+    size: int = Field(default=0, description="已消费的 K 线数")
+    last_pct_chg: float = Field(default=0.0, description="最后一日涨跌幅（%）")
+
+    # 滚动窗口（环形缓冲，按时间升序）
+    closes: List[float] = Field(default_factory=list, description="最近 200 根收盘价")
+    highs: List[float] = Field(default_factory=list, description="最近 20 根最高价")
+    lows: List[float] = Field(default_factory=list, description="最近 20 根最低价")
+    vols: List[float] = Field(default_factory=list, description="最近 20 根成交量")
+
+    # MACD(12, 26, 9)
+    ema_fast: Optional[float] = None
+    ema_slow: Optional[float] = None
+    macd_dif: Optional[float] = None
+    macd_dea: Optional[float] = None
+    dif_seed: List[float] = Field(default_factory=list, description="DEA 种子前的 DIF")
+
+    # KDJ(9, 3, 3)
+    kdj_k: Optional[float] = None
+    kdj_d: Optional[float] = None
+
+    # Wilder 平滑(14)：TR（即 ATR）、+DM、-DM、DX（即 ADX）
+    tr_avg: Optional[float] = None
+    plus_dm_avg: Optional[float] = None
+    minus_dm_avg: Optional[float] = None
+    adx: Optional[float] = None
+    tr_seed: List[float] = Field(default_factory=list)
+    plus_dm_seed: List[float] = Field(default_factory=list)
+    minus_dm_seed: List[float] = Field(default_factory=list)
+    dx_seed: List[float] = Field(default_factory=list)
+
+    # OBV 累加器与最近 6 个 OBV 值（5 日趋势）
+    obv: float = 0.0
+    obv_history: List[float] = Field(default_factory=list)
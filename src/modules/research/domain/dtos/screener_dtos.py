@@ -0,0 +1,24 @@
+"""
+条件选股的结果 DTO。
+"""
+
+from datetime import date
+from typing import Dict, List, Optional, Union
+
+from pydantic import BaseModel, Field
+
+
+class ScreenerItem(BaseModel):
+    """单个命中标的：代码 + 条件与排序涉及的指标值（缺失为 None）。"""
+
+    ticker: str
+    values: Dict[str, Optional[Union[float, str]]] = Field(default_factory=dict)
+
+
+class ScreenerResult(BaseModel):
+    """条件选股结果。"""
+
+    trade_date: date
+    universe: int = Field(..., description="该交易日有指标快照的标的数")
+    matched: int = Field(..., description="满足条件的标的数（截断前）")
+    items: List[ScreenerItem] = Field(default_factory=list, description="按排序字段截断后的结果")
@@ -36,3 +36,15 @@ class CatalystSearchError(BadRequestException):
 
     def __init__(self, message: str = "催化剂搜索全部失败"):
         super().__init__(message=message)
+
+
+class IndicatorStateMismatchError(AppException):
+    """校验模式下增量指标状态与全量重算结果不一致时抛出。"""
+
+    def __init__(self, ticker: str, fields: list[str]):
+        super().__init__(
+            message=f"增量指标状态与全量重算不一致: {ticker}",
+            code="INDICATOR_STATE_MISMATCH",
+            status_code=500,
+            details={"ticker": ticker, "fields": fields},
+        )
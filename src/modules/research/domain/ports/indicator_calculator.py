@@ -5,9 +5,14 @@ Application 通过此 Port 获取指标快照，不直接依赖实现或第三
 """
 
 from abc import ABC, abstractmethod
-from typing import List
+from datetime import date
+from typing import List, Optional
 
-from src.modules.research.domain.dtos.daily_bar_input import DailyBarInput
+from src.modules.research.domain.dtos.daily_bar_input import (
+    DailyBarColumns,
+    DailyBarInput,
+)
+from src.modules.research.domain.dtos.indicator_state import IndicatorState
 from src.modules.research.domain.dtos.indicators_snapshot import (
     TechnicalIndicatorsSnapshot,
 )
@@ -19,3 +24,25 @@ class IIndicatorCalculator(ABC):
     @abstractmethod
     def compute(self, bars: List[DailyBarInput]) -> TechnicalIndicatorsSnapshot:
         raise NotImplementedError
+
+    @abstractmethod
+    def compute_columns(self, columns: DailyBarColumns) -> TechnicalIndicatorsSnapshot:
+        """基于单个标的的日线列数组计算指标快照（批量计算使用，口径与 compute 一致）。"""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_stored(
+        self, ticker: str, trade_date: date
+    ) -> Optional[TechnicalIndicatorsSnapshot]:
+        """返回批量任务已为该标的、该交易日预计算的快照；未预计算时返回 None。"""
+        raise NotImplementedError
+
+    @abstractmethod
+    def update(self, state: IndicatorState, bar: DailyBarInput) -> IndicatorState:
+        """以一根新 K 线增量推进指标状态（原地修改并返回），bar 须晚于 state.last_trade_date。"""
+        raise NotImplementedError
+
+    @abstractmethod
+    def snapshot(self, state: IndicatorState) -> TechnicalIndicatorsSnapshot:
+        """由增量状态得到指标快照，与对同一段 K 线调用 compute 的结果相同。"""
+        raise NotImplementedError
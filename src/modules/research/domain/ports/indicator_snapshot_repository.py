@@ -0,0 +1,36 @@
+"""
+技术指标快照持久化的 Port。
+批量任务按交易日写入全市场指标快照，技术分析按 (标的, 交易日) 读取，避免逐次重算；
+条件选股按交易日读取全市场截面。
+"""
+
+from abc import ABC, abstractmethod
+from datetime import date
+from typing import Dict, Optional
+
+from src.modules.research.domain.dtos.indicator_cross_section import (
+    IndicatorCrossSection,
+)
+from src.modules.research.domain.dtos.indicators_snapshot import (
+    TechnicalIndicatorsSnapshot,
+)
+
+
+class IIndicatorSnapshotRepository(ABC):
+    """按 (标的, 交易日) 存取技术指标快照。"""
+
+    @abstractmethod
+    async def get(self, ticker: str, trade_date: date) -> Optional[TechnicalIndicatorsSnapshot]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def save_all(
+        self, trade_date: date, snapshots: Dict[str, TechnicalIndicatorsSnapshot]
+    ) -> int:
+        """写入（UPSERT）某交易日多个标的的快照，返回写入条数。"""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_cross_section(self, trade_date: date) -> IndicatorCrossSection:
+        """读取某交易日全部标的的标量指标（不含支撑/阻力等列表字段），无数据时返回空截面。"""
+        raise NotImplementedError
@@ -0,0 +1,23 @@
+"""
+增量指标状态持久化的 Port。
+批量任务按标的读取上一交易日的指标状态，推进当日 K 线后写回。
+"""
+
+from abc import ABC, abstractmethod
+from typing import Dict, List
+
+from src.modules.research.domain.dtos.indicator_state import IndicatorState
+
+
+class IIndicatorStateRepository(ABC):
+    """按标的存取增量指标状态（每标的一行，保存最新状态）。"""
+
+    @abstractmethod
+    async def get_many(self, tickers: List[str]) -> Dict[str, IndicatorState]:
+        """返回 {标的: 状态}；无状态的标的不出现在结果中。"""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def save_all(self, states: Dict[str, IndicatorState]) -> int:
+        """写入（UPSERT）多个标的的状态，返回写入条数。"""
+        raise NotImplementedError
@@ -7,7 +7,10 @@ from abc import ABC, abstractmethod
 from datetime import date
 from typing import List
 
-from src.modules.research.domain.dtos.daily_bar_input import DailyBarInput
+from src.modules.research.domain.dtos.daily_bar_input import (
+    DailyBarColumns,
+    DailyBarInput,
+)
 
 
 class IMarketQuotePort(ABC):
@@ -18,3 +21,15 @@ class IMarketQuotePort(ABC):
         self, ticker: str, start_date: date, end_date: date
     ) -> List[DailyBarInput]:
         raise NotImplementedError
+
+    @abstractmethod
+    async def get_tickers_traded_on(self, trade_date: date) -> List[str]:
+        """返回指定交易日有日线的全部标的代码（升序）。"""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_daily_bar_columns(
+        self, tickers: List[str], start_date: date, end_date: date
+    ) -> List[DailyBarColumns]:
+        """批量获取多个标的在日期区间内的日线列数组（区间内无数据的标的不返回）。"""
+        raise NotImplementedError
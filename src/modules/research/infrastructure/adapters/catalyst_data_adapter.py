@@ -11,7 +11,6 @@ from src.modules.llm_platform.application.services.web_search_service import (
     WebSearchService,
 )
 from src.modules.llm_platform.domain.web_search_dtos import (
-    WebSearchRequest,
     WebSearchResultItem,
 )
 from src.modules.research.domain.dtos.catalyst_inputs import (
@@ -23,9 +22,14 @@ from src.modules.research.domain.ports.catalyst_data import ICatalystDataPort
 from src.modules.research.infrastructure.search_utils.catalyst_search_dimensions import (
     CATALYST_SEARCH_DIMENSIONS,
 )
+from src.modules.research.infrastructure.search_utils.dimension_search_executor import (
+    DimensionSearchExecutor,
+)
 from src.modules.research.infrastructure.search_utils.result_filter import (
     SearchResultFilter,
 )
+from src.modules.research.infrastructure.session_data import stock_basic_info_key
+from src.shared.infrastructure.execution_context import load_in_session
 
 logger = logging.getLogger(__name__)
 
@@ -40,6 +44,7 @@ class CatalystDataAdapter(ICatalystDataPort):
         self.stock_info_use_case = stock_info_use_case
         self.web_search_service = web_search_service
         self.result_filter = result_filter
+        self.search_executor = DimensionSearchExecutor(web_search_service, result_filter)
 
     async def get_stock_overview(self, symbol: str) -> Optional[CatalystStockOverview]:
         """
@@ -47,7 +52,10 @@ class CatalystDataAdapter(ICatalystDataPort):
         内部调用 data_engineering 的 GetStockBasicInfoUseCase
         """
         try:
-            result = await self.stock_info_use_case.execute(symbol)
+            result = await load_in_session(
+                stock_basic_info_key(symbol),
+                lambda: self.stock_info_use_case.execute(symbol),
+            )
             if not result:
                 logger.warning(f"Stock basic info not found for symbol: {symbol}")
                 return None
@@ -72,55 +80,22 @@ class CatalystDataAdapter(ICatalystDataPort):
     ) -> List[CatalystSearchResult]:
         """
         执行多维度的催化剂搜索
-        内部调用 llm_platform 的 WebSearchService
+        内部调用 llm_platform 的 WebSearchService，各维度经 DimensionSearchExecutor 并发执行，
+        单维度失败或超时返回空结果
         """
-        current_year = date.today().year
-
-        results = []
-
-        # 使用配置驱动的搜索循环
-        for config in CATALYST_SEARCH_DIMENSIONS:
-            topic = config.topic
-            # 填充查询模板中的占位符
-            query = config.query_template.format(
-                stock_name=stock_name,
-                industry=industry,
-                current_year=current_year,
+        outcomes = await self.search_executor.run(
+            CATALYST_SEARCH_DIMENSIONS,
+            stock_name=stock_name,
+            industry=industry,
+            current_year=date.today().year,
+        )
+        return [
+            CatalystSearchResult(
+                dimension_topic=outcome.topic,
+                items=[self._map_search_item(item) for item in outcome.items],
             )
-
-            try:
-                # 调用搜索服务
-                search_req = WebSearchRequest(
-                    query=query,
-                    freshness=config.freshness,
-                    count=config.count,
-                    summary=True,
-                )
-
-                response = await self.web_search_service.search(search_req)
-
-                # 过滤和排序搜索结果
-                filtered_items = self.result_filter.filter_and_sort(response.results)
-
-                # 记录过滤统计日志
-                logger.info(
-                    f"维度 {topic} 过滤统计："
-                    f"过滤前={len(response.results)}，"
-                    f"过滤后={len(filtered_items)}"
-                )
-
-                items = [self._map_search_item(item) for item in filtered_items]
-
-                results.append(CatalystSearchResult(dimension_topic=topic, items=items))
-
-            except Exception as e:
-                # Graceful degradation logic as per Decision 6
-                logger.warning(
-                    f"Catalyst search failed for dimension '{topic}' query='{query}': {e}"
-                )
-                results.append(CatalystSearchResult(dimension_topic=topic, items=[]))
-
-        return results
+            for outcome in outcomes
+        ]
 
     def _map_search_item(self, item: WebSearchResultItem) -> CatalystSearchResultItem:
         return CatalystSearchResultItem(
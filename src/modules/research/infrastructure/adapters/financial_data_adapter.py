@@ -14,6 +14,8 @@ from src.modules.research.domain.dtos.financial_record_input import (
     FinanceRecordInput,
 )
 from src.modules.research.domain.ports.financial_data import IFinancialDataPort
+from src.modules.research.infrastructure.session_data import finance_key
+from src.shared.infrastructure.execution_context import load_in_session
 
 
 def _to_finance_record(d: FinanceIndicatorDTO) -> FinanceRecordInput:
@@ -52,5 +54,8 @@ class FinancialDataAdapter(IFinancialDataPort):
         self._get_finance = get_finance_use_case
 
     async def get_finance_records(self, ticker: str, limit: int = 5) -> List[FinanceRecordInput]:
-        dto_list = await self._get_finance.execute(ticker=ticker, limit=limit)
+        dto_list = await load_in_session(
+            finance_key(ticker, limit),
+            lambda: self._get_finance.execute(ticker=ticker, limit=limit),
+        )
         return [_to_finance_record(d) for d in dto_list]
@@ -16,26 +16,23 @@ from src.modules.data_engineering.application.queries.get_stock_basic_info impor
 from src.modules.llm_platform.application.services.web_search_service import (
     WebSearchService,
 )
-from src.modules.llm_platform.domain.exceptions import (
-    WebSearchConfigError,
-    WebSearchConnectionError,
-    WebSearchError,
-)
-from src.modules.llm_platform.domain.web_search_dtos import (
-    WebSearchRequest,
-)
 from src.modules.research.domain.dtos.macro_inputs import (
     MacroSearchResult,
     MacroSearchResultItem,
     MacroStockOverview,
 )
 from src.modules.research.domain.ports.macro_data import IMacroDataPort
+from src.modules.research.infrastructure.search_utils.dimension_search_executor import (
+    DimensionSearchExecutor,
+)
 from src.modules.research.infrastructure.search_utils.macro_search_dimensions import (
     MACRO_SEARCH_DIMENSIONS,
 )
 from src.modules.research.infrastructure.search_utils.result_filter import (
     SearchResultFilter,
 )
+from src.modules.research.infrastructure.session_data import stock_basic_info_key
+from src.shared.infrastructure.execution_context import load_in_session
 
 logger = logging.getLogger(__name__)
 
@@ -45,7 +42,7 @@ class MacroDataAdapter(IMacroDataPort):
     宏观数据 Adapter 实现。
 
     通过 data_engineering 获取股票基础信息，
-    通过 llm_platform 执行四个维度的宏观搜索。
+    通过 llm_platform 并发执行四个维度的宏观搜索。
     """
 
     def __init__(
@@ -65,6 +62,7 @@ class MacroDataAdapter(IMacroDataPort):
         self._stock_info_usecase = stock_info_usecase
         self._web_search_service = web_search_service
         self._result_filter = result_filter
+        self._search_executor = DimensionSearchExecutor(web_search_service, result_filter)
 
     async def get_stock_overview(self, symbol: str) -> Optional[MacroStockOverview]:
         """
@@ -83,7 +81,10 @@ class MacroDataAdapter(IMacroDataPort):
         logger.info(f"获取股票基础信息：symbol={symbol}")
 
         try:
-            basic_info = await self._stock_info_usecase.execute(symbol)
+            basic_info = await load_in_session(
+                stock_basic_info_key(symbol),
+                lambda: self._stock_info_usecase.execute(symbol),
+            )
 
             if basic_info is None:
                 logger.warning(f"标的不存在：symbol={symbol}")
@@ -108,9 +109,8 @@ class MacroDataAdapter(IMacroDataPort):
         """
         基于行业与公司上下文，执行四个维度的宏观搜索。
 
-        该方法内部调用 llm_platform 的 WebSearchService，
-        按四个维度分别构建搜索查询并执行。
-        每个维度的搜索独立 try/except，失败时返回空结果（不中断其他维度）。
+        四个维度经 DimensionSearchExecutor 并发执行：单维度失败或超过整体时限时
+        该维度返回空结果（不中断其他维度），结果顺序与维度配置一致。
 
         Args:
             industry: 所属行业（用于构建行业相关搜索查询）
@@ -121,45 +121,16 @@ class MacroDataAdapter(IMacroDataPort):
         """
         logger.info(f"开始执行四维度宏观搜索：行业={industry}，股票={stock_name}")
 
-        current_year = date.today().year
-
-        results: List[MacroSearchResult] = []
-
-        # 使用配置驱动的搜索循环
-        for config in MACRO_SEARCH_DIMENSIONS:
-            dimension = config.topic
-            # 填充查询模板中的占位符
-            query = config.query_template.format(
-                industry=industry,
-                stock_name=stock_name,
-                current_year=current_year,
-            )
-
-            logger.info(f"执行搜索：维度={dimension}，查询={query}")
-
-            try:
-                # 调用搜索服务
-                search_request = WebSearchRequest(
-                    query=query,
-                    freshness=config.freshness,
-                    summary=True,
-                    count=config.count,
-                )
-
-                search_response = await self._web_search_service.search(search_request)
-
-                # 过滤和排序搜索结果
-                filtered_items = self._result_filter.filter_and_sort(search_response.results)
-
-                # 记录过滤统计日志
-                logger.info(
-                    f"维度 {dimension} 过滤统计："
-                    f"过滤前={len(search_response.results)}，"
-                    f"过滤后={len(filtered_items)}"
-                )
-
-                # 转为 MacroSearchResultItem 列表
-                items = [
+        outcomes = await self._search_executor.run(
+            MACRO_SEARCH_DIMENSIONS,
+            industry=industry,
+            stock_name=stock_name,
+            current_year=date.today().year,
+        )
+        results = [
+            MacroSearchResult(
+                dimension_topic=outcome.topic,
+                items=[
                     MacroSearchResultItem(
                         title=item.title,
                         url=item.url,
@@ -168,47 +139,11 @@ class MacroDataAdapter(IMacroDataPort):
                         site_name=item.site_name,
                         published_date=item.published_date,
                     )
-                    for item in filtered_items
-                ]
-
-                results.append(
-                    MacroSearchResult(
-                        dimension_topic=dimension,
-                        items=items,
-                    )
-                )
-
-                logger.info(f"维度 {dimension} 搜索成功，返回 {len(items)} 条结果")
-
-            except (
-                WebSearchError,
-                WebSearchConnectionError,
-                WebSearchConfigError,
-            ) as e:
-                # 单维度搜索失败，记录警告，返回空结果，不中断其他维度
-                logger.warning(
-                    f"维度 {dimension} 搜索失败（类型={type(e).__name__}，错误={e}），"
-                    f"该维度返回空结果，继续其他维度搜索"
-                )
-                results.append(
-                    MacroSearchResult(
-                        dimension_topic=dimension,
-                        items=[],
-                    )
-                )
-
-            except Exception as e:
-                # 未预期的异常，同样记录警告并返回空结果
-                logger.warning(
-                    f"维度 {dimension} 搜索发生未预期错误（错误={e}），"
-                    f"该维度返回空结果，继续其他维度搜索"
-                )
-                results.append(
-                    MacroSearchResult(
-                        dimension_topic=dimension,
-                        items=[],
-                    )
-                )
+                    for item in outcome.items
+                ],
+            )
+            for outcome in outcomes
+        ]
 
         # 统计搜索结果
         total_items = sum(len(r.items) for r in results)
@@ -1,41 +1,96 @@
 """
 获取日线 Port 的 Adapter。
-内部调用 data_engineering 的 GetDailyBarsForTickerUseCase（Application 接口），
-不直接依赖 data_engineering 的 repository 或 domain。
+内部调用 data_engineering 的 GetDailyBarsForTickerUseCase / GetDailyBarsByDateUseCase
+（Application 接口）的列式查询，不直接依赖 data_engineering 的 repository 或 domain。
 """
 
 from datetime import date
-from typing import List
+from typing import List, Optional
 
+import numpy as np
+
+from src.modules.data_engineering.application.queries.get_daily_bars_by_date import (
+    GetDailyBarsByDateUseCase,
+)
 from src.modules.data_engineering.application.queries.get_daily_bars_for_ticker import (
     GetDailyBarsForTickerUseCase,
 )
-from src.modules.research.domain.dtos.daily_bar_input import DailyBarInput
+from src.modules.research.domain.dtos.daily_bar_input import (
+    DailyBarColumns,
+    DailyBarInput,
+)
 from src.modules.research.domain.ports.market_quote import IMarketQuotePort
 
 
 class MarketQuoteAdapter(IMarketQuotePort):
     """通过 data_engineering 的 Application 接口获取日线，转为 Research 的 DailyBarInput。"""
 
-    def __init__(self, get_daily_bars_use_case: GetDailyBarsForTickerUseCase):
+    def __init__(
+        self,
+        get_daily_bars_use_case: GetDailyBarsForTickerUseCase,
+        get_daily_bars_by_date_use_case: Optional[GetDailyBarsByDateUseCase] = None,
+    ):
         self._get_daily_bars = get_daily_bars_use_case
+        self._get_daily_bars_by_date = get_daily_bars_by_date_use_case
 
     async def get_daily_bars(
         self, ticker: str, start_date: date, end_date: date
     ) -> List[DailyBarInput]:
-        dto_list = await self._get_daily_bars.execute(
+        frame = await self._get_daily_bars.execute_frame(
             ticker=ticker, start_date=start_date, end_date=end_date
         )
+        # 列式结果已完成空值归零与类型转换，按列 zip 后跳过逐行校验直接构造
+        columns = zip(
+            frame.trade_date.tolist(),
+            frame.open.tolist(),
+            frame.high.tolist(),
+            frame.low.tolist(),
+            frame.close.tolist(),
+            frame.vol.tolist(),
+            frame.amount.tolist(),
+            frame.pct_chg.tolist(),
+        )
+        return [
+            DailyBarInput.model_construct(
+                trade_date=trade_date,
+                open=open_,
+                high=high,
+                low=low,
+                close=close,
+                vol=vol,
+                amount=amount,
+                pct_chg=pct_chg,
+            )
+            for trade_date, open_, high, low, close, vol, amount, pct_chg in columns
+        ]
+
+    async def get_tickers_traded_on(self, trade_date: date) -> List[str]:
+        if self._get_daily_bars_by_date is None:
+            raise RuntimeError("MarketQuoteAdapter 未注入 GetDailyBarsByDateUseCase")
+        frame = await self._get_daily_bars_by_date.execute_frame(trade_date)
+        return frame.third_code.tolist()
+
+    async def get_daily_bar_columns(
+        self, tickers: List[str], start_date: date, end_date: date
+    ) -> List[DailyBarColumns]:
+        frame = await self._get_daily_bars.execute_frame_for_tickers(
+            tickers=tickers, start_date=start_date, end_date=end_date
+        )
+        if len(frame) == 0:
+            return []
+        # 结果按 (third_code, trade_date) 升序，按代码变化位置切分为各标的的连续区段
+        codes = frame.third_code
+        starts = np.flatnonzero(np.r_[True, codes[1:] != codes[:-1]])
+        ends = np.r_[starts[1:], len(codes)]
         return [
-            DailyBarInput(
-                trade_date=d.trade_date,
-                open=d.open,
-                high=d.high,
-                low=d.low,
-                close=d.close,
-                vol=d.vol,
-                amount=d.amount,
-                pct_chg=getattr(d, "pct_chg", 0.0) or 0.0,
+            DailyBarColumns(
+                ticker=codes[start],
+                trade_date=frame.trade_date[start:end],
+                high=frame.high[start:end],
+                low=frame.low[start:end],
+                close=frame.close[start:end],
+                vol=frame.vol[start:end],
+                pct_chg=frame.pct_chg[start:end],
             )
-            for d in dto_list
+            for start, end in zip(starts.tolist(), ends.tolist())
         ]
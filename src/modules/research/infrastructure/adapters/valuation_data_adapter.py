@@ -9,7 +9,9 @@
 
 import logging
 from datetime import date
-from typing import Any, List, Optional
+from typing import Any, Dict, List, Optional
+
+import numpy as np
 
 from src.modules.data_engineering.application.queries.get_finance_for_ticker import (
     FinanceIndicatorDTO,
@@ -19,8 +21,8 @@ from src.modules.data_engineering.application.queries.get_stock_basic_info impor
     GetStockBasicInfoUseCase,
 )
 from src.modules.data_engineering.application.queries.get_valuation_dailies_for_ticker import (
+    VALUATION_PERCENTILE_FIELDS,
     GetValuationDailiesForTickerUseCase,
-    ValuationDailyDTO,
 )
 from src.modules.research.domain.dtos.financial_record_input import (
     FinanceRecordInput,
@@ -30,6 +32,11 @@ from src.modules.research.domain.dtos.valuation_inputs import (
     ValuationDailyInput,
 )
 from src.modules.research.domain.ports.valuation_data import IValuationDataPort
+from src.modules.research.infrastructure.session_data import (
+    finance_key,
+    stock_basic_info_key,
+)
+from src.shared.infrastructure.execution_context import load_in_session
 
 logger = logging.getLogger(__name__)
 
@@ -62,15 +69,28 @@ def _to_stock_overview(
     )
 
 
-def _to_valuation_daily(d: ValuationDailyDTO) -> ValuationDailyInput:
-    """将 data_engineering 的 ValuationDailyDTO 转为 Research 的 ValuationDailyInput。"""
-    return ValuationDailyInput(
-        trade_date=d.trade_date,
-        close=d.close,
-        pe_ttm=d.pe_ttm,
-        pb=d.pb,
-        ps_ttm=d.ps_ttm,
+def _nan_to_none(values: np.ndarray) -> List[Optional[float]]:
+    """float 数组转列表，NaN 还原为 None（整列向量化处理）。"""
+    out = values.astype(object)
+    out[np.isnan(values)] = None
+    return out.tolist()
+
+
+def _to_valuation_dailies(columns: Dict[str, np.ndarray]) -> List[ValuationDailyInput]:
+    """将按字段投影的估值历史（列数组）转为 Research 的 ValuationDailyInput 列表。"""
+    rows = zip(
+        columns["trade_date"].tolist(),
+        np.nan_to_num(columns["close"], nan=0.0).tolist(),
+        _nan_to_none(columns["pe_ttm"]),
+        _nan_to_none(columns["pb"]),
+        _nan_to_none(columns["ps_ttm"]),
     )
+    return [
+        ValuationDailyInput.model_construct(
+            trade_date=trade_date, close=close, pe_ttm=pe_ttm, pb=pb, ps_ttm=ps_ttm
+        )
+        for trade_date, close, pe_ttm, pb, ps_ttm in rows
+    ]
 
 
 def _to_finance_record(d: FinanceIndicatorDTO) -> FinanceRecordInput:
@@ -123,7 +143,10 @@ class ValuationDataAdapter(IValuationDataPort):
         获取股票基础信息与最新市场估值数据。
         返回 None 表示标的不存在。
         """
-        basic_info = await self._get_stock_basic_info.execute(symbol=symbol)
+        basic_info = await load_in_session(
+            stock_basic_info_key(symbol),
+            lambda: self._get_stock_basic_info.execute(symbol=symbol),
+        )
         if basic_info is None:
             return None
         overview = _to_stock_overview(basic_info)
@@ -133,14 +156,21 @@ class ValuationDataAdapter(IValuationDataPort):
         self, ticker: str, start_date: date, end_date: date
     ) -> List[ValuationDailyInput]:
         """获取历史估值日线（含 PE、PB、PS 等），用于历史分位点计算。"""
-        dto_list = await self._get_valuation_dailies.execute(
-            ticker=ticker, start_date=start_date, end_date=end_date
+        # 只投影分位计算所需的列（覆盖索引内），不读取整行日线
+        columns = await self._get_valuation_dailies.execute_fields(
+            ticker=ticker,
+            start_date=start_date,
+            end_date=end_date,
+            fields=VALUATION_PERCENTILE_FIELDS,
         )
-        return [_to_valuation_daily(d) for d in dto_list]
+        return _to_valuation_dailies(columns)
 
     async def get_finance_for_valuation(
         self, ticker: str, limit: int = 5
     ) -> List[FinanceRecordInput]:
         """获取财务指标数据（含 EPS、BPS、ROE 等），用于 PEG 计算与 Graham 计算。"""
-        dto_list = await self._get_finance.execute(ticker=ticker, limit=limit)
+        dto_list = await load_in_session(
+            finance_key(ticker, limit),
+            lambda: self._get_finance.execute(ticker=ticker, limit=limit),
+        )
         return [_to_finance_record(d) for d in dto_list]
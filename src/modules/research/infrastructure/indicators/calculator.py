@@ -2,6 +2,9 @@
 基于日线计算技术指标，输出全量原始数值供 Prompt 使用。
 实现：多周期 MA、RSI、MACD、KDJ、ADX、量比、支撑/阻力。
 数据不足时对应指标返回 None，由调用方填入 N/A。
+
+纯 Python 参考实现：线上计算走 vectorized_calculator（口径一致），
+本模块保留用于一致性校验与基准对比。
 """
 
 from typing import List, Optional, Tuple
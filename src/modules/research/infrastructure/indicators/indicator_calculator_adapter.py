@@ -1,25 +1,64 @@
 """
 指标计算 Port 的 Infrastructure 实现。
-委托给 calculator 模块（可在此处或 calculator 内依赖第三方库如 ta-lib、pandas），
+全量计算委托给 vectorized_calculator 模块（NumPy 向量化实现，口径与 calculator 模块的纯 Python 实现一致），
+增量推进委托给 streaming_calculator 模块；
 Application 仅依赖 Domain 的 IIndicatorCalculator，不直接引用本实现。
 """
 
-from typing import List
+from datetime import date
+from typing import List, Optional
 
-from src.modules.research.domain.dtos.daily_bar_input import DailyBarInput
+from src.modules.research.domain.dtos.daily_bar_input import (
+    DailyBarColumns,
+    DailyBarInput,
+)
+from src.modules.research.domain.dtos.indicator_state import IndicatorState
 from src.modules.research.domain.dtos.indicators_snapshot import (
     TechnicalIndicatorsSnapshot,
 )
 from src.modules.research.domain.ports.indicator_calculator import (
     IIndicatorCalculator,
 )
-from src.modules.research.infrastructure.indicators.calculator import (
-    compute_technical_indicators,
+from src.modules.research.domain.ports.indicator_snapshot_repository import (
+    IIndicatorSnapshotRepository,
+)
+from src.modules.research.infrastructure.indicators import streaming_calculator
+from src.modules.research.infrastructure.indicators.vectorized_calculator import (
+    compute_indicators_from_arrays,
+    compute_technical_indicators_vectorized,
 )
 
 
 class IndicatorCalculatorAdapter(IIndicatorCalculator):
-    """基于日线计算技术指标，实现可依赖第三方库；本实现使用 calculator 模块。"""
+    """
+    基于日线计算技术指标，实现可依赖第三方库；本实现使用 vectorized_calculator 模块。
+    注入快照仓储时，批量任务已预计算的 (标的, 交易日) 直接从 stock_indicator_daily 读取。
+    """
+
+    def __init__(self, snapshot_repo: Optional[IIndicatorSnapshotRepository] = None):
+        self._snapshot_repo = snapshot_repo
 
     def compute(self, bars: List[DailyBarInput]) -> TechnicalIndicatorsSnapshot:
-        return compute_technical_indicators(bars)
+        return compute_technical_indicators_vectorized(bars)
+
+    def compute_columns(self, columns: DailyBarColumns) -> TechnicalIndicatorsSnapshot:
+        return compute_indicators_from_arrays(
+            highs=columns.high,
+            lows=columns.low,
+            closes=columns.close,
+            vols=columns.vol,
+            last_pct_chg=columns.last_pct_chg,
+        )
+
+    def update(self, state: IndicatorState, bar: DailyBarInput) -> IndicatorState:
+        return streaming_calculator.update(state, bar)
+
+    def snapshot(self, state: IndicatorState) -> TechnicalIndicatorsSnapshot:
+        return streaming_calculator.snapshot(state)
+
+    async def get_stored(
+        self, ticker: str, trade_date: date
+    ) -> Optional[TechnicalIndicatorsSnapshot]:
+        if self._snapshot_repo is None:
+            return None
+        return await self._snapshot_repo.get(ticker, trade_date)
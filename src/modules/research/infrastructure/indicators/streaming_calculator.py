@@ -0,0 +1,215 @@
+"""
+技术指标的增量（流式）计算。
+
+EMA / MACD / KDJ / ATR / ADX / OBV 都是递推滤波，新 K 线只需在上一根的末值上推进一步；
+均线、RSI、布林带、VWAP 等窗口类指标只依赖最近若干根。IndicatorState 保存前者的末值与种子、
+后者的滚动窗口，update 每根 K 线 O(1) 推进，snapshot 由状态组装快照。
+
+推进公式与 vectorized_calculator 逐步一致（种子取 NumPy 均值、递推复刻 pandas ewm(adjust=False)
+的单步运算），对同一段 K 线，snapshot(replay(bars)) 与 compute_technical_indicators_vectorized(bars)
+逐字段相等，可用于增量结果的全量校验。
+"""
+
+from typing import Iterable, List, Optional
+
+import numpy as np
+
+from src.modules.research.domain.dtos.daily_bar_input import DailyBarInput
+from src.modules.research.domain.dtos.indicator_state import IndicatorState
+from src.modules.research.domain.dtos.indicators_snapshot import (
+    TechnicalIndicatorsSnapshot,
+)
+from src.modules.research.infrastructure.indicators.vectorized_calculator import (
+    build_snapshot,
+)
+
+MACD_FAST, MACD_SLOW, MACD_SIGNAL = 12, 26, 9
+KDJ_N, KDJ_M1, KDJ_M2 = 9, 3, 3
+WILDER_PERIOD = 14
+OBV_DAYS = 5
+
+# 滚动窗口长度：收盘价覆盖 MA200，其余覆盖 20 日窗口（VWAP / 布林带 / 支撑阻力 / KDJ / 量比）
+CLOSE_WINDOW = 200
+BAR_WINDOW = 20
+
+
+def _ewm_step(prev: float, value: float, alpha: float) -> float:
+    """单步 y = (1 - alpha) * y_prev + alpha * x，按 pandas ewm(adjust=False) 的运算顺序实现以保证逐位一致。"""
+    if prev == value:
+        return prev
+    com = (1.0 - alpha) / alpha
+    new_wt = 1.0 / (1.0 + com)
+    old_wt = 1.0 - new_wt
+    return (old_wt * prev + new_wt * value) / (old_wt + new_wt)
+
+
+def _seed_mean(values: List[float]) -> float:
+    return float(np.asarray(values, dtype=np.float64).mean())
+
+
+def _push(buffer: List[float], value: float, maxlen: int) -> None:
+    buffer.append(value)
+    if len(buffer) > maxlen:
+        del buffer[0]
+
+
+def _wilder_update(avg: Optional[float], seed: List[float], value: float) -> Optional[float]:
+    """Wilder 平滑推进：凑满 period 个值时取均值为种子，之后按 1/period 递推。"""
+    if avg is not None:
+        return _ewm_step(avg, value, 1.0 / WILDER_PERIOD)
+    seed.append(value)
+    if len(seed) < WILDER_PERIOD:
+        return None
+    avg = _seed_mean(seed)
+    seed.clear()
+    return avg
+
+
+def _update_macd(state: IndicatorState, close: float) -> None:
+    for period, attr in ((MACD_FAST, "ema_fast"), (MACD_SLOW, "ema_slow")):
+        if state.size == period:
+            setattr(state, attr, _seed_mean(state.closes[-period:]))
+        elif state.size > period:
+            setattr(state, attr, _ewm_step(getattr(state, attr), close, 2.0 / (period + 1)))
+
+    if state.size < MACD_SLOW:
+        return
+    state.macd_dif = state.ema_fast - state.ema_slow
+    if state.macd_dea is not None:
+        state.macd_dea = _ewm_step(state.macd_dea, state.macd_dif, 2.0 / (MACD_SIGNAL + 1))
+        return
+    state.dif_seed.append(state.macd_dif)
+    if len(state.dif_seed) == MACD_SIGNAL:
+        state.macd_dea = _seed_mean(state.dif_seed)
+        state.dif_seed.clear()
+
+
+def _update_kdj(state: IndicatorState, close: float) -> None:
+    if state.size < KDJ_N:
+        return
+    high_n = max(state.highs[-KDJ_N:])
+    low_n = min(state.lows[-KDJ_N:])
+    spread = high_n - low_n
+    rsv = (close - low_n) / spread * 100.0 if spread > 0 else 50.0
+    k = _ewm_step(50.0 if state.kdj_k is None else state.kdj_k, rsv, 1.0 / KDJ_M1)
+    state.kdj_d = _ewm_step(50.0 if state.kdj_d is None else state.kdj_d, k, 1.0 / KDJ_M2)
+    state.kdj_k = k
+
+
+def _update_wilder(
+    state: IndicatorState,
+    high: float,
+    low: float,
+    prev_high: float,
+    prev_low: float,
+    prev_close: float,
+) -> None:
+    tr = max(high - low, abs(high - prev_close), abs(low - prev_close))
+    up = high - prev_high
+    down = -(low - prev_low)
+    plus_dm = up if up > down and up > 0 else 0.0
+    minus_dm = down if down > up and down > 0 else 0.0
+
+    state.tr_avg = _wilder_update(state.tr_avg, state.tr_seed, tr)
+    state.plus_dm_avg = _wilder_update(state.plus_dm_avg, state.plus_dm_seed, plus_dm)
+    state.minus_dm_avg = _wilder_update(state.minus_dm_avg, state.minus_dm_seed, minus_dm)
+    if state.tr_avg is None:
+        return
+
+    # Wilder 累加平滑 = 均值平滑 × period，与 vectorized_calculator._adx 一致
+    tr_s = state.tr_avg * WILDER_PERIOD
+    if tr_s > 0:
+        di_plus = 100.0 * (state.plus_dm_avg * WILDER_PERIOD) / tr_s
+        di_minus = 100.0 * (state.minus_dm_avg * WILDER_PERIOD) / tr_s
+    else:
+        di_plus = di_minus = 0.0
+    di_sum = di_plus + di_minus
+    dx = 100.0 * abs(di_plus - di_minus) / di_sum if di_sum > 0 else 0.0
+    state.adx = _wilder_update(state.adx, state.dx_seed, dx)
+
+
+def update(state: IndicatorState, bar: DailyBarInput) -> IndicatorState:
+    """
+    以一根新 K 线推进指标状态（原地修改并返回 state）。
+    调用方保证 bar 按交易日升序到达且晚于 state.last_trade_date。
+    """
+    has_prev = state.size > 0
+    if has_prev:
+        prev_close, prev_high, prev_low = state.closes[-1], state.highs[-1], state.lows[-1]
+    else:
+        state.start_date = bar.trade_date
+
+    state.size += 1
+    state.last_trade_date = bar.trade_date
+    state.last_pct_chg = bar.pct_chg
+    _push(state.closes, bar.close, CLOSE_WINDOW)
+    _push(state.highs, bar.high, BAR_WINDOW)
+    _push(state.lows, bar.low, BAR_WINDOW)
+    _push(state.vols, bar.vol, BAR_WINDOW)
+
+    _update_macd(state, bar.close)
+    _update_kdj(state, bar.close)
+    if has_prev:
+        _update_wilder(state, bar.high, bar.low, prev_high, prev_low, prev_close)
+        if bar.close > prev_close:
+            state.obv += bar.vol
+        elif bar.close < prev_close:
+            state.obv -= bar.vol
+    _push(state.obv_history, state.obv, OBV_DAYS + 1)
+    return state
+
+
+def replay(bars: Iterable[DailyBarInput], state: Optional[IndicatorState] = None) -> IndicatorState:
+    """依次以 bars 推进状态；state 为空时从空状态开始（即从头构建）。"""
+    state = state if state is not None else IndicatorState()
+    for bar in bars:
+        update(state, bar)
+    return state
+
+
+def _obv_trend(state: IndicatorState) -> str:
+    if state.size <= OBV_DAYS:
+        return "Flat"
+    latest, base = state.obv_history[-1], state.obv_history[-1 - OBV_DAYS]
+    if latest > base:
+        return "Rising"
+    if latest < base:
+        return "Falling"
+    return "Flat"
+
+
+def snapshot(state: IndicatorState) -> TechnicalIndicatorsSnapshot:
+    """由增量状态组装技术指标快照（口径同 compute_technical_indicators_vectorized）。"""
+    if state.size == 0:
+        return TechnicalIndicatorsSnapshot()
+
+    if state.macd_dif is None:
+        macd = (None, None, None)
+    elif state.macd_dea is None:
+        macd = (round(state.macd_dif, 4), round(state.macd_dif, 4), None)
+    else:
+        macd = (
+            round(state.macd_dif, 4),
+            round(state.macd_dea, 4),
+            round(state.macd_dif - state.macd_dea, 4),
+        )
+
+    if state.kdj_k is None:
+        kdj = (None, None, None)
+    else:
+        k, d = state.kdj_k, state.kdj_d
+        kdj = (round(k, 2), round(d, 2), round(3 * k - 2 * d, 2))
+
+    return build_snapshot(
+        np.asarray(state.highs, dtype=np.float64),
+        np.asarray(state.lows, dtype=np.float64),
+        np.asarray(state.closes, dtype=np.float64),
+        np.asarray(state.vols, dtype=np.float64),
+        size=state.size,
+        last_pct_chg=state.last_pct_chg,
+        macd=macd,
+        kdj=kdj,
+        adx_value=round(state.adx, 2) if state.adx is not None else None,
+        atr_value=round(state.tr_avg, 4) if state.tr_avg is not None else None,
+        obv_trend=_obv_trend(state),
+    )
@@ -0,0 +1,330 @@
+"""
+基于 NumPy 数组的技术指标计算（向量化实现）。
+
+与 calculator 模块的纯 Python 实现口径一致（同样的种子、平滑方式与取整），输出相同的
+TechnicalIndicatorsSnapshot（浮点误差范围内）：
+- 均线、RSI、布林带、VWAP 直接在数组切片上计算；
+- EMA / MACD / KDJ / ATR / ADX 等递推滤波以整列一次性计算（pandas ewm，adjust=False），
+  MACD 不再对每个前缀重复计算 EMA，复杂度由 O(n²) 降为 O(n)；
+- KDJ 的 N 日最高/最低使用滑动窗口 max/min。
+
+compute_indicators_from_arrays 直接接收列数组，供批量（全市场）计算复用；
+build_snapshot 供 streaming_calculator 以增量状态组装同口径快照。
+"""
+
+from typing import List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+
+from src.modules.research.domain.dtos.daily_bar_input import DailyBarInput
+from src.modules.research.domain.dtos.indicators_snapshot import (
+    TechnicalIndicatorsSnapshot,
+)
+
+
+def _recursive_smooth(values: np.ndarray, alpha: float, seed: float) -> np.ndarray:
+    """一阶递推滤波 y[i] = (1 - alpha) * y[i-1] + alpha * x[i]，y[-1] = seed；返回与 values 等长的序列。"""
+    if len(values) == 0:
+        return np.empty(0, dtype=np.float64)
+    smoothed = pd.Series(np.concatenate(([seed], values))).ewm(alpha=alpha, adjust=False).mean()
+    return smoothed.to_numpy()[1:]
+
+
+def ema_series(values: np.ndarray, period: int) -> np.ndarray:
+    """
+    周期 period 的 EMA 序列：第 period 日取前 period 日 SMA 为种子，随后递推。
+    返回长度 len(values) - period + 1，对应原序列下标 period-1 起；数据不足时为空数组。
+    """
+    if len(values) < period:
+        return np.empty(0, dtype=np.float64)
+    seed = values[:period].mean()
+    tail = _recursive_smooth(values[period:], 2.0 / (period + 1), seed)
+    return np.concatenate(([seed], tail))
+
+
+def wilder_series(values: np.ndarray, period: int) -> np.ndarray:
+    """
+    Wilder 平滑序列：首值为前 period 个均值，随后 (prev * (period-1) + x) / period。
+    返回长度 len(values) - period + 1；调用方保证 len(values) >= period。
+    """
+    seed = values[:period].mean()
+    tail = _recursive_smooth(values[period:], 1.0 / period, seed)
+    return np.concatenate(([seed], tail))
+
+
+def _true_range(highs: np.ndarray, lows: np.ndarray, closes: np.ndarray) -> np.ndarray:
+    """真实波幅序列（自第 2 日起，长度 n-1）。"""
+    prev_close = closes[:-1]
+    return np.maximum.reduce(
+        [
+            highs[1:] - lows[1:],
+            np.abs(highs[1:] - prev_close),
+            np.abs(lows[1:] - prev_close),
+        ]
+    )
+
+
+def _sma_last(values: np.ndarray, period: int) -> float:
+    if len(values) == 0 or len(values) < period:
+        return 0.0
+    return float(values[-period:].mean())
+
+
+def _rsi(closes: np.ndarray, period: int = 14) -> Optional[float]:
+    if len(closes) < period + 1:
+        return None
+    deltas = np.diff(closes[-(period + 1) :])
+    avg_gain = float(np.maximum(deltas, 0.0).sum()) / period
+    avg_loss = float(np.maximum(-deltas, 0.0).sum()) / period
+    if avg_loss == 0:
+        return 100.0
+    return 100.0 - (100.0 / (1 + avg_gain / avg_loss))
+
+
+def _macd(
+    closes: np.ndarray, fast: int = 12, slow: int = 26, signal: int = 9
+) -> Tuple[Optional[float], Optional[float], Optional[float]]:
+    if len(closes) < slow:
+        return None, None, None
+    # DIF 序列：自第 slow 日起，快慢 EMA 之差
+    difs = ema_series(closes, fast)[slow - fast :] - ema_series(closes, slow)
+    dif = float(difs[-1])
+    if len(difs) < signal:
+        return round(dif, 4), round(dif, 4), None
+    dea = float(ema_series(difs, signal)[-1])
+    return round(dif, 4), round(dea, 4), round(dif - dea, 4)
+
+
+def _kdj(
+    highs: np.ndarray,
+    lows: np.ndarray,
+    closes: np.ndarray,
+    n: int = 9,
+    m1: int = 3,
+    m2: int = 3,
+) -> Tuple[Optional[float], Optional[float], Optional[float]]:
+    if len(closes) < n:
+        return None, None, None
+    high_n = sliding_window_view(highs, n).max(axis=1)
+    low_n = sliding_window_view(lows, n).min(axis=1)
+    spread = high_n - low_n
+    rsv = np.full(len(spread), 50.0)
+    valid = spread > 0
+    rsv[valid] = (closes[n - 1 :][valid] - low_n[valid]) / spread[valid] * 100.0
+    k = _recursive_smooth(rsv, 1.0 / m1, 50.0)
+    d = _recursive_smooth(k, 1.0 / m2, 50.0)
+    k_last, d_last = float(k[-1]), float(d[-1])
+    return round(k_last, 2), round(d_last, 2), round(3 * k_last - 2 * d_last, 2)
+
+
+def _vwap(
+    highs: np.ndarray, lows: np.ndarray, closes: np.ndarray, vols: np.ndarray, lookback: int = 0
+) -> Optional[float]:
+    if len(closes) == 0:
+        return None
+    start = -lookback if lookback and len(closes) >= lookback else 0
+    typical = (highs[start:] + lows[start:] + closes[start:]) / 3.0
+    total_v = float(vols[start:].sum())
+    return round(float((typical * vols[start:]).sum()) / total_v, 4) if total_v > 0 else None
+
+
+def _bollinger(
+    closes: np.ndarray, period: int = 20, k: float = 2.0
+) -> Tuple[Optional[float], Optional[float], Optional[float], Optional[float]]:
+    if len(closes) < period:
+        return None, None, None, None
+    window = closes[-period:]
+    middle = float(window.mean())
+    variance = float(((window - middle) ** 2).sum()) / period
+    std = variance**0.5 if variance > 0 else 0.0
+    upper = middle + k * std
+    lower = middle - k * std
+    bandwidth = (upper - lower) / middle * 100.0 if middle else 0.0
+    return round(upper, 4), round(lower, 4), round(middle, 4), round(bandwidth, 2)
+
+
+def _atr(
+    highs: np.ndarray, lows: np.ndarray, closes: np.ndarray, period: int = 14
+) -> Optional[float]:
+    if len(closes) < period + 1:
+        return None
+    return round(float(wilder_series(_true_range(highs, lows, closes), period)[-1]), 4)
+
+
+def _obv_trend(closes: np.ndarray, vols: np.ndarray, days: int = 5) -> str:
+    if len(closes) < 2 or len(vols) < 2 or len(closes) != len(vols) or days < 1:
+        return "Flat"
+    obv = np.concatenate(([0.0], np.cumsum(np.sign(np.diff(closes)) * vols[1:])))
+    if len(obv) <= days:
+        return "Flat"
+    if obv[-1] > obv[-1 - days]:
+        return "Rising"
+    if obv[-1] < obv[-1 - days]:
+        return "Falling"
+    return "Flat"
+
+
+def _adx(
+    highs: np.ndarray, lows: np.ndarray, closes: np.ndarray, period: int = 14
+) -> Optional[float]:
+    if len(closes) < period + 1:
+        return None
+    tr = _true_range(highs, lows, closes)
+    up = np.diff(highs)
+    down = -np.diff(lows)
+    plus_dm = np.where((up > down) & (up > 0), up, 0.0)
+    minus_dm = np.where((down > up) & (down > 0), down, 0.0)
+
+    # Wilder 累加平滑（首值为 period 日之和，随后 prev*(p-1)/p + x）= 均值平滑 × period
+    tr_s = wilder_series(tr, period) * period
+    plus_s = wilder_series(plus_dm, period) * period
+    minus_s = wilder_series(minus_dm, period) * period
+    positive = tr_s > 0
+    safe_tr = np.where(positive, tr_s, 1.0)
+    di_plus = np.where(positive, 100.0 * plus_s / safe_tr, 0.0)
+    di_minus = np.where(positive, 100.0 * minus_s / safe_tr, 0.0)
+    di_sum = di_plus + di_minus
+    safe_sum = np.where(di_sum > 0, di_sum, 1.0)
+    dx = np.where(di_sum > 0, 100.0 * np.abs(di_plus - di_minus) / safe_sum, 0.0)
+    if len(dx) < period:
+        return None
+    return round(float(wilder_series(dx, period)[-1]), 2)
+
+
+def compute_indicators_from_arrays(
+    highs: np.ndarray,
+    lows: np.ndarray,
+    closes: np.ndarray,
+    vols: np.ndarray,
+    last_pct_chg: float = 0.0,
+) -> TechnicalIndicatorsSnapshot:
+    """
+    基于按时间升序排列的 float64 列数组计算全量技术指标。
+    :param highs: 最高价
+    :param lows: 最低价
+    :param closes: 收盘价
+    :param vols: 成交量
+    :param last_pct_chg: 最后一日涨跌幅（%）
+    :return: 技术指标快照
+    """
+    if len(closes) == 0:
+        return TechnicalIndicatorsSnapshot()
+    return build_snapshot(
+        highs,
+        lows,
+        closes,
+        vols,
+        size=len(closes),
+        last_pct_chg=last_pct_chg,
+        macd=_macd(closes, 12, 26, 9),
+        kdj=_kdj(highs, lows, closes, 9, 3, 3),
+        adx_value=_adx(highs, lows, closes, 14),
+        atr_value=_atr(highs, lows, closes, 14),
+        obv_trend=_obv_trend(closes, vols, 5),
+    )
+
+
+def build_snapshot(
+    highs: np.ndarray,
+    lows: np.ndarray,
+    closes: np.ndarray,
+    vols: np.ndarray,
+    size: int,
+    last_pct_chg: float,
+    macd: Tuple[Optional[float], Optional[float], Optional[float]],
+    kdj: Tuple[Optional[float], Optional[float], Optional[float]],
+    adx_value: Optional[float],
+    atr_value: Optional[float],
+    obv_trend: str,
+) -> TechnicalIndicatorsSnapshot:
+    """
+    由已算好的递推类指标与末尾窗口数组组装快照。
+    窗口类指标（均线、RSI、布林带、VWAP、量比、支撑/阻力）只依赖末尾最多 200 根，
+    因此数组可以是完整序列，也可以是增量状态保留的滚动窗口；size 为完整序列长度。
+    """
+    current = float(closes[-1])
+
+    def ma_or_fallback(period: int) -> float:
+        return round(_sma_last(closes, period if size >= period else size), 4)
+
+    ma60 = ma_or_fallback(60)
+    ma120 = ma_or_fallback(120) if size >= 120 else ma60
+    ma200 = ma_or_fallback(200) if size >= 200 else ma120
+
+    rsi_val = _rsi(closes, 14)
+    macd_dif, macd_dea, macd_hist = macd
+    kdj_k, kdj_d, kdj_j = kdj
+
+    volume_ratio = None
+    if size >= 5:
+        vol_ma5 = _sma_last(vols, 5)
+        volume_ratio = round(float(vols[-1]) / vol_ma5, 4) if vol_ma5 > 0 else None
+
+    lookback = min(20, size)
+    recent_highs = highs[-lookback:]
+    recent_lows = lows[-lookback:]
+
+    vwap_val = _vwap(highs, lows, closes, vols, 20 if size >= 20 else 0)
+    if vwap_val is not None and vwap_val != 0:
+        if current > vwap_val:
+            price_vs_vwap_status = "上方"
+        elif current < vwap_val:
+            price_vs_vwap_status = "下方"
+        else:
+            price_vs_vwap_status = "持平"
+    else:
+        price_vs_vwap_status = ""
+
+    bb_upper, bb_lower, bb_middle, bb_bandwidth = _bollinger(closes, 20, 2.0)
+
+    return TechnicalIndicatorsSnapshot(
+        current_price=round(current, 4),
+        change_percent=round(float(last_pct_chg), 2),
+        ma5=ma_or_fallback(5),
+        ma10=ma_or_fallback(10),
+        ma20=ma_or_fallback(20),
+        ma30=ma_or_fallback(30),
+        ma60=ma60,
+        ma120=ma120,
+        ma200=ma200,
+        rsi_value=round(rsi_val, 2) if rsi_val is not None else None,
+        macd_dif=macd_dif,
+        macd_dea=macd_dea,
+        macd_histogram=macd_hist,
+        kdj_k=kdj_k,
+        kdj_d=kdj_d,
+        kdj_j=kdj_j,
+        adx_value=adx_value,
+        volume_ratio=volume_ratio,
+        obv_trend=obv_trend,
+        vwap_value=vwap_val,
+        price_vs_vwap_status=price_vs_vwap_status,
+        bb_upper=bb_upper,
+        bb_lower=bb_lower,
+        bb_middle=bb_middle,
+        bb_bandwidth=bb_bandwidth,
+        atr_value=atr_value,
+        high_20d=round(float(recent_highs.max()), 4),
+        low_20d=round(float(recent_lows.min()), 4),
+        calculated_support_levels=np.unique(recent_lows)[:3].tolist(),
+        calculated_resistance_levels=np.unique(recent_highs)[::-1][:3].tolist(),
+        detected_patterns=[],
+    )
+
+
+def compute_technical_indicators_vectorized(
+    bars: List[DailyBarInput],
+) -> TechnicalIndicatorsSnapshot:
+    """基于日线序列计算全量技术指标（向量化实现，口径同 calculator.compute_technical_indicators）。"""
+    if not bars:
+        return TechnicalIndicatorsSnapshot()
+    size = len(bars)
+    return compute_indicators_from_arrays(
+        highs=np.fromiter((b.high for b in bars), dtype=np.float64, count=size),
+        lows=np.fromiter((b.low for b in bars), dtype=np.float64, count=size),
+        closes=np.fromiter((b.close for b in bars), dtype=np.float64, count=size),
+        vols=np.fromiter((b.vol for b in bars), dtype=np.float64, count=size),
+        last_pct_chg=bars[-1].pct_chg,
+    )
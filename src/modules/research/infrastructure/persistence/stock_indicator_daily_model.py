@@ -0,0 +1,59 @@
+"""
+技术指标日快照 ORM 模型，对应表 stock_indicator_daily。
+每行为某标的某交易日的 TechnicalIndicatorsSnapshot（字段同名），由批量任务写入。
+"""
+
+from datetime import datetime
+
+from sqlalchemy import Column, Date, DateTime, Float, Index, String
+from sqlalchemy.dialects.postgresql import JSONB
+
+from src.shared.infrastructure.db.base import Base
+
+
+class StockIndicatorDailyModel(Base):
+    """技术指标日快照表。"""
+
+    __tablename__ = "stock_indicator_daily"
+
+    third_code = Column(String(20), primary_key=True, comment="股票代码")
+    trade_date = Column(Date, primary_key=True, comment="交易日期")
+
+    current_price = Column(Float, nullable=False, comment="收盘价")
+    change_percent = Column(Float, nullable=False, comment="日涨跌幅（%）")
+    ma5 = Column(Float, nullable=False)
+    ma10 = Column(Float, nullable=False)
+    ma20 = Column(Float, nullable=False)
+    ma30 = Column(Float, nullable=False)
+    ma60 = Column(Float, nullable=False)
+    ma120 = Column(Float, nullable=False)
+    ma200 = Column(Float, nullable=False)
+    rsi_value = Column(Float, nullable=True)
+    macd_dif = Column(Float, nullable=True)
+    macd_dea = Column(Float, nullable=True)
+    macd_histogram = Column(Float, nullable=True)
+    kdj_k = Column(Float, nullable=True)
+    kdj_d = Column(Float, nullable=True)
+    kdj_j = Column(Float, nullable=True)
+    adx_value = Column(Float, nullable=True)
+    volume_ratio = Column(Float, nullable=True)
+    obv_trend = Column(String(10), nullable=False, default="")
+    vwap_value = Column(Float, nullable=True)
+    price_vs_vwap_status = Column(String(10), nullable=False, default="")
+    bb_upper = Column(Float, nullable=True)
+    bb_lower = Column(Float, nullable=True)
+    bb_middle = Column(Float, nullable=True)
+    bb_bandwidth = Column(Float, nullable=True)
+    atr_value = Column(Float, nullable=True)
+    high_20d = Column(Float, nullable=False)
+    low_20d = Column(Float, nullable=False)
+    calculated_support_levels = Column(JSONB, nullable=False, default=list)
+    calculated_resistance_levels = Column(JSONB, nullable=False, default=list)
+    detected_patterns = Column(JSONB, nullable=False, default=list)
+
+    computed_at = Column(DateTime, nullable=False, default=datetime.now, comment="计算时间")
+
+    __table_args__ = (
+        # 主键以 third_code 开头，按交易日读取全市场截面（条件选股）需单独的 trade_date 索引
+        Index("ix_stock_indicator_daily_trade_date", "trade_date"),
+    )
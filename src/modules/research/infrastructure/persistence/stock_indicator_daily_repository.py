@@ -0,0 +1,86 @@
+"""
+技术指标日快照 PostgreSQL 仓储实现。
+"""
+
+from datetime import date, datetime
+from typing import Dict, Optional
+
+import numpy as np
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.modules.research.domain.dtos.indicator_cross_section import (
+    IndicatorCrossSection,
+)
+from src.modules.research.domain.dtos.indicators_snapshot import (
+    TechnicalIndicatorsSnapshot,
+)
+from src.modules.research.domain.ports.indicator_snapshot_repository import (
+    IIndicatorSnapshotRepository,
+)
+from src.modules.research.infrastructure.persistence.stock_indicator_daily_model import (
+    StockIndicatorDailyModel,
+)
+from src.shared.infrastructure.base_repository import BaseRepository
+
+_SNAPSHOT_FIELDS = tuple(TechnicalIndicatorsSnapshot.model_fields)
+# 截面选股使用的标量字段：数值列与文本列（列表字段不参与）
+_TEXT_FIELDS = ("obv_trend", "price_vs_vwap_status")
+_NUMERIC_FIELDS = tuple(
+    name
+    for name, info in TechnicalIndicatorsSnapshot.model_fields.items()
+    if name not in _TEXT_FIELDS and not name.startswith(("calculated_", "detected_"))
+)
+
+
+class PgIndicatorSnapshotRepository(
+    BaseRepository[StockIndicatorDailyModel], IIndicatorSnapshotRepository
+):
+    """stock_indicator_daily 表读写：主键 (third_code, trade_date) 单行读取，trade_date 索引读取截面。"""
+
+    def __init__(self, session: AsyncSession):
+        super().__init__(StockIndicatorDailyModel, session)
+
+    async def get(self, ticker: str, trade_date: date) -> Optional[TechnicalIndicatorsSnapshot]:
+        stmt = select(*(getattr(StockIndicatorDailyModel, f) for f in _SNAPSHOT_FIELDS)).where(
+            StockIndicatorDailyModel.third_code == ticker,
+            StockIndicatorDailyModel.trade_date == trade_date,
+        )
+        row = (await self.session.execute(stmt)).first()
+        if row is None:
+            return None
+        return TechnicalIndicatorsSnapshot.model_validate(row._asdict())
+
+    async def save_all(
+        self, trade_date: date, snapshots: Dict[str, TechnicalIndicatorsSnapshot]
+    ) -> int:
+        computed_at = datetime.now()
+        items = [
+            {
+                "third_code": ticker,
+                "trade_date": trade_date,
+                "computed_at": computed_at,
+                **snapshot.model_dump(),
+            }
+            for ticker, snapshot in snapshots.items()
+        ]
+        # 全市场约 5 千行 × 30+ 列，多行 INSERT 会超出单语句绑定参数上限，固定走 COPY 暂存表写入
+        return await self.upsert_all(items, unique_fields=["third_code", "trade_date"], bulk=True)
+
+    async def get_cross_section(self, trade_date: date) -> IndicatorCrossSection:
+        columns = ("third_code",) + _NUMERIC_FIELDS + _TEXT_FIELDS
+        stmt = (
+            select(*(getattr(StockIndicatorDailyModel, c) for c in columns))
+            .where(StockIndicatorDailyModel.trade_date == trade_date)
+            .order_by(StockIndicatorDailyModel.third_code)
+        )
+        rows = (await self.session.execute(stmt)).all()
+        values = list(zip(*rows)) if rows else [()] * len(columns)
+        data = dict(zip(columns, values))
+        return IndicatorCrossSection(
+            trade_date=trade_date,
+            tickers=np.asarray(data["third_code"], dtype=object),
+            # None 转为 NaN：比较运算对缺失值恒为 False
+            numeric={f: np.asarray(data[f], dtype=np.float64) for f in _NUMERIC_FIELDS},
+            text={f: np.asarray(data[f], dtype=object) for f in _TEXT_FIELDS},
+        )
@@ -0,0 +1,24 @@
+"""
+增量指标状态 ORM 模型，对应表 stock_indicator_state。
+每个标的一行，state 为 IndicatorState 的 JSON，批量任务每个交易日推进后覆盖写入。
+"""
+
+from datetime import datetime
+
+from sqlalchemy import Column, Date, DateTime, Integer, String
+from sqlalchemy.dialects.postgresql import JSONB
+
+from src.shared.infrastructure.db.base import Base
+
+
+class StockIndicatorStateModel(Base):
+    """增量指标状态表。"""
+
+    __tablename__ = "stock_indicator_state"
+
+    third_code = Column(String(20), primary_key=True, comment="股票代码")
+    start_date = Column(Date, nullable=False, comment="状态起始交易日")
+    last_trade_date = Column(Date, nullable=False, comment="最后推进的交易日")
+    bar_count = Column(Integer, nullable=False, comment="已消费的 K 线数")
+    state = Column(JSONB, nullable=False, comment="IndicatorState JSON")
+    updated_at = Column(DateTime, nullable=False, default=datetime.now, comment="更新时间")
@@ -0,0 +1,53 @@
+"""
+增量指标状态 PostgreSQL 仓储实现。
+"""
+
+from datetime import datetime
+from typing import Dict, List
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.modules.research.domain.dtos.indicator_state import IndicatorState
+from src.modules.research.domain.ports.indicator_state_repository import (
+    IIndicatorStateRepository,
+)
+from src.modules.research.infrastructure.persistence.stock_indicator_state_model import (
+    StockIndicatorStateModel,
+)
+from src.shared.infrastructure.base_repository import BaseRepository
+
+
+class PgIndicatorStateRepository(
+    BaseRepository[StockIndicatorStateModel], IIndicatorStateRepository
+):
+    """stock_indicator_state 表读写，主键 third_code。"""
+
+    def __init__(self, session: AsyncSession):
+        super().__init__(StockIndicatorStateModel, session)
+
+    async def get_many(self, tickers: List[str]) -> Dict[str, IndicatorState]:
+        if not tickers:
+            return {}
+        stmt = select(StockIndicatorStateModel.third_code, StockIndicatorStateModel.state).where(
+            StockIndicatorStateModel.third_code.in_(tickers)
+        )
+        rows = (await self.session.execute(stmt)).all()
+        return {code: IndicatorState.model_validate(state) for code, state in rows}
+
+    async def save_all(self, states: Dict[str, IndicatorState]) -> int:
+        updated_at = datetime.now()
+        items = [
+            {
+                "third_code": ticker,
+                "start_date": state.start_date,
+                "last_trade_date": state.last_trade_date,
+                "bar_count": state.size,
+                "state": state.model_dump(mode="json"),
+                "updated_at": updated_at,
+            }
+            for ticker, state in states.items()
+            if state.size
+        ]
+        # 每行状态含约 300 个浮点的 JSON，整批走 COPY 暂存表写入
+        return await self.upsert_all(items, unique_fields=["third_code"], bulk=True)
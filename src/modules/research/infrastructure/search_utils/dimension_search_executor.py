@@ -0,0 +1,143 @@
+"""
+多维度并发搜索执行器。
+
+宏观情报员、催化剂侦探按 SearchDimensionConfig 列表对多个维度发起 Web 搜索。各维度同时发起
+（博查 API 的并发与速率由 llm_platform 侧的全进程调用预算约束），整体耗时约等于最慢的单个维度：
+- 失败隔离：单个维度搜索失败只让该维度返回空结果，不影响其他维度；
+- 整体时限：超过 deadline_seconds 仍未返回的维度被取消并返回空结果；
+- 耗时报告：每个维度的结果带有状态与耗时，执行结束后汇总记录一条日志。
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any, List, Optional, Sequence
+
+from src.modules.llm_platform.application.services.web_search_service import (
+    WebSearchService,
+)
+from src.modules.llm_platform.domain.web_search_dtos import (
+    WebSearchRequest,
+    WebSearchResultItem,
+)
+from src.modules.research.domain.dtos.search_dimension_config import (
+    SearchDimensionConfig,
+)
+from src.modules.research.infrastructure.search_utils.result_filter import (
+    SearchResultFilter,
+)
+
+logger = logging.getLogger(__name__)
+
+# 全部维度搜索的整体时限（秒）：单次博查调用超时为 30 秒，另留排队余量
+DIMENSION_SEARCH_DEADLINE_SECONDS = 45.0
+
+
+@dataclass
+class DimensionSearchOutcome:
+    """
+    单个维度的搜索结果。
+
+    Attributes:
+        topic: 维度主题
+        query: 填充占位符后的查询词
+        items: 过滤排序后的搜索结果（失败或超时为空）
+        status: success / failed / timeout
+        latency_ms: 该维度耗时（毫秒，超时维度为整体时限）
+        error: 失败原因
+    """
+
+    topic: str
+    query: str
+    items: List[WebSearchResultItem] = field(default_factory=list)
+    status: str = "success"
+    latency_ms: int = 0
+    error: Optional[str] = None
+
+
+class DimensionSearchExecutor:
+    """并发执行多个维度的 Web 搜索，结果顺序与维度配置一致。"""
+
+    def __init__(
+        self,
+        web_search_service: WebSearchService,
+        result_filter: SearchResultFilter,
+        deadline_seconds: float = DIMENSION_SEARCH_DEADLINE_SECONDS,
+    ):
+        self._web_search_service = web_search_service
+        self._result_filter = result_filter
+        self._deadline_seconds = deadline_seconds
+
+    async def run(
+        self, dimensions: Sequence[SearchDimensionConfig], **placeholders: Any
+    ) -> List[DimensionSearchOutcome]:
+        """
+        并发搜索所有维度。
+
+        Args:
+            dimensions: 维度配置列表
+            **placeholders: 查询模板占位符取值（如 industry、stock_name、current_year）
+
+        Returns:
+            List[DimensionSearchOutcome]: 与 dimensions 同序的各维度结果
+        """
+        outcomes = [
+            DimensionSearchOutcome(
+                topic=config.topic, query=config.query_template.format(**placeholders)
+            )
+            for config in dimensions
+        ]
+        tasks = [
+            asyncio.create_task(self._search(config, outcome))
+            for config, outcome in zip(dimensions, outcomes)
+        ]
+        if not tasks:
+            return outcomes
+
+        _, pending = await asyncio.wait(tasks, timeout=self._deadline_seconds)
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+
+        for task, outcome in zip(tasks, outcomes):
+            if task in pending:
+                outcome.items = []
+                outcome.status = "timeout"
+                outcome.latency_ms = int(self._deadline_seconds * 1000)
+                logger.warning(
+                    f"维度 {outcome.topic} 搜索超过整体时限 {self._deadline_seconds}s，返回空结果"
+                )
+
+        logger.info(
+            "多维度搜索完成："
+            + "，".join(f"{o.topic}={o.status}/{o.latency_ms}ms/{len(o.items)}条" for o in outcomes)
+        )
+        return outcomes
+
+    async def _search(self, config: SearchDimensionConfig, outcome: DimensionSearchOutcome) -> None:
+        started = time.monotonic()
+        try:
+            response = await self._web_search_service.search(
+                WebSearchRequest(
+                    query=outcome.query,
+                    freshness=config.freshness,
+                    summary=True,
+                    count=config.count,
+                )
+            )
+            outcome.items = self._result_filter.filter_and_sort(response.results)
+            logger.info(
+                f"维度 {outcome.topic} 过滤统计："
+                f"过滤前={len(response.results)}，过滤后={len(outcome.items)}"
+            )
+        except Exception as e:
+            outcome.status = "failed"
+            outcome.error = f"{type(e).__name__}: {e}"
+            logger.warning(
+                f"维度 {outcome.topic} 搜索失败（类型={type(e).__name__}，错误={e}），"
+                f"查询={outcome.query}，该维度返回空结果"
+            )
+        finally:
+            outcome.latency_ms = int((time.monotonic() - started) * 1000)
@@ -0,0 +1,92 @@
+"""
+研究会话级共享数据：键定义与预取。
+
+一次完整研究中多个专家读取相同的只读数据：估值建模师、宏观情报员、催化剂侦探都需要股票基础信息，
+财务审计员与估值建模师都需要最近 N 期财务指标。各数据 Adapter 经 load_in_session 按下列键读取，
+同一会话内只查询一次；Coordinator 在专家并行执行前调用 ResearchDataPrefetcher 并发预取。
+无会话数据上下文时（单独调用专家接口）Adapter 直接查询，行为不变。
+"""
+
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Hashable, Iterable, List
+
+from src.shared.infrastructure.execution_context import current_execution_ctx
+
+logger = logging.getLogger(__name__)
+
+
+def stock_basic_info_key(symbol: str) -> Hashable:
+    """股票基础信息（GetStockBasicInfoUseCase）的会话数据键。"""
+    return ("stock_basic_info", symbol)
+
+
+def finance_key(ticker: str, limit: int) -> Hashable:
+    """最近 limit 期财务指标（GetFinanceForTickerUseCase）的会话数据键。"""
+    return ("finance_for_ticker", ticker, limit)
+
+
+class ResearchDataPrefetcher:
+    """
+    并发预取会话内多个专家共用的数据，写入当前执行上下文的会话数据上下文。
+
+    每项读取使用独立 AsyncSession（会话不支持并发语句）；单项失败只记录日志，
+    对应专家执行时再自行查询。
+    """
+
+    def __init__(self, session_factory: Any) -> None:
+        """
+        Args:
+            session_factory: 异步会话工厂，如 AsyncSessionLocal
+        """
+        self._session_factory = session_factory
+
+    async def prefetch(
+        self,
+        symbol: str,
+        stock_basic_info: bool = False,
+        finance_limits: Iterable[int] = (),
+    ) -> None:
+        """
+        Args:
+            symbol: 股票代码
+            stock_basic_info: 是否预取股票基础信息
+            finance_limits: 需要预取的财务指标期数
+        """
+        ctx = current_execution_ctx.get()
+        if ctx is None or ctx.data is None:
+            return
+
+        loads: List[Awaitable[Any]] = []
+        if stock_basic_info:
+            loads.append(
+                ctx.data.get_or_load(
+                    stock_basic_info_key(symbol),
+                    lambda: self._query(
+                        lambda de: de.get_stock_basic_info_use_case().execute(symbol)
+                    ),
+                )
+            )
+        for limit in sorted(set(finance_limits)):
+            loads.append(
+                ctx.data.get_or_load(
+                    finance_key(symbol, limit),
+                    lambda limit=limit: self._query(
+                        lambda de: de.get_finance_use_case().execute(ticker=symbol, limit=limit)
+                    ),
+                )
+            )
+        if not loads:
+            return
+
+        for result in await asyncio.gather(*loads, return_exceptions=True):
+            if isinstance(result, Exception):
+                logger.warning(
+                    f"研究数据预取失败，相关专家将自行查询：symbol={symbol}，错误={result}"
+                )
+
+    async def _query(self, query: Callable[[Any], Awaitable[Any]]) -> Any:
+        from src.modules.data_engineering.container import DataEngineeringContainer
+
+        async with self._session_factory() as session:
+            return await query(DataEngineeringContainer(session))
@@ -0,0 +1,20 @@
+"""技术指标批量计算定时任务。"""
+
+from datetime import date, datetime
+
+from src.modules.research.container import ResearchContainer
+from src.shared.infrastructure.db.session import AsyncSessionLocal
+
+
+async def compute_stock_indicators_job(target_date: str | None = None, verify: bool = False):
+    """
+    定时任务：按交易日增量推进全市场指标状态，快照写入 stock_indicator_daily（日线同步完成后执行）。
+
+    Args:
+        target_date: 目标交易日 (YYYYMMDD)，默认为当天
+        verify: 校验模式，增量结果与全量重算逐字段比对，不一致时任务失败
+    """
+    trade_date = datetime.strptime(target_date, "%Y%m%d").date() if target_date else date.today()
+    async with AsyncSessionLocal() as session:
+        service = ResearchContainer(session).indicator_batch_service()
+        await service.run(trade_date, verify=verify)
@@ -18,6 +18,7 @@ from src.modules.research.domain.exceptions import LLMOutputParseError
 from src.shared.domain.exceptions import BadRequestException
 from src.shared.dtos import BaseResponse
 from src.shared.infrastructure.db.session import get_db_session
+from src.shared.infrastructure.llm_stream import stream_llm_run
 
 logger = logging.getLogger(__name__)
 
@@ -62,32 +63,7 @@ async def get_catalyst_detective_analysis(
     service: CatalystDetectiveService = Depends(get_catalyst_detective_service),
 ):
     try:
-        result_dict = await service.run(symbol)
-        dto = result_dict["result"]
-        context = result_dict["catalyst_context"]
-        indicators_json = json.dumps(context, ensure_ascii=False)
-
-        return BaseResponse(
-            success=True,
-            code="CATALYST_DETECTIVE_SUCCESS",
-            message="催化剂侦探分析成功完成",
-            data=CatalystDetectiveApiResponse(
-                stock_name=context["stock_name"],
-                symbol=symbol,
-                catalyst_assessment=dto["catalyst_assessment"],
-                confidence_score=dto["confidence_score"],
-                catalyst_summary=dto["catalyst_summary"],
-                dimension_analyses=[
-                    CatalystDimensionAnalysis(**x) for x in dto["dimension_analyses"]
-                ],
-                positive_catalysts=[CatalystEvent(**x) for x in dto["positive_catalysts"]],
-                negative_catalysts=[CatalystEvent(**x) for x in dto["negative_catalysts"]],
-                information_sources=dto["information_sources"],
-                input=result_dict["user_prompt"],
-                output=result_dict["raw_llm_output"],
-                catalyst_indicators=indicators_json,
-            ),
-        )
+        return await _catalyst_detective(symbol, service)
 
     except BadRequestException as e:
         logger.warning("催化剂侦探请求错误：symbol=%s，错误=%s", symbol, e)
@@ -98,3 +74,41 @@ async def get_catalyst_detective_analysis(
     except Exception:
         logger.exception(f"Unexpected error in catalyst detective for {symbol}")
         raise HTTPException(status_code=500, detail="Internal server error")
+
+
+@router.get("/catalyst-detective/stream")
+async def get_catalyst_detective_analysis_stream(
+    symbol: str,
+    service: CatalystDetectiveService = Depends(get_catalyst_detective_service),
+):
+    """流式运行催化剂侦探（SSE：delta 为大模型增量输出，result 为与非流式接口相同的响应体）。"""
+    return await stream_llm_run(lambda: _catalyst_detective(symbol, service))
+
+
+async def _catalyst_detective(
+    symbol: str, service: CatalystDetectiveService
+) -> BaseResponse[CatalystDetectiveApiResponse]:
+    result_dict = await service.run(symbol)
+    dto = result_dict["result"]
+    context = result_dict["catalyst_context"]
+    indicators_json = json.dumps(context, ensure_ascii=False)
+
+    return BaseResponse(
+        success=True,
+        code="CATALYST_DETECTIVE_SUCCESS",
+        message="催化剂侦探分析成功完成",
+        data=CatalystDetectiveApiResponse(
+            stock_name=context["stock_name"],
+            symbol=symbol,
+            catalyst_assessment=dto["catalyst_assessment"],
+            confidence_score=dto["confidence_score"],
+            catalyst_summary=dto["catalyst_summary"],
+            dimension_analyses=[CatalystDimensionAnalysis(**x) for x in dto["dimension_analyses"]],
+            positive_catalysts=[CatalystEvent(**x) for x in dto["positive_catalysts"]],
+            negative_catalysts=[CatalystEvent(**x) for x in dto["negative_catalysts"]],
+            information_sources=dto["information_sources"],
+            input=result_dict["user_prompt"],
+            output=result_dict["raw_llm_output"],
+            catalyst_indicators=indicators_json,
+        ),
+    )
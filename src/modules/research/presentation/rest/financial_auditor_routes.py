@@ -18,6 +18,7 @@ from src.modules.research.domain.exceptions import LLMOutputParseError
 from src.shared.domain.exceptions import BadRequestException
 from src.shared.dtos import BaseResponse
 from src.shared.infrastructure.db.session import get_db_session
+from src.shared.infrastructure.llm_stream import stream_llm_run
 
 router = APIRouter()
 
@@ -67,13 +68,7 @@ async def run_financial_audit(
     对单个标的运行财务审计；响应体包含解析结果及 input、financial_indicators、output（由代码填入）。
     """
     try:
-        result = await service.run(symbol=symbol.strip(), limit=limit)
-        return BaseResponse(
-            success=True,
-            code="FINANCIAL_AUDIT_SUCCESS",
-            message="财务审计成功完成",
-            data=FinancialAuditApiResponse(**result),
-        )
+        return await _financial_audit(symbol, limit, service)
     except BadRequestException as e:
         raise HTTPException(status_code=400, detail=e.message)
     except LLMOutputParseError as e:
@@ -82,3 +77,29 @@ async def run_financial_audit(
     except Exception as e:
         logger.exception("财务审计执行异常: {}", str(e))
         raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get(
+    "/financial-audit/stream",
+    summary="对指定股票进行财务审计（流式）",
+    description="参数同 /financial-audit，以 SSE 返回：delta 为大模型增量输出，result 为与非流式接口相同的响应体。",
+)
+async def run_financial_audit_stream(
+    symbol: str = Query(..., description="股票代码，如 000001.SZ"),
+    limit: int = Query(5, ge=1, le=20, description="取最近几期财务数据，默认 5 期"),
+    service: FinancialAuditorService = Depends(get_financial_auditor_service),
+):
+    """流式运行财务审计；首个增量产出前的错误仍以 HTTP 状态码返回。"""
+    return await stream_llm_run(lambda: _financial_audit(symbol, limit, service))
+
+
+async def _financial_audit(
+    symbol: str, limit: int, service: FinancialAuditorService
+) -> BaseResponse[FinancialAuditApiResponse]:
+    result = await service.run(symbol=symbol.strip(), limit=limit)
+    return BaseResponse(
+        success=True,
+        code="FINANCIAL_AUDIT_SUCCESS",
+        message="财务审计成功完成",
+        data=FinancialAuditApiResponse(**result),
+    )
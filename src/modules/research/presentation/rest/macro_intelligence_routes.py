@@ -19,6 +19,7 @@ from src.modules.research.domain.exceptions import LLMOutputParseError
 from src.shared.domain.exceptions import BadRequestException
 from src.shared.dtos import BaseResponse
 from src.shared.infrastructure.db.session import get_db_session
+from src.shared.infrastructure.llm_stream import stream_llm_run
 
 router = APIRouter()
 
@@ -102,13 +103,7 @@ async def run_macro_intelligence(
         HTTPException 500: 其他未预期异常
     """
     try:
-        result = await service.run(symbol=symbol.strip())
-        return BaseResponse(
-            success=True,
-            code="MACRO_INTELLIGENCE_SUCCESS",
-            message="宏观情报分析成功完成",
-            data=MacroIntelligenceApiResponse(**result),
-        )
+        return await _macro_intelligence(symbol, service)
     except BadRequestException as e:
         logger.warning("宏观情报分析请求错误: {}", e.message)
         raise HTTPException(status_code=400, detail=e.message)
@@ -118,3 +113,28 @@ async def run_macro_intelligence(
     except Exception as e:
         logger.exception("宏观情报分析执行异常: {}", str(e))
         raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get(
+    "/macro-intelligence/stream",
+    summary="对指定股票进行宏观情报分析（流式）",
+    description="参数同 /macro-intelligence，以 SSE 返回：delta 为大模型增量输出，result 为与非流式接口相同的响应体。",
+)
+async def run_macro_intelligence_stream(
+    symbol: str = Query(..., description="股票代码，如 000001.SZ"),
+    service: MacroIntelligenceService = Depends(get_macro_intelligence_service),
+):
+    """流式运行宏观情报分析；首个增量产出前的错误（含宏观搜索全部失败）仍以 HTTP 状态码返回。"""
+    return await stream_llm_run(lambda: _macro_intelligence(symbol, service))
+
+
+async def _macro_intelligence(
+    symbol: str, service: MacroIntelligenceService
+) -> BaseResponse[MacroIntelligenceApiResponse]:
+    result = await service.run(symbol=symbol.strip())
+    return BaseResponse(
+        success=True,
+        code="MACRO_INTELLIGENCE_SUCCESS",
+        message="宏观情报分析成功完成",
+        data=MacroIntelligenceApiResponse(**result),
+    )
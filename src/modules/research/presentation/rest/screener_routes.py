@@ -0,0 +1,70 @@
+"""
+条件选股 REST 接口。
+按交易日对全市场已预计算的技术指标截面执行筛选表达式，不调用大模型。
+"""
+
+from datetime import date
+from typing import Literal, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from loguru import logger
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.modules.research.application.indicator_screener_service import (
+    IndicatorScreenerService,
+)
+from src.modules.research.container import ResearchContainer
+from src.modules.research.domain.dtos.screener_dtos import ScreenerResult
+from src.shared.domain.exceptions import BadRequestException
+from src.shared.dtos import BaseResponse
+from src.shared.infrastructure.db.session import get_db_session
+
+router = APIRouter()
+
+
+async def get_indicator_screener_service(
+    db: AsyncSession = Depends(get_db_session),
+) -> IndicatorScreenerService:
+    """通过 Research 模块 Composition Root 获取条件选股服务。"""
+    return ResearchContainer(db).indicator_screener_service()
+
+
+@router.get(
+    "/screener",
+    response_model=BaseResponse[ScreenerResult],
+    summary="按技术指标条件筛选全市场股票",
+    description=(
+        "对指定交易日全市场技术指标截面执行筛选表达式并排序，"
+        "例如 `rsi_value < 30 and current_price > ma200`。指标来自夜间批量任务，不调用大模型。"
+    ),
+)
+async def screen_stocks(
+    filter: str = Query(..., description="筛选表达式，子句以 and 连接"),
+    trade_date: Optional[str] = Query(None, description="交易日，YYYY-MM-DD；不传则使用当前日期"),
+    sort_by: Optional[str] = Query(None, description="排序的数值指标字段，不传则按代码排序"),
+    order: Literal["asc", "desc"] = Query("desc", description="排序方向"),
+    limit: int = Query(50, ge=1, le=1000, description="返回条数上限"),
+    service: IndicatorScreenerService = Depends(get_indicator_screener_service),
+) -> BaseResponse[ScreenerResult]:
+    try:
+        date_obj = date.fromisoformat(trade_date) if trade_date else date.today()
+        result = await service.screen(
+            trade_date=date_obj,
+            expression=filter,
+            sort_by=sort_by,
+            descending=order == "desc",
+            limit=limit,
+        )
+        return BaseResponse(
+            success=True,
+            code="SCREENER_SUCCESS",
+            message=f"命中 {result.matched} / {result.universe} 只股票",
+            data=result,
+        )
+    except ValueError:
+        raise HTTPException(status_code=400, detail="trade_date 格式应为 YYYY-MM-DD")
+    except BadRequestException as e:
+        raise HTTPException(status_code=400, detail=e.message)
+    except Exception as e:
+        logger.exception("条件选股执行异常: {}", str(e))
+        raise HTTPException(status_code=500, detail=str(e))
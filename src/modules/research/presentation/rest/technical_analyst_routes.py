@@ -19,6 +19,7 @@ from src.modules.research.domain.exceptions import LLMOutputParseError
 from src.shared.domain.exceptions import BadRequestException
 from src.shared.dtos import BaseResponse
 from src.shared.infrastructure.db.session import get_db_session
+from src.shared.infrastructure.llm_stream import stream_llm_run
 
 router = APIRouter()
 
@@ -66,14 +67,7 @@ async def run_technical_analysis(
     对单个标的运行技术分析；响应体包含解析结果及 input、technical_indicators、output（由代码填入）。
     """
     try:
-        date_obj = date.fromisoformat(analysis_date) if analysis_date else date.today()
-        result = await service.run(ticker=ticker.strip(), analysis_date=date_obj)
-        return BaseResponse(
-            success=True,
-            code="TECHNICAL_ANALYSIS_SUCCESS",
-            message="技术分析成功完成",
-            data=TechnicalAnalysisApiResponse(**result),
-        )
+        return await _technical_analysis(ticker, analysis_date, service)
     except BadRequestException as e:
         raise HTTPException(status_code=400, detail=e.message)
     except LLMOutputParseError as e:
@@ -82,3 +76,33 @@ async def run_technical_analysis(
     except Exception as e:
         logger.exception("技术分析执行异常: {}", str(e))
         raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get(
+    "/technical-analysis/stream",
+    summary="对指定股票进行技术分析（流式）",
+    description="参数同 /technical-analysis，以 SSE 返回：delta 为大模型增量输出，result 为与非流式接口相同的响应体。",
+)
+async def run_technical_analysis_stream(
+    ticker: str = Query(..., description="股票代码，如 000001.SZ"),
+    analysis_date: Optional[str] = Query(
+        None,
+        description="分析基准日，YYYY-MM-DD；不传则使用当前日期",
+    ),
+    service: TechnicalAnalystService = Depends(get_technical_analyst_service),
+):
+    """流式运行技术分析；首个增量产出前的错误仍以 HTTP 状态码返回。"""
+    return await stream_llm_run(lambda: _technical_analysis(ticker, analysis_date, service))
+
+
+async def _technical_analysis(
+    ticker: str, analysis_date: Optional[str], service: TechnicalAnalystService
+) -> BaseResponse[TechnicalAnalysisApiResponse]:
+    date_obj = date.fromisoformat(analysis_date) if analysis_date else date.today()
+    result = await service.run(ticker=ticker.strip(), analysis_date=date_obj)
+    return BaseResponse(
+        success=True,
+        code="TECHNICAL_ANALYSIS_SUCCESS",
+        message="技术分析成功完成",
+        data=TechnicalAnalysisApiResponse(**result),
+    )
@@ -18,6 +18,7 @@ from src.modules.research.domain.exceptions import LLMOutputParseError
 from src.shared.domain.exceptions import BadRequestException
 from src.shared.dtos import BaseResponse
 from src.shared.infrastructure.db.session import get_db_session
+from src.shared.infrastructure.llm_stream import stream_llm_run
 
 router = APIRouter()
 
@@ -69,13 +70,7 @@ async def run_valuation_model(
     对单个标的运行估值建模；响应体包含解析结果及 input、valuation_indicators、output（由代码填入）。
     """
     try:
-        result = await service.run(symbol=symbol.strip())
-        return BaseResponse(
-            success=True,
-            code="VALUATION_MODEL_SUCCESS",
-            message="估值建模成功完成",
-            data=ValuationModelApiResponse(**result),
-        )
+        return await _valuation_model(symbol, service)
     except BadRequestException as e:
         raise HTTPException(status_code=400, detail=e.message)
     except LLMOutputParseError as e:
@@ -84,3 +79,28 @@ async def run_valuation_model(
     except Exception as e:
         logger.exception("估值建模执行异常: {}", str(e))
         raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get(
+    "/valuation-model/stream",
+    summary="对指定股票进行估值建模（流式）",
+    description="参数同 /valuation-model，以 SSE 返回：delta 为大模型增量输出，result 为与非流式接口相同的响应体。",
+)
+async def run_valuation_model_stream(
+    symbol: str = Query(..., description="股票代码，如 000001.SZ"),
+    service: ValuationModelerService = Depends(get_valuation_modeler_service),
+):
+    """流式运行估值建模；首个增量产出前的错误仍以 HTTP 状态码返回。"""
+    return await stream_llm_run(lambda: _valuation_model(symbol, service))
+
+
+async def _valuation_model(
+    symbol: str, service: ValuationModelerService
+) -> BaseResponse[ValuationModelApiResponse]:
+    result = await service.run(symbol=symbol.strip())
+    return BaseResponse(
+        success=True,
+        code="VALUATION_MODEL_SUCCESS",
+        message="估值建模成功完成",
+        data=ValuationModelApiResponse(**result),
+    )
@@ -57,6 +57,13 @@ class Settings(BaseSettings):
             path=f"{values.get('POSTGRES_DB') or ''}",
         ).unicode_string()
 
+    # 调用审计日志异步批量写入：开关、每批条数、最长攒批毫秒、队列上限、队列满时策略（drop / block）
+    AUDIT_LOG_ASYNC_ENABLED: bool = True
+    AUDIT_LOG_BATCH_SIZE: int = 100
+    AUDIT_LOG_FLUSH_INTERVAL_MS: int = 500
+    AUDIT_LOG_QUEUE_SIZE: int = 10000
+    AUDIT_LOG_OVERFLOW: str = "drop"
+
     class Config:
         case_sensitive = True
         env_file = ".env"
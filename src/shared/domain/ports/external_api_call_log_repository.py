@@ -20,6 +20,11 @@ class IExternalAPICallLogRepository(ABC):
         """持久化单条调用日志。"""
         ...
 
+    async def save_many(self, logs: list[ExternalAPICallLog]) -> None:
+        """批量持久化调用日志（一次提交）；默认逐条 save。"""
+        for log in logs:
+            await self.save(log)
+
     @abstractmethod
     async def get_by_session_id(self, session_id: UUID) -> list[ExternalAPICallLog]:
         """按 session_id 查询调用日志，按 created_at 升序。"""
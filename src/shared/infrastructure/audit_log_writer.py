@@ -0,0 +1,164 @@
+"""
+异步批量审计日志写入器。
+
+调用日志（LLM 调用、外部 API 调用）不再在请求路径上逐条 insert + commit：写入方把记录放入
+进程内有界队列后立即返回，后台任务每攒满 batch_size 条或距批次首条超过 flush_interval_ms
+时，用独立会话整批写入。
+
+队列满时按 overflow 策略处理：drop 丢弃新记录并计数（默认，审计日志不拖慢业务请求）；
+block 让写入方等待队列腾出空间（背压）。应用关闭时由 close_audit_log_writers 刷出剩余记录。
+"""
+
+import asyncio
+from typing import Awaitable, Callable, Dict, Generic, List, Optional, TypeVar
+
+from loguru import logger
+
+from src.shared.config import settings
+
+T = TypeVar("T")
+
+OVERFLOW_DROP = "drop"
+OVERFLOW_BLOCK = "block"
+
+
+class AuditLogWriter(Generic[T]):
+    """有界队列 + 后台批量落库的日志写入器（单事件循环内使用）。"""
+
+    def __init__(
+        self,
+        name: str,
+        persist: Callable[[List[T]], Awaitable[None]],
+        batch_size: Optional[int] = None,
+        flush_interval_ms: Optional[int] = None,
+        max_queue_size: Optional[int] = None,
+        overflow: Optional[str] = None,
+    ) -> None:
+        """
+        :param name: 写入器名称（日志与统计用）
+        :param persist: 整批持久化函数，失败时该批记录被丢弃并计入 failed
+        :param overflow: 队列满时的策略，drop 或 block
+        """
+        self.name = name
+        self._persist = persist
+        self._batch_size = batch_size or settings.AUDIT_LOG_BATCH_SIZE
+        self._flush_interval = (flush_interval_ms or settings.AUDIT_LOG_FLUSH_INTERVAL_MS) / 1000
+        self._max_queue_size = max_queue_size or settings.AUDIT_LOG_QUEUE_SIZE
+        self._overflow = overflow or settings.AUDIT_LOG_OVERFLOW
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+        self._closed = False
+        # 新记录入队或关闭时唤醒正在攒批的后台任务
+        self._wake = asyncio.Event()
+        self._stats = dict.fromkeys(("submitted", "written", "dropped", "failed", "batches"), 0)
+
+    async def submit(self, item: T) -> None:
+        """放入队列；drop 策略下队列满时丢弃，block 策略下等待空位。"""
+        if self._closed:
+            await self._persist_batch([item])
+            return
+        queue = self._ensure_started()
+        if self._overflow == OVERFLOW_BLOCK:
+            await queue.put(item)
+        else:
+            try:
+                queue.put_nowait(item)
+            except asyncio.QueueFull:
+                self._stats["dropped"] += 1
+                if self._stats["dropped"] % 100 == 1:
+                    logger.warning(
+                        f"审计日志队列已满，丢弃记录: writer={self.name}, "
+                        f"累计丢弃 {self._stats['dropped']}"
+                    )
+                return
+        self._stats["submitted"] += 1
+        self._wake.set()
+
+    async def flush(self) -> None:
+        """等待已入队的记录全部处理完成。"""
+        if self._queue is not None and self._task is not None and not self._task.done():
+            await self._queue.join()
+
+    async def aclose(self, timeout: float = 10.0) -> None:
+        """停止接收新记录，在 timeout 秒内刷出剩余记录后停止后台任务。"""
+        self._closed = True
+        self._wake.set()
+        if self._task is None:
+            return
+        try:
+            await asyncio.wait_for(self.flush(), timeout)
+        except asyncio.TimeoutError:
+            logger.warning(
+                f"审计日志刷出超时，剩余 {self._queue.qsize()} 条未写入: writer={self.name}"
+            )
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        logger.info(f"审计日志写入器已关闭: writer={self.name}, stats={self.stats()}")
+
+    def stats(self) -> Dict[str, int]:
+        """提交 / 写入 / 丢弃 / 写入失败条数、批次数与当前队列长度。"""
+        queued = self._queue.qsize() if self._queue is not None else 0
+        return {**self._stats, "queued": queued}
+
+    def _ensure_started(self) -> asyncio.Queue:
+        if self._queue is None:
+            self._queue = asyncio.Queue(maxsize=self._max_queue_size)
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._drain())
+        return self._queue
+
+    async def _drain(self) -> None:
+        queue = self._queue
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await queue.get()]
+            deadline = loop.time() + self._flush_interval
+            while len(batch) < self._batch_size:
+                if not queue.empty():
+                    batch.append(queue.get_nowait())
+                    continue
+                remaining = deadline - loop.time()
+                # 关闭时不再等待攒批，立即写出
+                if remaining <= 0 or self._closed:
+                    break
+                self._wake.clear()
+                try:
+                    await asyncio.wait_for(self._wake.wait(), remaining)
+                except asyncio.TimeoutError:
+                    break
+            try:
+                await self._persist_batch(batch)
+            finally:
+                for _ in batch:
+                    queue.task_done()
+
+    async def _persist_batch(self, batch: List[T]) -> None:
+        try:
+            await self._persist(batch)
+        except Exception as e:
+            self._stats["failed"] += len(batch)
+            logger.warning(
+                f"审计日志批量写入失败，丢弃 {len(batch)} 条: writer={self.name}, error={str(e)}"
+            )
+            return
+        self._stats["written"] += len(batch)
+        self._stats["batches"] += 1
+
+
+_writers: List[AuditLogWriter] = []
+
+
+def register_audit_log_writer(writer: AuditLogWriter) -> AuditLogWriter:
+    """登记写入器，应用关闭时统一刷出。"""
+    _writers.append(writer)
+    return writer
+
+
+async def close_audit_log_writers() -> None:
+    """刷出并关闭所有已登记的写入器（应用关闭时调用）。"""
+    for writer in _writers:
+        await writer.aclose()
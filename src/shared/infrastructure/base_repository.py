@@ -7,6 +7,7 @@ from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.shared.infrastructure.db.base import Base
+from src.shared.infrastructure.db.copy_upsert import copy_upsert
 
 ModelType = TypeVar("ModelType", bound=Base)
 
@@ -73,6 +74,8 @@ class BaseRepository(Generic[ModelType]):
         items: List[dict],
         unique_fields: List[str],
         exclude_fields: List[str] = None,
+        bulk: Optional[bool] = None,
+        bulk_threshold: Optional[int] = None,
     ) -> int:
         """
         通用的批量 Upsert (Insert or Update) 方法
@@ -81,6 +84,8 @@ class BaseRepository(Generic[ModelType]):
         :param items: 待插入的数据字典列表
         :param unique_fields: 唯一约束的字段列表，用于判断冲突
         :param exclude_fields: 更新时需要排除的字段（如 created_at）
+        :param bulk: 是否走 COPY 暂存表写入；None 时按 bulk_threshold 自动选择
+        :param bulk_threshold: 自动选择 COPY 写入的行数阈值，None 表示不自动启用
         :return: 插入或更新的行数
         """
         if not items:
@@ -89,6 +94,11 @@ class BaseRepository(Generic[ModelType]):
         if exclude_fields is None:
             exclude_fields = ["created_at"]
 
+        if bulk is None:
+            bulk = bulk_threshold is not None and len(items) >= bulk_threshold
+        if bulk:
+            return await copy_upsert(self.session, self.model, items, unique_fields, exclude_fields)
+
         # 批量处理，避免一次性插入过多数据
         batch_size = 1000
         total_count = 0
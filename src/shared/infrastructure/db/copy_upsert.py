@@ -0,0 +1,136 @@
+"""
+基于 COPY 的批量 Upsert
+
+大批量写入时，多 VALUES 的 `INSERT ... ON CONFLICT` 需要逐批经过 SQLAlchemy 语句编译，
+且每批最多千行。本模块改为：
+
+1. 在当前事务内创建与目标表同列类型的临时暂存表（`ON COMMIT DROP`，不写 WAL）；
+2. 通过 asyncpg `copy_records_to_table` 以二进制 COPY 协议流式写入暂存表；
+3. 用一条 `INSERT ... SELECT ... ON CONFLICT DO UPDATE` 合并进目标表。
+
+COPY 会绕过 SQLAlchemy 的 Python 端默认值与类型绑定处理，因此写入前按 ORM 列定义
+补齐 Python 端默认值（如 `default=datetime.now`），并对值执行列类型的 bind processor
+（如 JSONB 序列化），保证与常规 upsert 写入结果一致。
+"""
+
+import uuid
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Type
+
+from loguru import logger
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.shared.infrastructure.db.base import Base
+
+
+def _quote(name: str) -> str:
+    return '"' + name.replace('"', '""') + '"'
+
+
+def resolve_copy_columns(
+    model: Type[Base], items: Sequence[Dict[str, Any]]
+) -> Tuple[List[str], Dict[str, Any]]:
+    """
+    确定 COPY 写入的列：待写数据中出现过的列 + 定义了 Python 端默认值的列（按表定义顺序）
+
+    Returns:
+        (列名列表, 需要补齐的 Python 端默认值 {列名: 值})
+    """
+    present = set()
+    for item in items:
+        present.update(item.keys())
+
+    columns: List[str] = []
+    defaults: Dict[str, Any] = {}
+    for column in model.__table__.columns:
+        if column.name in present:
+            columns.append(column.name)
+        elif column.default is not None and not column.default.is_sequence:
+            columns.append(column.name)
+            arg = column.default.arg
+            defaults[column.name] = arg(None) if column.default.is_callable else arg
+    return columns, defaults
+
+
+def build_merge_sql(
+    table: str,
+    staging: str,
+    columns: Sequence[str],
+    unique_fields: Sequence[str],
+    exclude_fields: Sequence[str],
+) -> str:
+    """生成暂存表 -> 目标表的合并语句（冲突时更新除唯一键与排除字段外的列）。"""
+    cols = ", ".join(_quote(c) for c in columns)
+    keys = ", ".join(_quote(c) for c in unique_fields)
+    updates = [
+        f"{_quote(c)} = EXCLUDED.{_quote(c)}"
+        for c in columns
+        if c not in unique_fields and c not in exclude_fields
+    ]
+    conflict = f"DO UPDATE SET {', '.join(updates)}" if updates else "DO NOTHING"
+    return (
+        f"INSERT INTO {_quote(table)} ({cols}) SELECT {cols} FROM {_quote(staging)} "
+        f"ON CONFLICT ({keys}) {conflict}"
+    )
+
+
+async def copy_upsert(
+    session: AsyncSession,
+    model: Type[Base],
+    items: List[Dict[str, Any]],
+    unique_fields: List[str],
+    exclude_fields: Optional[List[str]] = None,
+) -> int:
+    """
+    通过 COPY 暂存表批量 Upsert，并提交事务
+
+    :param session: 异步会话（底层驱动须为 asyncpg）
+    :param model: ORM 模型
+    :param items: 待写入的数据字典列表（同一唯一键重复时保留最后一条）
+    :param unique_fields: 唯一约束的字段列表
+    :param exclude_fields: 冲突更新时需要排除的字段（如 created_at）
+    :return: 插入或更新的行数
+    """
+    if not items:
+        return 0
+    if exclude_fields is None:
+        exclude_fields = ["created_at"]
+
+    # ON CONFLICT 不允许同一语句内重复命中同一行，先按唯一键去重
+    deduplicated = {tuple(item.get(f) for f in unique_fields): item for item in items}
+    rows = list(deduplicated.values())
+
+    table = model.__table__
+    columns, defaults = resolve_copy_columns(model, rows)
+
+    conn = await session.connection()
+    processors = [table.columns[c].type.bind_processor(conn.dialect) for c in columns]
+    records = []
+    for item in rows:
+        record = []
+        for col, processor in zip(columns, processors):
+            value = item[col] if col in item else defaults.get(col)
+            record.append(
+                processor(value) if processor is not None and value is not None else value
+            )
+        records.append(tuple(record))
+
+    staging = f"_stg_{table.name}_{uuid.uuid4().hex[:8]}"
+    select_cols = ", ".join(_quote(c) for c in columns)
+    await session.execute(
+        text(
+            f"CREATE TEMP TABLE {_quote(staging)} ON COMMIT DROP AS "
+            f"SELECT {select_cols} FROM {_quote(table.name)} WITH NO DATA"
+        )
+    )
+
+    raw = await conn.get_raw_connection()
+    await raw.driver_connection.copy_records_to_table(staging, records=records, columns=columns)
+
+    result = await session.execute(
+        text(build_merge_sql(table.name, staging, columns, unique_fields, exclude_fields))
+    )
+    await session.commit()
+
+    logger.info(f"COPY upsert completed for {model.__name__}: {len(records)} rows staged")
+    return result.rowcount
@@ -0,0 +1,21 @@
+"""
+AsyncSession 并发访问锁。
+
+同一个 AsyncSession（及其底层连接）不支持多个协程同时执行语句。请求内并发执行的任务
+共用依赖注入的会话时（如多维度并发搜索共用搜索缓存仓储），仓储在访问会话前取该会话的锁，
+把数据库操作串行化，网络调用等其余部分仍然并发。
+"""
+
+import asyncio
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+_LOCK_KEY = "concurrency_lock"
+
+
+def session_lock(session: AsyncSession) -> asyncio.Lock:
+    """获取绑定在会话上的锁（首次调用时创建，存放于 session.info）。"""
+    lock = session.info.get(_LOCK_KEY)
+    if lock is None:
+        lock = session.info[_LOCK_KEY] = asyncio.Lock()
+    return lock
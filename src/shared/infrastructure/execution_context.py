@@ -3,20 +3,82 @@
 
 Coordinator 在编排入口设置 ExecutionContext，下游（LLM 调用、外部 API 适配器）
 通过 current_execution_ctx.get() 读取，无需在 Port 签名中传递 session_id。
+
+ExecutionContext.data 为会话级数据上下文：同一研究会话内多个专家需要的相同只读数据
+（如股票基础信息、财务指标）由编排的预取阶段并发加载一次，各专家的数据 Adapter 经
+load_in_session 读取，会话内不再重复查询。
+
+ExecutionContext.priority 为本流水线发起的 LLM 调用的调度优先级（取值同 LLMRequestPriority，
+数值越小越先放行）：LLMService 在调用方未显式指定时采用它，批量研究据此让位于交互式请求。
 """
 
+import asyncio
 import contextvars
+from typing import Awaitable, Callable, Dict, Hashable, TypeVar
+
+from pydantic import BaseModel, ConfigDict
+
+T = TypeVar("T")
+
+
+class SessionDataContext:
+    """会话内只读数据的记忆表：按 key 保存加载结果，同一 key 的并发加载只执行一次。"""
 
-from pydantic import BaseModel
+    def __init__(self) -> None:
+        self._entries: Dict[Hashable, asyncio.Future] = {}
+
+    async def get_or_load(self, key: Hashable, loader: Callable[[], Awaitable[T]]) -> T:
+        """
+        读取 key 对应的数据；不存在时调用 loader 加载并记忆。
+        其他协程正在加载同一 key 时等待其结果；该次加载失败则自行调用 loader（失败不记忆）。
+        """
+        future = self._entries.get(key)
+        if future is not None:
+            try:
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                # 仅在加载方被取消时改为自行加载；自身被取消则继续传播
+                if not future.cancelled():
+                    raise
+            except Exception:
+                pass
+            return await loader()
+
+        future = self._entries[key] = asyncio.get_running_loop().create_future()
+        try:
+            value = await loader()
+        except BaseException as e:
+            self._entries.pop(key, None)
+            if isinstance(e, Exception):
+                future.set_exception(e)
+                # 无等待方时避免 "exception was never retrieved" 警告
+                future.exception()
+            else:
+                future.cancel()
+            raise
+        future.set_result(value)
+        return value
 
 
 class ExecutionContext(BaseModel):
     """当前执行上下文，用于关联审计日志与会话。"""
 
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
     session_id: str
+    data: SessionDataContext | None = None
+    priority: int = 0
 
 
 # 默认 None：无研究流水线上下文时（如单测、定时任务）仍可正常调用 LLM/API，只是不关联 session
 current_execution_ctx: contextvars.ContextVar[ExecutionContext | None] = contextvars.ContextVar(
     "current_execution_ctx", default=None
 )
+
+
+async def load_in_session(key: Hashable, loader: Callable[[], Awaitable[T]]) -> T:
+    """当前执行上下文带有会话数据上下文时经其读取（会话内去重），否则直接调用 loader。"""
+    ctx = current_execution_ctx.get()
+    if ctx is None or ctx.data is None:
+        return await loader()
+    return await ctx.data.get_or_load(key, loader)
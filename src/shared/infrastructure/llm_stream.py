@@ -0,0 +1,148 @@
+"""
+LLM 流式输出通道：基于 contextvars 将请求内 LLM 调用的增量文本转发给 SSE 接口。
+
+流式接口在运行业务流程前设置 LLMStreamSink，LLMService 检测到通道时改走流式生成并把
+每段增量写入通道；业务代码与各层 Port 签名不变，仍拿到完整文本。
+SSE 事件：delta（增量文本）→ result（与非流式接口相同的响应体）或 error（状态码与错误信息）。
+"""
+
+import asyncio
+import contextvars
+import json
+from typing import Any, AsyncIterator, Awaitable, Callable, Optional
+
+from fastapi import HTTPException
+from fastapi.responses import StreamingResponse
+from loguru import logger
+from pydantic import BaseModel
+
+from src.shared.domain.exceptions import AppException
+
+_CLOSED = object()
+
+
+class LLMStreamSink:
+    """请求内 LLM 增量文本通道（单生产者写入、单消费者读取）。"""
+
+    def __init__(self) -> None:
+        self._queue: asyncio.Queue = asyncio.Queue()
+
+    def push(self, text: str) -> None:
+        self._queue.put_nowait(text)
+
+    def close(self) -> None:
+        self._queue.put_nowait(_CLOSED)
+
+    async def next(self) -> Optional[str]:
+        """下一段增量文本；通道关闭后返回 None。"""
+        item = await self._queue.get()
+        return None if item is _CLOSED else item
+
+
+# 默认 None：非流式请求下 LLMService 走普通生成
+current_llm_stream_sink: contextvars.ContextVar[LLMStreamSink | None] = contextvars.ContextVar(
+    "current_llm_stream_sink", default=None
+)
+
+
+def sse_event(event: str, data: Any) -> str:
+    """格式化一条 SSE 事件（data 为 JSON）。"""
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+def to_http_exception(e: Exception) -> HTTPException:
+    """AppException 按其 status_code 映射，其余异常视为 500。"""
+    if isinstance(e, HTTPException):
+        return e
+    if isinstance(e, AppException):
+        return HTTPException(status_code=e.status_code, detail=e.message)
+    logger.opt(exception=e).error("流式请求执行异常: {}", str(e))
+    return HTTPException(status_code=500, detail=str(e))
+
+
+def _error_event(e: Exception) -> str:
+    http_error = to_http_exception(e)
+    return sse_event("error", {"status_code": http_error.status_code, "detail": http_error.detail})
+
+
+async def stream_llm_run(run: Callable[[], Awaitable[BaseModel]]) -> StreamingResponse:
+    """
+    在设置了 LLMStreamSink 的上下文中运行 run，以 SSE 推送其间的 LLM 增量文本与最终响应体。
+
+    首个增量产出前即失败（参数校验、数据缺失、所有候选模型不可用等）时直接抛出 HTTPException，
+    保留与非流式接口一致的 HTTP 状态码；开始推送后的失败以 error 事件告知。
+    """
+    sink = LLMStreamSink()
+    context = contextvars.copy_context()
+    context.run(current_llm_stream_sink.set, sink)
+
+    async def run_then_close() -> BaseModel:
+        try:
+            return await run()
+        finally:
+            sink.close()
+
+    task = asyncio.create_task(run_then_close(), context=context)
+    first = await sink.next()
+    if first is None:
+        try:
+            result = await task
+        except Exception as e:
+            raise to_http_exception(e)
+        payload = sse_event("result", result.model_dump(mode="json"))
+
+        async def single() -> AsyncIterator[str]:
+            yield payload
+
+        return StreamingResponse(single(), media_type="text/event-stream")
+
+    async def events() -> AsyncIterator[str]:
+        try:
+            text: Optional[str] = first
+            while text is not None:
+                yield sse_event("delta", {"text": text})
+                text = await sink.next()
+            try:
+                result = await task
+            except Exception as e:
+                yield _error_event(e)
+                return
+            yield sse_event("result", result.model_dump(mode="json"))
+        finally:
+            # 客户端断开时取消仍在运行的业务流程
+            if not task.done():
+                task.cancel()
+
+    return StreamingResponse(events(), media_type="text/event-stream")
+
+
+async def stream_llm_chunks(chunks: AsyncIterator[str]) -> StreamingResponse:
+    """
+    以 SSE 推送 LLM 增量文本，结束时发送 done 事件（含完整文本长度）。
+
+    预先取出首个增量：首个增量产出前失败时直接抛出 HTTPException。
+    """
+    try:
+        first = await anext(chunks)
+    except StopAsyncIteration:
+        first = None
+    except Exception as e:
+        raise to_http_exception(e)
+
+    async def events() -> AsyncIterator[str]:
+        length = 0
+        try:
+            if first is not None:
+                length += len(first)
+                yield sse_event("delta", {"text": first})
+                async for chunk in chunks:
+                    length += len(chunk)
+                    yield sse_event("delta", {"text": chunk})
+        except Exception as e:
+            yield _error_event(e)
+            return
+        finally:
+            await chunks.aclose()
+        yield sse_event("done", {"length": length})
+
+    return StreamingResponse(events(), media_type="text/event-stream")
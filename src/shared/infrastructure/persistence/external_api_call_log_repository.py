@@ -2,6 +2,7 @@
 外部 API 调用日志 PostgreSQL 仓储实现。
 """
 
+from typing import TYPE_CHECKING, Optional
 from uuid import UUID
 
 from sqlalchemy import select
@@ -13,10 +14,14 @@ from src.shared.domain.dtos.external_api_call_log_dtos import (
 from src.shared.domain.ports.external_api_call_log_repository import (
     IExternalAPICallLogRepository,
 )
+from src.shared.infrastructure.db.session_lock import session_lock
 from src.shared.infrastructure.persistence.external_api_call_log_model import (
     ExternalAPICallLogModel,
 )
 
+if TYPE_CHECKING:
+    from src.shared.infrastructure.audit_log_writer import AuditLogWriter
+
 
 def _dto_to_model(d: ExternalAPICallLog) -> ExternalAPICallLogModel:
     return ExternalAPICallLogModel(
@@ -51,12 +56,28 @@ def _model_to_dto(m: ExternalAPICallLogModel) -> ExternalAPICallLog:
 
 
 class PgExternalAPICallLogRepository(IExternalAPICallLogRepository):
-    def __init__(self, session: AsyncSession) -> None:
+    """
+    外部 API 调用日志仓储。
+    传入 writer 时 save 只把记录交给异步批量写入器，由其后台整批落库，不占用请求路径上的数据库往返。
+    """
+
+    def __init__(
+        self, session: AsyncSession, writer: "AuditLogWriter[ExternalAPICallLog] | None" = None
+    ) -> None:
         self._session = session
+        self._writer = writer
 
     async def save(self, log: ExternalAPICallLog) -> None:
+        if self._writer is not None:
+            await self._writer.submit(log)
+            return
         model = _dto_to_model(log)
-        self._session.add(model)
+        async with session_lock(self._session):
+            self._session.add(model)
+            await self._session.commit()
+
+    async def save_many(self, logs: list[ExternalAPICallLog]) -> None:
+        self._session.add_all([_dto_to_model(log) for log in logs])
         await self._session.commit()
 
     async def get_by_session_id(self, session_id: UUID) -> list[ExternalAPICallLog]:
@@ -67,3 +88,26 @@ class PgExternalAPICallLogRepository(IExternalAPICallLogRepository):
         )
         models = result.scalars().all()
         return [_model_to_dto(m) for m in models]
+
+
+_external_api_call_log_writer: Optional["AuditLogWriter[ExternalAPICallLog]"] = None
+
+
+def get_external_api_call_log_writer() -> "AuditLogWriter[ExternalAPICallLog]":
+    """获取进程内共享的外部 API 调用日志异步批量写入器（独立会话落库）。"""
+    global _external_api_call_log_writer
+    if _external_api_call_log_writer is None:
+        from src.shared.infrastructure.audit_log_writer import (
+            AuditLogWriter,
+            register_audit_log_writer,
+        )
+        from src.shared.infrastructure.db.session import AsyncSessionLocal
+
+        async def persist(logs: list[ExternalAPICallLog]) -> None:
+            async with AsyncSessionLocal() as session:
+                await PgExternalAPICallLogRepository(session).save_many(logs)
+
+        _external_api_call_log_writer = register_audit_log_writer(
+            AuditLogWriter("external_api_call_log", persist)
+        )
+    return _external_api_call_log_writer
@@ -0,0 +1,124 @@
+"""
+DataFrame → 领域对象转换微基准：逐行 iterrows（旧）vs 列式转换（新）。
+
+夹具 DataFrame 按 Tushare 实际返回的列结构构造（固定随机种子）：
+- 全市场单日：约 5,300 行 × 28 列（daily + adj_factor + daily_basic 合并结果）
+- 单只股票长历史：约 6,000 行（约 25 年）
+
+运行方式（项目根目录）：
+    python -m tests.benchmark.bench_converters
+"""
+
+import timeit
+from typing import Callable, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from src.modules.data_engineering.domain.model.stock_daily import StockDaily
+from src.modules.data_engineering.infrastructure.external_apis.tushare.converters.quote_converter import (  # noqa: E501
+    StockDailyAssembler,
+)
+
+_NUMERIC_COLUMNS = [
+    "open",
+    "high",
+    "low",
+    "close",
+    "pre_close",
+    "change",
+    "pct_chg",
+    "vol",
+    "amount",
+    "adj_factor",
+    "turnover_rate",
+    "turnover_rate_f",
+    "volume_ratio",
+    "pe",
+    "pe_ttm",
+    "pb",
+    "ps",
+    "ps_ttm",
+    "dv_ratio",
+    "dv_ttm",
+    "total_share",
+    "float_share",
+    "free_share",
+    "total_mv",
+    "circ_mv",
+]
+
+
+def make_daily_frame(codes: List[str], dates: List[str], seed: int = 42) -> pd.DataFrame:
+    """构造与 TushareClient.fetch_daily 合并结果同构的 DataFrame（约 5% 的可选指标为 NaN）。"""
+    rng = np.random.default_rng(seed)
+    rows = len(codes) * len(dates)
+    df = pd.DataFrame(
+        {
+            "ts_code": np.repeat(codes, len(dates)),
+            "trade_date": np.tile(dates, len(codes)),
+        }
+    )
+    for col in _NUMERIC_COLUMNS:
+        values = rng.uniform(1.0, 100.0, rows)
+        if col not in _NUMERIC_COLUMNS[:9]:
+            values[rng.random(rows) < 0.05] = np.nan
+        df[col] = values
+    return df
+
+
+def legacy_to_domain_list(df: pd.DataFrame) -> List[StockDaily]:
+    """旧实现：NaN 整表替换后 iterrows，逐行 pd.to_datetime + 逐行构造 StockDaily。"""
+    dailies = []
+    df = df.where(pd.notnull(df), None)
+    for _, row in df.iterrows():
+        try:
+            daily = _legacy_row_to_entity(row)
+            if daily:
+                dailies.append(daily)
+        except Exception:
+            continue
+    return dailies
+
+
+def _legacy_row_to_entity(row: pd.Series) -> Optional[StockDaily]:
+    def parse_date(date_str):
+        if not date_str:
+            return None
+        try:
+            return pd.to_datetime(date_str).date()
+        except ValueError:
+            return None
+
+    fields = {col: row.get(col) for col in _NUMERIC_COLUMNS}
+    return StockDaily(
+        third_code=row["ts_code"],
+        trade_date=parse_date(row["trade_date"]),
+        source="tushare",
+        **fields,
+    )
+
+
+def _bench(name: str, func: Callable[[], object], number: int) -> float:
+    seconds = min(timeit.repeat(func, number=number, repeat=3)) / number
+    print(f"  {name:<28s} {seconds * 1000:10.1f} ms")
+    return seconds
+
+
+def main() -> None:
+    codes = [f"{i:06d}.SZ" for i in range(5300)]
+    market_df = make_daily_frame(codes, ["20240115"])
+    dates = pd.bdate_range("20000101", periods=6000).strftime("%Y%m%d").tolist()
+    history_df = make_daily_frame(["000001.SZ"], dates)
+
+    for label, df in (("全市场单日", market_df), ("单股长历史", history_df)):
+        print(f"{label}: {len(df)} 行 × {len(df.columns)} 列")
+        assert len(legacy_to_domain_list(df)) == len(StockDailyAssembler.to_domain_list(df))
+        old = _bench("legacy iterrows", lambda: legacy_to_domain_list(df), number=1)
+        new = _bench("columnar to_domain_list", lambda: StockDailyAssembler.to_domain_list(df), 3)
+        _bench("columnar to_records", lambda: StockDailyAssembler.to_records(df), number=3)
+        print(f"  加速比 {old / new:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+技术指标计算微基准：纯 Python 参考实现（旧）vs NumPy 向量化实现（新）。
+
+夹具为固定随机种子的随机游走日线，分别取 250（约 1 年）、2,500（约 10 年）、
+10,000 根 K 线；旧实现的 MACD 对每个前缀重算 EMA（O(n²)），长序列只跑 1 次。
+
+运行方式（项目根目录）：
+    python -m tests.benchmark.bench_indicators
+"""
+
+import timeit
+from datetime import date, timedelta
+from typing import Callable, List
+
+import numpy as np
+
+from src.modules.research.domain.dtos.daily_bar_input import DailyBarInput
+from src.modules.research.infrastructure.indicators.calculator import (
+    compute_technical_indicators,
+)
+from src.modules.research.infrastructure.indicators.vectorized_calculator import (
+    compute_technical_indicators_vectorized,
+)
+
+
+def make_bars(size: int, seed: int = 42) -> List[DailyBarInput]:
+    """构造 size 根随机游走日线。"""
+    rng = np.random.default_rng(seed)
+    closes = 10.0 + np.abs(np.cumsum(rng.normal(0, 0.2, size)))
+    spreads = np.abs(rng.normal(0, 0.15, size))
+    vols = rng.uniform(1e4, 1e6, size)
+    start = date(1990, 1, 1)
+    return [
+        DailyBarInput(
+            trade_date=start + timedelta(days=i),
+            open=float(closes[i]),
+            high=float(closes[i] + spreads[i]),
+            low=float(closes[i] - spreads[i]),
+            close=float(closes[i]),
+            vol=float(vols[i]),
+            pct_chg=0.0,
+        )
+        for i in range(size)
+    ]
+
+
+def _bench(name: str, func: Callable[[], object], number: int) -> float:
+    seconds = min(timeit.repeat(func, number=number, repeat=3)) / number
+    print(f"  {name:<28s} {seconds * 1000:10.2f} ms")
+    return seconds
+
+
+def main() -> None:
+    for size, legacy_number in ((250, 5), (2_500, 1), (10_000, 1)):
+        bars = make_bars(size)
+        print(f"{size} 根 K 线")
+        old = _bench(
+            "legacy pure-Python", lambda: compute_technical_indicators(bars), legacy_number
+        )
+        new = _bench("vectorized", lambda: compute_technical_indicators_vectorized(bars), 20)
+        print(f"  加速比 {old / new:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
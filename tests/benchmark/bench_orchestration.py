@@ -0,0 +1,96 @@
+"""
+研究编排开销微基准：每次请求重新编译图（旧）vs 复用按结构缓存的编译图（新）。
+
+使用立即返回的桩 Gateway（专家、辩论、裁决均无 I/O），测得的耗时即编排本身的开销：
+图编译 + LangGraph 调度 5 个专家并行 fan-out、聚合、辩论、裁决。
+
+运行方式（项目根目录）：
+    python -m tests.benchmark.bench_orchestration
+"""
+
+import asyncio
+import time
+from typing import Any, Awaitable, Callable
+
+from src.modules.coordinator.domain.model.enums import ExpertType
+from src.modules.coordinator.domain.ports.research_expert_gateway import (
+    IResearchExpertGateway,
+)
+from src.modules.coordinator.infrastructure.orchestration.graph_builder import (
+    build_research_graph,
+    get_research_graph,
+    research_graph_config,
+)
+
+
+class StubExpertGateway(IResearchExpertGateway):
+    async def run_expert(self, expert_type, symbol, options=None):
+        return {"signal": "NEUTRAL", "narrative_report": expert_type.value}
+
+
+class StubDebateGateway:
+    async def run_debate(self, symbol, expert_results):
+        return {"direction": "NEUTRAL", "narrative_report": "debate"}
+
+
+class StubJudgeGateway:
+    async def run_verdict(self, symbol, debate_outcome):
+        return {"action": "HOLD", "narrative_report": "verdict"}
+
+
+_STATE = {
+    "symbol": "000001.SZ",
+    "selected_experts": [e.value for e in ExpertType],
+    "options": {},
+    "results": {},
+}
+_CONFIG = research_graph_config(StubExpertGateway(), StubDebateGateway(), StubJudgeGateway())
+
+
+async def per_request_build() -> Any:
+    graph = build_research_graph(with_debate=True, with_judge=True)
+    return await graph.ainvoke(dict(_STATE), config=_CONFIG)
+
+
+async def cached_graph() -> Any:
+    graph = get_research_graph(with_debate=True, with_judge=True, persist=False)
+    return await graph.ainvoke(dict(_STATE), config=_CONFIG)
+
+
+async def _bench(name: str, func: Callable[[], Awaitable[Any]], number: int) -> float:
+    await func()  # 预热
+    best = float("inf")
+    for _ in range(3):
+        started = time.perf_counter()
+        for _ in range(number):
+            await func()
+        best = min(best, (time.perf_counter() - started) / number)
+    print(f"  {name:<28s} {best * 1000:10.2f} ms/请求")
+    return best
+
+
+async def _main() -> None:
+    state = await cached_graph()
+    assert state["overall_status"] == "completed" and state["verdict"]
+
+    print("5 专家 + 辩论 + 裁决，桩 Gateway：")
+    old = await _bench("per-request compile", per_request_build, number=50)
+    new = await _bench("cached compiled graph", cached_graph, number=50)
+    print(f"  加速比 {old / new:.1f}x")
+
+    print("20 个请求并发：")
+    for name, func in (
+        ("per-request compile", per_request_build),
+        ("cached compiled graph", cached_graph),
+    ):
+        started = time.perf_counter()
+        await asyncio.gather(*(func() for _ in range(20)))
+        print(f"  {name:<28s} {(time.perf_counter() - started) * 1000:10.2f} ms 总计")
+
+
+def main() -> None:
+    asyncio.run(_main())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,162 @@
+"""增量辩论：达到法定专家数即提前论证，后到结果实质改变输入时才重新论证，耗时写入时间线。"""
+
+import asyncio
+
+import pytest
+
+from src.modules.coordinator.domain.model.enums import ExpertType
+from src.modules.coordinator.domain.ports.debate_gateway import IDebateGateway
+from src.modules.coordinator.domain.ports.research_expert_gateway import (
+    IResearchExpertGateway,
+)
+from src.modules.coordinator.infrastructure.orchestration.graph_builder import (
+    get_research_graph,
+    research_graph_config,
+)
+from src.modules.coordinator.infrastructure.orchestration.incremental_debate import (
+    IncrementalDebate,
+)
+from src.modules.coordinator.infrastructure.orchestration.pipeline_timeline import (
+    PipelineTimeline,
+)
+from src.modules.debate.domain.dtos.debate_input import DebateInput, ExpertSummary
+from src.modules.debate.domain.services.debate_input_drift import (
+    DebateInputDriftDetector,
+)
+
+_EXPERTS = [
+    ExpertType.TECHNICAL_ANALYST,
+    ExpertType.FINANCIAL_AUDITOR,
+    ExpertType.MACRO_INTELLIGENCE,
+]
+
+
+class SlowMacroGateway(IResearchExpertGateway):
+    """宏观情报员最慢；信号按专家配置。"""
+
+    def __init__(self, signals):
+        self.signals = signals
+
+    async def run_expert(self, expert_type, symbol, options=None):
+        delay = 0.2 if expert_type == ExpertType.MACRO_INTELLIGENCE else 0.01
+        await asyncio.sleep(delay)
+        return {"signal": self.signals[expert_type.value]}
+
+
+class RecordingDebateGateway(IDebateGateway):
+    """记录每次论证使用的专家集合；advocacy_outdated 以最后到达的专家信号是否偏空判定。"""
+
+    def __init__(self):
+        self.advocated = []
+
+    async def run_debate(self, symbol, expert_results):
+        raise AssertionError("增量模式不应调用 run_debate")
+
+    async def run_advocacy(self, symbol, expert_results):
+        self.advocated.append(sorted(expert_results))
+        await asyncio.sleep(0.1)
+        return {"experts": sorted(expert_results)}
+
+    def advocacy_outdated(self, advocated_results, expert_results):
+        late = set(expert_results) - set(advocated_results)
+        return any(expert_results[k]["signal"] == "BEARISH" for k in late)
+
+    async def run_resolution(self, symbol, advocacy):
+        return {"direction": "BULLISH", "experts": advocacy["experts"]}
+
+
+async def _run(signals):
+    debate_gateway = RecordingDebateGateway()
+    timeline = PipelineTimeline()
+    incremental = IncrementalDebate(debate_gateway, "000001.SZ", quorum=2, timeline=timeline)
+    graph = get_research_graph(with_debate=True, with_judge=False, persist=False)
+    state = await graph.ainvoke(
+        {
+            "symbol": "000001.SZ",
+            "selected_experts": [e.value for e in _EXPERTS],
+            "options": {},
+            "results": {},
+        },
+        config=research_graph_config(
+            SlowMacroGateway(signals),
+            debate_gateway=debate_gateway,
+            incremental_debate=incremental,
+            timeline=timeline,
+        ),
+    )
+    return state, debate_gateway, timeline.as_dict()
+
+
+@pytest.mark.asyncio
+async def test_advocacy_starts_at_quorum_and_is_reused_when_late_result_agrees():
+    state, debate_gateway, breakdown = await _run(
+        {
+            "technical_analyst": "BULLISH",
+            "financial_auditor": "BULLISH",
+            "macro_intelligence": "BULLISH",
+        }
+    )
+
+    assert debate_gateway.advocated == [["financial_auditor", "technical_analyst"]]
+    assert state["debate_outcome"]["experts"] == ["financial_auditor", "technical_analyst"]
+    assert breakdown["advocacy_reissued"] is False
+    # 提前论证与最慢专家重叠：论证在全部专家完成前开始、完成后很快结束
+    assert breakdown["advocacy_started_ms"] < breakdown["macro_intelligence_done_ms"]
+    assert breakdown["debate_done_ms"] - breakdown["experts_done_ms"] < 80
+
+
+@pytest.mark.asyncio
+async def test_advocacy_is_reissued_when_late_result_materially_changes_input():
+    state, debate_gateway, breakdown = await _run(
+        {
+            "technical_analyst": "BULLISH",
+            "financial_auditor": "BULLISH",
+            "macro_intelligence": "BEARISH",
+        }
+    )
+
+    assert debate_gateway.advocated[-1] == [
+        "financial_auditor",
+        "macro_intelligence",
+        "technical_analyst",
+    ]
+    assert len(debate_gateway.advocated) == 2
+    assert breakdown["advocacy_reissued"] is True
+    assert len(state["debate_outcome"]["experts"]) == 3
+
+
+def _input(**signals):
+    return DebateInput(
+        symbol="000001.SZ",
+        expert_summaries={
+            k: ExpertSummary(signal=v, confidence=0.8, reasoning="", risk_warning="")
+            for k, v in signals.items()
+        },
+    )
+
+
+def test_drift_detector_flags_only_material_changes():
+    detector = DebateInputDriftDetector(shift_threshold=0.25)
+    base = _input(technical_analyst="BULLISH", valuation_modeler="Undervalued")
+
+    assert not detector.is_material_change(base, base)
+    # 同向结果加入：倾向不变
+    assert not detector.is_material_change(
+        base,
+        _input(
+            technical_analyst="BULLISH",
+            valuation_modeler="Undervalued",
+            catalyst_detective="Positive (正面催化)",
+        ),
+    )
+    # 反向结果加入：倾向从偏多降到约 0.33，变动超过阈值
+    assert detector.is_material_change(
+        base,
+        _input(
+            technical_analyst="BULLISH",
+            valuation_modeler="Undervalued",
+            macro_intelligence="Unfavorable (不利)",
+        ),
+    )
+    assert detector.stance("Unfavorable (不利)") == -1
+    assert detector.stance("Fair") == 0
@@ -0,0 +1,263 @@
+"""批量研究：有界并发、按完成顺序产出、批次状态、续跑跳过已完成标的与执行租约。"""
+
+import asyncio
+from contextlib import aclosing
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+import anyio
+import pytest
+
+from src.modules.coordinator.application.research_batch_service import (
+    ResearchBatchService,
+)
+from src.modules.coordinator.domain.dtos.research_dtos import ResearchResult
+from src.modules.coordinator.domain.exceptions import BatchNotResumableError
+from src.modules.coordinator.domain.model.research_session import (
+    ResearchSession,
+)
+from src.modules.coordinator.domain.ports.research_batch_repository import (
+    IResearchBatchRepository,
+)
+from src.shared.domain.exceptions import BadRequestException
+
+
+class InMemoryBatchRepo(IResearchBatchRepository):
+    def __init__(self):
+        self.batches = {}
+        self.sessions = []
+
+    async def save_batch(self, batch):
+        self.batches[batch.id] = batch.model_copy()
+
+    async def update_batch(self, batch):
+        self.batches[batch.id] = batch.model_copy()
+
+    async def claim_lease(self, batch_id, owner, now, expired_before):
+        batch = self.batches[batch_id]
+        if batch.lease_owner is not None and batch.heartbeat_at >= expired_before:
+            return False
+        batch.lease_owner, batch.heartbeat_at = owner, now
+        return True
+
+    async def renew_lease(self, batch_id, owner, now):
+        await asyncio.sleep(0)
+        batch = self.batches[batch_id]
+        if batch.lease_owner != owner:
+            return False
+        batch.heartbeat_at = now
+        return True
+
+    async def release_lease(self, batch_id, owner):
+        await asyncio.sleep(0)
+        batch = self.batches[batch_id]
+        if batch.lease_owner == owner:
+            batch.lease_owner, batch.heartbeat_at = None, None
+
+    async def get_batch_by_id(self, batch_id):
+        batch = self.batches.get(batch_id)
+        return batch.model_copy() if batch else None
+
+    async def list_batch_sessions(self, batch_id):
+        return [s for s in self.sessions if s.batch_id == batch_id]
+
+
+class FakeRunner:
+    """按标的配置耗时与失败；记录同时执行的最大标的数，并像编排器一样写入会话。"""
+
+    def __init__(self, repo, delays=None, failing=()):
+        self.repo = repo
+        self.delays = delays or {}
+        self.failing = set(failing)
+        self.running = 0
+        self.max_running = 0
+        self.calls = []
+
+    async def __call__(self, request):
+        self.calls.append(request.symbol)
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        try:
+            await asyncio.sleep(self.delays.get(request.symbol, 0.01))
+            if request.symbol in self.failing:
+                raise RuntimeError("LLM 不可用")
+        finally:
+            self.running -= 1
+        session_id = uuid4()
+        self.repo.sessions.append(
+            ResearchSession(
+                id=session_id,
+                symbol=request.symbol,
+                status="completed",
+                created_at=datetime.utcnow(),
+                batch_id=request.batch_id,
+            )
+        )
+        return ResearchResult(
+            symbol=request.symbol,
+            overall_status="completed",
+            expert_results=[],
+            session_id=str(session_id),
+        )
+
+
+async def _collect(service, batch, skip=None):
+    return [item async for item in service.run(batch, skip)]
+
+
+@pytest.mark.asyncio
+async def test_runs_with_bounded_concurrency_and_yields_in_completion_order():
+    repo = InMemoryBatchRepo()
+    runner = FakeRunner(repo, delays={"A": 0.08, "B": 0.01, "C": 0.02, "D": 0.01})
+    service = ResearchBatchService(repo, runner, concurrency=2)
+    batch = await service.create(["A", "B", "C", "D", "B"], ["technical_analyst"])
+
+    items = await _collect(service, batch)
+
+    assert batch.symbols == ["A", "B", "C", "D"]
+    assert [i.symbol for i in items] == ["B", "C", "D", "A"]
+    assert runner.max_running == 2
+    assert all(i.status == "completed" and i.session_id for i in items)
+    assert repo.batches[batch.id].status == "completed"
+
+
+@pytest.mark.asyncio
+async def test_resume_skips_completed_symbols():
+    repo = InMemoryBatchRepo()
+    runner = FakeRunner(repo, failing={"B"})
+    service = ResearchBatchService(repo, runner, concurrency=4)
+    batch = await service.create(["A", "B", "C"], ["macro_intelligence"])
+
+    items = await _collect(service, batch)
+    assert {i.symbol: i.status for i in items} == {
+        "A": "completed",
+        "B": "failed",
+        "C": "completed",
+    }
+    assert repo.batches[batch.id].status == "partial"
+
+    runner.failing.clear()
+    runner.calls.clear()
+    resumed = await service.get_resumable(batch.id)
+    skip = await service.completed_symbols(resumed)
+    items = await _collect(service, resumed, skip)
+
+    assert skip == {"A", "C"}
+    assert runner.calls == ["B"]
+    assert [i.status for i in items] == ["completed"]
+    assert repo.batches[batch.id].status == "completed"
+    with pytest.raises(BatchNotResumableError):
+        await service.get_resumable(batch.id)
+
+
+@pytest.mark.asyncio
+async def test_closing_stream_early_cancels_workers_and_keeps_batch_running():
+    repo = InMemoryBatchRepo()
+    runner = FakeRunner(repo, delays={"A": 0.01, "B": 5, "C": 5})
+    service = ResearchBatchService(repo, runner, concurrency=3)
+    batch = await service.create(["A", "B", "C"], ["technical_analyst"])
+
+    stream = service.run(batch)
+    first = await stream.__anext__()
+    await stream.aclose()
+
+    assert first.symbol == "A"
+    assert runner.running == 0
+    assert repo.batches[batch.id].status == "running"
+
+
+@pytest.mark.asyncio
+async def test_resume_is_rejected_while_original_run_holds_lease():
+    repo = InMemoryBatchRepo()
+    runner = FakeRunner(repo, delays={"A": 0.01, "B": 5})
+    service = ResearchBatchService(
+        repo, runner, concurrency=2, lease_seconds=0.2, heartbeat_seconds=0.05
+    )
+    batch = await service.create(["A", "B"], ["technical_analyst"])
+
+    stream = service.run(batch)
+    await stream.__anext__()
+    # 原连接持续续约：超过租约时长后仍不可续跑
+    await asyncio.sleep(0.3)
+    with pytest.raises(BatchNotResumableError) as exc_info:
+        await service.get_resumable(batch.id)
+    assert exc_info.value.status_code == 409
+
+    # 原连接断开后释放租约，续跑接管
+    await stream.aclose()
+    resumed = await service.get_resumable(batch.id)
+    assert resumed.lease_owner is not None
+    with pytest.raises(BatchNotResumableError):
+        await service.get_resumable(batch.id)
+
+
+@pytest.mark.asyncio
+async def test_cancelled_stream_releases_lease_and_leaves_no_tasks():
+    """流式响应断开时 Starlette 取消 cancel scope：清理仍须完成，租约释放、无残留任务。"""
+    repo = InMemoryBatchRepo()
+    runner = FakeRunner(repo, delays={"A": 0.01, "B": 5})
+    service = ResearchBatchService(
+        repo, runner, concurrency=2, lease_seconds=60, heartbeat_seconds=0.01
+    )
+    batch = await service.create(["A", "B"], ["technical_analyst"])
+
+    async def events():
+        async with aclosing(service.run(batch)) as items:
+            async for _ in items:
+                pass
+
+    async with anyio.create_task_group() as tg:
+        tg.start_soon(events)
+        await asyncio.sleep(0.05)
+        tg.cancel_scope.cancel()
+    await asyncio.sleep(0.05)
+
+    assert repo.batches[batch.id].lease_owner is None
+    assert runner.running == 0
+    assert asyncio.all_tasks() == {asyncio.current_task()}
+    resumed = await service.get_resumable(batch.id)
+    assert resumed.lease_owner is not None
+
+
+@pytest.mark.asyncio
+async def test_run_stops_when_lease_is_taken_over():
+    repo = InMemoryBatchRepo()
+    runner = FakeRunner(repo, delays={"A": 0.01, "B": 5})
+    service = ResearchBatchService(
+        repo, runner, concurrency=2, lease_seconds=60, heartbeat_seconds=0.02
+    )
+    batch = await service.create(["A", "B"], ["technical_analyst"])
+
+    stream = service.run(batch)
+    await stream.__anext__()
+    repo.batches[batch.id].lease_owner = uuid4()
+    with pytest.raises(BatchNotResumableError) as exc_info:
+        await stream.__anext__()
+
+    assert exc_info.value.status_code == 409
+    assert runner.running == 0
+    assert repo.batches[batch.id].status == "running"
+
+
+@pytest.mark.asyncio
+async def test_expired_lease_can_be_taken_over():
+    repo = InMemoryBatchRepo()
+    service = ResearchBatchService(repo, FakeRunner(repo), lease_seconds=60)
+    batch = await service.create(["A"], ["technical_analyst"])
+    # 模拟执行进程崩溃：租约未释放，心跳停在 2 分钟前
+    repo.batches[batch.id].heartbeat_at = datetime.utcnow() - timedelta(minutes=2)
+
+    resumed = await service.get_resumable(batch.id)
+
+    assert resumed.lease_owner != batch.lease_owner
+
+
+@pytest.mark.asyncio
+async def test_create_validates_symbols_and_experts():
+    service = ResearchBatchService(InMemoryBatchRepo(), FakeRunner(None), max_symbols=2)
+    with pytest.raises(BadRequestException):
+        await service.create([" "], ["technical_analyst"])
+    with pytest.raises(BadRequestException):
+        await service.create(["A", "B", "C"], ["technical_analyst"])
+    with pytest.raises(BadRequestException):
+        await service.create(["A"], ["fortune_teller"])
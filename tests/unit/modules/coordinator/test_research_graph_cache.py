@@ -0,0 +1,78 @@
+"""编译图缓存：同一结构复用同一编译图，请求级依赖经 config 注入、互不串扰。"""
+
+import asyncio
+
+import pytest
+
+from src.modules.coordinator.domain.model.enums import ExpertType
+from src.modules.coordinator.domain.ports.research_expert_gateway import (
+    IResearchExpertGateway,
+)
+from src.modules.coordinator.infrastructure.orchestration.graph_builder import (
+    get_research_graph,
+    research_graph_config,
+)
+from src.shared.infrastructure.execution_context import (
+    ExecutionContext,
+    current_execution_ctx,
+)
+
+
+class TaggedGateway(IResearchExpertGateway):
+    def __init__(self, tag):
+        self.tag = tag
+
+    async def run_expert(self, expert_type, symbol, options=None):
+        await asyncio.sleep(0.01)
+        return {"tag": self.tag, "narrative_report": symbol}
+
+
+class RecordingSessionRepo:
+    def __init__(self):
+        self.node_types = []
+
+    async def save_node_execution(self, execution):
+        self.node_types.append(execution.node_type)
+
+
+def _state(symbol):
+    return {
+        "symbol": symbol,
+        "selected_experts": [ExpertType.TECHNICAL_ANALYST.value],
+        "options": {},
+        "results": {},
+    }
+
+
+def test_graph_is_compiled_once_per_variant():
+    assert get_research_graph(True, True, False) is get_research_graph(True, True, False)
+    assert get_research_graph(True, False, False) is not get_research_graph(True, True, False)
+    # 不辩论时裁决无效，归并为同一变体
+    assert get_research_graph(False, True, True) is get_research_graph(False, False, True)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_use_their_own_dependencies():
+    graph = get_research_graph(False, False, False)
+    a, b = await asyncio.gather(
+        graph.ainvoke(_state("A"), config=research_graph_config(TaggedGateway("a"))),
+        graph.ainvoke(_state("B"), config=research_graph_config(TaggedGateway("b"))),
+    )
+    assert a["results"]["technical_analyst"]["tag"] == "a"
+    assert b["results"]["technical_analyst"]["tag"] == "b"
+
+
+@pytest.mark.asyncio
+async def test_persisted_variant_reads_session_repo_from_config():
+    repo = RecordingSessionRepo()
+    graph = get_research_graph(False, False, True)
+    token = current_execution_ctx.set(
+        ExecutionContext(session_id="00000000-0000-0000-0000-000000000001")
+    )
+    try:
+        await graph.ainvoke(
+            _state("A"), config=research_graph_config(TaggedGateway("a"), session_repo=repo)
+        )
+    finally:
+        current_execution_ctx.reset(token)
+    assert repo.node_types == ["technical_analyst"]
@@ -0,0 +1,108 @@
+"""研究编排数据预取：预取节点先于专家执行、会话内共用数据只查询一次。"""
+
+import asyncio
+
+import pytest
+
+from src.modules.coordinator.domain.model.enums import ExpertType
+from src.modules.coordinator.domain.ports.research_expert_gateway import (
+    IResearchExpertGateway,
+)
+from src.modules.coordinator.infrastructure.orchestration.graph_builder import (
+    get_research_graph,
+    research_graph_config,
+)
+from src.shared.infrastructure.execution_context import (
+    ExecutionContext,
+    SessionDataContext,
+    current_execution_ctx,
+    load_in_session,
+)
+
+
+class FakeGateway(IResearchExpertGateway):
+    """专家与预取都经 load_in_session 读取同一份“股票基础信息”。"""
+
+    def __init__(self):
+        self.queries = 0
+        self.events = []
+
+    async def _load_basic_info(self):
+        self.queries += 1
+        await asyncio.sleep(0.01)
+        return {"name": "平安银行"}
+
+    async def prefetch(self, symbol, expert_types, options=None):
+        self.events.append("prefetch")
+        await load_in_session(("stock_basic_info", symbol), self._load_basic_info)
+
+    async def run_expert(self, expert_type, symbol, options=None):
+        self.events.append(expert_type.value)
+        info = await load_in_session(("stock_basic_info", symbol), self._load_basic_info)
+        return {"stock_name": info["name"]}
+
+
+async def _run(gateway, experts):
+    graph = get_research_graph(with_debate=False, with_judge=False, persist=False)
+    return await graph.ainvoke(
+        {
+            "symbol": "000001.SZ",
+            "selected_experts": [e.value for e in experts],
+            "options": {},
+            "results": {},
+        },
+        config=research_graph_config(gateway),
+    )
+
+
+@pytest.mark.asyncio
+async def test_prefetch_runs_before_experts_and_dedupes_reads():
+    experts = [
+        ExpertType.VALUATION_MODELER,
+        ExpertType.MACRO_INTELLIGENCE,
+        ExpertType.CATALYST_DETECTIVE,
+    ]
+    gateway = FakeGateway()
+    token = current_execution_ctx.set(ExecutionContext(session_id="s-1", data=SessionDataContext()))
+    try:
+        state = await _run(gateway, experts)
+    finally:
+        current_execution_ctx.reset(token)
+
+    assert gateway.events[0] == "prefetch"
+    assert gateway.queries == 1
+    assert state["overall_status"] == "completed"
+    assert {v["stock_name"] for v in state["results"].values()} == {"平安银行"}
+
+
+@pytest.mark.asyncio
+async def test_without_session_data_context_experts_query_directly():
+    gateway = FakeGateway()
+    state = await _run(gateway, [ExpertType.MACRO_INTELLIGENCE, ExpertType.CATALYST_DETECTIVE])
+
+    # 无会话数据上下文：预取不缓存，各专家各查一次
+    assert gateway.queries == 3
+    assert len(state["results"]) == 2
+
+
+@pytest.mark.asyncio
+async def test_concurrent_loads_share_one_query_and_failures_are_not_memoized():
+    data = SessionDataContext()
+    calls = 0
+
+    async def loader():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return calls
+
+    results = await asyncio.gather(*(data.get_or_load("k", loader) for _ in range(5)))
+    assert results == [1] * 5
+    assert calls == 1
+
+    async def failing():
+        raise RuntimeError("db down")
+
+    with pytest.raises(RuntimeError):
+        await data.get_or_load("bad", failing)
+    assert await data.get_or_load("bad", loader) == 2
@@ -0,0 +1,144 @@
+"""SyncConceptDataCmd 单元测试（并发获取 + 批量写库）与 akshare 令牌桶限速器。"""
+
+import asyncio
+import time
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.modules.data_engineering.application.commands.sync_concept_data_cmd import (
+    SyncConceptDataCmd,
+)
+from src.modules.data_engineering.domain.dtos.concept_dtos import (
+    ConceptConstituentDTO,
+    ConceptInfoDTO,
+    ConceptMappingDiffDTO,
+)
+from src.modules.data_engineering.domain.model.concept import ConceptStock
+from src.modules.data_engineering.domain.services.concept_membership_differ import (
+    ConceptMembershipDiffer,
+)
+from src.modules.data_engineering.infrastructure.external_apis.akshare.rate_limiter import (
+    TokenBucketRateLimiter,
+)
+
+
+def _concepts(n: int) -> list[ConceptInfoDTO]:
+    return [ConceptInfoDTO(code=f"BK{i:04d}", name=f"概念{i}") for i in range(n)]
+
+
+@pytest.mark.asyncio
+async def test_execute_fetches_concurrently_and_writes_per_batch():
+    """测试：成份股并发获取（受并发数约束），每批概念一次写库。"""
+    in_flight = 0
+    max_in_flight = 0
+
+    async def fetch_constituents(name):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return [ConceptConstituentDTO(stock_code="000001.SZ", stock_name="平安银行")]
+
+    provider = AsyncMock()
+    provider.fetch_concept_list.return_value = _concepts(5)
+    provider.fetch_concept_constituents.side_effect = fetch_constituents
+    repo = AsyncMock()
+    repo.get_concept_states.return_value = {}
+    repo.replace_concepts_with_stocks.return_value = ConceptMappingDiffDTO()
+
+    cmd = SyncConceptDataCmd(provider, repo, concurrency=2, write_batch_size=2)
+    result = await cmd.execute()
+
+    assert result.success_concepts == 5
+    assert result.failed_concepts == 0
+    assert result.total_stocks == 5
+    assert max_in_flight == 2
+    batch_sizes = [len(c.args[0]) for c in repo.replace_concepts_with_stocks.await_args_list]
+    assert batch_sizes == [2, 2, 1]
+
+
+@pytest.mark.asyncio
+async def test_execute_isolates_fetch_and_batch_write_failures():
+    """测试：单个概念获取失败只跳过该概念；批次写入失败计入该批全部概念。"""
+
+    async def fetch_constituents(name):
+        if name == "概念1":
+            raise RuntimeError("network")
+        return []
+
+    provider = AsyncMock()
+    provider.fetch_concept_list.return_value = _concepts(4)
+    provider.fetch_concept_constituents.side_effect = fetch_constituents
+    repo = AsyncMock()
+    repo.get_concept_states.return_value = {}
+    repo.replace_concepts_with_stocks.side_effect = [
+        ConceptMappingDiffDTO(concepts=1),
+        RuntimeError("db"),
+    ]
+
+    cmd = SyncConceptDataCmd(provider, repo, concurrency=4, write_batch_size=2)
+    result = await cmd.execute()
+
+    assert [item.code for item in repo.replace_concepts_with_stocks.await_args_list[0].args[0]] == [
+        "BK0000"
+    ]
+    assert result.success_concepts == 1
+    assert result.failed_concepts == 3
+
+
+@pytest.mark.asyncio
+async def test_execute_skips_concepts_with_unchanged_membership():
+    """测试：名称与成份股内容哈希均未变化的概念不写库。"""
+    stocks = [ConceptStock(concept_code="BK0000", third_code="000001.SZ", stock_name="平安银行")]
+    provider = AsyncMock()
+    provider.fetch_concept_list.return_value = _concepts(2)
+    provider.fetch_concept_constituents.return_value = [
+        ConceptConstituentDTO(stock_code="000001.SZ", stock_name="平安银行")
+    ]
+    repo = AsyncMock()
+    repo.get_concept_states.return_value = {
+        "BK0000": ("概念0", ConceptMembershipDiffer.membership_hash(stocks)),
+        "BK0001": ("概念1", "stale"),
+    }
+    repo.replace_concepts_with_stocks.return_value = ConceptMappingDiffDTO(concepts=1, inserted=1)
+
+    result = await SyncConceptDataCmd(provider, repo).execute()
+
+    written = repo.replace_concepts_with_stocks.await_args.args[0]
+    assert [item.code for item in written] == ["BK0001"]
+    assert result.success_concepts == 2
+    assert result.unchanged_concepts == 1
+
+
+def test_membership_hash_ignores_order_and_tracks_names():
+    """测试：成份股内容哈希与顺序无关，股票名称变化时哈希变化。"""
+    a = ConceptStock(concept_code="BK0000", third_code="000001.SZ", stock_name="平安银行")
+    b = ConceptStock(concept_code="BK0000", third_code="600000.SH", stock_name="浦发银行")
+    renamed = b.model_copy(update={"stock_name": "浦发"})
+    membership_hash = ConceptMembershipDiffer.membership_hash
+
+    assert membership_hash([a, b]) == membership_hash([b, a])
+    assert membership_hash([a, b]) != membership_hash([a, renamed])
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_spaces_calls_without_holding_lock():
+    """测试：令牌桶按速率放行，等待期间不持锁，调用本身可重叠执行。"""
+    limiter = TokenBucketRateLimiter(rate=50.0, capacity=1)
+    starts: list[float] = []
+
+    async def call():
+        await limiter.acquire()
+        starts.append(time.monotonic())
+        await asyncio.sleep(0.1)  # 模拟远慢于限速间隔的网络调用
+
+    begin = time.monotonic()
+    await asyncio.gather(*(call() for _ in range(4)))
+    elapsed = time.monotonic() - begin
+
+    # 第 i 个调用最早在开始后 i / rate 秒放行（按相对起点判断，不受单次唤醒抖动影响）
+    assert all(start - begin >= 0.018 * i for i, start in enumerate(sorted(starts)))
+    # 持锁跨越网络调用时总耗时至少 0.4s
+    assert elapsed < 0.3
@@ -0,0 +1,122 @@
+"""SyncDailyHistoryPipelineCmd 单元测试。"""
+
+import asyncio
+from datetime import date
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.modules.data_engineering.application.commands.sync_daily_history_pipeline_cmd import (
+    BatchCheckpointTracker,
+    SyncDailyHistoryPipelineCmd,
+)
+from src.modules.data_engineering.domain.model.stock_daily import StockDaily
+
+
+def _make_stock(code: str) -> MagicMock:
+    return MagicMock(third_code=code, name=code)
+
+
+def _make_daily(code: str) -> StockDaily:
+    return StockDaily(
+        third_code=code,
+        trade_date=date(2024, 1, 15),
+        open=1.0,
+        high=1.0,
+        low=1.0,
+        close=1.0,
+        pre_close=1.0,
+        change=0.0,
+        pct_chg=0.0,
+        vol=1.0,
+        amount=1.0,
+    )
+
+
+class TestBatchCheckpointTracker:
+    """测试乱序完成时断点只推进到连续完成的批次。"""
+
+    def test_乱序完成时不越过未完成批次(self) -> None:
+        tracker = BatchCheckpointTracker(batch_size=2)
+        first = tracker.register(offset=0, size=2)
+        second = tracker.register(offset=2, size=2)
+
+        assert tracker.mark_done(second, synced=True) == []
+        assert tracker.mark_done(second, synced=True) == []
+        assert tracker.mark_done(first, synced=True) == []
+
+        committed = tracker.mark_done(first, synced=False)
+        assert [b.offset for b in committed] == [0, 2]
+        assert [tracker.next_offset(b) for b in committed] == [2, 4]
+        assert [b.synced_stocks for b in committed] == [1, 2]
+
+
+@pytest.fixture
+def stock_repo():
+    stocks = [_make_stock(f"00000{i}.SZ") for i in range(5)]
+    repo = AsyncMock()
+    repo.get_all.side_effect = lambda skip, limit: stocks[skip : skip + limit]
+    return repo
+
+
+@pytest.mark.asyncio
+async def test_execute_乱序拉取时断点单调递增(stock_repo):
+    """测试：后面的股票先返回时，断点仍按批次顺序提交。"""
+    delays = {"000000.SZ": 0.05, "000001.SZ": 0.0, "000002.SZ": 0.0, "000003.SZ": 0.01}
+
+    async def fetch_daily(third_code: str):
+        await asyncio.sleep(delays.get(third_code, 0.0))
+        return [_make_daily(third_code)]
+
+    provider = AsyncMock()
+    provider.fetch_daily.side_effect = fetch_daily
+    daily_repo = AsyncMock()
+    daily_repo.save_all.side_effect = lambda dailies: len(dailies)
+
+    checkpoints = []
+
+    async def on_checkpoint(processed: int, new_offset: int) -> None:
+        checkpoints.append((processed, new_offset))
+
+    cmd = SyncDailyHistoryPipelineCmd(stock_repo, daily_repo, provider, concurrency=4, queue_size=2)
+    result = await cmd.execute(batch_size=2, offset=0, on_checkpoint=on_checkpoint)
+
+    assert result.synced_stocks == 5
+    assert result.total_rows == 5
+    assert checkpoints == [(2, 2), (2, 4), (1, 6)]
+
+
+@pytest.mark.asyncio
+async def test_execute_单只股票失败不中断(stock_repo):
+    """测试：拉取失败的股票计入批次完成但不计入成功数。"""
+
+    async def fetch_daily(third_code: str):
+        if third_code == "000001.SZ":
+            raise RuntimeError("boom")
+        return [_make_daily(third_code)]
+
+    provider = AsyncMock()
+    provider.fetch_daily.side_effect = fetch_daily
+    daily_repo = AsyncMock()
+    daily_repo.save_all.side_effect = lambda dailies: len(dailies)
+    on_checkpoint = AsyncMock()
+
+    cmd = SyncDailyHistoryPipelineCmd(stock_repo, daily_repo, provider, concurrency=3)
+    result = await cmd.execute(batch_size=2, offset=2, on_checkpoint=on_checkpoint)
+
+    assert result.synced_stocks == 3
+    assert on_checkpoint.await_args_list[-1].args == (1, 6)
+
+
+@pytest.mark.asyncio
+async def test_execute_无股票时返回空结果():
+    """测试：offset 超出股票总数时直接返回。"""
+    repo = AsyncMock()
+    repo.get_all.return_value = []
+    provider = AsyncMock()
+
+    cmd = SyncDailyHistoryPipelineCmd(repo, AsyncMock(), provider)
+    result = await cmd.execute(batch_size=50, offset=5000)
+
+    assert result.synced_stocks == 0
+    provider.fetch_daily.assert_not_called()
@@ -0,0 +1,112 @@
+"""列式 DataFrame 转换单元测试：日期整列解析、NaN 转 None、非法行跳过。"""
+
+from datetime import date
+
+import numpy as np
+import pandas as pd
+
+from src.modules.data_engineering.infrastructure.external_apis.akshare.converters.market_data_assembler import (  # noqa: E501
+    AkShareMarketDataAssembler,
+)
+from src.modules.data_engineering.infrastructure.external_apis.tushare.converters.finance_converter import (  # noqa: E501
+    StockFinanceAssembler,
+)
+from src.modules.data_engineering.infrastructure.external_apis.tushare.converters.quote_converter import (  # noqa: E501
+    StockDailyAssembler,
+)
+
+
+def _daily_frame() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "ts_code": ["000001.SZ", "600000.SH", "000002.SZ"],
+            "trade_date": ["20240115", "20240115", "20240115"],
+            "open": [10.0, 8.0, 5.0],
+            "high": [10.5, 8.2, 5.1],
+            "low": [9.9, 7.9, 4.9],
+            "close": [10.2, 8.1, np.nan],
+            "pre_close": [10.0, 8.0, 5.0],
+            "change": [0.2, 0.1, 0.0],
+            "pct_chg": [2.0, 1.25, 0.0],
+            "vol": [1000.0, 2000.0, 3000.0],
+            "amount": [1.0e4, 2.0e4, 3.0e4],
+            "adj_factor": [1.1, np.nan, 1.0],
+            "pe": [5.0, 6.0, np.nan],
+        }
+    )
+
+
+def test_日线整列转换_NaN转None且非法行跳过() -> None:
+    dailies = StockDailyAssembler.to_domain_list(_daily_frame())
+
+    # 第 3 行 close 为 NaN（必填），被跳过
+    assert [d.third_code for d in dailies] == ["000001.SZ", "600000.SH"]
+    assert dailies[0].trade_date == date(2024, 1, 15)
+    assert dailies[0].adj_factor == 1.1
+    assert dailies[1].adj_factor is None
+    assert dailies[1].turnover_rate is None
+    assert dailies[0].source == "tushare"
+
+
+def test_财务指标缺少报告期的行被丢弃() -> None:
+    df = pd.DataFrame(
+        {
+            "ts_code": ["000001.SZ", "600000.SH"],
+            "ann_date": ["20240420", "20240421"],
+            "end_date": ["20240331", None],
+            "eps": [0.5, 0.3],
+            "roe": [np.nan, 1.0],
+        }
+    )
+
+    finances = StockFinanceAssembler.to_domain_list(df)
+
+    assert len(finances) == 1
+    assert finances[0].end_date == date(2024, 3, 31)
+    assert finances[0].eps == 0.5
+    assert finances[0].roe is None
+
+
+def test_涨停池代码转换与默认值() -> None:
+    df = pd.DataFrame(
+        {
+            "代码": ["000001", "688001", "999999"],
+            "名称": ["平安银行", "华兴源创", "未知"],
+            "涨跌幅": [10.0, 20.0, 10.0],
+            "最新价": [11.0, 30.0, 1.0],
+            "成交额": [1e8, np.nan, 1.0],
+            "换手率": [1.0, 2.0, 3.0],
+            "连板数": [2, np.nan, 1],
+            "首次封板时间": ["092500", None, "093000"],
+            "所属行业": ["银行", "半导体", ""],
+        }
+    )
+
+    result = AkShareMarketDataAssembler.to_limit_up_pool_list(df)
+
+    assert [r.third_code for r in result] == ["000001.SZ", "688001.SH"]
+    assert result[0].consecutive_boards == 2
+    assert result[1].consecutive_boards == 1
+    assert result[1].amount == 0.0
+    assert result[0].first_limit_up_time == "092500"
+    assert result[1].first_limit_up_time is None
+    assert result[0].last_limit_up_time is None
+
+
+def test_龙虎榜席位按列组装() -> None:
+    df = pd.DataFrame(
+        {
+            "代码": ["600000"],
+            "名称": ["浦发银行"],
+            "买1席位": ["机构专用"],
+            "买1金额": [1000.0],
+            "买2席位": ["-"],
+            "卖1席位": ["某营业部"],
+            "卖1金额": [500.0],
+        }
+    )
+
+    result = AkShareMarketDataAssembler.to_dragon_tiger_list(df)
+
+    assert result[0].buy_seats == [{"seat_name": "机构专用", "buy_amount": 1000.0}]
+    assert result[0].sell_seats == [{"seat_name": "某营业部", "sell_amount": 500.0}]
@@ -0,0 +1,94 @@
+"""ConceptMembershipDiffer 单元测试：成份股内容哈希与有变化 / 无变化概念拆分。"""
+
+from src.modules.data_engineering.domain.dtos.concept_dtos import ConceptWithStocksDTO
+from src.modules.data_engineering.domain.model.concept import ConceptStock
+from src.modules.data_engineering.domain.services.concept_membership_differ import (
+    ConceptMembershipDiffer,
+)
+
+
+def _stock(third_code: str, stock_name: str, concept_code: str = "BK0001") -> ConceptStock:
+    return ConceptStock(concept_code=concept_code, third_code=third_code, stock_name=stock_name)
+
+
+def _concept(code: str, name: str, stocks: list[tuple[str, str]]) -> ConceptWithStocksDTO:
+    return ConceptWithStocksDTO(
+        code=code,
+        name=name,
+        stocks=[_stock(third_code, stock_name, code) for third_code, stock_name in stocks],
+    )
+
+
+BASE_STOCKS = [("000001.SZ", "平安银行"), ("600000.SH", "浦发银行")]
+
+
+class TestMembershipHash:
+    """测试 membership_hash()"""
+
+    def test_与成份股顺序无关(self) -> None:
+        forward = [_stock(c, n) for c, n in BASE_STOCKS]
+        backward = list(reversed(forward))
+        assert ConceptMembershipDiffer.membership_hash(
+            forward
+        ) == ConceptMembershipDiffer.membership_hash(backward)
+
+    def test_新增或移除成份股时哈希变化(self) -> None:
+        base = ConceptMembershipDiffer.membership_hash([_stock(c, n) for c, n in BASE_STOCKS])
+        added = ConceptMembershipDiffer.membership_hash(
+            [_stock(c, n) for c, n in BASE_STOCKS + [("000002.SZ", "万科A")]]
+        )
+        removed = ConceptMembershipDiffer.membership_hash([_stock(*BASE_STOCKS[0])])
+        assert len({base, added, removed}) == 3
+
+    def test_股票更名时哈希变化(self) -> None:
+        base = ConceptMembershipDiffer.membership_hash([_stock("000001.SZ", "平安银行")])
+        renamed = ConceptMembershipDiffer.membership_hash([_stock("000001.SZ", "ST平安")])
+        assert base != renamed
+
+
+class TestSplitChanged:
+    """测试 split_changed()"""
+
+    def test_哈希与名称均未变的概念被跳过(self) -> None:
+        differ = ConceptMembershipDiffer()
+        item = _concept("BK0001", "银行", BASE_STOCKS)
+        current = {"BK0001": ("银行", differ.membership_hash(item.stocks))}
+
+        changed, unchanged = differ.split_changed([item], current)
+
+        assert changed == []
+        assert unchanged == [item]
+
+    def test_新增移除成份股及新概念均视为有变化(self) -> None:
+        differ = ConceptMembershipDiffer()
+        stored_hash = differ.membership_hash(_concept("BK0001", "银行", BASE_STOCKS).stocks)
+        current = {
+            "BK0001": ("银行", stored_hash),
+            "BK0002": ("银行", stored_hash),
+        }
+        added = _concept("BK0001", "银行", BASE_STOCKS + [("000002.SZ", "万科A")])
+        removed = _concept("BK0002", "银行", BASE_STOCKS[:1])
+        brand_new = _concept("BK0003", "券商", [("600030.SH", "中信证券")])
+
+        changed, unchanged = differ.split_changed([added, removed, brand_new], current)
+
+        assert [c.code for c in changed] == ["BK0001", "BK0002", "BK0003"]
+        assert unchanged == []
+
+    def test_仅概念名称变化也视为有变化(self) -> None:
+        differ = ConceptMembershipDiffer()
+        item = _concept("BK0001", "银行板块", BASE_STOCKS)
+        current = {"BK0001": ("银行", differ.membership_hash(item.stocks))}
+
+        changed, unchanged = differ.split_changed([item], current)
+
+        assert changed == [item]
+        assert unchanged == []
+
+    def test_库中尚无哈希时视为有变化(self) -> None:
+        differ = ConceptMembershipDiffer()
+        item = _concept("BK0001", "银行", BASE_STOCKS)
+
+        changed, _ = differ.split_changed([item], {"BK0001": ("银行", None)})
+
+        assert changed == [item]
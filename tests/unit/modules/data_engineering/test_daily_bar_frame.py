@@ -0,0 +1,99 @@
+"""测试日线列投影读路径：投影行 -> DTO / 列式 DailyBarFrame -> 研究模块输入，以及按字段投影的估值历史。"""
+
+from datetime import date
+from unittest.mock import AsyncMock
+
+import numpy as np
+import pytest
+
+from src.modules.data_engineering.application.queries.get_daily_bars_for_ticker import (
+    GetDailyBarsForTickerUseCase,
+)
+from src.modules.data_engineering.application.queries.get_valuation_dailies_for_ticker import (
+    GetValuationDailiesForTickerUseCase,
+)
+from src.modules.data_engineering.domain.model.daily_bar_row import DailyBarRow
+from src.modules.data_engineering.infrastructure.persistence.repositories.pg_quote_repo import (
+    StockDailyRepositoryImpl,
+)
+from src.modules.research.infrastructure.adapters.market_quote_adapter import MarketQuoteAdapter
+from src.modules.research.infrastructure.adapters.valuation_data_adapter import (
+    ValuationDataAdapter,
+)
+
+ROWS = [
+    DailyBarRow("000001.SZ", "", date(2024, 1, 2), 10.0, 10.5, 9.8, 10.2, 1000.0, 1.0e4, 2.0),
+    DailyBarRow("000001.SZ", "", date(2024, 1, 3), 10.2, 10.4, 10.0, 10.1, 800.0, 0.8e4, -0.98),
+]
+
+
+def _use_case(rows) -> GetDailyBarsForTickerUseCase:
+    repo = AsyncMock()
+    repo.get_by_third_code_and_date_range.return_value = rows
+    return GetDailyBarsForTickerUseCase(market_quote_repo=repo)
+
+
+@pytest.mark.asyncio
+async def test_列式结果按字段为数组() -> None:
+    frame = await _use_case(ROWS).execute_frame("000001.SZ", date(2024, 1, 1), date(2024, 1, 31))
+
+    assert len(frame) == 2
+    assert frame.close.dtype == np.float64
+    np.testing.assert_allclose(frame.close, [10.2, 10.1])
+    assert frame.trade_date.tolist() == [date(2024, 1, 2), date(2024, 1, 3)]
+
+    empty = await _use_case([]).execute_frame("000001.SZ", date(2024, 1, 1), date(2024, 1, 31))
+    assert len(empty) == 0 and empty.vol.dtype == np.float64
+
+
+@pytest.mark.asyncio
+async def test_DTO与研究模块输入字段一致() -> None:
+    use_case = _use_case(ROWS)
+
+    dtos = await use_case.execute("000001.SZ", date(2024, 1, 1), date(2024, 1, 31))
+    bars = await MarketQuoteAdapter(use_case).get_daily_bars(
+        "000001.SZ", date(2024, 1, 1), date(2024, 1, 31)
+    )
+
+    assert [b.model_dump() for b in bars] == [
+        d.model_dump(exclude={"third_code", "stock_name"}) for d in dtos
+    ]
+    assert bars[1].pct_chg == -0.98
+
+
+@pytest.mark.asyncio
+async def test_估值历史按字段投影且空值还原为None() -> None:
+    repo = AsyncMock()
+    repo.get_field_history.return_value = {
+        "trade_date": [date(2024, 1, 2), date(2024, 1, 3)],
+        "close": [10.0, None],
+        "pe_ttm": [12.5, None],
+        "pb": [1.2, 1.3],
+        "ps_ttm": [None, 2.0],
+    }
+    adapter = ValuationDataAdapter(
+        get_stock_basic_info_use_case=AsyncMock(),
+        get_valuation_dailies_use_case=GetValuationDailiesForTickerUseCase(repo),
+        get_finance_use_case=AsyncMock(),
+    )
+
+    dailies = await adapter.get_valuation_dailies("000001.SZ", date(2024, 1, 1), date(2024, 1, 31))
+
+    assert repo.get_field_history.await_args.kwargs["fields"] == (
+        "trade_date",
+        "close",
+        "pe_ttm",
+        "pb",
+        "ps_ttm",
+    )
+    assert [d.pe_ttm for d in dailies] == [12.5, None]
+    assert [d.ps_ttm for d in dailies] == [None, 2.0]
+    assert dailies[1].close == 0.0
+
+
+@pytest.mark.asyncio
+async def test_字段投影拒绝未知字段() -> None:
+    repo = StockDailyRepositoryImpl(session=AsyncMock())
+
+    with pytest.raises(ValueError):
+        await repo.get_field_history("000001.SZ", date(2024, 1, 1), date(2024, 1, 31), ["bogus"])
@@ -0,0 +1,208 @@
+"""
+测试日线历史回补规划：按股票 / 按交易日策略选择，以及按交易日回补的断点分批。
+"""
+
+from datetime import date
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.modules.data_engineering.application.commands.sync_engine import SyncEngine
+from src.modules.data_engineering.application.dtos.sync_result_dtos import (
+    DailyByDateSyncResult,
+    DailyHistorySyncResult,
+)
+from src.modules.data_engineering.domain.model.enums import (
+    SyncJobType,
+    SyncTaskStatus,
+)
+from src.modules.data_engineering.domain.model.sync_task import SyncTask
+from src.modules.data_engineering.domain.services.daily_history_sync_planner import (
+    DailyHistorySyncPlanner,
+)
+
+
+class TestDailyHistorySyncPlanner:
+    """测试策略选择"""
+
+    def test_缺失股票少时按股票回补(self) -> None:
+        plan = DailyHistorySyncPlanner().plan(
+            start_date="20240101",
+            end_date="20241231",
+            listed_tickers=5300,
+            missing_tickers=["000001.SZ", "600000.SH"],
+            trade_days=242,
+        )
+        assert plan.job_type == SyncJobType.DAILY_HISTORY
+        assert plan.per_ticker_calls == 6
+        assert plan.per_date_calls == 726
+
+    def test_缺失股票多时按交易日回补(self) -> None:
+        plan = DailyHistorySyncPlanner().plan(
+            start_date="20240101",
+            end_date="20241231",
+            listed_tickers=5300,
+            missing_tickers=[f"{i:06d}.SZ" for i in range(5300)],
+            trade_days=242,
+        )
+        assert plan.job_type == SyncJobType.DAILY_HISTORY_BY_DATE
+
+
+def _make_engine(daily_repo=None, stock_repo=None) -> SyncEngine:
+    return SyncEngine(
+        sync_task_repo=AsyncMock(),
+        stock_repo=stock_repo or AsyncMock(),
+        daily_repo=daily_repo or AsyncMock(),
+        finance_repo=AsyncMock(),
+        quote_provider=AsyncMock(),
+        finance_provider=AsyncMock(),
+    )
+
+
+@pytest.mark.asyncio
+async def test_plan_daily_history_backfill_统计缺失股票() -> None:
+    stock_repo = AsyncMock()
+    stock_repo.get_all_third_codes.return_value = ["000001.SZ", "000002.SZ", "600000.SH"]
+    daily_repo = AsyncMock()
+    daily_repo.get_third_codes_with_dailies.return_value = ["000001.SZ", "600000.SH"]
+    engine = _make_engine(daily_repo=daily_repo, stock_repo=stock_repo)
+
+    plan = await engine.plan_daily_history_backfill("20240101", "20240131")
+
+    assert plan.missing_tickers == ["000002.SZ"]
+    assert plan.job_type == SyncJobType.DAILY_HISTORY
+    daily_repo.get_third_codes_with_dailies.assert_awaited_once_with(
+        date(2024, 1, 1), date(2024, 1, 31)
+    )
+
+
+@pytest.mark.asyncio
+async def test_execute_by_date_batch_按offset切片交易日(monkeypatch) -> None:
+    engine = _make_engine()
+    executed = []
+
+    async def fake_execute(self, trade_date: str) -> DailyByDateSyncResult:
+        executed.append(trade_date)
+        return DailyByDateSyncResult(status="success", count=10)
+
+    monkeypatch.setattr(
+        "src.modules.data_engineering.application.commands.sync_engine."
+        "SyncDailyByDateCmd.execute",
+        fake_execute,
+    )
+    task = SyncTask(
+        job_type=SyncJobType.DAILY_HISTORY_BY_DATE,
+        status=SyncTaskStatus.RUNNING,
+        batch_size=2,
+        current_offset=2,
+        config={"start_date": "20240101", "end_date": "20240107"},
+    )
+
+    result = await engine._execute_by_date_batch(task)
+
+    # 20240101~20240107 的工作日为 1/1~1/5，offset=2 取第 3、4 个
+    assert executed == ["20240103", "20240104"]
+    assert result.synced_dates == 2
+    assert result.total_rows == 20
+
+
+@pytest.mark.asyncio
+async def test_execute_by_date_batch_越界返回0() -> None:
+    engine = _make_engine()
+    task = MagicMock(
+        batch_size=20,
+        current_offset=100,
+        config={"start_date": "20240101", "end_date": "20240107"},
+    )
+
+    result = await engine._execute_by_date_batch(task)
+
+    assert result.synced_dates == 0
+
+
+def _paused_task(config, job_type=SyncJobType.DAILY_HISTORY) -> SyncTask:
+    return SyncTask(
+        job_type=job_type,
+        status=SyncTaskStatus.PAUSED,
+        current_offset=150,
+        config=config,
+    )
+
+
+async def _run_with_latest(
+    latest: SyncTask, config, paused=(), job_type=SyncJobType.DAILY_HISTORY
+) -> SyncTask:
+    engine = _make_engine()
+    engine.sync_task_repo.get_latest_by_job_type.return_value = latest
+    engine.sync_task_repo.list_paused_by_job_type.return_value = list(paused)
+    engine.sync_task_repo.create.side_effect = lambda task: task
+    engine._execute_batch = AsyncMock(return_value=DailyHistorySyncResult())
+    return await engine.run_history_sync(job_type, config)
+
+
+@pytest.mark.asyncio
+async def test_按股票回补不续跑暂停中的全量同步() -> None:
+    full_sync = _paused_task({"concurrency": 1})
+    backfill_config = {
+        "concurrency": 1,
+        "start_date": "20240101",
+        "end_date": "20240131",
+        "third_codes": ["000002.SZ"],
+    }
+
+    task = await _run_with_latest(full_sync, backfill_config)
+
+    assert task is not full_sync
+    assert task.current_offset == 0
+    assert task.config["third_codes"] == ["000002.SZ"]
+
+
+@pytest.mark.asyncio
+async def test_全量同步不续跑暂停中的按股票回补() -> None:
+    backfill = _paused_task(
+        {"start_date": "20240101", "end_date": "20240131", "third_codes": ["000002.SZ"]}
+    )
+
+    task = await _run_with_latest(backfill, {"concurrency": 1})
+
+    assert task is not backfill
+    assert "third_codes" not in task.config
+
+
+@pytest.mark.asyncio
+async def test_覆盖范围一致时断点续跑() -> None:
+    full_sync = _paused_task({"concurrency": 1, "timeout_message": "超时自动暂停"})
+
+    task = await _run_with_latest(full_sync, {"concurrency": 1})
+
+    assert task is full_sync
+    assert task.current_offset == 150
+
+
+@pytest.mark.asyncio
+async def test_仅结束日期不同时财务历史任务断点续跑() -> None:
+    config = {"batch_size": 100, "start_date": "20200101"}
+    paused = _paused_task({**config, "end_date": "20241017"}, job_type=SyncJobType.FINANCE_HISTORY)
+
+    task = await _run_with_latest(
+        paused, {**config, "end_date": "20241018"}, job_type=SyncJobType.FINANCE_HISTORY
+    )
+
+    assert task is paused
+    assert task.current_offset == 150
+    assert task.config["end_date"] == "20241018"
+
+
+@pytest.mark.asyncio
+async def test_最近任务为回补时仍续跑更早暂停的全量同步() -> None:
+    backfill = SyncTask(
+        job_type=SyncJobType.DAILY_HISTORY,
+        status=SyncTaskStatus.COMPLETED,
+        config={"start_date": "20240101", "third_codes": ["000002.SZ"]},
+    )
+    full_sync = _paused_task({"concurrency": 1})
+
+    task = await _run_with_latest(backfill, {"concurrency": 1}, paused=[full_sync])
+
+    assert task is full_sync
+    assert task.current_offset == 150
@@ -0,0 +1,127 @@
+"""测试 stock_daily 年度分区维护：缺失分区按需创建、仅缓存已提交的分区、写入前按年确保分区。"""
+
+from contextlib import asynccontextmanager
+from datetime import date
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.modules.data_engineering.domain.model.stock_daily import StockDaily
+from src.modules.data_engineering.infrastructure.persistence import partitioning
+from src.modules.data_engineering.infrastructure.persistence.repositories.pg_quote_repo import (
+    StockDailyRepositoryImpl,
+)
+
+
+@pytest.fixture(autouse=True)
+def _reset_known_partitions():
+    partitioning._known_partitions.clear()
+    yield
+    partitioning._known_partitions.clear()
+
+
+class _DuplicateTable(Exception):
+    sqlstate = "42P07"
+
+
+class _LockTimeout(Exception):
+    sqlstate = "55P03"
+
+
+def _mock_session(existing=(), ddl_error=None) -> AsyncSession:
+    """真实 AsyncSession（提交 / 回滚触发会话事件），数据库语句以桩替代。"""
+    session = AsyncSession()
+    session.sync_session.begin()
+    session.scalar = AsyncMock(
+        side_effect=lambda stmt, params: params["name"] if params["name"] in existing else None
+    )
+    session.execute = AsyncMock(side_effect=ddl_error)
+
+    @asynccontextmanager
+    async def begin_nested():
+        yield
+
+    session.begin_nested = begin_nested
+    return session
+
+
+@pytest.mark.asyncio
+async def test_仅创建缺失分区且提交后进程内只检查一次() -> None:
+    session = _mock_session(existing={"stock_daily_y2024"})
+
+    created = await partitioning.ensure_year_partitions(session, "stock_daily", [2025, 2024, 2025])
+
+    assert created == ["stock_daily_y2025"]
+    ddl = str(session.execute.await_args.args[0])
+    assert "PARTITION OF \"stock_daily\" FOR VALUES FROM ('2025-01-01') TO ('2026-01-01')" in ddl
+    # 同一事务内不重复创建
+    assert await partitioning.ensure_year_partitions(session, "stock_daily", [2025]) == []
+    assert session.execute.await_count == 1
+
+    await session.commit()
+    session.scalar.reset_mock()
+    assert await partitioning.ensure_year_partitions(session, "stock_daily", [2024, 2025]) == []
+    session.scalar.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_事务回滚时新建分区不进入缓存() -> None:
+    session = _mock_session()
+    assert await partitioning.ensure_year_partitions(session, "stock_daily", [2025]) == [
+        "stock_daily_y2025"
+    ]
+
+    await session.rollback()
+
+    assert "stock_daily_y2025" not in partitioning._known_partitions
+    session.sync_session.begin()
+    assert await partitioning.ensure_year_partitions(session, "stock_daily", [2025]) == [
+        "stock_daily_y2025"
+    ]
+
+
+@pytest.mark.asyncio
+async def test_并发创建冲突跳过且不缓存_其他错误抛出() -> None:
+    duplicate = DBAPIError("CREATE TABLE", {}, _DuplicateTable("already exists"))
+    session = _mock_session(ddl_error=duplicate)
+    assert await partitioning.ensure_year_partitions(session, "stock_daily", [2025]) == []
+    await session.commit()
+    assert "stock_daily_y2025" not in partitioning._known_partitions
+
+    timeout = DBAPIError("CREATE TABLE", {}, _LockTimeout("lock timeout"))
+    with pytest.raises(DBAPIError):
+        await partitioning.ensure_year_partitions(
+            _mock_session(ddl_error=timeout), "stock_daily", [2025]
+        )
+    assert "stock_daily_y2025" not in partitioning._known_partitions
+
+
+@pytest.mark.asyncio
+async def test_写入前按年确保分区并按交易日排序() -> None:
+    repo = StockDailyRepositoryImpl(session=MagicMock())
+    repo.ensure_year_partitions = AsyncMock(return_value=[])
+    repo.upsert_all = AsyncMock()
+
+    def bar(day: date) -> StockDaily:
+        return StockDaily(
+            third_code="000001.SZ",
+            trade_date=day,
+            open=1,
+            high=1,
+            low=1,
+            close=1,
+            pre_close=1,
+            change=0,
+            pct_chg=0,
+            vol=1,
+            amount=1,
+        )
+
+    saved = await repo.save_all([bar(date(2025, 1, 2)), bar(date(2024, 12, 31))])
+
+    assert saved == 2
+    repo.ensure_year_partitions.assert_awaited_once_with({2024, 2025})
+    items = repo.upsert_all.await_args.kwargs["items"]
+    assert [i["trade_date"] for i in items] == [date(2024, 12, 31), date(2025, 1, 2)]
@@ -0,0 +1,151 @@
+"""
+测试交易日历服务：缓存查询、从数据源补齐、不可用时降级，以及增量同步跳过非交易日。
+"""
+
+from contextlib import asynccontextmanager
+from datetime import date
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.exc import DBAPIError
+
+from src.modules.data_engineering.application.commands.sync_engine import SyncEngine
+from src.modules.data_engineering.application.dtos.sync_result_dtos import (
+    DailyByDateSyncResult,
+)
+from src.modules.data_engineering.application.services.trading_calendar_service import (
+    TradingCalendarCache,
+    TradingCalendarService,
+)
+from src.modules.data_engineering.domain.model.trade_calendar import TradeCalendarDay
+from src.modules.data_engineering.infrastructure.persistence.repositories.pg_trade_calendar_repo import (  # noqa: E501
+    PgTradeCalendarRepository,
+)
+
+# 2024 年国庆：9/30 周一交易，10/1~10/7 休市，10/8 周二开市
+OPEN_DAYS = [date(2024, 9, 27), date(2024, 9, 30), date(2024, 10, 8), date(2024, 10, 9)]
+
+
+def _make_repo(open_days=None, covered_until=None) -> AsyncMock:
+    repo = AsyncMock()
+    repo.get_open_dates.return_value = open_days or []
+    repo.get_latest_cal_date.return_value = covered_until
+    return repo
+
+
+def _make_service(repo, provider=None) -> TradingCalendarService:
+    return TradingCalendarService(
+        calendar_repo=repo,
+        provider_factory=(lambda: provider) if provider else None,
+        exchange="SSE",
+        cache=TradingCalendarCache(ttl_seconds=3600),
+    )
+
+
+@pytest.mark.asyncio
+async def test_节假日不是交易日且只加载一次() -> None:
+    repo = _make_repo(OPEN_DAYS, date(2024, 12, 31))
+    service = _make_service(repo)
+
+    assert await service.is_trading_day(date(2024, 10, 8)) is True
+    assert await service.is_trading_day(date(2024, 10, 2)) is False
+    assert await service.get_trading_days(date(2024, 9, 28), date(2024, 10, 8)) == [
+        date(2024, 9, 30),
+        date(2024, 10, 8),
+    ]
+    assert await service.get_previous_trading_day(date(2024, 10, 8)) == date(2024, 9, 30)
+    repo.get_open_dates.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_数据库为空时从数据源补齐() -> None:
+    repo = _make_repo()
+    provider = AsyncMock()
+    provider.fetch_trade_calendar.return_value = [
+        TradeCalendarDay(cal_date=date(2024, 10, 1), is_open=False)
+    ]
+
+    async def save_all(days):
+        repo.get_open_dates.return_value = OPEN_DAYS
+        repo.get_latest_cal_date.return_value = date(2024, 12, 31)
+        return len(days)
+
+    repo.save_all.side_effect = save_all
+    service = _make_service(repo, provider)
+
+    assert await service.is_trading_day(date(2024, 10, 1)) is False
+    provider.fetch_trade_calendar.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_数据源不可用时降级为工作日且不重复请求() -> None:
+    repo = _make_repo()
+    provider = AsyncMock()
+    provider.fetch_trade_calendar.side_effect = RuntimeError("boom")
+    service = _make_service(repo, provider)
+
+    assert await service.is_trading_day(date(2024, 10, 1)) is True
+    assert await service.is_trading_day(date(2024, 10, 5)) is False
+    provider.fetch_trade_calendar.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_日历查询失败时只回滚savepoint不影响调用方会话() -> None:
+    events = []
+    session = MagicMock()
+
+    @asynccontextmanager
+    async def begin_nested():
+        events.append("savepoint")
+        try:
+            yield
+        except Exception:
+            events.append("rollback_to_savepoint")
+            raise
+        events.append("release_savepoint")
+
+    session.begin_nested = begin_nested
+    session.execute = AsyncMock(
+        side_effect=DBAPIError("SELECT", {}, Exception("relation does not exist"))
+    )
+    service = _make_service(PgTradeCalendarRepository(session))
+
+    assert await service.is_trading_day(date(2024, 10, 1)) is True
+    assert events == ["savepoint", "rollback_to_savepoint"]
+    session.rollback.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_增量同步只补偿交易日(monkeypatch) -> None:
+    daily_repo = AsyncMock()
+    daily_repo.get_latest_trade_date.return_value = date(2024, 9, 27)
+    calendar = _make_service(_make_repo(OPEN_DAYS, date(2024, 12, 31)))
+    engine = SyncEngine(
+        sync_task_repo=AsyncMock(),
+        stock_repo=AsyncMock(),
+        daily_repo=daily_repo,
+        finance_repo=AsyncMock(),
+        quote_provider=AsyncMock(),
+        finance_provider=AsyncMock(),
+        trading_calendar=calendar,
+    )
+    executed = []
+
+    async def fake_execute(self, trade_date: str) -> DailyByDateSyncResult:
+        executed.append(trade_date)
+        return DailyByDateSyncResult(status="success", count=1)
+
+    monkeypatch.setattr(
+        "src.modules.data_engineering.application.commands.sync_engine."
+        "SyncDailyByDateCmd.execute",
+        fake_execute,
+    )
+
+    result = await engine.run_incremental_daily_sync("20241008")
+    assert executed == ["20240930", "20241008"]
+
+    executed.clear()
+    daily_repo.get_latest_trade_date.return_value = date(2024, 10, 9)
+    result = await engine.run_incremental_daily_sync("20241012")
+    assert executed == []
+    assert result["synced_dates"] == []
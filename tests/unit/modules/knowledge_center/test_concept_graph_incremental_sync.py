@@ -0,0 +1,163 @@
+"""概念图谱增量同步单元测试：变更日志折叠 / 分页游标推进与 SyncConceptGraphCommand.execute_incremental。"""
+
+from datetime import datetime
+from unittest.mock import AsyncMock
+
+from src.modules.data_engineering.domain.dtos.concept_dtos import (
+    ConceptMembershipChangeDTO,
+    ConceptWithStocksDTO,
+)
+from src.modules.data_engineering.domain.model.enums import ConceptChangeType
+from src.modules.knowledge_center.application.commands.sync_concept_graph_command import (
+    SyncConceptGraphCommand,
+)
+from src.modules.knowledge_center.domain.dtos.concept_sync_dtos import ConceptGraphSyncDTO
+from src.modules.knowledge_center.domain.dtos.graph_sync_dtos import SyncResult
+from src.modules.knowledge_center.infrastructure.adapters.concept_data_adapter import (
+    CONCEPT_GRAPH_CONSUMER,
+    ConceptDataAdapter,
+)
+
+
+def _change(
+    change_id: int,
+    concept_code: str,
+    third_code: str,
+    change_type: ConceptChangeType,
+) -> ConceptMembershipChangeDTO:
+    return ConceptMembershipChangeDTO(
+        id=change_id,
+        concept_code=concept_code,
+        third_code=third_code,
+        stock_name="股票",
+        change_type=change_type,
+        changed_at=datetime(2026, 1, 5),
+    )
+
+
+def _concept_repo(changes: list[ConceptMembershipChangeDTO], cursor: int | None = 0) -> AsyncMock:
+    """按 id > after_id 分页返回变更日志的概念仓储替身。"""
+
+    async def get_membership_changes(after_id, limit):
+        return [c for c in changes if c.id > after_id][:limit]
+
+    repo = AsyncMock()
+    repo.get_membership_changes.side_effect = get_membership_changes
+    repo.get_change_cursor.return_value = cursor
+    repo.get_concept_states.return_value = {
+        "BK0001": ("银行", "h1"),
+        "BK0002": ("券商", "h2"),
+    }
+    return repo
+
+
+def _graph_repo(failed: int = 0) -> AsyncMock:
+    async def merge_concepts(concepts, batch_size=500):
+        return SyncResult(
+            total=len(concepts),
+            success=len(concepts) - failed,
+            failed=failed,
+            duration_ms=0.0,
+            error_details=["写入失败"] if failed else [],
+        )
+
+    repo = AsyncMock()
+    repo.merge_concepts.side_effect = merge_concepts
+    repo.remove_concept_relationships.return_value = 0
+    return repo
+
+
+async def test_fetch_concept_delta_页内同一映射以最后一次变更为准():
+    """测试：先增后删的映射只出现在 removed，更名不影响关系但计入条数。"""
+    repo = _concept_repo(
+        [
+            _change(11, "BK0001", "000001.SZ", ConceptChangeType.ADDED),
+            _change(12, "BK0001", "000001.SZ", ConceptChangeType.REMOVED),
+            _change(13, "BK0001", "600000.SH", ConceptChangeType.ADDED),
+            _change(14, "BK0002", "600030.SH", ConceptChangeType.REMOVED),
+            _change(15, "BK0002", "000002.SZ", ConceptChangeType.RENAMED),
+        ]
+    )
+
+    delta = await ConceptDataAdapter(repo).fetch_concept_delta(10, 100)
+
+    assert delta.added == [
+        ConceptGraphSyncDTO(code="BK0001", name="银行", stock_third_codes=["600000.SH"])
+    ]
+    assert {(d.code, tuple(d.stock_third_codes)) for d in delta.removed} == {
+        ("BK0001", ("000001.SZ",)),
+        ("BK0002", ("600030.SH",)),
+    }
+    assert delta.change_count == 5
+    assert delta.last_change_id == 15
+
+
+async def test_fetch_concept_delta_按页读取并返回本页最后一条id():
+    """测试：每页最多 limit 条，游标为本页最后一条 id；读完后 change_count 为 0 且游标不动。"""
+    changes = [_change(i, "BK0001", f"{i:06d}.SZ", ConceptChangeType.ADDED) for i in range(1, 6)]
+    adapter = ConceptDataAdapter(_concept_repo(changes))
+
+    first = await adapter.fetch_concept_delta(0, 2)
+    second = await adapter.fetch_concept_delta(first.last_change_id, 2)
+    third = await adapter.fetch_concept_delta(second.last_change_id, 2)
+    done = await adapter.fetch_concept_delta(third.last_change_id, 2)
+
+    assert [first.last_change_id, second.last_change_id, third.last_change_id] == [2, 4, 5]
+    assert [first.change_count, second.change_count, third.change_count] == [2, 2, 1]
+    assert done.change_count == 0
+    assert done.last_change_id == 5
+
+
+async def test_execute_incremental_逐页应用并推进游标():
+    """测试：每页先移除再写入关系，全部成功后保存游标，返回已应用的变更条数。"""
+    changes = [
+        _change(101, "BK0001", "000001.SZ", ConceptChangeType.ADDED),
+        _change(102, "BK0001", "600000.SH", ConceptChangeType.REMOVED),
+        _change(103, "BK0002", "600030.SH", ConceptChangeType.ADDED),
+    ]
+    concept_repo = _concept_repo(changes, cursor=100)
+    graph_repo = _graph_repo()
+
+    cmd = SyncConceptGraphCommand(graph_repo, ConceptDataAdapter(concept_repo))
+    result = await cmd.execute_incremental(batch_size=10, page_size=2)
+
+    assert result.total == 3
+    assert result.failed == 0
+    saved = [c.args for c in concept_repo.save_change_cursor.await_args_list]
+    assert saved == [(CONCEPT_GRAPH_CONSUMER, 102), (CONCEPT_GRAPH_CONSUMER, 103)]
+    removed_pages = [c.args[0] for c in graph_repo.remove_concept_relationships.await_args_list]
+    assert [[d.code for d in page] for page in removed_pages] == [["BK0001"], []]
+    graph_repo.delete_all_concept_relationships.assert_not_awaited()
+
+
+async def test_execute_incremental_写入失败时游标停留在失败页之前():
+    """测试：某页有概念写入失败时停止且不保存游标，下次从该页重新应用。"""
+    concept_repo = _concept_repo(
+        [_change(101, "BK0001", "000001.SZ", ConceptChangeType.ADDED)], cursor=100
+    )
+    graph_repo = _graph_repo(failed=1)
+
+    cmd = SyncConceptGraphCommand(graph_repo, ConceptDataAdapter(concept_repo))
+    result = await cmd.execute_incremental()
+
+    assert result.total == 0
+    assert result.failed == 1
+    assert result.error_details == ["写入失败"]
+    concept_repo.save_change_cursor.assert_not_awaited()
+
+
+async def test_execute_incremental_从未同步过时退化为全量同步():
+    """测试：无游标时执行全量同步，并把同步前记录的最新变更 id 作为游标。"""
+    concept_repo = _concept_repo([], cursor=None)
+    concept_repo.get_latest_change_id.return_value = 42
+    concept_repo.get_all_concepts_with_stocks.return_value = [
+        ConceptWithStocksDTO(code="BK0001", name="银行")
+    ]
+    graph_repo = _graph_repo()
+
+    cmd = SyncConceptGraphCommand(graph_repo, ConceptDataAdapter(concept_repo))
+    await cmd.execute_incremental()
+
+    graph_repo.delete_all_concept_relationships.assert_awaited_once()
+    concept_repo.get_membership_changes.assert_not_awaited()
+    concept_repo.save_change_cursor.assert_awaited_once_with(CONCEPT_GRAPH_CONSUMER, 42)
@@ -0,0 +1,146 @@
+"""LLM Provider 客户端池与注册表原子刷新测试。"""
+
+import asyncio
+
+import pytest
+
+from src.modules.llm_platform.domain.entities.llm_config import LLMConfig
+from src.modules.llm_platform.infrastructure import client_pool
+from src.modules.llm_platform.infrastructure.client_pool import LLMClientPool
+from src.modules.llm_platform.infrastructure.registry import LLMRegistry
+
+
+def make_config(alias, base_url="https://a.example/v1", api_key="k1", **kwargs):
+    return LLMConfig(
+        alias=alias,
+        vendor="test",
+        provider_type="openai",
+        api_key=api_key,
+        base_url=base_url,
+        model_name=f"{alias}-model",
+        **kwargs,
+    )
+
+
+class FakeConfigRepo:
+    def __init__(self, configs):
+        self.configs = configs
+        self.gate = None
+
+    async def get_active_configs(self):
+        if self.gate is not None:
+            await self.gate.wait()
+        return list(self.configs)
+
+
+@pytest.fixture
+def pool(monkeypatch):
+    pool = LLMClientPool(http2=False, close_grace_seconds=0)
+    monkeypatch.setattr(client_pool, "_llm_client_pool", pool)
+    monkeypatch.setattr(LLMRegistry, "_providers", {})
+    monkeypatch.setattr(LLMRegistry, "_configs", {})
+    return pool
+
+
+@pytest.mark.asyncio
+async def test_aliases_sharing_endpoint_reuse_one_client(pool):
+    registry = LLMRegistry()
+    registry.set_repository(
+        FakeConfigRepo(
+            [
+                make_config("a", max_connections=10),
+                make_config("b", max_connections=30, timeout_seconds=5),
+                make_config("c", api_key="k2"),
+            ]
+        )
+    )
+    await registry.refresh()
+
+    a, b, c = (registry.get_provider(alias).client for alias in "abc")
+    assert len(pool) == 2
+    # 超时不同的别名使用派生客户端，但共用同一个 httpx 连接池
+    assert a._client is b._client
+    assert b.timeout == 5
+    assert a._client is not c._client
+    # 共用客户端取各配置中最大的连接上限
+    assert a._client._transport._pool._max_connections == 30
+
+    await pool.aclose()
+
+
+@pytest.mark.asyncio
+async def test_refresh_keeps_unchanged_clients_and_closes_evicted(pool):
+    repo = FakeConfigRepo([make_config("a"), make_config("c", api_key="k2")])
+    registry = LLMRegistry()
+    registry.set_repository(repo)
+    await registry.refresh()
+    kept = registry.get_provider("a").client
+    evicted = registry.get_provider("c").client
+
+    repo.configs = [make_config("a"), make_config("b")]
+    await registry.refresh()
+    await asyncio.sleep(0.01)
+
+    assert registry.get_provider("a").client is kept
+    assert registry.get_provider("b").client is kept
+    assert registry.get_provider("c") is None
+    assert evicted.is_closed()
+    assert not kept.is_closed()
+
+    await pool.aclose()
+    assert kept.is_closed()
+
+
+@pytest.mark.asyncio
+async def test_refresh_swaps_registry_atomically(pool):
+    repo = FakeConfigRepo([make_config("a")])
+    registry = LLMRegistry()
+    registry.set_repository(repo)
+    await registry.refresh()
+
+    repo.configs = [make_config("b")]
+    repo.gate = asyncio.Event()
+    refreshing = asyncio.create_task(registry.refresh())
+    await asyncio.sleep(0)
+
+    # 加载新配置期间仍可读到完整的旧注册表
+    assert [c.alias for c in registry.get_all_configs()] == ["a"]
+    assert registry.get_provider("a") is not None
+
+    repo.gate.set()
+    await refreshing
+    assert [c.alias for c in registry.get_all_configs()] == ["b"]
+    assert registry.get_provider("a") is None
+
+    await pool.aclose()
+
+
+@pytest.mark.asyncio
+async def test_evicted_client_closes_after_in_flight_requests_finish():
+    pool = LLMClientPool(http2=False, close_grace_seconds=60)
+    client = pool.get("https://a.example/v1", "k1")
+    derived = pool.get("https://a.example/v1", "k1", timeout_seconds=5)
+
+    async with pool.lease(derived):
+        pool.retain([])
+        await asyncio.sleep(0.01)
+        # 派生客户端的在途请求计入原客户端：淘汰后不立即关闭
+        assert pool.in_flight(client) == 1
+        assert not client.is_closed()
+
+    await asyncio.sleep(0.01)
+    assert client.is_closed()
+    assert pool.in_flight(client) == 0
+
+
+@pytest.mark.asyncio
+async def test_evicted_client_is_force_closed_after_grace_period():
+    pool = LLMClientPool(http2=False, close_grace_seconds=0.05)
+    client = pool.get("https://a.example/v1", "k1")
+
+    async with pool.lease(client):
+        pool.retain([])
+        await asyncio.sleep(0.1)
+        assert client.is_closed()
+
+    await pool.aclose()
@@ -0,0 +1,152 @@
+"""LLMService 补全缓存（内存层 + 数据库层）测试。"""
+
+from datetime import timedelta
+
+import pytest
+
+from src.modules.llm_platform.application.services.llm_service import LLMService
+from src.modules.llm_platform.domain.dtos.llm_completion_cache_dtos import (
+    LLMCompletionCacheEntry,
+)
+from src.modules.llm_platform.domain.llm_completion_cache_utils import (
+    compute_completion_cache_key,
+)
+from src.modules.llm_platform.domain.ports.llm_completion_cache_repository import (
+    ILLMCompletionCacheRepository,
+)
+from src.modules.llm_platform.infrastructure.completion_cache import (
+    LLMCompletionMemoryCache,
+    utc_now,
+)
+
+
+class FakeRouter:
+    def __init__(self):
+        self.calls = 0
+        self.model_name = "m-v1"
+
+    def resolved_models(self, alias, tags):
+        return [f"{alias}={self.model_name}"]
+
+    async def generate(self, prompt, system_message=None, temperature=0.7, **kwargs):
+        self.calls += 1
+        return f"completion-{self.calls}"
+
+
+class InMemoryCacheRepository(ILLMCompletionCacheRepository):
+    def __init__(self):
+        self.entries = {}
+
+    async def get(self, cache_key):
+        entry = self.entries.get(cache_key)
+        return entry if entry and entry.expires_at > utc_now() else None
+
+    async def put(self, entry: LLMCompletionCacheEntry):
+        self.entries[entry.cache_key] = entry
+
+    async def cleanup_expired(self):
+        return 0
+
+
+def make_service(repo=None, capacity=8) -> LLMService:
+    service = LLMService(
+        registry=object(),
+        completion_cache_repository=repo,
+        memory_cache=LLMCompletionMemoryCache(capacity),
+    )
+    service.router = FakeRouter()
+    return service
+
+
+@pytest.mark.asyncio
+async def test_low_temperature_calls_are_cached_in_memory():
+    """测试：低温调用同参数第二次命中内存层，不再调用模型。"""
+    service = make_service()
+
+    first = await service.generate("prompt", "system", temperature=0.3, alias="m")
+    second = await service.generate("prompt", "system", temperature=0.3, alias="m")
+
+    assert first == second == "completion-1"
+    assert service.router.calls == 1
+    stats = service.cache_stats()
+    assert (stats.lookups, stats.memory_hits, stats.misses, stats.stores) == (2, 1, 1, 1)
+    assert stats.hit_rate == 0.5
+
+
+@pytest.mark.asyncio
+async def test_opt_in_rules():
+    """测试：高温默认不缓存；cache=True 强制参与、cache=False 禁用。"""
+    service = make_service()
+
+    await service.generate("p", temperature=0.7)
+    await service.generate("p", temperature=0.7)
+    assert service.router.calls == 2
+    assert service.cache_stats().lookups == 0
+
+    await service.generate("p", temperature=0.7, cache=True)
+    await service.generate("p", temperature=0.7, cache=True)
+    assert service.router.calls == 3
+
+    await service.generate("q", temperature=0.0, cache=False)
+    await service.generate("q", temperature=0.0, cache=False)
+    assert service.router.calls == 5
+
+
+@pytest.mark.asyncio
+async def test_db_tier_hit_backfills_memory():
+    """测试：内存层未命中时命中数据库层并回填内存层。"""
+    repo = InMemoryCacheRepository()
+    await make_service(repo).generate("prompt", temperature=0.2, alias="m")
+
+    service = make_service(repo)
+    assert await service.generate("prompt", temperature=0.2, alias="m") == "completion-1"
+    assert await service.generate("prompt", temperature=0.2, alias="m") == "completion-1"
+
+    assert service.router.calls == 0
+    stats = service.cache_stats()
+    assert (stats.db_hits, stats.memory_hits, stats.misses) == (1, 1, 0)
+
+
+@pytest.mark.asyncio
+async def test_alias_pointed_to_new_model_misses_old_completions():
+    """测试：别名改指向新模型后，同参数调用不命中旧模型的补全。"""
+    repo = InMemoryCacheRepository()
+    service = make_service(repo)
+    await service.generate("prompt", temperature=0.2, alias="m")
+
+    service.router.model_name = "m-v2"
+    assert await service.generate("prompt", temperature=0.2, alias="m") == "completion-2"
+    assert await service.generate("prompt", temperature=0.2, alias="m") == "completion-2"
+    assert service.router.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_memory_tier_evicts_lru_and_expired():
+    """测试：超容量淘汰最久未使用的条目；过期条目不命中。"""
+    cache = LLMCompletionMemoryCache(capacity=2)
+    future = utc_now() + timedelta(hours=1)
+    cache.put("a", "A", future)
+    cache.put("b", "B", future)
+    assert cache.get("a") == "A"
+    cache.put("c", "C", future)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == "A" and cache.get("c") == "C"
+
+    cache.put("d", "D", utc_now() - timedelta(seconds=1))
+    assert cache.get("d") is None
+
+
+def test_cache_key_distinguishes_route_and_parameters():
+    """测试：缓存键随路由目标及其解析到的模型、System Prompt、温度变化，tags 顺序无关。"""
+    base = compute_completion_cache_key("p", "s", 0.3, alias="m")
+    assert base == compute_completion_cache_key("p", "s", 0.3, alias="m", tags=["x"])
+    assert base != compute_completion_cache_key("p", "s", 0.2, alias="m")
+    assert base != compute_completion_cache_key("p", None, 0.3, alias="m")
+    assert base != compute_completion_cache_key("p", "s", 0.3, alias="n")
+    assert compute_completion_cache_key("p", "s", 0.3, alias="m", models=["m=v1"]) != (
+        compute_completion_cache_key("p", "s", 0.3, alias="m", models=["m=v2"])
+    )
+    assert compute_completion_cache_key("p", "s", 0.3, tags=["a", "b"]) == (
+        compute_completion_cache_key("p", "s", 0.3, tags=["b", "a"])
+    )
@@ -0,0 +1,154 @@
+"""流式生成：Router 首 token 前故障切换、LLMService 审计首 token 耗时、SSE 通道转发测试。"""
+
+import asyncio
+import json
+
+import pytest
+from fastapi import HTTPException
+
+from src.modules.llm_platform.application.services.llm_service import LLMService
+from src.modules.llm_platform.domain.entities.llm_config import LLMConfig
+from src.modules.llm_platform.domain.exceptions import LLMConnectionError
+from src.modules.llm_platform.infrastructure.completion_cache import (
+    LLMCompletionMemoryCache,
+)
+from src.modules.llm_platform.infrastructure.request_scheduler import (
+    LLMRequestScheduler,
+)
+from src.modules.llm_platform.infrastructure.router import LLMRouter
+from src.shared.domain.exceptions import BadRequestException
+from src.shared.dtos import BaseResponse
+from src.shared.infrastructure.llm_stream import stream_llm_run
+
+
+class StreamingProvider:
+    def __init__(self, chunks, fail_after=None):
+        self.chunks = chunks
+        self.fail_after = fail_after
+        self.calls = 0
+
+    async def generate_stream(self, prompt, system_message=None, temperature=0.7):
+        self.calls += 1
+        for i, chunk in enumerate(self.chunks):
+            if i == self.fail_after:
+                raise LLMConnectionError("stream broken")
+            yield chunk
+        if self.fail_after == len(self.chunks):
+            raise LLMConnectionError("stream broken")
+
+
+class FakeRegistry:
+    def __init__(self, providers):
+        self.providers = providers
+
+    def get_all_configs(self):
+        return [
+            LLMConfig(
+                alias=alias,
+                vendor="test",
+                provider_type="openai",
+                api_key="sk-test",
+                model_name=alias,
+                priority=i,
+            )
+            for i, alias in enumerate(self.providers)
+        ]
+
+    def get_provider(self, alias):
+        return self.providers[alias]
+
+
+class RecordingLogRepository:
+    def __init__(self):
+        self.logs = []
+
+    async def save(self, log):
+        self.logs.append(log)
+
+
+async def collect(stream):
+    return [chunk async for chunk in stream]
+
+
+@pytest.mark.asyncio
+async def test_router_fails_over_before_first_token():
+    """测试：首个增量前失败切换到下一个候选模型。"""
+    broken = StreamingProvider(["x"], fail_after=0)
+    healthy = StreamingProvider(["he", "llo"])
+    router = LLMRouter(FakeRegistry({"a": broken, "b": healthy}))
+
+    assert await collect(router.generate_stream("p")) == ["he", "llo"]
+    assert broken.calls == 1 and healthy.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_router_does_not_fail_over_after_first_token():
+    """测试：已产出增量后失败直接抛出，不切换模型。"""
+    broken = StreamingProvider(["he", "llo"], fail_after=1)
+    healthy = StreamingProvider(["ok"])
+    router = LLMRouter(FakeRegistry({"a": broken, "b": healthy}))
+
+    received = []
+    with pytest.raises(LLMConnectionError):
+        async for chunk in router.generate_stream("p"):
+            received.append(chunk)
+    assert received == ["he"]
+    assert healthy.calls == 0
+
+
+@pytest.mark.asyncio
+async def test_service_stream_logs_time_to_first_token():
+    """测试：流式调用结束后写入审计日志，含首 token 耗时与完整文本。"""
+    repo = RecordingLogRepository()
+    service = LLMService(
+        registry=FakeRegistry({"a": StreamingProvider(["he", "llo"])}),
+        call_log_repository=repo,
+        scheduler=LLMRequestScheduler(),
+        memory_cache=LLMCompletionMemoryCache(8),
+    )
+
+    assert await collect(service.generate_stream("p", temperature=0.7)) == ["he", "llo"]
+
+    (log,) = repo.logs
+    assert log.status == "success"
+    assert log.completion_text == "hello"
+    assert log.time_to_first_token_ms is not None
+    assert log.time_to_first_token_ms <= log.latency_ms
+
+
+@pytest.mark.asyncio
+async def test_generate_forwards_chunks_to_stream_sink():
+    """测试：SSE 通道下业务代码调用 generate 仍得完整文本，增量经 delta 事件推送。"""
+    service = LLMService(
+        registry=FakeRegistry({"a": StreamingProvider(["he", "llo"])}),
+        scheduler=LLMRequestScheduler(),
+        memory_cache=LLMCompletionMemoryCache(8),
+    )
+
+    async def run():
+        text = await service.generate("p", temperature=0.7)
+        return BaseResponse(data={"text": text})
+
+    response = await stream_llm_run(run)
+    body = "".join([chunk async for chunk in response.body_iterator])
+    events = [
+        (lines[0].removeprefix("event: "), json.loads(lines[1].removeprefix("data: ")))
+        for lines in (block.split("\n") for block in body.strip().split("\n\n"))
+    ]
+
+    assert events[:2] == [("delta", {"text": "he"}), ("delta", {"text": "llo"})]
+    assert events[2][0] == "result"
+    assert events[2][1]["data"] == {"text": "hello"}
+
+
+@pytest.mark.asyncio
+async def test_stream_run_error_before_first_token_keeps_http_status():
+    """测试：首个增量前的业务异常映射为对应 HTTP 状态码。"""
+
+    async def run():
+        await asyncio.sleep(0)
+        raise BadRequestException(message="ticker 为必填")
+
+    with pytest.raises(HTTPException) as exc_info:
+        await stream_llm_run(run)
+    assert exc_info.value.status_code == 400
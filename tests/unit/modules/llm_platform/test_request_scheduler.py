@@ -0,0 +1,188 @@
+"""LLMRequestScheduler 并发上限、优先级排队、token 预算与指标测试。"""
+
+import asyncio
+from uuid import uuid4
+
+import pytest
+
+from src.modules.llm_platform.application.services.llm_service import LLMService
+from src.modules.llm_platform.domain.dtos.llm_scheduler_dtos import (
+    LLMRequestPriority,
+)
+from src.modules.llm_platform.domain.entities.llm_config import LLMConfig
+from src.modules.llm_platform.infrastructure.request_scheduler import (
+    LLMRequestScheduler,
+)
+from src.shared.infrastructure.execution_context import (
+    ExecutionContext,
+    current_execution_ctx,
+)
+
+
+def make_config(max_concurrency=None, tokens_per_minute=None) -> LLMConfig:
+    return LLMConfig(
+        alias="test-model",
+        vendor="test",
+        provider_type="openai",
+        api_key="sk-test",
+        model_name="test",
+        max_concurrency=max_concurrency,
+        tokens_per_minute=tokens_per_minute,
+    )
+
+
+@pytest.mark.asyncio
+async def test_concurrency_limit_is_enforced():
+    """测试：同一别名同时执行的请求数不超过 max_concurrency。"""
+    scheduler = LLMRequestScheduler()
+    config = make_config(max_concurrency=2)
+    running = peak = 0
+
+    async def call():
+        nonlocal running, peak
+        async with scheduler.slot(config):
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+    await asyncio.gather(*(call() for _ in range(6)))
+
+    assert peak == 2
+    (metrics,) = scheduler.metrics()
+    assert metrics.admitted_total == 6
+    assert metrics.waited_total == 4
+    assert metrics.in_flight == 0 and metrics.queue_depth == 0
+
+
+@pytest.mark.asyncio
+async def test_interactive_requests_jump_ahead_of_batch():
+    """测试：排队中的交互式请求先于更早入队的批量请求放行。"""
+    scheduler = LLMRequestScheduler()
+    config = make_config(max_concurrency=1)
+    order = []
+    gate = asyncio.Event()
+
+    async def holder():
+        async with scheduler.slot(config):
+            await gate.wait()
+
+    async def call(name, priority):
+        async with scheduler.slot(config, priority):
+            order.append(name)
+
+    first = asyncio.create_task(holder())
+    await asyncio.sleep(0)
+    tasks = [
+        asyncio.create_task(call("batch-1", LLMRequestPriority.BATCH)),
+        asyncio.create_task(call("batch-2", LLMRequestPriority.BATCH)),
+        asyncio.create_task(call("interactive", LLMRequestPriority.INTERACTIVE)),
+    ]
+    await asyncio.sleep(0)
+
+    (metrics,) = scheduler.metrics()
+    assert metrics.queue_depth == 3
+    assert metrics.queue_depth_by_priority == {"BATCH": 2, "INTERACTIVE": 1}
+
+    gate.set()
+    await asyncio.gather(first, *tasks)
+    assert order == ["interactive", "batch-1", "batch-2"]
+
+
+class SlotRouter:
+    """按 generate 收到的优先级占用调度槽位，记录放行顺序。"""
+
+    def __init__(self, scheduler, config):
+        self.scheduler = scheduler
+        self.config = config
+        self.order = []
+
+    async def generate(self, prompt, system_message=None, temperature=0.7, **kwargs):
+        async with self.scheduler.slot(self.config, kwargs["priority"]):
+            self.order.append(prompt)
+            return prompt
+
+
+@pytest.mark.asyncio
+async def test_batch_context_calls_queue_behind_interactive():
+    """测试：未显式指定优先级时沿用执行上下文；批量研究发起的调用排在交互式调用之后。"""
+    scheduler = LLMRequestScheduler()
+    config = make_config(max_concurrency=1)
+    service = LLMService(registry=object(), scheduler=scheduler)
+    service.router = SlotRouter(scheduler, config)
+    gate = asyncio.Event()
+
+    async def holder():
+        async with scheduler.slot(config):
+            await gate.wait()
+
+    async def batch_call():
+        current_execution_ctx.set(
+            ExecutionContext(session_id=str(uuid4()), priority=LLMRequestPriority.BATCH)
+        )
+        return await service.generate("batch")
+
+    first = asyncio.create_task(holder())
+    await asyncio.sleep(0)
+    batch = asyncio.create_task(batch_call())
+    await asyncio.sleep(0)
+    interactive = asyncio.create_task(service.generate("interactive"))
+    await asyncio.sleep(0)
+
+    (metrics,) = scheduler.metrics()
+    assert metrics.queue_depth_by_priority == {"BATCH": 1, "INTERACTIVE": 1}
+
+    gate.set()
+    await asyncio.gather(first, batch, interactive)
+    assert service.router.order == ["interactive", "batch"]
+
+
+@pytest.mark.asyncio
+async def test_token_budget_delays_until_refilled():
+    """测试：预算耗尽后的请求等待令牌补足再放行，并计入等待时长。"""
+    scheduler = LLMRequestScheduler()
+    # 60000 TPM = 每秒补充 1000 token
+    config = make_config(tokens_per_minute=60_000)
+
+    async with scheduler.slot(config, tokens=60_000):
+        pass
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    async with scheduler.slot(config, tokens=100):
+        pass
+    waited = loop.time() - started
+
+    assert waited >= 0.09
+    (metrics,) = scheduler.metrics()
+    assert metrics.waited_total == 1
+    assert metrics.wait_ms_max >= 90
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_does_not_leak_slot():
+    """测试：排队中被取消的请求不占用名额，后续请求正常放行。"""
+    scheduler = LLMRequestScheduler()
+    config = make_config(max_concurrency=1)
+    gate = asyncio.Event()
+
+    async def holder():
+        async with scheduler.slot(config):
+            await gate.wait()
+
+    async def waiter():
+        async with scheduler.slot(config):
+            pass
+
+    first = asyncio.create_task(holder())
+    await asyncio.sleep(0)
+    queued = asyncio.create_task(waiter())
+    await asyncio.sleep(0)
+    queued.cancel()
+    gate.set()
+    await first
+    with pytest.raises(asyncio.CancelledError):
+        await queued
+
+    await asyncio.wait_for(waiter(), timeout=1)
+    (metrics,) = scheduler.metrics()
+    assert metrics.in_flight == 0
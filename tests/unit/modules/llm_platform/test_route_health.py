@@ -0,0 +1,201 @@
+"""LLMRouter 自适应路由：期望耗时排序、熔断与对冲测试。"""
+
+import asyncio
+
+import pytest
+
+from src.modules.llm_platform.domain.dtos.llm_route_dtos import LLMCircuitState
+from src.modules.llm_platform.domain.entities.llm_config import LLMConfig
+from src.modules.llm_platform.domain.exceptions import (
+    LLMConnectionError,
+    NoAvailableModelError,
+)
+from src.modules.llm_platform.infrastructure.config import llm_config
+from src.modules.llm_platform.infrastructure.route_health import LLMRouteHealth
+from src.modules.llm_platform.infrastructure.router import LLMRouter
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class FakeProvider:
+    def __init__(self, reply, delay=0.0, fail=False):
+        self.reply = reply
+        self.delay = delay
+        self.fail = fail
+        self.calls = 0
+
+    async def generate(self, prompt, system_message=None, temperature=0.7):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        if self.fail:
+            raise LLMConnectionError("down")
+        return self.reply
+
+
+class FakeRegistry:
+    def __init__(self, providers):
+        self.providers = providers
+
+    def get_all_configs(self):
+        return [
+            LLMConfig(
+                alias=alias,
+                vendor="test",
+                provider_type="openai",
+                api_key="sk-test",
+                model_name=alias,
+                priority=i,
+            )
+            for i, alias in enumerate(self.providers)
+        ]
+
+    def get_provider(self, alias):
+        return self.providers[alias]
+
+
+def test_circuit_opens_after_threshold_and_probes_after_cooldown():
+    """测试：连续失败达到阈值后熔断；冷却后只放行一次探测，探测成功即恢复。"""
+    clock = FakeClock()
+    health = LLMRouteHealth(failure_threshold=3, open_seconds=30, clock=clock)
+
+    for _ in range(3):
+        assert health.allow("m")
+        health.record_failure("m")
+    assert not health.allow("m")
+
+    clock.now = 31
+    assert health.allow("m")
+    assert not health.allow("m")  # 探测请求未返回前不放行其他请求
+    health.record_success("m", 0.1)
+
+    (stats,) = health.stats(["m"])
+    assert stats.circuit_state is LLMCircuitState.CLOSED
+    assert health.allow("m")
+
+
+def test_failed_probe_reopens_circuit():
+    """测试：半开探测失败立即重新熔断。"""
+    clock = FakeClock()
+    health = LLMRouteHealth(failure_threshold=2, open_seconds=10, clock=clock)
+    health.record_failure("m")
+    health.record_failure("m")
+    clock.now = 11
+    assert health.allow("m")
+    health.record_failure("m")
+
+    (stats,) = health.stats(["m"])
+    assert stats.circuit_state is LLMCircuitState.OPEN
+    assert stats.reopen_in_seconds == 10
+
+
+@pytest.mark.asyncio
+async def test_router_prefers_faster_model_and_skips_open_circuit():
+    """测试：按标签路由时选择期望耗时更低的模型；熔断中的模型被跳过。"""
+    health = LLMRouteHealth(min_samples=2, failure_threshold=1)
+    for _ in range(2):
+        health.record_success("slow", 2.0)
+        health.record_success("fast", 0.2)
+    providers = {"slow": FakeProvider("slow"), "fast": FakeProvider("fast")}
+    router = LLMRouter(FakeRegistry(providers), health=health)
+
+    assert await router.generate("p") == "fast"
+
+    health.record_failure("fast")
+    assert await router.generate("p") == "slow"
+    assert providers["fast"].calls == 1
+
+
+@pytest.mark.asyncio
+async def test_alias_with_open_circuit_fails_fast():
+    """测试：指定别名熔断中时不调用模型，直接抛出无可用模型。"""
+    health = LLMRouteHealth(failure_threshold=1)
+    provider = FakeProvider("x", fail=True)
+    router = LLMRouter(FakeRegistry({"m": provider}), health=health)
+
+    with pytest.raises(NoAvailableModelError):
+        await router.generate("p", alias="m")
+    with pytest.raises(NoAvailableModelError):
+        await router.generate("p", alias="m")
+    assert provider.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_hedged_request_returns_backup_when_primary_is_slow(monkeypatch):
+    """测试：主模型超过 P95 未返回时对冲备用模型，取先返回的结果。"""
+    monkeypatch.setattr(llm_config, "LLM_HEDGE_ENABLED", True)
+    monkeypatch.setattr(llm_config, "LLM_ADAPTIVE_ROUTING", False)
+    health = LLMRouteHealth(min_samples=2)
+    for _ in range(2):
+        health.record_success("primary", 0.02)
+    providers = {
+        "primary": FakeProvider("primary", delay=1.0),
+        "backup": FakeProvider("backup", delay=0.01),
+    }
+    router = LLMRouter(FakeRegistry(providers), health=health)
+
+    assert await asyncio.wait_for(router.generate("p"), timeout=0.5) == "backup"
+    assert providers["primary"].calls == providers["backup"].calls == 1
+    # 落败的主请求被取消，不计入失败
+    (primary_stats,) = health.stats(["primary"])
+    assert primary_stats.error_rate == 0.0
+
+
+def test_unreturned_probe_slot_is_reclaimed_after_cooldown():
+    """测试：探测名额未归还时，最长占用 open_seconds 后收回，可再次探测。"""
+    clock = FakeClock()
+    health = LLMRouteHealth(failure_threshold=1, open_seconds=30, clock=clock)
+    health.record_failure("m")
+
+    clock.now = 31
+    assert health.allow("m")
+    clock.now = 50
+    assert not health.allow("m")
+    clock.now = 61
+    assert health.allow("m")
+
+
+@pytest.mark.asyncio
+async def test_probe_cancelled_while_queued_releases_probe_slot():
+    """测试：探测请求在调度队列中被取消时归还探测名额，不会让模型永久熔断。"""
+    from src.modules.llm_platform.infrastructure.request_scheduler import (
+        LLMRequestScheduler,
+    )
+
+    clock = FakeClock()
+    health = LLMRouteHealth(failure_threshold=1, open_seconds=30, clock=clock)
+    registry = FakeRegistry({"m": FakeProvider("ok")})
+    config = registry.get_all_configs()[0]
+    config.max_concurrency = 1
+    registry.get_all_configs = lambda: [config]
+    scheduler = LLMRequestScheduler()
+    router = LLMRouter(registry, scheduler=scheduler, health=health)
+    health.record_failure("m")
+    clock.now = 31
+
+    release = asyncio.Event()
+
+    async def hold_slot():
+        async with scheduler.slot(config):
+            await release.wait()
+
+    holder = asyncio.create_task(hold_slot())
+    await asyncio.sleep(0)
+    probe = asyncio.create_task(router.generate("hi", alias="m"))
+    await asyncio.sleep(0.01)
+    assert health.is_open("m")  # 探测请求排队中
+    probe.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await probe
+
+    assert not health.is_open("m")
+    release.set()
+    await holder
+    assert await router.generate("hi", alias="m") == "ok"
+    (stats,) = health.stats(["m"])
+    assert stats.circuit_state is LLMCircuitState.CLOSED
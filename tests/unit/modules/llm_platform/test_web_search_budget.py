@@ -0,0 +1,33 @@
+"""博查搜索调用预算：并发上限与发起速率。"""
+
+import asyncio
+import time
+
+import pytest
+
+from src.modules.llm_platform.infrastructure.web_search_budget import WebSearchBudget
+
+
+@pytest.mark.asyncio
+async def test_budget_caps_concurrency_and_paces_starts():
+    budget = WebSearchBudget(max_concurrency=2, rate_per_second=50.0, burst=1)
+    in_flight = 0
+    peak = 0
+    starts = []
+
+    async def call():
+        nonlocal in_flight, peak
+        async with budget.slot():
+            starts.append(time.monotonic())
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+
+    begin = time.monotonic()
+    await asyncio.gather(*(call() for _ in range(5)))
+
+    assert peak <= 2
+    # 速率 50/s、突发 1：第 i 次发起不早于 i * 20ms（留计时抖动余量）
+    for i, start in enumerate(sorted(starts)):
+        assert start - begin >= 0.018 * i
@@ -0,0 +1,126 @@
+"""DeConceptDataAdapter 单元测试：进程内概念成分股索引按变更日志增量失效。"""
+
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.modules.data_engineering.domain.dtos.concept_dtos import (
+    ConceptMembershipChangeDTO,
+    ConceptWithStocksDTO,
+)
+from src.modules.data_engineering.domain.model.concept import ConceptStock
+from src.modules.data_engineering.domain.model.enums import ConceptChangeType
+from src.modules.market_insight.infrastructure.adapters import de_concept_data_adapter
+from src.modules.market_insight.infrastructure.adapters.de_concept_data_adapter import (
+    DeConceptDataAdapter,
+    _ConceptMembershipIndex,
+)
+
+
+def _change(
+    change_id: int,
+    third_code: str,
+    change_type: ConceptChangeType,
+    stock_name: str | None = None,
+    concept_code: str = "BK0001",
+) -> ConceptMembershipChangeDTO:
+    return ConceptMembershipChangeDTO(
+        id=change_id,
+        concept_code=concept_code,
+        third_code=third_code,
+        stock_name=stock_name,
+        change_type=change_type,
+        changed_at=datetime(2026, 1, 5),
+    )
+
+
+def _concept_repo(changes: list[ConceptMembershipChangeDTO]) -> AsyncMock:
+    """初始含 BK0001 两只成份股、最新变更 id 为 10，之后按 id > after_id 返回变更日志。"""
+
+    async def get_membership_changes(after_id, limit):
+        return [c for c in changes if c.id > after_id][:limit]
+
+    repo = AsyncMock()
+    repo.get_latest_change_id.return_value = 10
+    repo.get_all_concepts_with_stocks.return_value = [
+        ConceptWithStocksDTO(
+            code="BK0001",
+            name="银行",
+            stocks=[
+                ConceptStock(concept_code="BK0001", third_code="000001.SZ", stock_name="平安银行"),
+                ConceptStock(concept_code="BK0001", third_code="600000.SH", stock_name="浦发银行"),
+            ],
+        )
+    ]
+    repo.get_membership_changes.side_effect = get_membership_changes
+    repo.get_concept_states.return_value = {"BK0001": ("银行", "h1"), "BK0002": ("券商", "h2")}
+    return repo
+
+
+async def test_首次全量加载并记录加载前的变更游标():
+    """测试：首次 refresh 全量加载，游标取加载前的最新变更 id，不读取变更日志。"""
+    repo = _concept_repo([])
+    index = _ConceptMembershipIndex()
+
+    await index.refresh(repo)
+
+    assert index.members == {"BK0001": {"000001.SZ": "平安银行", "600000.SH": "浦发银行"}}
+    assert index.cursor == 10
+    repo.get_membership_changes.assert_not_awaited()
+
+
+async def test_之后按变更日志应用新增移除更名且不再全量加载():
+    """测试：后续 refresh 只应用游标之后的变更（含新概念），游标推进到最后一条。"""
+    changes = [
+        _change(9, "000002.SZ", ConceptChangeType.ADDED, "早于游标"),
+        _change(11, "000001.SZ", ConceptChangeType.REMOVED),
+        _change(12, "600000.SH", ConceptChangeType.RENAMED, "ST浦发"),
+        _change(13, "600030.SH", ConceptChangeType.ADDED, "中信证券", concept_code="BK0002"),
+    ]
+    repo = _concept_repo(changes)
+    index = _ConceptMembershipIndex()
+    await index.refresh(repo)
+
+    await index.refresh(repo)
+
+    assert index.members == {
+        "BK0001": {"600000.SH": "ST浦发"},
+        "BK0002": {"600030.SH": "中信证券"},
+    }
+    assert index.cursor == 13
+    repo.get_all_concepts_with_stocks.assert_awaited_once()
+
+
+async def test_变更日志超过一页时分页读取(monkeypatch: pytest.MonkeyPatch):
+    """测试：每页读满后继续读取下一页，直到没有新的变更。"""
+    monkeypatch.setattr(de_concept_data_adapter, "_CHANGE_PAGE_SIZE", 2)
+    changes = [
+        _change(i, f"{i:06d}.SZ", ConceptChangeType.ADDED, f"股票{i}") for i in range(11, 16)
+    ]
+    repo = _concept_repo(changes)
+    index = _ConceptMembershipIndex()
+    await index.refresh(repo)
+
+    await index.refresh(repo)
+
+    assert index.cursor == 15
+    assert len(index.members["BK0001"]) == 7
+    after_ids = [c.args[0] for c in repo.get_membership_changes.await_args_list]
+    assert after_ids == [10, 12, 14, 15]
+
+
+async def test_adapter_按概念表返回名称与索引中的成分股(monkeypatch: pytest.MonkeyPatch):
+    """测试：概念名称取自 concept 表，索引中没有成分股的概念返回空列表。"""
+    monkeypatch.setattr(de_concept_data_adapter, "_concept_index", _ConceptMembershipIndex())
+    repo = _concept_repo([_change(11, "000001.SZ", ConceptChangeType.REMOVED)])
+    container = MagicMock()
+    container.get_concept_repository.return_value = repo
+    adapter = DeConceptDataAdapter(container)
+
+    await adapter.get_all_concepts_with_stocks()
+    result = await adapter.get_all_concepts_with_stocks()
+
+    assert [(c.code, c.name) for c in result] == [("BK0001", "银行"), ("BK0002", "券商")]
+    assert [s.third_code for s in result[0].stocks] == ["600000.SH"]
+    assert result[1].stocks == []
@@ -0,0 +1,95 @@
+"""多维度并发搜索执行器：并发发起、失败隔离、整体时限与结果顺序。"""
+
+import asyncio
+import time
+
+import pytest
+
+from src.modules.llm_platform.domain.exceptions import WebSearchConnectionError
+from src.modules.llm_platform.domain.web_search_dtos import (
+    WebSearchResponse,
+    WebSearchResultItem,
+)
+from src.modules.research.domain.dtos.search_dimension_config import (
+    SearchDimensionConfig,
+)
+from src.modules.research.infrastructure.search_utils.dimension_search_executor import (
+    DimensionSearchExecutor,
+)
+from src.modules.research.infrastructure.search_utils.result_filter import (
+    SearchResultFilter,
+)
+
+
+def dimension(topic):
+    return SearchDimensionConfig(
+        topic=topic, query_template=f"{topic} {{industry}}", count=5, freshness="oneMonth"
+    )
+
+
+class FakeSearchService:
+    """按查询词配置延迟与失败的搜索服务。"""
+
+    def __init__(self, delays, failing=()):
+        self.delays = delays
+        self.failing = failing
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def search(self, request):
+        topic = request.query.split()[0]
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delays.get(topic, 0))
+            if topic in self.failing:
+                raise WebSearchConnectionError("timeout")
+            return WebSearchResponse(
+                query=request.query,
+                results=[
+                    WebSearchResultItem(
+                        title=f"{topic} 新闻",
+                        url=f"https://example.com/{topic}",
+                        snippet="内容",
+                        summary="摘要",
+                        published_date="2026-10-01",
+                    )
+                ],
+            )
+        finally:
+            self.in_flight -= 1
+
+
+@pytest.mark.asyncio
+async def test_dimensions_run_concurrently_in_config_order():
+    service = FakeSearchService({"a": 0.1, "b": 0.02, "c": 0.06})
+    executor = DimensionSearchExecutor(service, SearchResultFilter())
+
+    started = time.monotonic()
+    outcomes = await executor.run([dimension(t) for t in "abc"], industry="银行")
+    elapsed = time.monotonic() - started
+
+    assert [o.topic for o in outcomes] == ["a", "b", "c"]
+    assert [o.query for o in outcomes] == ["a 银行", "b 银行", "c 银行"]
+    assert all(o.status == "success" and len(o.items) == 1 for o in outcomes)
+    assert service.max_in_flight == 3
+    # 整体耗时接近最慢维度，而非各维度之和
+    assert elapsed < 0.15
+    assert outcomes[0].latency_ms >= 95
+
+
+@pytest.mark.asyncio
+async def test_failed_and_slow_dimensions_return_empty():
+    service = FakeSearchService({"slow": 1.0}, failing={"bad"})
+    executor = DimensionSearchExecutor(service, SearchResultFilter(), deadline_seconds=0.05)
+
+    outcomes = await executor.run(
+        [dimension("ok"), dimension("bad"), dimension("slow")], industry="银行"
+    )
+
+    ok, bad, slow = outcomes
+    assert ok.status == "success" and len(ok.items) == 1
+    assert bad.status == "failed" and bad.items == []
+    assert "WebSearchConnectionError" in bad.error
+    assert slow.status == "timeout" and slow.items == []
+    assert service.in_flight == 0
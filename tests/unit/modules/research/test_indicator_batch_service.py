@@ -0,0 +1,187 @@
+"""IndicatorBatchService 与 MarketQuoteAdapter 列式切分的单元测试。"""
+
+from datetime import date, timedelta
+from unittest.mock import AsyncMock
+
+import numpy as np
+import pytest
+
+from src.modules.data_engineering.application.dtos.daily_bar_frame import DailyBarFrame
+from src.modules.research.application.indicator_batch_service import (
+    IndicatorBatchService,
+)
+from src.modules.research.domain.dtos.daily_bar_input import (
+    DailyBarColumns,
+    DailyBarInput,
+)
+from src.modules.research.domain.exceptions import IndicatorStateMismatchError
+from src.modules.research.infrastructure.adapters.market_quote_adapter import (
+    MarketQuoteAdapter,
+)
+from src.modules.research.infrastructure.indicators.indicator_calculator_adapter import (
+    IndicatorCalculatorAdapter,
+)
+
+TRADE_DATE = date(2026, 10, 16)
+
+
+def _frame(series: dict[str, int]) -> DailyBarFrame:
+    """按 {代码: K 线数} 构造以 TRADE_DATE 结尾、按 (代码, 日期) 升序的列式日线。"""
+    codes, dates, closes = [], [], []
+    for code, size in sorted(series.items()):
+        for i in range(size):
+            codes.append(code)
+            dates.append(TRADE_DATE - timedelta(days=size - 1 - i))
+            closes.append(10.0 + np.sin(i / 3.0))
+    closes = np.asarray(closes, dtype=np.float64)
+    return DailyBarFrame(
+        third_code=np.asarray(codes, dtype=object),
+        stock_name=np.asarray(codes, dtype=object),
+        trade_date=np.asarray(dates, dtype=object),
+        open=closes,
+        high=closes + 0.1,
+        low=closes - 0.1,
+        close=closes,
+        vol=np.full(len(closes), 1e5),
+        amount=np.zeros(len(closes)),
+        pct_chg=np.ones(len(closes)),
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_daily_bar_columns_splits_frame_per_ticker():
+    """测试：一次查询的多标的列式结果按代码切分，且与逐根 K 线计算结果一致。"""
+    use_case = AsyncMock()
+    use_case.execute_frame_for_tickers.return_value = _frame({"000001.SZ": 40, "600000.SH": 35})
+    adapter = MarketQuoteAdapter(get_daily_bars_use_case=use_case)
+
+    series = await adapter.get_daily_bar_columns(
+        ["000001.SZ", "600000.SH"], TRADE_DATE - timedelta(days=365), TRADE_DATE
+    )
+
+    assert [(s.ticker, len(s), s.last_trade_date) for s in series] == [
+        ("000001.SZ", 40, TRADE_DATE),
+        ("600000.SH", 35, TRADE_DATE),
+    ]
+    columns = series[1]
+    bars = [
+        DailyBarInput(
+            trade_date=TRADE_DATE,
+            open=c,
+            high=h,
+            low=lo,
+            close=c,
+            vol=v,
+            pct_chg=columns.last_pct_chg,
+        )
+        for h, lo, c, v in zip(columns.high, columns.low, columns.close, columns.vol)
+    ]
+    calculator = IndicatorCalculatorAdapter()
+    assert calculator.compute_columns(columns) == calculator.compute(bars)
+
+
+class _FakeMarketQuote:
+    """按 (标的, 日期区间) 从内存日线中切片返回列数组。"""
+
+    def __init__(self, series: dict[str, DailyBarColumns]):
+        self.series = series
+        self.requests: list[tuple[list[str], date, date]] = []
+
+    async def get_tickers_traded_on(self, trade_date):
+        return [t for t, c in self.series.items() if trade_date in c.trade_date.tolist()]
+
+    async def get_daily_bar_columns(self, tickers, start_date, end_date):
+        self.requests.append((list(tickers), start_date, end_date))
+        result = []
+        for ticker in tickers:
+            columns = self.series[ticker].since(start_date)
+            end = int(np.searchsorted(columns.trade_date, end_date, side="right"))
+            result.append(
+                DailyBarColumns(
+                    ticker=ticker,
+                    trade_date=columns.trade_date[:end],
+                    high=columns.high[:end],
+                    low=columns.low[:end],
+                    close=columns.close[:end],
+                    vol=columns.vol[:end],
+                    pct_chg=columns.pct_chg[:end],
+                )
+            )
+        return result
+
+
+class _MemoryStateRepo:
+    def __init__(self):
+        self.states: dict = {}
+
+    async def get_many(self, tickers):
+        return {t: self.states[t].model_copy(deep=True) for t in tickers if t in self.states}
+
+    async def save_all(self, states):
+        self.states.update({t: s.model_copy(deep=True) for t, s in states.items()})
+        return len(states)
+
+
+def _columns(ticker: str, size: int, end: date = TRADE_DATE) -> DailyBarColumns:
+    frame = _frame({ticker: size})
+    shift = TRADE_DATE - end
+    return DailyBarColumns(
+        ticker=ticker,
+        trade_date=np.asarray([d - shift for d in frame.trade_date], dtype=object),
+        high=frame.high,
+        low=frame.low,
+        close=frame.close + size / 100.0,
+        vol=frame.vol,
+        pct_chg=frame.pct_chg,
+    )
+
+
+def _service(market_quote, state_repo, snapshot_repo) -> IndicatorBatchService:
+    return IndicatorBatchService(
+        market_quote, IndicatorCalculatorAdapter(), snapshot_repo, state_repo
+    )
+
+
+@pytest.mark.asyncio
+async def test_run_bootstraps_states_then_advances_only_new_bars():
+    """测试：首日以回看窗口构建状态；次日只读取新 K 线推进，快照与全量重算一致（校验模式）。"""
+    day2 = TRADE_DATE + timedelta(days=1)
+    series = {"A": _columns("A", 80, end=day2), "B": _columns("B", 10, end=day2)}
+    market_quote = _FakeMarketQuote(series)
+    state_repo = _MemoryStateRepo()
+    snapshot_repo = AsyncMock()
+    snapshot_repo.save_all.side_effect = lambda trade_date, snapshots: len(snapshots)
+    service = _service(market_quote, state_repo, snapshot_repo)
+
+    first = await service.run(TRADE_DATE)
+    assert first["bootstrapped"] == 2 and first["saved"] == 1 and first["skipped"] == 1
+    assert state_repo.states["A"].last_trade_date == TRADE_DATE
+
+    market_quote.requests.clear()
+    second = await service.run(day2, verify=True)
+
+    assert second["advanced"] == 2 and second["bootstrapped"] == 0
+    assert second["verified"] == 1 and second["saved"] == 1
+    # 推进请求只覆盖上次状态之后的一天
+    assert market_quote.requests[0][1:] == (day2, day2)
+    assert state_repo.states["A"].size == 80
+    stored = snapshot_repo.save_all.await_args.args[1]["A"]
+    assert stored == IndicatorCalculatorAdapter().compute_columns(series["A"].since(date.min))
+
+
+@pytest.mark.asyncio
+async def test_verify_raises_when_state_diverges():
+    """测试：校验模式下状态与全量重算不一致时抛出异常，且不写库。"""
+    market_quote = _FakeMarketQuote({"A": _columns("A", 60)})
+    state_repo = _MemoryStateRepo()
+    snapshot_repo = AsyncMock()
+    snapshot_repo.save_all.return_value = 1
+    service = _service(market_quote, state_repo, snapshot_repo)
+    await service.run(TRADE_DATE - timedelta(days=1))
+    state_repo.states["A"].tr_avg *= 2  # 模拟状态损坏
+
+    with pytest.raises(IndicatorStateMismatchError) as exc_info:
+        await service.run(TRADE_DATE, verify=True)
+
+    assert "atr_value" in exc_info.value.details["fields"]
+    assert snapshot_repo.save_all.await_count == 1
@@ -0,0 +1,108 @@
+"""IndicatorScreenerService 条件选股单元测试（表达式求值、排序、截面 LRU 缓存）。"""
+
+from datetime import date, timedelta
+from unittest.mock import AsyncMock
+
+import numpy as np
+import pytest
+
+from src.modules.research.application import indicator_screener_service
+from src.modules.research.application.indicator_screener_service import (
+    IndicatorScreenerService,
+    invalidate_cross_section,
+)
+from src.modules.research.domain.dtos.indicator_cross_section import (
+    IndicatorCrossSection,
+)
+from src.shared.domain.exceptions import BadRequestException
+
+TRADE_DATE = date(2026, 10, 16)
+
+
+def _section(trade_date: date = TRADE_DATE) -> IndicatorCrossSection:
+    nan = np.nan
+    return IndicatorCrossSection(
+        trade_date=trade_date,
+        tickers=np.asarray(["A", "B", "C", "D"], dtype=object),
+        numeric={
+            "current_price": np.array([10.0, 20.0, 30.0, 40.0]),
+            "change_percent": np.array([1.0, -2.0, 0.5, 3.0]),
+            "rsi_value": np.array([25.0, 28.0, 45.0, nan]),
+            "ma200": np.array([9.0, 21.0, 25.0, 30.0]),
+            "volume_ratio": np.array([1.5, 3.0, nan, 2.0]),
+        },
+        text={"obv_trend": np.asarray(["Rising", "Falling", "Rising", "Flat"], dtype=object)},
+    )
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    invalidate_cross_section()
+    yield
+    invalidate_cross_section()
+
+
+def _service(*sections: IndicatorCrossSection):
+    repo = AsyncMock()
+    by_date = {s.trade_date: s for s in sections}
+    repo.get_cross_section.side_effect = lambda trade_date: by_date[trade_date]
+    return IndicatorScreenerService(repo), repo
+
+
+@pytest.mark.asyncio
+async def test_screen_filters_ranks_and_skips_missing_values():
+    """测试：多子句逻辑与、字段间比较（含系数）、文本相等；缺失值不命中并排在最后。"""
+    service, _ = _service(_section())
+
+    result = await service.screen(TRADE_DATE, "rsi_value < 30 and current_price > ma200")
+    assert [item.ticker for item in result.items] == ["A"]
+    assert result.items[0].values == {
+        "current_price": 10.0,
+        "change_percent": 1.0,
+        "rsi_value": 25.0,
+        "ma200": 9.0,
+    }
+
+    result = await service.screen(
+        TRADE_DATE, "current_price >= ma200 * 1.1 AND obv_trend != 'Falling'", "volume_ratio"
+    )
+    assert [item.ticker for item in result.items] == ["D", "A", "C"]
+    assert result.items[2].values["volume_ratio"] is None
+
+    result = await service.screen(TRADE_DATE, "rsi_value != 0", "rsi_value", descending=False)
+    assert (result.universe, result.matched) == (4, 3)
+    assert [item.ticker for item in result.items] == ["A", "B", "C"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "expression",
+    ["", "rsi_value <", "unknown > 1", "obv_trend > 'Rising'", "rsi_value < ma200 + 1"],
+)
+async def test_screen_rejects_invalid_expressions(expression):
+    """测试：空表达式、未知字段、文本字段非等值比较、不支持的算式均返回 BadRequest。"""
+    service, _ = _service(_section())
+
+    with pytest.raises(BadRequestException):
+        await service.screen(TRADE_DATE, expression)
+
+
+@pytest.mark.asyncio
+async def test_cross_section_is_cached_per_trade_date_with_lru_eviction(monkeypatch):
+    """测试：同一交易日截面只加载一次；超出容量时淘汰最久未用的交易日；失效后重新加载。"""
+    monkeypatch.setattr(
+        indicator_screener_service,
+        "_cross_section_cache",
+        indicator_screener_service._CrossSectionCache(maxsize=2),
+    )
+    days = [TRADE_DATE - timedelta(days=i) for i in range(3)]
+    service, repo = _service(*(_section(d) for d in days))
+
+    for day in (days[0], days[1], days[0], days[2], days[0], days[1]):
+        await service.screen(day, "rsi_value < 30")
+    loaded = [c.args[0] for c in repo.get_cross_section.await_args_list]
+    assert loaded == [days[0], days[1], days[2], days[1]]
+
+    invalidate_cross_section(days[0])
+    await service.screen(days[0], "rsi_value < 30")
+    assert repo.get_cross_section.await_args.args[0] == days[0]
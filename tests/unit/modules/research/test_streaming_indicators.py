@@ -0,0 +1,63 @@
+"""增量指标状态与全量向量化计算的一致性测试。"""
+
+from datetime import date, timedelta
+
+import numpy as np
+import pytest
+
+from src.modules.research.domain.dtos.daily_bar_input import DailyBarInput
+from src.modules.research.domain.dtos.indicator_state import IndicatorState
+from src.modules.research.infrastructure.indicators.streaming_calculator import (
+    replay,
+    snapshot,
+    update,
+)
+from src.modules.research.infrastructure.indicators.vectorized_calculator import (
+    compute_technical_indicators_vectorized,
+)
+
+
+def make_bars(size: int, seed: int, flat_every: int = 0) -> list[DailyBarInput]:
+    """随机游走日线；flat_every>0 时定期制造平盘与一字线（覆盖 OBV / RSV / DM 边界）。"""
+    rng = np.random.default_rng(seed)
+    closes = 10.0 + np.cumsum(rng.normal(0, 0.2, size))
+    bars: list[DailyBarInput] = []
+    for i, close in enumerate(closes):
+        flat = flat_every and i and i % flat_every == 0
+        close = bars[-1].close if flat else float(close)
+        spread = 0.0 if flat else abs(rng.normal(0, 0.15))
+        bars.append(
+            DailyBarInput(
+                trade_date=date(2020, 1, 1) + timedelta(days=i),
+                open=close,
+                high=close + spread,
+                low=close - spread,
+                close=close,
+                vol=float(rng.uniform(1e4, 1e6)),
+                pct_chg=float(rng.normal(0, 2)),
+            )
+        )
+    return bars
+
+
+@pytest.mark.parametrize("seed", [1, 2, 3])
+def test_update_matches_full_recompute_at_every_bar(seed):
+    """测试：逐根推进后的快照与对同一段前缀全量重算的结果逐字段相等。"""
+    bars = make_bars(260, seed=seed, flat_every=7)
+    state = IndicatorState()
+
+    for i, bar in enumerate(bars):
+        update(state, bar)
+        assert snapshot(state) == compute_technical_indicators_vectorized(bars[: i + 1]), i
+
+
+def test_state_survives_json_roundtrip_and_continues():
+    """测试：状态序列化后恢复，继续推进的结果与不中断推进一致。"""
+    bars = make_bars(240, seed=5)
+    restored = IndicatorState.model_validate_json(replay(bars[:230]).model_dump_json())
+
+    resumed = replay(bars[230:], restored)
+
+    assert resumed.size == 240
+    assert resumed.start_date == bars[0].trade_date
+    assert snapshot(resumed) == snapshot(replay(bars))
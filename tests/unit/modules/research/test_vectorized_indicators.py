@@ -0,0 +1,74 @@
+"""向量化指标计算与纯 Python 参考实现的一致性测试。"""
+
+from datetime import date, timedelta
+
+import numpy as np
+import pytest
+
+from src.modules.research.domain.dtos.daily_bar_input import DailyBarInput
+from src.modules.research.infrastructure.indicators.calculator import (
+    compute_technical_indicators,
+)
+from src.modules.research.infrastructure.indicators.vectorized_calculator import (
+    compute_technical_indicators_vectorized,
+)
+
+# 取整到 2 位小数的字段允许末位差 1（浮点求和顺序不同导致的舍入边界）
+_TOLERANCE = 0.0101
+
+
+def make_bars(size: int, seed: int = 7, flat_every: int = 0) -> list[DailyBarInput]:
+    """随机游走日线；flat_every>0 时每隔若干日制造一次平盘（测试 OBV / RSV 边界）。"""
+    rng = np.random.default_rng(seed)
+    closes = 10.0 + np.cumsum(rng.normal(0, 0.2, size))
+    bars = []
+    start = date(2020, 1, 1)
+    for i, close in enumerate(closes):
+        if flat_every and i and i % flat_every == 0:
+            close = bars[-1].close
+        spread = abs(rng.normal(0, 0.15))
+        bars.append(
+            DailyBarInput(
+                trade_date=start + timedelta(days=i),
+                open=float(close),
+                high=float(close + spread),
+                low=float(close - spread),
+                close=float(close),
+                vol=float(rng.uniform(1e4, 1e6)),
+                pct_chg=float(rng.normal(0, 2)),
+            )
+        )
+    return bars
+
+
+@pytest.mark.parametrize("size", [0, 1, 5, 9, 15, 26, 34, 60, 130, 250, 600])
+def test_vectorized_matches_reference(size):
+    """测试：各数据长度下向量化实现与参考实现输出一致（浮点误差内）。"""
+    bars = make_bars(size, flat_every=7)
+
+    expected = compute_technical_indicators(bars).model_dump()
+    actual = compute_technical_indicators_vectorized(bars).model_dump()
+
+    assert actual.keys() == expected.keys()
+    for field, value in expected.items():
+        if isinstance(value, float):
+            assert actual[field] == pytest.approx(value, abs=_TOLERANCE), field
+        else:
+            assert actual[field] == value, field
+
+
+def test_vectorized_handles_constant_prices():
+    """测试：价格恒定（区间高低点相同、无涨跌）时的边界分支与参考实现一致。"""
+    bars = [
+        DailyBarInput(
+            trade_date=date(2024, 1, 1) + timedelta(days=i),
+            open=10.0,
+            high=10.0,
+            low=10.0,
+            close=10.0,
+            vol=1000.0,
+        )
+        for i in range(40)
+    ]
+
+    assert compute_technical_indicators_vectorized(bars) == compute_technical_indicators(bars)
@@ -0,0 +1,71 @@
+"""异步批量审计日志写入器：按条数 / 时间攒批、队列满丢弃、关闭时刷出。"""
+
+import asyncio
+
+import pytest
+
+from src.shared.infrastructure.audit_log_writer import AuditLogWriter
+
+
+class FakeSink:
+    def __init__(self, fail=False):
+        self.batches = []
+        self.fail = fail
+        self.gate = None
+
+    async def persist(self, batch):
+        if self.gate is not None:
+            await self.gate.wait()
+        if self.fail:
+            raise RuntimeError("db down")
+        self.batches.append(list(batch))
+
+
+@pytest.mark.asyncio
+async def test_batches_by_size_and_interval():
+    sink = FakeSink()
+    writer = AuditLogWriter("test", sink.persist, batch_size=3, flush_interval_ms=20)
+
+    for i in range(4):
+        await writer.submit(i)
+    await writer.flush()
+
+    # 满 3 条立即成批，剩余 1 条在攒批间隔到期后单独成批
+    assert sink.batches == [[0, 1, 2], [3]]
+    assert writer.stats()["written"] == 4
+    assert writer.stats()["batches"] == 2
+    await writer.aclose()
+
+
+@pytest.mark.asyncio
+async def test_drop_policy_when_queue_full():
+    sink = FakeSink()
+    sink.gate = asyncio.Event()
+    writer = AuditLogWriter(
+        "test", sink.persist, batch_size=1, flush_interval_ms=1, max_queue_size=2
+    )
+
+    await writer.submit("a")
+    await asyncio.sleep(0)  # 后台任务取走 a 并阻塞在写入
+    for item in ("b", "c", "d"):
+        await writer.submit(item)
+    assert writer.stats()["dropped"] == 1
+
+    sink.gate.set()
+    await writer.aclose()
+    assert [b for batch in sink.batches for b in batch] == ["a", "b", "c"]
+
+
+@pytest.mark.asyncio
+async def test_close_flushes_pending_and_failures_do_not_raise():
+    sink = FakeSink()
+    writer = AuditLogWriter("test", sink.persist, batch_size=100, flush_interval_ms=10_000)
+    await writer.submit(1)
+    await writer.submit(2)
+    await writer.aclose()
+    assert sink.batches == [[1, 2]]
+
+    failing = AuditLogWriter("test", FakeSink(fail=True).persist, flush_interval_ms=1)
+    await failing.submit(1)
+    await failing.aclose()
+    assert failing.stats()["failed"] == 1
@@ -0,0 +1,90 @@
+"""测试 COPY 批量 upsert：列推导、合并语句生成、记录组装与阈值选择。"""
+
+import json
+from datetime import date, datetime
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.dialects.postgresql import asyncpg
+
+from src.modules.data_engineering.infrastructure.persistence.models.daily_bar_model import (
+    StockDailyModel,
+)
+from src.modules.data_engineering.infrastructure.persistence.models.dragon_tiger_model import (
+    DragonTigerModel,
+)
+from src.shared.infrastructure.base_repository import BaseRepository
+from src.shared.infrastructure.db.copy_upsert import build_merge_sql, copy_upsert
+
+
+def _mock_session():
+    driver = SimpleNamespace(copy_records_to_table=AsyncMock())
+    conn = MagicMock()
+    conn.dialect = asyncpg.dialect()
+    conn.get_raw_connection = AsyncMock(return_value=SimpleNamespace(driver_connection=driver))
+    session = MagicMock()
+    session.connection = AsyncMock(return_value=conn)
+    session.execute = AsyncMock(return_value=SimpleNamespace(rowcount=2))
+    session.commit = AsyncMock()
+    return session, driver
+
+
+def test_合并语句排除唯一键与排除字段() -> None:
+    sql = build_merge_sql(
+        "stock_daily",
+        "_stg",
+        ["third_code", "trade_date", "close", "created_at"],
+        ["third_code", "trade_date"],
+        ["created_at"],
+    )
+
+    assert sql == (
+        'INSERT INTO "stock_daily" ("third_code", "trade_date", "close", "created_at") '
+        'SELECT "third_code", "trade_date", "close", "created_at" FROM "_stg" '
+        'ON CONFLICT ("third_code", "trade_date") DO UPDATE SET "close" = EXCLUDED."close"'
+    )
+
+
+@pytest.mark.asyncio
+async def test_COPY写入去重并补齐默认值与JSON序列化() -> None:
+    session, driver = _mock_session()
+    items = [
+        {"trade_date": date(2024, 1, 2), "third_code": "000001.SZ", "reason": "r", "buy_seats": []},
+        {
+            "trade_date": date(2024, 1, 2),
+            "third_code": "000001.SZ",
+            "reason": "r",
+            "buy_seats": [{"seat_name": "机构专用"}],
+        },
+    ]
+
+    count = await copy_upsert(
+        session, DragonTigerModel, items, ["trade_date", "third_code", "reason"]
+    )
+
+    assert count == 2
+    kwargs = driver.copy_records_to_table.await_args.kwargs
+    columns = kwargs["columns"]
+    assert "id" not in columns
+    assert {"sell_seats", "created_at", "updated_at"} <= set(columns)
+    (record,) = kwargs["records"]
+    row = dict(zip(columns, record))
+    assert json.loads(row["buy_seats"]) == [{"seat_name": "机构专用"}]
+    assert row["sell_seats"] == "[]"
+    assert isinstance(row["created_at"], datetime)
+    session.commit.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_达到阈值才走COPY() -> None:
+    session, driver = _mock_session()
+    repo = BaseRepository(StockDailyModel, session)
+    items = [{"third_code": "000001.SZ", "trade_date": date(2024, 1, 2), "close": 1.0}]
+
+    await repo.upsert_all(items, ["third_code", "trade_date"], bulk_threshold=1)
+    driver.copy_records_to_table.assert_awaited_once()
+
+    driver.copy_records_to_table.reset_mock()
+    await repo.upsert_all(items, ["third_code", "trade_date"], bulk_threshold=2)
+    driver.copy_records_to_table.assert_not_awaited()